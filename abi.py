@@ -0,0 +1,681 @@
+"""Local ABI decoding of transaction inputs and event logs
+
+Blockscout only fills ``decoded_input`` / ``decoded`` for verified contracts
+and ships them with every item. Here ABIs are fetched once from
+``/smart-contracts/{hash}`` into a persistent SQLite cache (AbiRegistry),
+every function selector and event topic is indexed, and decoding runs
+locally (AbiDecoder). Batches are grouped by (contract, selector) so the
+ABI lookup and the compiled decoder are shared by every item of a group,
+and decoded arguments can be returned as typed columns per signature.
+
+Selectors are also indexed across contracts, so calls to unverified
+contracts still decode when another cached ABI shares the selector
+(e.g. ERC-20 ``transfer``).
+"""
+
+import json
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .columnar import Column, ColumnarBatch
+from .exceptions import BlockScoutAPIError
+from .keccak import keccak256
+
+# Types
+
+
+class AbiType:
+    """Parsed ABI type"""
+
+    __slots__ = ("base", "size", "components", "dims", "name")
+
+    def __init__(
+        self,
+        base: str,
+        size: int = 0,
+        components: Sequence["AbiType"] = (),
+        dims: Sequence[Optional[int]] = (),
+        name: str = "",
+    ):
+        self.base = base  # uint | int | address | bool | bytes | string | tuple
+        self.size = size  # bits of uint/int, length of fixed bytesN (0 = dynamic)
+        self.components = list(components)
+        self.dims = list(dims)  # array dimensions, outermost last; None = dynamic
+        self.name = name
+
+    @classmethod
+    def from_abi(cls, param: Dict[str, Any]) -> "AbiType":
+        """Parse an ABI JSON parameter (``{"type": ..., "components": ...}``)"""
+        match = re.fullmatch(r"([a-z]+)(\d*)((?:\[\d*\])*)", param["type"])
+        if not match:
+            raise ValueError(f"Unsupported ABI type: {param['type']!r}")
+        base, size, arrays = match.groups()
+        dims = [int(d) if d else None for d in re.findall(r"\[(\d*)\]", arrays)]
+        components = [cls.from_abi(c) for c in param.get("components") or []]
+        if base in ("uint", "int"):
+            size = size or "256"
+        elif base == "fixed" or base == "ufixed":
+            raise ValueError(f"Unsupported ABI type: {param['type']!r}")
+        return cls(base, int(size or 0), components, dims, param.get("name") or "")
+
+    @property
+    def canonical(self) -> str:
+        if self.base == "tuple":
+            text = "(" + ",".join(c.canonical for c in self.components) + ")"
+        elif self.base in ("uint", "int") or (self.base == "bytes" and self.size):
+            text = f"{self.base}{self.size}"
+        else:
+            text = self.base
+        return text + "".join(f"[{'' if d is None else d}]" for d in self.dims)
+
+    def element(self) -> "AbiType":
+        """Type of the elements of an array type"""
+        return AbiType(self.base, self.size, self.components, self.dims[:-1])
+
+    @property
+    def dynamic(self) -> bool:
+        if self.dims:
+            return self.dims[-1] is None or self.element().dynamic
+        if self.base == "tuple":
+            return any(c.dynamic for c in self.components)
+        return self.base == "string" or (self.base == "bytes" and not self.size)
+
+    @property
+    def head_size(self) -> int:
+        """Bytes taken in the head of an enclosing tuple"""
+        if self.dynamic:
+            return 32
+        if self.dims:
+            return self.dims[-1] * self.element().head_size
+        if self.base == "tuple":
+            return sum(c.head_size for c in self.components)
+        return 32
+
+    @property
+    def column_kind(self) -> str:
+        """columnar.Column kind used for decoded values of this type"""
+        if self.dims or self.base == "tuple":
+            return "str"
+        if self.base in ("uint", "int"):
+            # int64 columns hold everything up to int64 / uint56
+            fits = self.size <= 64 if self.base == "int" else self.size <= 56
+            return "int" if fits else "uint256"
+        if self.base == "bool":
+            return "bool"
+        return "str"
+
+
+# Decoding
+
+
+def _word_decoder(t: AbiType) -> Callable[[bytes], Any]:
+    """Decoder for one 32-byte word of a static scalar type"""
+    if t.base == "uint":
+        return lambda word: int.from_bytes(word, "big")
+    if t.base == "int":
+        return lambda word: int.from_bytes(word, "big", signed=True)
+    if t.base == "address":
+        return lambda word: "0x" + word[12:].hex()
+    if t.base == "bool":
+        return lambda word: word[31] == 1
+    if t.base == "bytes":
+        size = t.size
+        return lambda word: "0x" + word[:size].hex()
+    raise ValueError(f"Unsupported ABI type: {t.canonical}")
+
+
+def _uint(data: bytes, offset: int) -> int:
+    if offset + 32 > len(data):
+        raise ValueError("ABI data too short")
+    return int.from_bytes(data[offset : offset + 32], "big")
+
+
+def _decode_at(t: AbiType, data: bytes, start: int) -> Any:
+    """Decode a value whose encoding starts at start"""
+    if t.dims:
+        element = t.element()
+        length = t.dims[-1]
+        if length is None:
+            length = _uint(data, start)
+            start += 32
+        if length > len(data):
+            raise ValueError("ABI array length out of range")
+        return _decode_sequence([element] * length, data, start)
+    if t.base == "tuple":
+        values = _decode_sequence(t.components, data, start)
+        if all(c.name for c in t.components):
+            return {c.name: value for c, value in zip(t.components, values)}
+        return values
+    if t.base in ("string", "bytes") and not t.size:
+        length = _uint(data, start)
+        raw = data[start + 32 : start + 32 + length]
+        if len(raw) != length:
+            raise ValueError("ABI data too short")
+        return (
+            raw.decode("utf-8", "replace") if t.base == "string" else "0x" + raw.hex()
+        )
+    if start + 32 > len(data):
+        raise ValueError("ABI data too short")
+    return _word_decoder(t)(data[start : start + 32])
+
+
+def _decode_sequence(types: Sequence[AbiType], data: bytes, start: int) -> List[Any]:
+    """Decode a tuple encoding (head with offsets, then tails) at start"""
+    values = []
+    position = start
+    for t in types:
+        if t.dynamic:
+            values.append(_decode_at(t, data, start + _uint(data, position)))
+        else:
+            values.append(_decode_at(t, data, position))
+        position += t.head_size
+    return values
+
+
+def compile_decoder(types: Sequence[AbiType]) -> Callable[[bytes], List[Any]]:
+    """
+    Build a decoder for an argument list
+
+    Lists made only of static scalars (the common case: addresses, amounts,
+    flags) decode with a precomputed word plan; anything else goes through
+    the general recursive decoder.
+    """
+    types = list(types)
+    if all(not t.dims and t.base != "tuple" and not t.dynamic for t in types):
+        plan = [(i * 32, _word_decoder(t)) for i, t in enumerate(types)]
+        end = len(types) * 32
+
+        def decode_static(data: bytes) -> List[Any]:
+            if len(data) < end:
+                raise ValueError("ABI data too short")
+            return [decoder(data[offset : offset + 32]) for offset, decoder in plan]
+
+        return decode_static
+    return lambda data: _decode_sequence(types, data, 0)
+
+
+# ABI entries
+
+
+def _entry_signature(entry: Dict[str, Any]) -> str:
+    types = [AbiType.from_abi(p).canonical for p in entry.get("inputs") or []]
+    return f"{entry['name']}({','.join(types)})"
+
+
+def _hex_bytes(value: Optional[str]) -> bytes:
+    if not value:
+        return b""
+    value = value[2:] if value.startswith("0x") else value
+    return bytes.fromhex(value)
+
+
+class _Function:
+    """Compiled function entry"""
+
+    def __init__(self, entry: Dict[str, Any]):
+        self.name = entry["name"]
+        self.signature = _entry_signature(entry)
+        self.types = [AbiType.from_abi(p) for p in entry.get("inputs") or []]
+        self.names = [t.name or f"arg{i}" for i, t in enumerate(self.types)]
+        self._decode = compile_decoder(self.types)
+
+    def decode(self, raw_input: bytes) -> Dict[str, Any]:
+        return dict(zip(self.names, self._decode(raw_input[4:])))
+
+
+class _Event:
+    """Compiled event entry"""
+
+    def __init__(self, entry: Dict[str, Any]):
+        self.name = entry["name"]
+        self.signature = _entry_signature(entry)
+        self.anonymous = bool(entry.get("anonymous"))
+        self.types = [AbiType.from_abi(p) for p in entry.get("inputs") or []]
+        self.names = [t.name or f"arg{i}" for i, t in enumerate(self.types)]
+        self.indexed = [bool(p.get("indexed")) for p in entry.get("inputs") or []]
+        self._data_types = [t for t, i in zip(self.types, self.indexed) if not i]
+        self._decode_data = compile_decoder(self._data_types)
+        self._topic_decoders = [
+            # Indexed reference types are stored as their keccak hash
+            None if t.dynamic or t.dims or t.base == "tuple" else _word_decoder(t)
+            for t, indexed in zip(self.types, self.indexed)
+            if indexed
+        ]
+
+    def decode(self, topics: Sequence[str], data: bytes) -> Dict[str, Any]:
+        topics = topics if self.anonymous else topics[1:]
+        data_values = iter(self._decode_data(data))
+        topic_values = iter(zip(topics, self._topic_decoders))
+        values = []
+        for indexed in self.indexed:
+            if not indexed:
+                values.append(next(data_values))
+                continue
+            topic, decoder = next(topic_values)
+            values.append(topic if decoder is None else decoder(_hex_bytes(topic)))
+        return dict(zip(self.names, values))
+
+
+class _ContractAbi:
+    """Functions by selector and events by (topic0, indexed count) of one ABI"""
+
+    def __init__(self, abi: List[Dict[str, Any]]):
+        self.functions: Dict[str, Dict[str, Any]] = {}
+        self.events: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        for entry in abi:
+            try:
+                if entry.get("type") == "function" and entry.get("name"):
+                    selector = _selector(_entry_signature(entry))
+                    self.functions[selector] = entry
+                elif entry.get("type") == "event" and entry.get("name"):
+                    indexed = sum(bool(p.get("indexed")) for p in entry["inputs"])
+                    topic = _topic(_entry_signature(entry))
+                    self.events[(topic, indexed)] = entry
+            except (KeyError, ValueError):
+                continue  # skip entries with types we can't decode
+
+
+def _selector(signature: str) -> str:
+    return "0x" + keccak256(signature.encode())[:4].hex()
+
+
+def _topic(signature: str) -> str:
+    return "0x" + keccak256(signature.encode()).hex()
+
+
+def _parse_abi(abi: Any) -> List[Dict[str, Any]]:
+    if isinstance(abi, str):
+        abi = json.loads(abi)
+    return list(abi or [])
+
+
+# Registry
+
+
+class AbiRegistry:
+    """
+    Persistent ABI and selector cache
+
+    Example:
+        registry = AbiRegistry("~/.blockscout/abi.db")
+        registry.fetch(client, {tx["to"]["hash"] for tx in transactions})
+
+    Args:
+        path: SQLite file (":memory:" for a throwaway cache)
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        with self.conn:
+            # abi is NULL for contracts without a verified ABI so they are
+            # not fetched again
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS contracts ("
+                "address TEXT NOT NULL PRIMARY KEY, abi TEXT, fetched_at TEXT)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS selectors ("
+                "selector TEXT NOT NULL, kind TEXT NOT NULL, "
+                "indexed INTEGER NOT NULL, signature TEXT NOT NULL, entry TEXT, "
+                "PRIMARY KEY (selector, kind, indexed, signature))"
+            )
+        self._contracts: Dict[str, Optional[_ContractAbi]] = {}
+        self._global: Dict[Tuple[str, str, int], Optional[Dict[str, Any]]] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def add_abi(self, address_hash: str, abi: Any) -> None:
+        """Store a contract's ABI (JSON string or list) and index its entries"""
+        address_hash = address_hash.lower()
+        entries = _parse_abi(abi)
+        contract = _ContractAbi(entries)
+        selectors = [
+            (selector, "function", 0, _entry_signature(entry), json.dumps(entry))
+            for selector, entry in contract.functions.items()
+        ] + [
+            (topic, "event", indexed, _entry_signature(entry), json.dumps(entry))
+            for (topic, indexed), entry in contract.events.items()
+        ]
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO contracts VALUES (?, ?, ?)",
+                (address_hash, json.dumps(entries), _now()),
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO selectors VALUES (?, ?, ?, ?, ?)", selectors
+            )
+        self._contracts[address_hash] = contract
+        self._global.clear()
+
+    def mark_unverified(self, address_hash: str) -> None:
+        """Remember that a contract has no ABI"""
+        address_hash = address_hash.lower()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO contracts VALUES (?, NULL, ?)",
+                (address_hash, _now()),
+            )
+        self._contracts[address_hash] = None
+
+    def known(self, address_hash: str) -> bool:
+        """True if the contract was fetched before (verified or not)"""
+        address_hash = address_hash.lower()
+        if address_hash in self._contracts:
+            return True
+        return (
+            self.conn.execute(
+                "SELECT 1 FROM contracts WHERE address = ?", (address_hash,)
+            ).fetchone()
+            is not None
+        )
+
+    def _contract(self, address_hash: str) -> Optional[_ContractAbi]:
+        address_hash = address_hash.lower()
+        if address_hash not in self._contracts:
+            row = self.conn.execute(
+                "SELECT abi FROM contracts WHERE address = ?", (address_hash,)
+            ).fetchone()
+            self._contracts[address_hash] = (
+                _ContractAbi(_parse_abi(row[0])) if row and row[0] else None
+            )
+        return self._contracts[address_hash]
+
+    def get_abi(self, address_hash: str) -> Optional[List[Dict[str, Any]]]:
+        """Cached ABI of a contract, or None"""
+        row = self.conn.execute(
+            "SELECT abi FROM contracts WHERE address = ?", (address_hash.lower(),)
+        ).fetchone()
+        return _parse_abi(row[0]) if row and row[0] else None
+
+    def _lookup_global(self, selector: str, kind: str, indexed: int):
+        key = (selector, kind, indexed)
+        if key not in self._global:
+            row = self.conn.execute(
+                "SELECT entry FROM selectors "
+                "WHERE selector = ? AND kind = ? AND indexed = ? LIMIT 1",
+                key,
+            ).fetchone()
+            self._global[key] = json.loads(row[0]) if row else None
+        return self._global[key]
+
+    def function(
+        self, address_hash: Optional[str], selector: str
+    ) -> Optional[Dict[str, Any]]:
+        """ABI entry for a call: the contract's own ABI first, then any cached ABI"""
+        selector = selector.lower()
+        contract = self._contract(address_hash) if address_hash else None
+        if contract is not None and selector in contract.functions:
+            return contract.functions[selector]
+        return self._lookup_global(selector, "function", 0)
+
+    def event(
+        self, address_hash: Optional[str], topic0: str, indexed: int
+    ) -> Optional[Dict[str, Any]]:
+        """ABI entry for a log: the contract's own ABI first, then any cached ABI"""
+        topic0 = topic0.lower()
+        contract = self._contract(address_hash) if address_hash else None
+        if contract is not None and (topic0, indexed) in contract.events:
+            return contract.events[(topic0, indexed)]
+        return self._lookup_global(topic0, "event", indexed)
+
+    def fetch(
+        self,
+        client: Any,
+        addresses: Iterable[str],
+        refresh: bool = False,
+        max_workers: int = 4,
+    ) -> int:
+        """
+        Fetch and cache the ABIs of contracts not seen before
+
+        Requests run concurrently; unverified contracts are remembered so
+        they are not requested again (unless refresh is set).
+
+        Returns:
+            Number of contracts requested
+        """
+        missing = sorted(
+            {a.lower() for a in addresses if a and (refresh or not self.known(a))}
+        )
+        if not missing:
+            return 0
+
+        def fetch_one(address_hash: str) -> Any:
+            try:
+                # Only the ABI is needed; the raw payload avoids validating
+                # the many version-dependent fields of the full response
+                return client.get_raw(f"/smart-contracts/{address_hash}").get("abi")
+            except BlockScoutAPIError as e:
+                if e.status_code in (404, 422):
+                    return None
+                raise
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for address_hash, abi in zip(missing, executor.map(fetch_one, missing)):
+                if abi:
+                    self.add_abi(address_hash, abi)
+                else:
+                    self.mark_unverified(address_hash)
+        return len(missing)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# Decoder
+
+
+class DecodedData(NamedTuple):
+    """Decoded call or event"""
+
+    kind: str  # "function" | "event"
+    name: str
+    signature: str
+    args: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "signature": self.signature, "args": self.args}
+
+
+def _field(item: Any, name: str) -> Any:
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def _address(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return _field(value, "hash")
+
+
+class AbiDecoder:
+    """
+    Decode transaction inputs and logs with cached ABIs
+
+    Example:
+        decoder = AbiDecoder(AbiRegistry("abi.db"), client)
+        calls = decoder.decode_inputs(transactions)   # fetches missing ABIs once
+        tables = decoder.decode_logs_columnar(logs)   # {signature: ColumnarBatch}
+
+    Args:
+        registry: ABI cache
+        client: BlockScoutClient used to fetch missing ABIs (None for
+            cache-only decoding)
+    """
+
+    def __init__(self, registry: AbiRegistry, client: Any = None):
+        self.registry = registry
+        self.client = client
+        self._compiled: Dict[str, Any] = {}
+        self._by_signature: Dict[Tuple[str, str], Any] = {}
+
+    def _compile(self, kind: str, entry: Dict[str, Any]):
+        key = kind + json.dumps(entry, sort_keys=True)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = _Function(entry) if kind == "function" else _Event(entry)
+            self._compiled[key] = compiled
+            self._by_signature[(kind, compiled.signature)] = compiled
+        return compiled
+
+    def _prefetch(self, addresses: Iterable[Optional[str]]) -> None:
+        if self.client is not None:
+            self.registry.fetch(self.client, (a for a in addresses if a))
+
+    # Inputs
+
+    def decode_inputs(self, transactions: Sequence[Any]) -> List[Optional[DecodedData]]:
+        """
+        Decode the raw_input of transactions (raw dicts or models)
+
+        Returns one DecodedData per transaction, None where no ABI matches or
+        the input does not decode.
+        """
+        groups: Dict[Tuple[Optional[str], str], List[int]] = {}
+        inputs: List[bytes] = []
+        for position, transaction in enumerate(transactions):
+            raw = _hex_bytes(_field(transaction, "raw_input"))
+            inputs.append(raw)
+            if len(raw) < 4:
+                continue
+            to = _address(_field(transaction, "to"))
+            key = (to.lower() if to else None, "0x" + raw[:4].hex())
+            groups.setdefault(key, []).append(position)
+
+        self._prefetch(address for address, _ in groups)
+        results: List[Optional[DecodedData]] = [None] * len(inputs)
+        for (address, selector), positions in groups.items():
+            entry = self.registry.function(address, selector)
+            if entry is None:
+                continue
+            function = self._compile("function", entry)
+            for position in positions:
+                try:
+                    args = function.decode(inputs[position])
+                except (ValueError, IndexError, StopIteration):
+                    continue
+                results[position] = DecodedData(
+                    "function", function.name, function.signature, args
+                )
+        return results
+
+    # Logs
+
+    def decode_logs(self, logs: Sequence[Any]) -> List[Optional[DecodedData]]:
+        """Decode logs (raw dicts or Log models); None where undecodable"""
+        groups: Dict[Tuple[Optional[str], str, int], List[int]] = {}
+        for position, log in enumerate(logs):
+            topics = [t for t in _field(log, "topics") or [] if t]
+            if not topics:
+                continue
+            address = _address(_field(log, "address"))
+            key = (address.lower() if address else None, topics[0], len(topics) - 1)
+            groups.setdefault(key, []).append(position)
+
+        self._prefetch(address for address, _, _ in groups)
+        results: List[Optional[DecodedData]] = [None] * len(logs)
+        for (address, topic0, indexed), positions in groups.items():
+            entry = self.registry.event(address, topic0, indexed)
+            if entry is None:
+                continue
+            event = self._compile("event", entry)
+            for position in positions:
+                log = logs[position]
+                topics = [t for t in _field(log, "topics") or [] if t]
+                try:
+                    args = event.decode(topics, _hex_bytes(_field(log, "data")))
+                except (ValueError, IndexError, StopIteration):
+                    continue
+                results[position] = DecodedData(
+                    "event", event.name, event.signature, args
+                )
+        return results
+
+    # Columns
+
+    def decode_inputs_columnar(
+        self, transactions: Sequence[Any]
+    ) -> Dict[str, ColumnarBatch]:
+        """
+        Decode transaction inputs into one typed ColumnarBatch per signature
+
+        Each batch has a ``transaction_hash`` column followed by one column
+        per argument (uint/int as int64 or exact uint256, bool, address and
+        bytes as strings; arrays and tuples as JSON).
+        """
+        return self._columnar(
+            transactions,
+            self.decode_inputs(transactions),
+            [Column("transaction_hash", "hash")],
+        )
+
+    def decode_logs_columnar(self, logs: Sequence[Any]) -> Dict[str, ColumnarBatch]:
+        """Decode logs into one typed ColumnarBatch per event signature"""
+        return self._columnar(
+            logs,
+            self.decode_logs(logs),
+            [
+                Column("transaction_hash"),
+                Column("block_number", kind="int"),
+                Column("log_index", "index", "int"),
+            ],
+        )
+
+    def _columnar(
+        self,
+        items: Sequence[Any],
+        decoded: Sequence[Optional[DecodedData]],
+        key_columns: List[Column],
+    ) -> Dict[str, ColumnarBatch]:
+        groups: Dict[str, List[Tuple[Any, DecodedData]]] = {}
+        for item, result in zip(items, decoded):
+            if result is not None:
+                groups.setdefault(result.signature, []).append((item, result))
+
+        batches = {}
+        for signature, group in groups.items():
+            compiled = self._by_signature[(group[0][1].kind, signature)]
+            names = compiled.names
+            batch = ColumnarBatch(
+                [Column(c.name, c.name, c.kind) for c in key_columns]
+                + [
+                    Column(name, name, t.column_kind)
+                    for name, t in zip(names, compiled.types)
+                ]
+            )
+            rows = []
+            for item, result in group:
+                raw = item if isinstance(item, dict) else item.model_dump()
+                row = {c.name: c.getter(raw) for c in key_columns}
+                # Positional: entries sharing a signature may name arguments
+                # differently
+                for name, value in zip(names, result.args.values()):
+                    row[name] = (
+                        json.dumps(value) if isinstance(value, (list, dict)) else value
+                    )
+                rows.append(row)
+            batch.append_items(rows)
+            batches[signature] = batch
+        return batches
@@ -0,0 +1,213 @@
+"""Streaming holder analytics
+
+Holder concentration metrics computed in a single pass over the paginated
+holder list with bounded memory. Balances are kept as exact integers in
+base units; only the final ratios are converted to floats.
+
+Blockscout returns holders in descending balance order, which the Gini
+coefficient and percentile sketch rely on.
+"""
+
+from bisect import bisect_left
+from fractions import Fraction
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .utils import format_token_amount
+
+
+def _holder_value(holder: Any) -> Tuple[int, bool]:
+    """Return (balance, is_contract) for a Holder, HolderRecord or raw item"""
+    if isinstance(holder, dict):
+        return int(holder["value"]), bool(holder["address"].get("is_contract"))
+    if hasattr(holder, "flags"):
+        return holder.value, holder.is_contract
+    return int(holder.value), bool(holder.address.is_contract)
+
+
+class SortedStreamSketch:
+    """Bounded-memory quantile sketch for a stream sorted in descending order
+
+    Keeps every k-th value with its rank; when the sample grows past
+    2 * size, every other entry is dropped and k doubles. Quantiles are
+    therefore exact up to k ranks, with k <= 2 * n / size.
+    """
+
+    def __init__(self, size: int = 4096):
+        self.size = size
+        self.step = 1
+        self.count = 0
+        self._ranks: List[int] = []
+        self._values: List[int] = []
+
+    def add(self, value: int) -> None:
+        if self.count % self.step == 0:
+            self._ranks.append(self.count)
+            self._values.append(value)
+            if len(self._ranks) > 2 * self.size:
+                self._ranks = self._ranks[::2]
+                self._values = self._values[::2]
+                self.step *= 2
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[int]:
+        """Value at quantile q (0..1) of the ascending distribution"""
+        if not self.count:
+            return None
+        rank = round((1 - q) * (self.count - 1))
+        index = min(bisect_left(self._ranks, rank), len(self._ranks) - 1)
+        if index and rank - self._ranks[index - 1] < self._ranks[index] - rank:
+            index -= 1
+        return self._values[index]
+
+
+class HolderStats:
+    """Incremental holder concentration statistics
+
+    Example:
+        stats = HolderStats(decimals=token.decimals, total_supply=token.total_supply)
+        for page in client.iter_token_holder_pages(token.address):
+            stats.add_page(page["items"])
+        print(stats.summary())
+    """
+
+    def __init__(
+        self,
+        decimals: Any = 0,
+        total_supply: Any = None,
+        top_n: Sequence[int] = (10, 100, 1000),
+        percentiles: Sequence[float] = (50, 90, 99),
+        sketch_size: int = 4096,
+    ):
+        self.decimals = int(decimals or 0)
+        self.total_supply = int(total_supply) if total_supply else None
+        self.top_n = sorted(top_n)
+        self.percentiles = list(percentiles)
+        self.count = 0
+        self.total = 0
+        self.max_value: Optional[int] = None
+        self.min_value: Optional[int] = None
+        self.sum_squares = 0
+        self.rank_weighted_sum = 0
+        self.contract_count = 0
+        self.contract_total = 0
+        self.top_totals: Dict[int, int] = {n: 0 for n in self.top_n}
+        self.is_sorted = True
+        self._sketch = SortedStreamSketch(sketch_size)
+
+    def add(self, holder: Any) -> None:
+        """Add one holder (Holder, HolderRecord or raw API item)"""
+        value, is_contract = _holder_value(holder)
+        if self.min_value is not None and value > self.min_value:
+            self.is_sorted = False
+
+        self.count += 1
+        self.total += value
+        self.sum_squares += value * value
+        self.rank_weighted_sum += self.count * value
+        self.max_value = value if self.max_value is None else max(self.max_value, value)
+        self.min_value = value if self.min_value is None else min(self.min_value, value)
+
+        if is_contract:
+            self.contract_count += 1
+            self.contract_total += value
+
+        for n in self.top_n:
+            if self.count <= n:
+                self.top_totals[n] += value
+
+        self._sketch.add(value)
+
+    def add_page(self, items: Sequence[Any]) -> None:
+        """Add a page of holders"""
+        for item in items:
+            self.add(item)
+
+    def gini(self) -> Optional[float]:
+        """Gini coefficient of the balances seen so far"""
+        if not self.count or not self.total:
+            return None
+        n = self.count
+        return float(
+            Fraction((n + 1) * self.total - 2 * self.rank_weighted_sum, n * self.total)
+        )
+
+    def hhi(self) -> Optional[float]:
+        """Herfindahl-Hirschman index (sum of squared shares, 0..1)"""
+        if not self.total:
+            return None
+        return float(Fraction(self.sum_squares, self.total * self.total))
+
+    def percentile(self, p: float) -> Optional[int]:
+        """Balance at percentile p (0..100), in base units"""
+        return self._sketch.quantile(p / 100)
+
+    def summary(self) -> Dict[str, Any]:
+        """Current statistics with balances formatted in token units"""
+
+        def fmt(value: Optional[int]) -> Optional[str]:
+            return None if value is None else format_token_amount(value, self.decimals)
+
+        def share(part: int, whole: Optional[int]) -> Optional[float]:
+            return float(Fraction(part, whole)) * 100 if whole else None
+
+        summary: Dict[str, Any] = {
+            "holders": self.count,
+            "total_held": fmt(self.total),
+            "total_supply": fmt(self.total_supply),
+            "max_balance": fmt(self.max_value),
+            "min_balance": fmt(self.min_value),
+            "mean_balance": fmt(self.total // self.count) if self.count else None,
+        }
+        for p in self.percentiles:
+            summary[f"p{p:g}_balance"] = fmt(self.percentile(p))
+        for n in self.top_n:
+            summary[f"top_{n}_share_pct"] = share(self.top_totals[n], self.total)
+            if self.total_supply:
+                summary[f"top_{n}_supply_pct"] = share(
+                    self.top_totals[n], self.total_supply
+                )
+        summary.update(
+            {
+                "gini": self.gini(),
+                "hhi": self.hhi(),
+                "contract_holders": self.contract_count,
+                "contract_share_pct": share(self.contract_total, self.total),
+                "eoa_holders": self.count - self.contract_count,
+                "eoa_share_pct": share(self.total - self.contract_total, self.total),
+                "sorted_input": self.is_sorted,
+            }
+        )
+        return summary
+
+
+def holder_stats(
+    client: Any,
+    address_hash: str,
+    top_n: Sequence[int] = (10, 100, 1000),
+    percentiles: Sequence[float] = (50, 90, 99),
+    limit: Optional[int] = None,
+    on_page: Optional[Callable[[HolderStats], None]] = None,
+) -> HolderStats:
+    """
+    Compute holder concentration statistics for a token in one streaming pass
+
+    Args:
+        client: BlockScoutClient instance
+        address_hash: Token contract address
+        top_n: Top-N cut-offs to report shares for
+        percentiles: Balance percentiles to report
+        limit: Only consider the top `limit` holders
+        on_page: Callback invoked with the running stats after every page
+    """
+    token = client.get_token(address_hash)
+    stats = HolderStats(
+        decimals=token.decimals,
+        total_supply=token.total_supply,
+        top_n=top_n,
+        percentiles=percentiles,
+    )
+    for page in client.iter_token_holder_pages(address_hash, limit=limit):
+        stats.add_page(page["items"])
+        if on_page is not None:
+            on_page(stats)
+    return stats
@@ -0,0 +1,266 @@
+"""Parallel block-range backfill
+
+Splits ``[start, end]`` into shards of contiguous heights and fetches them
+with a pool of worker threads sharing the client (and its rate limiter).
+Completed heights are tracked in a bitmap, so failed or not-yet-indexed
+heights show up as gaps that are re-fetched in later passes, and the whole
+run can be resumed from a small state file.
+
+Workers only fetch; results are handed to the sink on the calling thread,
+so sinks (file writers, the SQLite warehouse) need not be thread-safe.
+"""
+
+import base64
+import json
+import os
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .exceptions import BlockScoutAPIError, BlockScoutError
+
+
+class HeightBitmap:
+    """One bit per block height in [start, end]"""
+
+    def __init__(self, start: int, end: int, data: Optional[bytes] = None):
+        if end < start:
+            raise ValueError("end must be >= start")
+        self.start = start
+        self.end = end
+        size = (end - start) // 8 + 1
+        self._bits = bytearray(data) if data is not None else bytearray(size)
+        if len(self._bits) != size:
+            raise ValueError("Bitmap size does not match the height range")
+
+    def __len__(self) -> int:
+        return self.end - self.start + 1
+
+    def __contains__(self, height: int) -> bool:
+        offset = height - self.start
+        return bool(self._bits[offset >> 3] & (1 << (offset & 7)))
+
+    def add(self, height: int) -> None:
+        offset = height - self.start
+        self._bits[offset >> 3] |= 1 << (offset & 7)
+
+    def count(self) -> int:
+        """Number of completed heights"""
+        return sum(bin(byte).count("1") for byte in self._bits)
+
+    def gaps(self) -> Iterator[Tuple[int, int]]:
+        """Yield (first, last) ranges of missing heights"""
+        bits = self._bits
+        height = self.start
+        gap_start = None
+        while height <= self.end:
+            offset = height - self.start
+            # Skip fully completed bytes quickly
+            if offset & 7 == 0 and bits[offset >> 3] == 0xFF and gap_start is None:
+                height += 8
+                continue
+            if bits[offset >> 3] & (1 << (offset & 7)):
+                if gap_start is not None:
+                    yield gap_start, height - 1
+                    gap_start = None
+            elif gap_start is None:
+                gap_start = height
+            height += 1
+        if gap_start is not None:
+            yield gap_start, self.end
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._bits)
+
+
+class BackfillState:
+    """Bitmap of completed heights persisted to a JSON state file"""
+
+    def __init__(self, start: int, end: int, path: Optional[str] = None):
+        self.path = path
+        self.bitmap = HeightBitmap(start, end)
+
+    @classmethod
+    def load(cls, path: str, start: int, end: int) -> "BackfillState":
+        """Load a state file, or start fresh if it does not exist"""
+        state = cls(start, end, path)
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            if (data["start"], data["end"]) != (start, end):
+                raise ValueError(
+                    f"State file {path} covers blocks {data['start']}-{data['end']}, "
+                    f"not {start}-{end}"
+                )
+            state.bitmap = HeightBitmap(
+                start, end, zlib.decompress(base64.b64decode(data["bitmap"]))
+            )
+        return state
+
+    def save(self) -> None:
+        """Atomically write the state file"""
+        if self.path is None:
+            return
+        data = {
+            "start": self.bitmap.start,
+            "end": self.bitmap.end,
+            "bitmap": base64.b64encode(zlib.compress(self.bitmap.to_bytes())).decode(),
+        }
+        partial = f"{self.path}.partial"
+        with open(partial, "w") as f:
+            json.dump(data, f)
+        os.replace(partial, self.path)
+
+
+def _shards(gaps: Iterator[Tuple[int, int]], shard_size: int) -> Iterator[range]:
+    for first, last in gaps:
+        for shard_start in range(first, last + 1, shard_size):
+            yield range(shard_start, min(shard_start + shard_size, last + 1))
+
+
+class BlockBackfill:
+    """
+    Fetch a block range with concurrent workers
+
+    Example:
+        with BlockScoutClient(url, rate_limit=20) as client:
+            backfill = BlockBackfill(client, 1_000_000, 2_000_000, workers=16,
+                                     state_path="range.state")
+            backfill.run(lambda block, txs: writer.write_items([block]))
+
+    Args:
+        client: BlockScoutClient instance (shared by all workers)
+        start: First block height
+        end: Last block height (inclusive)
+        workers: Number of concurrent worker threads
+        shard_size: Contiguous heights handed to a worker at a time
+        transactions: Also fetch /blocks/{n}/transactions (all pages)
+        state_path: Resumable state file (None to keep state in memory only)
+        checkpoint_every: Save the state after this many completed shards
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        start: int,
+        end: int,
+        workers: int = 8,
+        shard_size: int = 100,
+        transactions: bool = False,
+        state_path: Optional[str] = None,
+        checkpoint_every: int = 10,
+    ):
+        self.client = client
+        self.workers = workers
+        self.shard_size = shard_size
+        self.transactions = transactions
+        self.checkpoint_every = checkpoint_every
+        self.state = (
+            BackfillState.load(state_path, start, end)
+            if state_path
+            else BackfillState(start, end)
+        )
+        self.missing: Set[int] = set()
+        self.errors: Dict[int, str] = {}
+
+    @property
+    def bitmap(self) -> HeightBitmap:
+        return self.state.bitmap
+
+    def _fetch_block(self, height: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        block = self.client.get_raw(f"/blocks/{height}")
+        transactions: List[Dict[str, Any]] = []
+        # Skip the extra request for blocks known to be empty
+        if self.transactions and block.get("transaction_count") != 0:
+            for page in self.client.iter_raw_pages(f"/blocks/{height}/transactions"):
+                transactions.extend(page.get("items", []))
+        return block, transactions
+
+    def _fetch_shard(self, shard: range) -> List[Tuple[int, Any, Any]]:
+        """Fetch every height of a shard; errors are returned, not raised"""
+        results = []
+        for height in shard:
+            try:
+                block, transactions = self._fetch_block(height)
+                results.append((height, block, transactions))
+            except BlockScoutError as e:
+                results.append((height, None, e))
+        return results
+
+    def run(
+        self,
+        sink: Callable[[Dict[str, Any], List[Dict[str, Any]]], None],
+        max_passes: int = 3,
+        progress: Optional[Callable[[int, int], None]] = None,
+        flush: Optional[Callable[[], None]] = None,
+    ) -> int:
+        """
+        Fetch all missing heights, re-fetching gaps for up to max_passes passes
+
+        Args:
+            sink: Called with (block, transactions) for every fetched block
+            max_passes: Passes over the remaining gaps
+            progress: Callback receiving (completed heights, total heights)
+            flush: Called before every state checkpoint so buffered sink
+                output is durable before its heights are marked done
+
+        Returns:
+            Number of blocks fetched in this run
+        """
+        fetched = 0
+        total = len(self.bitmap)
+        completed = self.bitmap.count()
+
+        def checkpoint():
+            if flush is not None:
+                flush()
+            self.state.save()
+
+        for _ in range(max_passes):
+            self.missing.clear()
+            self.errors.clear()
+            shards = _shards(self.bitmap.gaps(), self.shard_size)
+            done_shards = 0
+            pending: Set[Future] = set()
+
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                # Keep a bounded number of shards in flight so a huge range
+                # never materializes as millions of futures
+                for shard in shards:
+                    pending.add(executor.submit(self._fetch_shard, shard))
+                    if len(pending) < self.workers * 2:
+                        continue
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        fetched += self._collect(future.result(), sink)
+                        done_shards += 1
+                        if done_shards % self.checkpoint_every == 0:
+                            checkpoint()
+                    if progress is not None:
+                        progress(completed + fetched, total)
+
+                for future in pending:
+                    fetched += self._collect(future.result(), sink)
+                    if progress is not None:
+                        progress(completed + fetched, total)
+
+            checkpoint()
+            if not self.errors:
+                break
+
+        return fetched
+
+    def _collect(self, results: List[Tuple[int, Any, Any]], sink) -> int:
+        fetched = 0
+        for height, block, extra in results:
+            if block is None:
+                if isinstance(extra, BlockScoutAPIError) and extra.status_code == 404:
+                    # Not indexed (yet); stays a gap without counting as an error
+                    self.missing.add(height)
+                else:
+                    self.errors[height] = str(extra)
+                continue
+            sink(block, extra)
+            self.bitmap.add(height)
+            fetched += 1
+        return fetched
@@ -1,5 +1,14 @@
 """CLI commands package"""
 
-from . import search, address, transaction, block, token
+from . import search, address, transaction, block, token, sync, stats, feed
 
-__all__ = ["search", "address", "transaction", "block", "token"]
+__all__ = [
+    "search",
+    "address",
+    "transaction",
+    "block",
+    "token",
+    "sync",
+    "stats",
+    "feed",
+]
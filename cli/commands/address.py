@@ -2,9 +2,20 @@
 
 import click
 from rich.console import Console
-from ..formatters import format_output
+from ..formatters import dataframe_rows, print_output, stream_export
+from ... import crawler
 from ...client import BlockScoutClient
 from ...exceptions import BlockScoutError
+from ...exporters import (
+    export_dataframe,
+    format_from_path,
+    open_page_writer,
+    part_path,
+)
+from ...portfolio import fetch_portfolio, read_addresses
+from ...schemas import CRAWL_EDGE_SCHEMA, TRANSACTION_SCHEMA
+from ...timeseries import CHART_MAX_AGE, DEFAULT_ROOT, TimeSeriesCache
+from ...utils import parse_token_amount
 
 console = Console()
 
@@ -46,14 +57,7 @@ def info(ctx, address_hash, output_format, debug):
                         f"[yellow]Debug: Dict keys: {list(address.to_dict().keys())}[/yellow]"
                     )
 
-            output = format_output(
-                address, format_type, f"Address Info: {address_hash}"
-            )
-            # Check if it's a Rich Table object or string
-            if hasattr(output, "add_row"):  # It's a Rich Table
-                console.print(output)
-            else:  # It's a string (JSON/CSV)
-                console.print(output)
+            print_output(address, format_type, f"Address Info: {address_hash}")
 
     except BlockScoutError as e:
         console.print(f"❌ Error: {e}", style="red")
@@ -98,10 +102,9 @@ def transactions(ctx, address_hash, filter_type, output_format):
                 return
 
             limited_results = result.items[: config.max_items]
-            output = format_output(
+            print_output(
                 limited_results, format_type, f"Transactions for {address_hash}"
             )
-            console.print(output)
 
             if len(result.items) > config.max_items:
                 console.print(
@@ -138,10 +141,9 @@ def tokens(ctx, address_hash, output_format):
                 return
 
             limited_results = balances[: config.max_items]
-            output = format_output(
+            print_output(
                 limited_results, format_type, f"Token Balances for {address_hash}"
             )
-            console.print(output)
 
             if len(balances) > config.max_items:
                 console.print(
@@ -151,3 +153,353 @@ def tokens(ctx, address_hash, output_format):
     except BlockScoutError as e:
         console.print(f"❌ Error: {e}", style="red")
         raise click.Abort()
+
+
+@address_group.command(name="balance-history")
+@click.argument("address_hash")
+@click.option(
+    "--by-day", is_flag=True, help="Daily balances instead of every balance change"
+)
+@click.option(
+    "--cache",
+    default=DEFAULT_ROOT,
+    show_default=True,
+    help="Time-series cache directory",
+)
+@click.option(
+    "--max-age",
+    type=int,
+    help=f"Seconds before the cached series is refreshed "
+    f"[default: 0, or {CHART_MAX_AGE} with --by-day]",
+)
+@click.option("--offline", is_flag=True, help="Only read the cache")
+@click.option(
+    "--limit", type=int, default=25, show_default=True, help="Rows to show (0 for all)"
+)
+@click.option("--output", "-o", help="Write the whole series to a file")
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def balance_history(
+    ctx, address_hash, by_day, cache, max_age, offline, limit, output, output_format
+):
+    """Native coin balance history, cached and refreshed incrementally"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+    if offline:
+        max_age = None
+    elif max_age is None:
+        max_age = CHART_MAX_AGE if by_day else 0
+
+    try:
+        with BlockScoutClient(
+            config.base_url, config.timeout, rate_limit=config.rate_limit
+        ) as client:
+            series = TimeSeriesCache(client, cache)
+            with console.status("Refreshing balance history..."):
+                if by_day:
+                    df = series.coin_balance_history_by_day(address_hash, max_age)
+                else:
+                    df = series.coin_balance_history(address_hash, max_age)
+
+        if output:
+            rows_written = export_dataframe(df, output)
+            console.print(f"✅ Wrote {rows_written:,} rows to {output}", style="green")
+        elif df.empty:
+            console.print("No balance history found.", style="yellow")
+        else:
+            if format_type == "table" and "transaction_hash" in df:
+                df = df.drop(columns="transaction_hash")
+            print_output(
+                dataframe_rows(df, limit),
+                format_type,
+                f"Balance history: {address_hash}",
+            )
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@address_group.command()
+@click.argument("addresses", nargs=-1)
+@click.option(
+    "--from-file",
+    "from_file",
+    type=click.File("r"),
+    help="File with one address per line ('-' for stdin)",
+)
+@click.option(
+    "--by",
+    type=click.Choice(["token", "address", "balance"]),
+    default="token",
+    show_default=True,
+    help="Aggregate per token, per address, or list every balance",
+)
+@click.option(
+    "--workers", type=int, default=16, show_default=True, help="Concurrent requests"
+)
+@click.option(
+    "--output",
+    "-o",
+    help="Write the selected view to a file (CSV/NDJSON/Parquet/Feather)",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def portfolio(ctx, addresses, from_file, by, workers, output, output_format):
+    """Token balances of many addresses, aggregated per token or address"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+    addresses = read_addresses(
+        list(addresses) + (from_file.readlines() if from_file else [])
+    )
+    if not addresses:
+        raise click.UsageError("Pass addresses as arguments or with --from-file")
+    view = {"token": "tokens", "address": "addresses", "balance": "balances"}[by]
+
+    try:
+        with BlockScoutClient(
+            config.base_url, config.timeout, rate_limit=config.rate_limit
+        ) as client:
+            with console.status("Fetching balances...") as status:
+                result = fetch_portfolio(
+                    client,
+                    addresses,
+                    workers=workers,
+                    progress=lambda done, total: status.update(
+                        f"Fetching balances... {done:,}/{total:,} addresses"
+                    ),
+                )
+
+        if output:
+            schema, rows = result.view(view)
+            with open_page_writer(output, schema, format_from_path(output)) as writer:
+                writer.write_items(rows)
+            console.print(f"✅ Wrote {view} to {output}", style="green")
+        else:
+            rows = result.flat_rows(view)
+            shown = rows if format_type == "csv" else rows[: config.max_items]
+            print_output(
+                shown,
+                format_type,
+                f"Portfolio of {len(addresses):,} addresses ({len(rows):,} {view})",
+            )
+            if len(shown) < len(rows):
+                console.print(
+                    f"\n[yellow]Showing {len(shown)} of {len(rows)} {view}[/yellow]"
+                )
+
+        for address, error in sorted(result.errors.items())[:10]:
+            console.print(f"⚠️  {address}: {error}", style="yellow")
+        if len(result.errors) > 10:
+            console.print(
+                f"⚠️  {len(result.errors) - 10} more addresses failed", style="yellow"
+            )
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@address_group.command()
+@click.argument("roots", nargs=-1)
+@click.option(
+    "--from-file",
+    "from_file",
+    type=click.File("r"),
+    help="File with one root address per line ('-' for stdin)",
+)
+@click.option("--output", "-o", required=True, help="Edge list file (CSV/Parquet/...)")
+@click.option("--depth", type=int, default=2, show_default=True, help="Hops to expand")
+@click.option(
+    "--fanout",
+    type=int,
+    default=25,
+    show_default=True,
+    help="Counterparties followed per address",
+)
+@click.option(
+    "--min-value",
+    default="0",
+    show_default=True,
+    help="Ignore transfers below this amount in base units, e.g. 1e18 (wei)",
+)
+@click.option(
+    "--source",
+    "sources",
+    type=click.Choice(crawler.SOURCES),
+    multiple=True,
+    help="Edges to follow (default: all)",
+)
+@click.option(
+    "--max-pages",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Pages fetched per address and source",
+)
+@click.option(
+    "--contracts/--no-contracts",
+    default=False,
+    help="Also expand contract counterparties",
+)
+@click.option(
+    "--workers", type=int, default=8, show_default=True, help="Concurrent requests"
+)
+@click.option(
+    "--bloom",
+    "bloom_capacity",
+    type=int,
+    help="Track visited addresses in a Bloom filter sized for this many keys",
+)
+@click.option(
+    "--state", "state_path", help="Resume state file (default: <output>.state)"
+)
+@click.pass_context
+def crawl(
+    ctx,
+    roots,
+    from_file,
+    output,
+    depth,
+    fanout,
+    min_value,
+    sources,
+    max_pages,
+    contracts,
+    workers,
+    bloom_capacity,
+    state_path,
+):
+    """Breadth-first crawl of counterparties into an edge list"""
+    config = ctx.obj["config"]
+    roots = read_addresses(list(roots) + (from_file.readlines() if from_file else []))
+    if not roots:
+        raise click.UsageError("Pass root addresses as arguments or with --from-file")
+    state_path = state_path or f"{output}.state"
+    try:
+        min_value = parse_token_amount(min_value)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--min-value")
+
+    try:
+        with BlockScoutClient(
+            config.base_url, config.timeout, rate_limit=config.rate_limit
+        ) as client:
+            job = crawler.CounterpartyCrawler(
+                client,
+                roots,
+                depth=depth,
+                max_fanout=fanout,
+                min_value=min_value,
+                sources=sources or crawler.SOURCES,
+                max_pages=max_pages,
+                expand_contracts=contracts,
+                workers=workers,
+                bloom_capacity=bloom_capacity,
+                state_path=state_path,
+            )
+            if job.state.done:
+                console.print(
+                    f"✅ Crawl already finished with {job.state.edges:,} edges "
+                    f"(remove {state_path} to start over)",
+                    style="green",
+                )
+                return
+            if job.state.expanded:
+                console.print(
+                    f"Resuming: {job.state.expanded:,} addresses already expanded",
+                    style="cyan",
+                )
+
+            # A resumed crawl writes its new edges next to the earlier ones
+            written_path = part_path(output)
+            with open_page_writer(
+                written_path, CRAWL_EDGE_SCHEMA, format_from_path(output)
+            ) as writer:
+                with console.status("Crawling...") as status:
+                    emitted = job.run(
+                        writer.write_items,
+                        progress=lambda expanded, edges, level: status.update(
+                            f"Crawling depth {level}... {expanded:,} addresses, "
+                            f"{edges:,} edges"
+                        ),
+                        flush=writer.flush,
+                    )
+
+        console.print(
+            f"✅ Crawled {job.state.expanded:,} addresses, wrote {emitted:,} edges "
+            f"to {written_path}",
+            style="green",
+        )
+        for address, error in sorted(job.errors.items())[:10]:
+            console.print(f"⚠️  {address}: {error}", style="yellow")
+        if job.state.retry:
+            console.print(
+                f"⚠️  {len(job.state.retry):,} addresses at depth {job.state.level} "
+                f"still failing; run the command again to retry them",
+                style="yellow",
+            )
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@address_group.command()
+@click.argument("address_hash")
+@click.option("--output", "-o", required=True, help="Output Parquet/Feather file path")
+@click.option(
+    "--filter",
+    "filter_type",
+    type=click.Choice(["to", "from"]),
+    help="Filter transactions by direction",
+)
+@click.option("--max-transactions", type=int, help="Maximum number of transactions")
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(["parquet", "feather"]),
+    help="Output file format (guessed from the extension by default)",
+)
+@click.option(
+    "--compression", default="zstd", show_default=True, help="Compression codec"
+)
+@click.pass_context
+def export_transactions(
+    ctx, address_hash, output, filter_type, max_transactions, export_format, compression
+):
+    """Stream all address transactions to a Parquet or Feather file"""
+    config = ctx.obj["config"]
+    params = {"filter": filter_type} if filter_type else {}
+
+    try:
+        with BlockScoutClient(config.base_url, config.timeout) as client:
+            rows = stream_export(
+                client.iter_raw_pages(
+                    f"/addresses/{address_hash}/transactions", params
+                ),
+                output,
+                TRANSACTION_SCHEMA,
+                export_format=export_format,
+                compression=compression,
+                max_rows=max_transactions,
+            )
+            console.print(
+                f"[green]💾 Successfully exported {rows} transactions to {output}[/green]"
+            )
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
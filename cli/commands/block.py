@@ -1,10 +1,17 @@
 """Block commands"""
 
+import json
+
 import click
 from rich.console import Console
-from ..formatters import format_output
+from ..formatters import print_output, stream_export
+from ... import warehouse
+from ...backfill import BlockBackfill
 from ...client import BlockScoutClient
 from ...exceptions import BlockScoutError
+from ...exporters import format_from_path, open_page_writer, part_path
+from ...follow import ChainFollower
+from ...schemas import BLOCK_SCHEMA, TRANSACTION_SCHEMA
 
 console = Console()
 
@@ -45,8 +52,7 @@ def list(ctx, block_type, output_format):
                 return
 
             limited_results = result.items[: config.max_items]
-            output = format_output(limited_results, format_type, "Recent Blocks")
-            console.print(output)
+            print_output(limited_results, format_type, "Recent Blocks")
 
             if len(result.items) > config.max_items:
                 console.print(
@@ -60,6 +66,9 @@ def list(ctx, block_type, output_format):
 
 @block_group.command()
 @click.argument("block_number_or_hash")
+@click.option(
+    "--full", is_flag=True, help="Also fetch all transactions and withdrawals"
+)
 @click.option(
     "--format",
     "-f",
@@ -68,19 +77,277 @@ def list(ctx, block_type, output_format):
     help="Output format (overrides config)",
 )
 @click.pass_context
-def info(ctx, block_number_or_hash, output_format):
+def info(ctx, block_number_or_hash, full, output_format):
     """Get block details"""
     config = ctx.obj["config"]
     format_type = output_format or config.output_format
 
     try:
         with BlockScoutClient(config.base_url, config.timeout) as client:
-            with console.status(f"Fetching block {block_number_or_hash}..."):
-                block = client.get_block(block_number_or_hash)
+            if not full:
+                with console.status(f"Fetching block {block_number_or_hash}..."):
+                    block = client.get_block(block_number_or_hash)
+
+                print_output(block, format_type, f"Block: {block_number_or_hash}")
+                return
+
+            with console.status(f"Fetching block bundle {block_number_or_hash}..."):
+                bundle = client.get_block_bundle(block_number_or_hash)
+
+            if format_type == "json":
+                print_output(bundle, format_type)
+                return
+
+            print_output(bundle.block, format_type, f"Block: {block_number_or_hash}")
+            sections = [
+                ("Transactions", bundle.transactions),
+                ("Withdrawals", bundle.withdrawals),
+            ]
+            for title, items in sections:
+                if items:
+                    print_output(items, format_type, f"{title} ({len(items)})")
+            for name, error in bundle.errors.items():
+                console.print(f"⚠️  {name} unavailable: {error}", style="yellow")
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@block_group.command()
+@click.option("--output", "-o", required=True, help="Output Parquet/Feather file path")
+@click.option(
+    "--type",
+    "block_type",
+    type=click.Choice(["block", "uncle", "reorg"]),
+    help="Filter blocks by type",
+)
+@click.option("--max-blocks", type=int, help="Maximum number of blocks, newest first")
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(["parquet", "feather"]),
+    help="Output file format (guessed from the extension by default)",
+)
+@click.option(
+    "--compression", default="zstd", show_default=True, help="Compression codec"
+)
+@click.pass_context
+def export(ctx, output, block_type, max_blocks, export_format, compression):
+    """Stream blocks (newest first) to a Parquet or Feather file"""
+    config = ctx.obj["config"]
+    params = {"type": block_type} if block_type else {}
+
+    try:
+        with BlockScoutClient(config.base_url, config.timeout) as client:
+            rows = stream_export(
+                client.iter_raw_pages("/blocks", params),
+                output,
+                BLOCK_SCHEMA,
+                export_format=export_format,
+                compression=compression,
+                max_rows=max_blocks,
+            )
+            console.print(
+                f"[green]💾 Successfully exported {rows} blocks to {output}[/green]"
+            )
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@block_group.command()
+@click.argument("start", type=int)
+@click.argument("end", type=int)
+@click.option("--db", "db_path", help="SQLite warehouse to ingest into")
+@click.option("--output", "-o", help="Block output file (CSV/NDJSON/Parquet/Feather)")
+@click.option(
+    "--transactions-output", help="Transaction output file (implies --transactions)"
+)
+@click.option(
+    "--transactions", is_flag=True, help="Also fetch the transactions of every block"
+)
+@click.option("--workers", type=int, default=8, show_default=True)
+@click.option(
+    "--shard-size",
+    type=int,
+    default=100,
+    show_default=True,
+    help="Contiguous heights per work item",
+)
+@click.option(
+    "--passes",
+    type=int,
+    default=3,
+    show_default=True,
+    help="Passes over remaining gaps before giving up",
+)
+@click.option("--state", "state_path", help="Resumable state file")
+@click.pass_context
+def backfill(
+    ctx,
+    start,
+    end,
+    db_path,
+    output,
+    transactions_output,
+    transactions,
+    workers,
+    shard_size,
+    passes,
+    state_path,
+):
+    """Fetch blocks START..END concurrently (resumable, rate limited)"""
+    config = ctx.obj["config"]
+    if not db_path and not output:
+        raise click.UsageError("Specify --db and/or --output")
+    transactions = transactions or bool(transactions_output)
+    state_path = state_path or f"{db_path or output}.{start}-{end}.state"
+
+    wh = warehouse.Warehouse(db_path) if db_path else None
+    block_writer = (
+        open_page_writer(part_path(output), BLOCK_SCHEMA, format_from_path(output))
+        if output
+        else None
+    )
+    tx_writer = (
+        open_page_writer(
+            part_path(transactions_output),
+            TRANSACTION_SCHEMA,
+            format_from_path(transactions_output),
+        )
+        if transactions_output
+        else None
+    )
+    blocks_buffer, tx_buffer = [], []
+
+    def sink(block, block_transactions):
+        blocks_buffer.append(block)
+        tx_buffer.extend(block_transactions)
+        if len(blocks_buffer) >= 1000:
+            flush()
+
+    def flush():
+        if wh is not None:
+            wh.insert_blocks(blocks_buffer)
+            wh.insert_transactions(tx_buffer)
+            wh.commit()
+        if block_writer is not None:
+            block_writer.write_items(blocks_buffer)
+            block_writer.flush()
+        if tx_writer is not None:
+            tx_writer.write_items(tx_buffer)
+            tx_writer.flush()
+        blocks_buffer.clear()
+        tx_buffer.clear()
+
+    try:
+        with BlockScoutClient(
+            config.base_url, config.timeout, rate_limit=config.rate_limit
+        ) as client:
+            engine = BlockBackfill(
+                client,
+                start,
+                end,
+                workers=workers,
+                shard_size=shard_size,
+                transactions=transactions,
+                state_path=state_path,
+            )
+            done = engine.bitmap.count()
+            if done:
+                console.print(f"Resuming: {done:,} blocks already done", style="cyan")
+
+            with console.status("Backfilling...") as status:
+                fetched = engine.run(
+                    sink,
+                    max_passes=passes,
+                    progress=lambda completed, total: status.update(
+                        f"Backfilling... {completed:,}/{total:,} blocks"
+                    ),
+                    flush=flush,
+                )
+
+    except (BlockScoutError, ValueError) as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+    finally:
+        for closeable in (wh, block_writer, tx_writer):
+            if closeable is not None:
+                closeable.close()
+
+    console.print(f"✅ Fetched {fetched:,} blocks", style="green")
+    gaps = [f"{a}-{b}" if a != b else str(a) for a, b in engine.bitmap.gaps()]
+    if gaps:
+        console.print(
+            f"⚠️  {len(engine.bitmap) - engine.bitmap.count():,} heights still missing "
+            f"({len(engine.errors)} errors): {', '.join(gaps[:10])}"
+            + (" ..." if len(gaps) > 10 else ""),
+            style="yellow",
+        )
+        console.print(f"Re-run with --state {state_path} to resume", style="yellow")
 
-            output = format_output(block, format_type, f"Block: {block_number_or_hash}")
-            console.print(output)
 
+@block_group.command()
+@click.option(
+    "--transactions", is_flag=True, help="Also fetch the transactions of every block"
+)
+@click.option("--from-height", type=int, help="First height to emit (default: head)")
+@click.option("--count", type=int, help="Stop after this many blocks")
+@click.option(
+    "--window",
+    type=int,
+    default=64,
+    show_default=True,
+    help="Recent blocks kept for reorg detection",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json"]),
+    help="Output format: one line per block, or NDJSON events",
+)
+@click.pass_context
+def follow(ctx, transactions, from_height, count, window, output_format):
+    """Tail new blocks as they are produced, reporting reorgs"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+
+    try:
+        with BlockScoutClient(
+            config.base_url, config.timeout, rate_limit=config.rate_limit
+        ) as client:
+            follower = ChainFollower(
+                client,
+                transactions=transactions,
+                start_height=from_height,
+                window=window,
+            )
+            for event in follower.events(max_blocks=count):
+                if format_type == "json":
+                    click.echo(json.dumps(event.to_dict(), default=str))
+                elif event.kind == "rollback":
+                    console.print(
+                        f"↩️  Rolled back block {event.height} {event.hash}",
+                        style="yellow",
+                    )
+                else:
+                    block = event.block
+                    tx_count = (
+                        len(event.transactions)
+                        if event.transactions is not None
+                        else block.get("transaction_count")
+                    )
+                    console.print(
+                        f"🧱 {block['height']} {block['hash']} "
+                        f"{block.get('timestamp')} txs={tx_count} "
+                        f"[dim](~{follower.block_time:.1f}s blocks)[/dim]"
+                    )
+
+    except KeyboardInterrupt:
+        pass
     except BlockScoutError as e:
         console.print(f"❌ Error: {e}", style="red")
         raise click.Abort()
@@ -0,0 +1,168 @@
+"""Chain-wide feed commands"""
+
+import contextlib
+
+import click
+from rich.console import Console
+from ... import feeds, warehouse
+from ...client import BlockScoutClient
+from ...exceptions import BlockScoutError
+from ...exporters import format_from_path, open_page_writer, part_path
+
+console = Console()
+
+
+@click.group(name="feed")
+def feed_group():
+    """Capture chain-wide token transfers and internal transactions"""
+    pass
+
+
+def feed_options(func):
+    """Options shared by every feed command"""
+    options = [
+        click.option("--output", "-o", help="Output file (CSV/NDJSON/Parquet/...)"),
+        click.option("--db", "db_path", help="SQLite warehouse file"),
+        click.option(
+            "--until-block", type=int, help="Backfill down to this block (inclusive)"
+        ),
+        click.option(
+            "--max-pages", type=int, help="Stop the backfill after this many pages"
+        ),
+        click.option(
+            "--follow",
+            is_flag=True,
+            help="Then keep polling the head for new items (Ctrl-C to stop)",
+        ),
+        click.option(
+            "--interval",
+            type=float,
+            default=5.0,
+            show_default=True,
+            help="Seconds between polls with --follow",
+        ),
+        click.option(
+            "--batch-size",
+            type=int,
+            default=1000,
+            show_default=True,
+            help="Items handed to the output at once",
+        ),
+        click.option(
+            "--state",
+            "state_path",
+            help="Resume state file (default: <output or db>.<feed>.state)",
+        ),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+def _consume(
+    ctx,
+    feed,
+    output,
+    db_path,
+    until_block,
+    max_pages,
+    follow,
+    interval,
+    batch_size,
+    state_path,
+):
+    """Backfill and/or follow one feed into a file or the warehouse"""
+    config = ctx.obj["config"]
+    if bool(output) == bool(db_path):
+        raise click.UsageError("Pass exactly one of --output or --db")
+    state_path = state_path or f"{output or db_path}.{feed}.state"
+
+    try:
+        with contextlib.ExitStack() as stack:
+            client = stack.enter_context(
+                BlockScoutClient(
+                    config.base_url, config.timeout, rate_limit=config.rate_limit
+                )
+            )
+            consumer = feeds.FeedConsumer(
+                client, feed, batch_size=batch_size, state_path=state_path
+            )
+            if output:
+                writer = stack.enter_context(
+                    open_page_writer(
+                        part_path(output),
+                        consumer.feed.schema,
+                        format_from_path(output),
+                    )
+                )
+                sink, flush = writer.write_items, writer.flush
+            else:
+                wh = stack.enter_context(warehouse.Warehouse(db_path))
+                sink, flush = getattr(wh, consumer.feed.insert), wh.commit
+
+            state = consumer.state
+            backfill = not follow or until_block is not None or state.page_params
+            if backfill and state.done:
+                console.print(
+                    f"✅ Backfill already finished with {state.rows:,} items "
+                    f"(remove {state_path} to start over)",
+                    style="green",
+                )
+            elif backfill:
+                if state.page_params:
+                    console.print(
+                        f"Resuming backfill: {state.rows:,} items already written",
+                        style="cyan",
+                    )
+                with console.status(f"Backfilling {feed}...") as status:
+                    rows = consumer.backfill(
+                        sink,
+                        until_block=until_block,
+                        max_pages=max_pages,
+                        progress=lambda n: status.update(
+                            f"Backfilling {feed}... {n:,} items"
+                        ),
+                        flush=flush,
+                    )
+                console.print(f"✅ Backfilled {rows:,} {feed}", style="green")
+
+            if follow:
+                with console.status(f"Following {feed}...") as status:
+                    try:
+                        consumer.follow(
+                            sink,
+                            interval=interval,
+                            progress=lambda n: status.update(
+                                f"Following {feed}... {n:,} new items, "
+                                f"head block {consumer.state.head_block}"
+                            ),
+                            flush=flush,
+                        )
+                    except KeyboardInterrupt:
+                        pass
+                console.print(
+                    f"✅ Stopped at block {consumer.state.head_block}", style="green"
+                )
+
+        if consumer.duplicates:
+            console.print(f"Skipped {consumer.duplicates:,} duplicates", style="cyan")
+
+    except (BlockScoutError, ValueError) as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@feed_group.command(name="token-transfers")
+@feed_options
+@click.pass_context
+def token_transfers(ctx, **options):
+    """Token transfers of the whole chain, deduplicated by (tx, log index)"""
+    _consume(ctx, "token-transfers", **options)
+
+
+@feed_group.command(name="internal-transactions")
+@feed_options
+@click.pass_context
+def internal_transactions(ctx, **options):
+    """Internal transactions of the whole chain, deduplicated by (tx, index)"""
+    _consume(ctx, "internal-transactions", **options)
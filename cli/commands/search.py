@@ -2,9 +2,10 @@
 
 import click
 from rich.console import Console
-from ..formatters import format_output
+from ..formatters import print_output
 from ...client import BlockScoutClient
 from ...exceptions import BlockScoutError
+from ...registry import SOURCES, TokenRegistry, default_registry_path
 
 console = Console()
 
@@ -42,10 +43,7 @@ def query(ctx, query, output_format):
             # Limit results
             limited_results = results.items[: config.max_items]
 
-            output = format_output(
-                limited_results, format_type, f"Search Results for '{query}'"
-            )
-            console.print(output)
+            print_output(limited_results, format_type, f"Search Results for '{query}'")
 
             if len(results.items) > config.max_items:
                 console.print(
@@ -79,3 +77,103 @@ def redirect(ctx, query):
     except BlockScoutError as e:
         console.print(f"❌ Error: {e}", style="red")
         raise click.Abort()
+
+
+registry_option = click.option(
+    "--registry",
+    "registry_path",
+    help="Registry file (default: ~/.blockscout/registry/<chain>.db)",
+)
+
+
+@search_group.command()
+@click.argument("query")
+@registry_option
+@click.option(
+    "--limit", type=int, default=10, show_default=True, help="Maximum results"
+)
+@click.option(
+    "--fallback/--no-fallback",
+    default=True,
+    help="Ask the server when nothing matches locally",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def local(ctx, query, registry_path, limit, fallback, output_format):
+    """Search tokens and contracts in the local registry"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+
+    try:
+        with BlockScoutClient(config.base_url, config.timeout) as client:
+            with TokenRegistry(
+                registry_path or default_registry_path(config.base_url)
+            ) as registry:
+                client.registry = registry
+                results = client.search_local(query, limit, fallback=fallback)
+
+        if not results:
+            console.print("No results found.", style="yellow")
+            return
+        print_output(results, format_type, f"Local Results for '{query}'")
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@search_group.command(name="refresh-registry")
+@registry_option
+@click.option(
+    "--source",
+    "sources",
+    type=click.Choice(SOURCES),
+    multiple=True,
+    help="Lists to page (default: all)",
+)
+@click.option("--max-pages", type=int, help="Stop each list after this many pages")
+@click.option(
+    "--max-age",
+    type=int,
+    help="Skip lists refreshed less than this many seconds ago",
+)
+@click.pass_context
+def refresh_registry(ctx, registry_path, sources, max_pages, max_age):
+    """Page tokens and verified contracts into the local search registry"""
+    config = ctx.obj["config"]
+    registry_path = registry_path or default_registry_path(config.base_url)
+
+    try:
+        with BlockScoutClient(
+            config.base_url, config.timeout, rate_limit=config.rate_limit
+        ) as client:
+            with TokenRegistry(registry_path) as registry:
+                with console.status("Refreshing registry...") as status:
+                    counts = registry.refresh(
+                        client,
+                        sources or SOURCES,
+                        max_age=max_age,
+                        max_pages=max_pages,
+                        progress=lambda source, n: status.update(
+                            f"Refreshing registry... {n:,} {source}"
+                        ),
+                    )
+                total = len(registry)
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+    if not counts:
+        console.print(f"Registry is up to date ({total:,} entries)", style="cyan")
+        return
+    summary = ", ".join(f"{rows:,} {source}" for source, rows in counts.items())
+    console.print(
+        f"✅ Refreshed {summary}; {total:,} entries in {registry_path}", style="green"
+    )
@@ -0,0 +1,286 @@
+"""Chain statistics commands"""
+
+import math
+
+import click
+from rich.console import Console
+from ..formatters import dataframe_rows, print_output
+from ...client import BlockScoutClient
+from ...exceptions import BlockScoutError
+from ...exporters import export_dataframe
+from ...gas import DEFAULT_PERCENTILES, fetch_gas_frame
+from ...timeseries import CHART_MAX_AGE, DEFAULT_ROOT, TimeSeriesCache
+from ...utils import format_token_amount
+
+console = Console()
+
+GWEI = 10**9
+
+
+@click.group(name="stats")
+def stats_group():
+    """Chain statistics commands"""
+    pass
+
+
+def _gwei(value: float) -> str:
+    return f"{value / GWEI:,.3f}"
+
+
+@stats_group.command()
+@click.option("--from", "start", type=int, required=True, help="First block height")
+@click.option("--to", "end", type=int, required=True, help="Last block height")
+@click.option(
+    "--transactions/--no-transactions",
+    default=False,
+    help="Also fetch transactions for gas price percentiles (much slower)",
+)
+@click.option(
+    "--window",
+    type=click.IntRange(min=1),
+    default=100,
+    show_default=True,
+    help="Moving-average window in blocks",
+)
+@click.option(
+    "--bins", type=int, default=10, show_default=True, help="Utilization bins"
+)
+@click.option(
+    "--workers", type=int, default=8, show_default=True, help="Concurrent requests"
+)
+@click.option(
+    "--output",
+    "-o",
+    help="Write per-block gas columns to a file (CSV/NDJSON/Parquet/Feather)",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def gas(ctx, start, end, transactions, window, bins, workers, output, output_format):
+    """Gas usage and fee statistics of a block range"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+    if end < start:
+        raise click.BadParameter("--to must be >= --from")
+
+    try:
+        with BlockScoutClient(
+            config.base_url, config.timeout, rate_limit=config.rate_limit
+        ) as client:
+            with console.status("Fetching blocks...") as status:
+                frame = fetch_gas_frame(
+                    client,
+                    start,
+                    end,
+                    workers=workers,
+                    transactions=transactions,
+                    progress=lambda done, total: status.update(
+                        f"Fetching blocks... {done:,}/{total:,}"
+                    ),
+                )
+
+        if not len(frame):
+            console.print("No blocks found.", style="yellow")
+            return
+
+        # A range shorter than the window averages over the whole range
+        window = min(window, len(frame))
+        summary = frame.summary()
+        overview = {
+            "blocks": summary["blocks"],
+            "range": f"{summary['first_block']}-{summary['last_block']}",
+            "transactions": summary["transactions"],
+            "gas_used": summary["gas_used"],
+            "mean_utilization": f"{summary['mean_utilization']:.2%}",
+        }
+        utilization_ma = frame.moving_average("utilization", window)[-1]
+        if not math.isnan(utilization_ma):
+            overview[f"utilization_ma{window}"] = f"{utilization_ma:.2%}"
+        # Missing before EIP-1559
+        base_fee_ma = frame.moving_average("base_fee_per_gas", window)[-1]
+        if not math.isnan(base_fee_ma):
+            overview[f"base_fee_ma{window}_gwei"] = _gwei(base_fee_ma)
+        overview["burnt_fees"] = format_token_amount(summary["burnt_fees"], 18)
+        overview["priority_fees"] = format_token_amount(summary["priority_fees"], 18)
+
+        percentile_rows = []
+        for name, label in (
+            ("base_fee_per_gas", "base fee (gwei)"),
+            ("utilization", "utilization (%)"),
+            ("tx_gas_price", "gas price (gwei)"),
+        ):
+            if name == "tx_gas_price" and not frame.transaction_count:
+                continue
+            percentiles = frame.percentiles(name)
+            scale = 100 if name == "utilization" else 1 / GWEI
+            row = {"metric": label}
+            for p in DEFAULT_PERCENTILES:
+                row[f"p{p}"] = f"{percentiles[p] * scale:,.3f}"
+            percentile_rows.append(row)
+
+        counts, edges = frame.histogram("utilization", bins=bins)
+        histogram_rows = [
+            {
+                "utilization": f"{low:.0%}-{high:.0%}",
+                "blocks": int(count),
+                "share": f"{count / len(frame):.1%}",
+            }
+            for low, high, count in zip(edges[:-1], edges[1:], counts)
+        ]
+
+        if format_type == "table":
+            print_output(
+                [{"metric": k, "value": v} for k, v in overview.items()],
+                format_type,
+                f"Gas: blocks {start}-{end}",
+            )
+            print_output(percentile_rows, format_type, "Percentiles")
+            peak = max(int(counts.max()), 1)
+            for row in histogram_rows:
+                row[""] = "█" * round(40 * row["blocks"] / peak)
+            print_output(histogram_rows, format_type, "Utilization")
+        elif format_type == "json":
+            print_output(
+                {
+                    "summary": overview,
+                    "percentiles": percentile_rows,
+                    "utilization": histogram_rows,
+                },
+                format_type,
+            )
+        else:
+            # One CSV document: the percentile rows; use -o for per-block data
+            print_output(percentile_rows, format_type)
+
+        if output:
+            rows_written = export_dataframe(
+                frame.to_pandas(moving_average=window), output
+            )
+            console.print(f"✅ Wrote {rows_written:,} blocks to {output}", style="green")
+
+        for height, error in sorted(frame.errors.items())[:10]:
+            console.print(f"⚠️  Block {height}: {error}", style="yellow")
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+def _print_series(df, output, output_format, limit, title):
+    if output:
+        rows_written = export_dataframe(df, output)
+        console.print(f"✅ Wrote {rows_written:,} rows to {output}", style="green")
+        return
+    if df.empty:
+        console.print("No data.", style="yellow")
+        return
+    print_output(dataframe_rows(df, limit), output_format, title)
+
+
+@stats_group.command()
+@click.argument("chart", type=click.Choice(["transactions", "market"]))
+@click.option(
+    "--cache",
+    default=DEFAULT_ROOT,
+    show_default=True,
+    help="Time-series cache directory",
+)
+@click.option(
+    "--max-age",
+    type=int,
+    default=CHART_MAX_AGE,
+    show_default=True,
+    help="Seconds before the cached chart is refreshed",
+)
+@click.option("--offline", is_flag=True, help="Only read the cache")
+@click.option(
+    "--limit", type=int, default=30, show_default=True, help="Days to show (0 for all)"
+)
+@click.option("--output", "-o", help="Write the whole series to a file")
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def chart(ctx, chart, cache, max_age, offline, limit, output, output_format):
+    """Daily transaction or market chart, cached and refreshed incrementally"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+
+    try:
+        with BlockScoutClient(
+            config.base_url, config.timeout, rate_limit=config.rate_limit
+        ) as client:
+            series = TimeSeriesCache(client, cache)
+            with console.status(f"Refreshing {chart} chart..."):
+                if chart == "transactions":
+                    df = series.transactions_chart(None if offline else max_age)
+                else:
+                    df = series.market_chart(None if offline else max_age)
+
+        _print_series(df, output, format_type, limit, f"Chart: {chart}")
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@stats_group.command()
+@click.option(
+    "--cache",
+    default=DEFAULT_ROOT,
+    show_default=True,
+    help="Time-series cache directory",
+)
+@click.option(
+    "--max-age",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Seconds before a new snapshot is taken",
+)
+@click.option("--history", type=int, help="Show the last N cached snapshots instead")
+@click.option("--output", "-o", help="Write every cached snapshot to a file")
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def counters(ctx, cache, max_age, history, output, output_format):
+    """Chain-wide counters, with every snapshot kept in the local cache"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+
+    try:
+        with BlockScoutClient(
+            config.base_url, config.timeout, rate_limit=config.rate_limit
+        ) as client:
+            with console.status("Fetching counters..."):
+                df = TimeSeriesCache(client, cache).stats(max_age)
+
+        if output or history:
+            _print_series(df, output, format_type, history, "Counters")
+            return
+        latest = dataframe_rows(df, 1)[0]
+        print_output(
+            [{"metric": k, "value": v} for k, v in latest.items()]
+            if format_type == "table"
+            else latest,
+            format_type,
+            "Counters",
+        )
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
@@ -0,0 +1,221 @@
+"""Sync commands"""
+
+import sqlite3
+
+import click
+from rich.console import Console
+from ..formatters import print_output
+from ... import warehouse
+from ...client import BlockScoutClient
+from ...exceptions import BlockScoutError
+
+console = Console()
+
+db_option = click.option(
+    "--db",
+    "db_path",
+    default="blockscout.db",
+    show_default=True,
+    help="SQLite warehouse file",
+)
+max_pages_option = click.option(
+    "--max-pages",
+    type=int,
+    help="Pages per stream for new items, and as many again for older history",
+)
+full_option = click.option(
+    "--full",
+    is_flag=True,
+    help="Re-ingest everything instead of stopping at synced data",
+)
+
+
+@click.group(name="sync")
+def sync_group():
+    """Ingest chain data into a local SQLite warehouse"""
+    pass
+
+
+def _run(ctx, label, sync):
+    """Open the client and warehouse, run one sync and report row counts"""
+    config = ctx.obj["config"]
+
+    try:
+        with BlockScoutClient(config.base_url, config.timeout) as client:
+            with warehouse.Warehouse(ctx.params["db_path"]) as wh:
+                with console.status(f"Syncing {label}...") as status:
+                    counts = sync(
+                        client,
+                        wh,
+                        lambda n: status.update(f"Syncing {label}... {n:,} rows"),
+                    )
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+    if not isinstance(counts, dict):
+        counts = {label: counts}
+    summary = ", ".join(f"{rows:,} {name}" for name, rows in counts.items())
+    console.print(f"✅ Synced {summary} into {ctx.params['db_path']}", style="green")
+
+
+@sync_group.command()
+@db_option
+@max_pages_option
+@full_option
+@click.pass_context
+def blocks(ctx, db_path, max_pages, full):
+    """Ingest the latest blocks"""
+    _run(
+        ctx,
+        "blocks",
+        lambda client, wh, progress: warehouse.sync_blocks(
+            client, wh, max_pages=max_pages, full=full, progress=progress
+        ),
+    )
+
+
+@sync_group.command()
+@click.argument("address_hash")
+@db_option
+@max_pages_option
+@full_option
+@click.pass_context
+def address(ctx, address_hash, db_path, max_pages, full):
+    """Ingest transactions and token transfers of an address"""
+    _run(
+        ctx,
+        f"address {address_hash}",
+        lambda client, wh, progress: warehouse.sync_address(
+            client, wh, address_hash, max_pages=max_pages, full=full, progress=progress
+        ),
+    )
+
+
+@sync_group.command()
+@click.argument("address_hash")
+@db_option
+@click.option("--holders/--no-holders", default=True, help="Refresh token holders")
+@click.option("--transfers/--no-transfers", default=True, help="Ingest token transfers")
+@max_pages_option
+@full_option
+@click.pass_context
+def token(ctx, address_hash, db_path, holders, transfers, max_pages, full):
+    """Ingest a token with its holders and transfers"""
+    _run(
+        ctx,
+        f"token {address_hash}",
+        lambda client, wh, progress: warehouse.sync_token(
+            client,
+            wh,
+            address_hash,
+            holders=holders,
+            transfers=transfers,
+            max_pages=max_pages,
+            full=full,
+            progress=progress,
+        ),
+    )
+
+
+@sync_group.command()
+@click.argument("addresses", nargs=-1, required=True)
+@db_option
+@max_pages_option
+@full_option
+@click.pass_context
+def logs(ctx, addresses, db_path, max_pages, full):
+    """Ingest event logs of one or more contract addresses"""
+    _run(
+        ctx,
+        "logs",
+        lambda client, wh, progress: {
+            f"logs of {address_hash}": rows
+            for address_hash, rows in warehouse.sync_logs(
+                client, wh, addresses, max_pages=max_pages, full=full, progress=progress
+            ).items()
+        },
+    )
+
+
+@sync_group.command()
+@click.argument("address_hash", required=False)
+@db_option
+@click.option(
+    "--event",
+    help='Event signature (e.g. "Transfer(address,address,uint256)") or topic0',
+)
+@click.option("--from-block", type=int, help="First block (inclusive)")
+@click.option("--to-block", type=int, help="Last block (inclusive)")
+@click.option("--limit", type=int, help="Maximum number of logs")
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def events(
+    ctx, address_hash, db_path, event, from_block, to_block, limit, output_format
+):
+    """Query stored event logs by contract, event signature and block range"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+
+    try:
+        with warehouse.Warehouse(db_path) as wh:
+            rows = wh.query_logs(
+                address_hash,
+                event=event,
+                from_block=from_block,
+                to_block=to_block,
+                limit=limit,
+            )
+    except (sqlite3.Error, ValueError) as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+    print_output(rows, format_type, f"Logs ({len(rows)})")
+
+
+@sync_group.command()
+@click.argument("sql")
+@db_option
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def query(ctx, sql, db_path, output_format):
+    """Run a SQL query against the warehouse"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+
+    try:
+        with warehouse.Warehouse(db_path) as wh:
+            rows = wh.query(sql)
+    except sqlite3.Error as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+    print_output(rows, format_type, "Query Results")
+
+
+@sync_group.command()
+@db_option
+@click.pass_context
+def status(ctx, db_path):
+    """Show row counts of the warehouse tables"""
+    with warehouse.Warehouse(db_path) as wh:
+        counts = wh.counts()
+
+    print_output(
+        [{"table": name, "rows": rows} for name, rows in counts.items()],
+        "table",
+        f"Warehouse {db_path}",
+    )
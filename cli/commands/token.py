@@ -1,10 +1,30 @@
 """Token commands"""
 
+import heapq
+import os
+
 import click
 from rich.console import Console
-from ..formatters import format_output
+from rich.live import Live
+from ..formatters import format_output, print_output, stream_export
+from ... import analytics, balances, nft, snapshots
 from ...client import BlockScoutClient
 from ...exceptions import BlockScoutError
+from ...exporters import (
+    CsvPageWriter,
+    format_from_path,
+    open_page_writer,
+    part_path,
+)
+from ...schemas import (
+    HOLDER_CHANGE_SCHEMA,
+    HOLDER_SCHEMA,
+    NFT_INSTANCE_SCHEMA,
+    NFT_METADATA_SCHEMA,
+    TOKEN_TRANSFER_SCHEMA,
+)
+from ...models.records import unpack_hash
+from ...utils import format_token_amount, parse_token_amount
 
 console = Console()
 
@@ -43,8 +63,7 @@ def list(ctx, query, token_type, output_format):
                 return
 
             limited_results = result.items[: config.max_items]
-            output = format_output(limited_results, format_type, "Tokens")
-            console.print(output)
+            print_output(limited_results, format_type, "Tokens")
 
             if len(result.items) > config.max_items:
                 console.print(
@@ -76,8 +95,7 @@ def info(ctx, address_hash, output_format):
             with console.status(f"Fetching token info for {address_hash}..."):
                 token = client.get_token(address_hash)
 
-            output = format_output(token, format_type, f"Token: {address_hash}")
-            console.print(output)
+            print_output(token, format_type, f"Token: {address_hash}")
 
     except BlockScoutError as e:
         console.print(f"❌ Error: {e}", style="red")
@@ -100,7 +118,10 @@ def info(ctx, address_hash, output_format):
     type=click.Choice(["table", "json", "csv"]),
     help="Output format (overrides config)",
 )
-@click.option("--save-to", help="Save results to file (CSV format)")
+@click.option(
+    "--save-to",
+    help="Save results to file (format from extension: csv, ndjson, parquet, feather)",
+)
 @click.pass_context
 def holders(ctx, address_hash, limit, fetch_all, output_format, save_to):
     """Get token holders with pagination support"""
@@ -120,6 +141,20 @@ def holders(ctx, address_hash, limit, fetch_all, output_format, save_to):
 
     try:
         with BlockScoutClient(config.base_url, config.timeout) as client:
+            if save_to:
+                rows = stream_export(
+                    client.iter_raw_pages(
+                        f"/tokens/{address_hash}/holders",
+                        max_pages=None if fetch_all else 1,
+                    ),
+                    save_to,
+                    HOLDER_SCHEMA,
+                    export_format=format_from_path(save_to),
+                    max_rows=actual_limit,
+                )
+                console.print(f"[green]💾 Saved {rows} holders to {save_to}[/green]")
+                return
+
             if fetch_all:
                 with console.status(
                     f"Fetching ALL holders for token {address_hash} (this may take time)..."
@@ -140,25 +175,13 @@ def holders(ctx, address_hash, limit, fetch_all, output_format, save_to):
             total_holders = len(result.items)
             console.print(f"[green]✅ Found {total_holders} holders[/green]")
 
-            # Save to file if requested
-            if save_to:
-                import pandas as pd
-
-                df = pd.DataFrame([holder.to_dict() for holder in result.items])
-                df.to_csv(save_to, index=False)
-                console.print(
-                    f"[green]💾 Saved {total_holders} holders to {save_to}[/green]"
-                )
-                return
-
             # Display results
             display_limit = min(50, total_holders)  # Limit display for readability
             display_items = result.items[:display_limit]
 
-            output = format_output(
+            print_output(
                 display_items, format_type, f"Token Holders for {address_hash}"
             )
-            console.print(output)
 
             if total_holders > display_limit:
                 console.print(
@@ -208,10 +231,9 @@ def holders_interactive(ctx, address_hash, page_size, output_format):
                 console.print(
                     f"\n[bold]Page {page_num} - {len(result.items)} holders[/bold]"
                 )
-                output = format_output(
+                print_output(
                     result.items, format_type, f"Token Holders - Page {page_num}"
                 )
-                console.print(output)
 
                 # Check if there are more pages
                 if not result.next_page_params:
@@ -229,28 +251,32 @@ def holders_interactive(ctx, address_hash, page_size, output_format):
                 if choice == "q":
                     break
                 elif choice == "a":
-                    # Fetch all remaining pages
-                    all_holders = list(result.items)
-                    current_params = result.next_page_params
-
-                    with console.status("Fetching all remaining holders..."):
-                        while current_params:
-                            page_result = client.get_token_holders_paginated(
-                                address_hash, current_params
-                            )
-                            if not page_result.items:
-                                break
-                            all_holders.extend(page_result.items)
-                            current_params = page_result.next_page_params
-
-                    # Save to CSV
-                    filename = f"holders_{address_hash}_{len(all_holders)}_total.csv"
-                    import pandas as pd
-
-                    df = pd.DataFrame([holder.to_dict() for holder in all_holders])
-                    df.to_csv(filename, index=False)
+                    # Stream current and remaining pages straight to disk
+                    partial = f"holders_{address_hash}.csv.partial"
+                    with CsvPageWriter(partial, HOLDER_SCHEMA) as writer:
+                        writer.write_items(
+                            [
+                                holder.model_dump(by_alias=True)
+                                for holder in result.items
+                            ]
+                        )
+                        with console.status(
+                            "Fetching all remaining holders..."
+                        ) as status:
+                            for page in client.iter_raw_pages(
+                                f"/tokens/{address_hash}/holders",
+                                page_params=result.next_page_params,
+                            ):
+                                writer.write_page(page)
+                                status.update(
+                                    f"Fetching all remaining holders... "
+                                    f"{writer.rows_written:,} rows written"
+                                )
+
+                    filename = f"holders_{address_hash}_{writer.rows_written}_total.csv"
+                    os.replace(partial, filename)
                     console.print(
-                        f"[green]💾 Saved {len(all_holders)} holders to {filename}[/green]"
+                        f"[green]💾 Saved {writer.rows_written} holders to {filename}[/green]"
                     )
                     break
                 elif choice == "n":
@@ -269,13 +295,37 @@ def holders_interactive(ctx, address_hash, page_size, output_format):
 
 @token_group.command()
 @click.argument("address_hash")
-@click.option("--output", "-o", required=True, help="Output CSV file path")
-@click.option("--max-holders", type=int, help="Maximum number of holders to export")
-@click.option("--min-balance", type=float, help="Minimum token balance to include")
+@click.option("--output", "-o", required=True, help="Output file path")
+@click.option(
+    "--max-holders",
+    "--top",
+    "max_holders",
+    type=int,
+    help="Export only the top N holders (stops paginating once reached)",
+)
+@click.option(
+    "--min-balance",
+    help="Minimum token balance to include, in token units (e.g. 1000.5)",
+)
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(["csv", "ndjson", "parquet", "feather"]),
+    help="Output file format (guessed from the extension by default)",
+)
+@click.option(
+    "--compression",
+    default="zstd",
+    show_default=True,
+    help="Compression codec for Parquet/Feather output",
+)
 @click.pass_context
-def export_holders(ctx, address_hash, output, max_holders, min_balance):
-    """Export token holders to CSV file with filtering options"""
+def export_holders(
+    ctx, address_hash, output, max_holders, min_balance, export_format, compression
+):
+    """Export token holders to CSV, NDJSON, Parquet or Feather with filtering options"""
     config = ctx.obj["config"]
+    export_format = export_format or format_from_path(output)
 
     try:
         with BlockScoutClient(config.base_url, config.timeout) as client:
@@ -283,70 +333,63 @@ def export_holders(ctx, address_hash, output, max_holders, min_balance):
                 f"[cyan]🔍 Exporting holders for token {address_hash}...[/cyan]"
             )
 
-            with console.status(
-                "Fetching all holders (this may take several minutes)..."
-            ):
-                result = client.get_token_holders(
-                    address_hash, limit=max_holders, all_pages=True
+            token = client.get_token(address_hash)
+            decimals = token.decimals or 0
+            try:
+                min_value = (
+                    parse_token_amount(min_balance, decimals) if min_balance else None
                 )
+            except ValueError as e:
+                raise click.BadParameter(str(e), param_hint="--min-balance")
+
+            # Holders arrive in descending order: the first one is the max and
+            # the last one the min
+            stats = {"count": 0, "total": 0, "max": None, "min": None}
+
+            def track_holder(item):
+                value = int(item["value"])
+                stats["count"] += 1
+                stats["total"] += value
+                if stats["max"] is None:
+                    stats["max"] = value
+                stats["min"] = value
+                return True
+
+            rows = stream_export(
+                client.iter_token_holder_pages(
+                    address_hash, min_value=min_value, limit=max_holders
+                ),
+                output,
+                HOLDER_SCHEMA,
+                export_format=export_format,
+                compression=compression,
+                item_filter=track_holder,
+            )
 
-            if not result.items:
-                console.print("No holders found.", style="yellow")
-                return
-
-            holders_data = []
-            total_holders = len(result.items)
-
-            console.print(f"[green]✅ Found {total_holders} holders[/green]")
-
-            # Process and filter holders
-            with console.status("Processing holder data..."):
-                for holder in result.items:
-                    holder_dict = holder.to_dict()
-
-                    # Apply minimum balance filter
-                    if min_balance:
-                        try:
-                            balance = float(holder_dict.get("value", 0))
-                            if balance < min_balance:
-                                continue
-                        except (ValueError, TypeError):
-                            continue
-
-                    holders_data.append(holder_dict)
-
-            if not holders_data:
+            if not rows:
                 console.print(
                     "[yellow]No holders match the specified criteria[/yellow]"
                 )
                 return
 
-            # Save to CSV
-            import pandas as pd
-
-            df = pd.DataFrame(holders_data)
-            df.to_csv(output, index=False)
-
             console.print(
-                f"[green]💾 Successfully exported {len(holders_data)} holders to {output}[/green]"
+                f"[green]💾 Successfully exported {rows} holders to {output}[/green]"
             )
 
             # Show summary statistics
-            if "value" in df.columns:
-                try:
-                    df["value_numeric"] = pd.to_numeric(df["value"], errors="coerce")
-                    console.print(f"[cyan]📊 Summary Statistics:[/cyan]")
-                    console.print(f"  Total holders: {len(holders_data)}")
-                    console.print(
-                        f"  Average balance: {df['value_numeric'].mean():.2f}"
-                    )
-                    console.print(
-                        f"  Median balance: {df['value_numeric'].median():.2f}"
-                    )
-                    console.print(f"  Max balance: {df['value_numeric'].max():.2f}")
-                    console.print(f"  Min balance: {df['value_numeric'].min():.2f}")
-                except Exception:
-                    pass
+            if stats["count"]:
+                console.print(f"[cyan]📊 Summary Statistics:[/cyan]")
+                console.print(f"  Total holders: {rows}")
+                console.print(
+                    "  Average balance: "
+                    f"{format_token_amount(stats['total'] // stats['count'], decimals)}"
+                )
+                console.print(
+                    f"  Max balance: {format_token_amount(stats['max'], decimals)}"
+                )
+                console.print(
+                    f"  Min balance: {format_token_amount(stats['min'], decimals)}"
+                )
 
     except BlockScoutError as e:
         console.print(f"❌ Error: {e}", style="red")
@@ -378,10 +421,9 @@ def transfers(ctx, address_hash, output_format):
                 return
 
             limited_results = result.items[: config.max_items]
-            output = format_output(
+            print_output(
                 limited_results, format_type, f"Token Transfers for {address_hash}"
             )
-            console.print(output)
 
             if len(result.items) > config.max_items:
                 console.print(
@@ -393,6 +435,448 @@ def transfers(ctx, address_hash, output_format):
         raise click.Abort()
 
 
+@token_group.command()
+@click.argument("address_hash")
+@click.option("--output", "-o", required=True, help="Output Parquet/Feather file path")
+@click.option("--max-transfers", type=int, help="Maximum number of transfers to export")
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(["parquet", "feather"]),
+    help="Output file format (guessed from the extension by default)",
+)
+@click.option(
+    "--compression",
+    default="zstd",
+    show_default=True,
+    help="Compression codec",
+)
+@click.pass_context
+def export_transfers(
+    ctx, address_hash, output, max_transfers, export_format, compression
+):
+    """Stream all token transfers to a Parquet or Feather file"""
+    config = ctx.obj["config"]
+
+    try:
+        with BlockScoutClient(config.base_url, config.timeout) as client:
+            rows = stream_export(
+                client.iter_raw_pages(f"/tokens/{address_hash}/transfers"),
+                output,
+                TOKEN_TRANSFER_SCHEMA,
+                export_format=export_format,
+                compression=compression,
+                max_rows=max_transfers,
+            )
+            console.print(
+                f"[green]💾 Successfully exported {rows} transfers to {output}[/green]"
+            )
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@token_group.command()
+@click.argument("address_hash")
+@click.option(
+    "--top",
+    "top_n",
+    default="10,100,1000",
+    show_default=True,
+    help="Comma-separated top-N cut-offs",
+)
+@click.option("--max-holders", type=int, help="Only consider the top N holders")
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def holder_stats(ctx, address_hash, top_n, max_holders, output_format):
+    """Stream holder concentration statistics (Gini, HHI, top-N shares)"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+
+    try:
+        top_n = [int(n) for n in top_n.split(",") if n.strip()]
+    except ValueError:
+        raise click.BadParameter(
+            "expected comma-separated integers", param_hint="--top"
+        )
+
+    def summary_table(stats):
+        return format_output(
+            [{"metric": k, "value": v} for k, v in stats.summary().items()],
+            "table",
+            f"Holder Statistics for {address_hash}",
+        )
+
+    try:
+        with BlockScoutClient(config.base_url, config.timeout) as client:
+            if format_type == "table":
+                with Live(console=console, refresh_per_second=4) as live:
+                    stats = analytics.holder_stats(
+                        client,
+                        address_hash,
+                        top_n=top_n,
+                        limit=max_holders,
+                        on_page=lambda s: live.update(summary_table(s)),
+                    )
+                    live.update(summary_table(stats))
+            else:
+                with console.status("Streaming holders...") as status:
+                    stats = analytics.holder_stats(
+                        client,
+                        address_hash,
+                        top_n=top_n,
+                        limit=max_holders,
+                        on_page=lambda s: status.update(
+                            f"Streaming holders... {s.count:,} processed"
+                        ),
+                    )
+                print_output(stats.summary(), format_type)
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@token_group.command()
+@click.argument("address_hash")
+@click.option("--output", "-o", required=True, help="Snapshot file path")
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=1_000_000,
+    show_default=True,
+    help="Holders sorted in memory before spilling to disk",
+)
+@click.pass_context
+def snapshot(ctx, address_hash, output, chunk_size):
+    """Save all holders to an address-sorted snapshot for later diffing"""
+    config = ctx.obj["config"]
+
+    try:
+        with BlockScoutClient(config.base_url, config.timeout) as client:
+            with console.status("Fetching holders...") as status:
+                snap = snapshots.snapshot_token_holders(
+                    client,
+                    address_hash,
+                    output,
+                    chunk_size=chunk_size,
+                    on_page=lambda n: status.update(
+                        f"Fetching holders... {n:,} fetched"
+                    ),
+                )
+
+        console.print(
+            f"✅ Saved {len(snap):,} holders at block {snap.block_number} to {output}",
+            style="green",
+        )
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@token_group.command()
+@click.argument("address_hash")
+@click.option(
+    "--output", "-o", required=True, help="Instance output file (CSV/Parquet/...)"
+)
+@click.option(
+    "--metadata-output",
+    help="Distinct metadata output file (default: <output>.metadata.<ext>)",
+)
+@click.option(
+    "--workers", type=int, default=8, show_default=True, help="Concurrent requests"
+)
+@click.option(
+    "--details/--no-details",
+    default=True,
+    help="Fetch the detail of every instance (slower, fuller metadata)",
+)
+@click.option("--max-pages", type=int, help="Stop after this many pages")
+@click.option(
+    "--state", "state_path", help="Resume state file (default: <output>.state)"
+)
+@click.pass_context
+def harvest(
+    ctx,
+    address_hash,
+    output,
+    metadata_output,
+    workers,
+    details,
+    max_pages,
+    state_path,
+):
+    """Harvest all NFT instances of a collection with deduplicated metadata"""
+    config = ctx.obj["config"]
+    if metadata_output is None:
+        stem, ext = os.path.splitext(output)
+        metadata_output = f"{stem}.metadata{ext}"
+    state_path = state_path or f"{output}.state"
+
+    try:
+        with BlockScoutClient(
+            config.base_url, config.timeout, rate_limit=config.rate_limit
+        ) as client:
+            harvester = nft.NFTHarvester(
+                client,
+                address_hash,
+                workers=workers,
+                details=details,
+                state_path=state_path,
+            )
+            if harvester.state.done:
+                console.print(
+                    f"✅ Already harvested {harvester.state.instances:,} instances "
+                    f"(remove {state_path} to start over)",
+                    style="green",
+                )
+                return
+            if harvester.state.instances:
+                console.print(
+                    f"Resuming: {harvester.state.instances:,} instances already done",
+                    style="cyan",
+                )
+
+            # A resumed harvest writes its new rows next to the earlier ones
+            written_path = part_path(output)
+            instance_writer = open_page_writer(
+                written_path, NFT_INSTANCE_SCHEMA, format_from_path(output)
+            )
+            metadata_writer = open_page_writer(
+                part_path(metadata_output),
+                NFT_METADATA_SCHEMA,
+                format_from_path(metadata_output),
+            )
+
+            def flush():
+                instance_writer.flush()
+                metadata_writer.flush()
+
+            with instance_writer, metadata_writer:
+                with console.status("Harvesting instances...") as status:
+                    harvested = harvester.run(
+                        instance_writer.write_items,
+                        metadata_writer.write_items,
+                        max_pages=max_pages,
+                        progress=lambda n: status.update(
+                            f"Harvesting instances... {n:,} done"
+                        ),
+                        flush=flush,
+                    )
+
+        console.print(
+            f"✅ Harvested {harvested:,} instances "
+            f"({len(harvester.state.metadata_hashes):,} distinct metadata) "
+            f"into {written_path}",
+            style="green",
+        )
+        if not harvester.state.done:
+            console.print(
+                "More instances remain; run again to continue", style="yellow"
+            )
+        for token_id, error in sorted(harvester.errors.items())[:10]:
+            console.print(f"⚠️  Instance {token_id}: {error}", style="yellow")
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
+@token_group.command(name="holders-diff")
+@click.argument("old_snapshot", type=click.Path(exists=True, dir_okay=False))
+@click.argument("new_snapshot", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output", "-o", help="Write every change to a CSV/NDJSON/Parquet/Feather file"
+)
+@click.option(
+    "--show",
+    type=int,
+    default=20,
+    show_default=True,
+    help="Number of largest balance changes to display",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def holders_diff(ctx, old_snapshot, new_snapshot, output, show, output_format):
+    """Compare two holder snapshots: new holders, exited holders and deltas"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+
+    try:
+        old = snapshots.HolderSnapshot(old_snapshot)
+        new = snapshots.HolderSnapshot(new_snapshot)
+    except ValueError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+    if old.token_address != new.token_address:
+        console.print(
+            f"⚠️  Snapshots are for different tokens "
+            f"({old.token_address} vs {new.token_address})",
+            style="yellow",
+        )
+
+    decimals = new.decimals or old.decimals or 0
+    counts = {"new": 0, "exited": 0, "changed": 0}
+    inflow = outflow = 0
+    largest = []
+
+    writer = (
+        open_page_writer(output, HOLDER_CHANGE_SCHEMA, format_from_path(output))
+        if output
+        else None
+    )
+    try:
+        with console.status("Diffing snapshots..."):
+            batch = []
+            for change in snapshots.diff_snapshots(old, new):
+                counts[change.kind] += 1
+                delta = change.delta
+                if delta > 0:
+                    inflow += delta
+                else:
+                    outflow -= delta
+                if show:
+                    entry = (abs(delta), sum(counts.values()), change)
+                    if len(largest) < show:
+                        heapq.heappush(largest, entry)
+                    elif entry > largest[0]:
+                        heapq.heapreplace(largest, entry)
+                if writer is not None:
+                    batch.append(change.to_dict())
+                    if len(batch) >= 10_000:
+                        writer.write_items(batch)
+                        batch = []
+            if writer is not None:
+                writer.write_items(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    summary = {
+        "old_block": old.block_number,
+        "new_block": new.block_number,
+        "old_holders": len(old),
+        "new_holders": len(new),
+        "new": counts["new"],
+        "exited": counts["exited"],
+        "changed": counts["changed"],
+        "inflow": format_token_amount(inflow, decimals),
+        "outflow": format_token_amount(outflow, decimals),
+        "net": format_token_amount(inflow - outflow, decimals),
+    }
+    if format_type == "table":
+        summary = [{"metric": k, "value": v} for k, v in summary.items()]
+    print_output(summary, format_type, "Holder Diff")
+
+    if largest:
+        rows = [
+            {
+                "kind": change.kind,
+                "address": change.address,
+                "token_id": change.token_id,
+                "old_balance": format_token_amount(change.old_value, decimals),
+                "new_balance": format_token_amount(change.new_value, decimals),
+                "delta": format_token_amount(change.delta, decimals),
+            }
+            for _, _, change in sorted(largest, reverse=True)
+        ]
+        print_output(rows, format_type, "Largest Balance Changes")
+
+    if output:
+        console.print(f"✅ Changes written to {output}", style="green")
+
+
+@token_group.command(name="holders-sync")
+@click.argument("snapshot_path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output", "-o", help="Write the updated snapshot here (default: in place)"
+)
+@click.option(
+    "--show",
+    type=int,
+    default=0,
+    help="Display the N largest holders after syncing",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def holders_sync(ctx, snapshot_path, output, show, output_format):
+    """Bring a holder snapshot up to date by applying transfers since its block"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+
+    try:
+        index = balances.BalanceIndex.from_snapshot(
+            snapshots.HolderSnapshot(snapshot_path)
+        )
+    except ValueError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+    start_block = index.block_number
+
+    try:
+        with BlockScoutClient(config.base_url, config.timeout) as client:
+            with console.status(
+                f"Fetching transfers since block {start_block}..."
+            ) as status:
+                applied = index.sync(
+                    client,
+                    on_page=lambda n: status.update(
+                        f"Fetching transfers since block {start_block}... {n:,} fetched"
+                    ),
+                )
+    except (BlockScoutError, ValueError) as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+    count = index.save(output or snapshot_path)
+    console.print(
+        f"✅ Applied {applied:,} transfers (block {start_block} → {index.block_number}), "
+        f"{count:,} holders saved to {output or snapshot_path}",
+        style="green",
+    )
+
+    drift = index.negative_balances()
+    if drift:
+        console.print(
+            f"⚠️  {drift:,} balances went negative; the snapshot has drifted, "
+            "take a fresh one with 'token snapshot'",
+            style="yellow",
+        )
+
+    if show:
+        rows = [
+            {
+                "address": unpack_hash(record.address),
+                "token_id": record.token_id,
+                "balance": format_token_amount(record.value, index.decimals),
+                "is_contract": record.is_contract,
+            }
+            for record in index.top(show)
+        ]
+        print_output(rows, format_type, f"Top {show} Holders")
+
+
 @token_group.command()
 @click.argument("address_hash")
 @click.pass_context
@@ -1,8 +1,12 @@
 """Transaction commands"""
 
+import json
+import os
+
 import click
 from rich.console import Console
-from ..formatters import format_output
+from ..formatters import print_output
+from ...abi import AbiDecoder, AbiRegistry
 from ...client import BlockScoutClient
 from ...exceptions import BlockScoutError
 
@@ -47,8 +51,7 @@ def list(ctx, filter_type, tx_type, method, output_format):
                 return
 
             limited_results = result.items[: config.max_items]
-            output = format_output(limited_results, format_type, "Recent Transactions")
-            console.print(output)
+            print_output(limited_results, format_type, "Recent Transactions")
 
             if len(result.items) > config.max_items:
                 console.print(
@@ -62,6 +65,12 @@ def list(ctx, filter_type, tx_type, method, output_format):
 
 @transaction_group.command()
 @click.argument("tx_hash")
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Also fetch logs, internal transactions, transfers, state changes and summary",
+)
+@click.option("--raw-trace", is_flag=True, help="Include the raw trace (with --full)")
 @click.option(
     "--format",
     "-f",
@@ -70,18 +79,41 @@ def list(ctx, filter_type, tx_type, method, output_format):
     help="Output format (overrides config)",
 )
 @click.pass_context
-def info(ctx, tx_hash, output_format):
+def info(ctx, tx_hash, full, raw_trace, output_format):
     """Get transaction details"""
     config = ctx.obj["config"]
     format_type = output_format or config.output_format
 
     try:
         with BlockScoutClient(config.base_url, config.timeout) as client:
-            with console.status(f"Fetching transaction {tx_hash}..."):
-                transaction = client.get_transaction(tx_hash)
+            if not full:
+                with console.status(f"Fetching transaction {tx_hash}..."):
+                    transaction = client.get_transaction(tx_hash)
+
+                print_output(transaction, format_type, f"Transaction: {tx_hash}")
+                return
+
+            with console.status(f"Fetching transaction bundle {tx_hash}..."):
+                bundle = client.get_transaction_bundle(tx_hash, raw_trace=raw_trace)
+
+            if format_type == "json":
+                print_output(bundle, format_type)
+                return
 
-            output = format_output(transaction, format_type, f"Transaction: {tx_hash}")
-            console.print(output)
+            print_output(bundle.transaction, format_type, f"Transaction: {tx_hash}")
+            sections = [
+                ("Token Transfers", bundle.token_transfers),
+                ("Logs", bundle.logs),
+                ("Internal Transactions", bundle.internal_transactions),
+                ("State Changes", bundle.state_changes),
+            ]
+            for title, items in sections:
+                if items:
+                    print_output(items, format_type, f"{title} ({len(items)})")
+            if bundle.summary is not None:
+                print_output(bundle.summary, format_type, "Summary")
+            for name, error in bundle.errors.items():
+                console.print(f"⚠️  {name} unavailable: {error}", style="yellow")
 
     except BlockScoutError as e:
         console.print(f"❌ Error: {e}", style="red")
@@ -116,10 +148,7 @@ def transfers(ctx, tx_hash, token_type, output_format):
                 return
 
             limited_results = result.items[: config.max_items]
-            output = format_output(
-                limited_results, format_type, f"Token Transfers for {tx_hash}"
-            )
-            console.print(output)
+            print_output(limited_results, format_type, f"Token Transfers for {tx_hash}")
 
             if len(result.items) > config.max_items:
                 console.print(
@@ -129,3 +158,66 @@ def transfers(ctx, tx_hash, token_type, output_format):
     except BlockScoutError as e:
         console.print(f"❌ Error: {e}", style="red")
         raise click.Abort()
+
+
+@transaction_group.command()
+@click.argument("tx_hash")
+@click.option(
+    "--abi-cache",
+    default=os.path.expanduser("~/.blockscout/abi.db"),
+    show_default=True,
+    help="Persistent ABI and selector cache",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["table", "json", "csv"]),
+    help="Output format (overrides config)",
+)
+@click.pass_context
+def decode(ctx, tx_hash, abi_cache, output_format):
+    """Decode transaction input and logs locally with cached ABIs"""
+    config = ctx.obj["config"]
+    format_type = output_format or config.output_format
+
+    try:
+        os.makedirs(os.path.dirname(abi_cache) or ".", exist_ok=True)
+        with BlockScoutClient(config.base_url, config.timeout) as client:
+            with AbiRegistry(abi_cache) as registry:
+                decoder = AbiDecoder(registry, client)
+                with console.status(f"Fetching transaction {tx_hash}..."):
+                    transaction = client.get_transaction(tx_hash)
+                    logs = [
+                        log
+                        for page in client.iter_raw_pages(
+                            f"/transactions/{tx_hash}/logs"
+                        )
+                        for log in page.get("items", [])
+                    ]
+                with console.status("Decoding..."):
+                    call = decoder.decode_inputs([transaction])[0]
+                    events = decoder.decode_logs(logs)
+
+        rows = [
+            {
+                "kind": "function",
+                "index": None,
+                **(call.to_dict() if call else {"name": None, "signature": None}),
+            }
+        ] + [
+            {
+                "kind": "event",
+                "index": log.get("index"),
+                **(event.to_dict() if event else {"name": None, "signature": None}),
+            }
+            for log, event in zip(logs, events)
+        ]
+        if format_type != "json":
+            for row in rows:
+                row["args"] = json.dumps(row.get("args"))
+        print_output(rows, format_type, f"Decoded: {tx_hash}")
+
+    except BlockScoutError as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
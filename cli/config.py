@@ -15,6 +15,7 @@ class Config:
     timeout: int = 30
     output_format: str = "table"  # table, json, csv
     max_items: int = 50
+    rate_limit: Optional[float] = None  # requests per second
 
     @classmethod
     def load(cls, config_path: Optional[str] = None) -> "Config":
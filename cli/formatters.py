@@ -3,7 +3,8 @@
 import json
 import csv
 import io
-from typing import List, Any, Dict, Union
+import sys
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Union
 from rich.console import Console
 from rich.table import Table
 from rich.json import JSON
@@ -79,32 +80,22 @@ class OutputFormatter:
         return json.dumps(data, indent=indent, default=str)
 
     @staticmethod
-    def format_csv(data: List[Dict[str, Any]]) -> str:
-        """Format data as CSV"""
-        if not data:
-            return ""
-
-        # Ensure data is a list
-        if not isinstance(data, list):
-            data = [data]
-
-        # Convert Pydantic models to dicts if needed
-        processed_data = []
+    def write_csv(data: Iterable[Any], stream: IO[str]) -> int:
+        """Write data as CSV to a stream one row at a time"""
+        writer = None
+        rows = 0
         for item in data:
             if hasattr(item, "to_dict"):
-                processed_data.append(item.to_dict())
+                row = item.to_dict()
             elif isinstance(item, dict):
-                processed_data.append(item)
+                row = item
             else:
-                processed_data.append({"value": str(item)})
+                row = {"value": str(item)}
 
-        if not processed_data:
-            return ""
+            if writer is None:
+                writer = csv.DictWriter(stream, fieldnames=row.keys())
+                writer.writeheader()
 
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=processed_data[0].keys())
-        writer.writeheader()
-        for row in processed_data:
             # Convert complex objects to strings for CSV
             csv_row = {}
             for key, value in row.items():
@@ -113,6 +104,21 @@ class OutputFormatter:
                 else:
                     csv_row[key] = str(value) if value is not None else ""
             writer.writerow(csv_row)
+            rows += 1
+        return rows
+
+    @staticmethod
+    def format_csv(data: List[Dict[str, Any]]) -> str:
+        """Format data as CSV"""
+        if not data:
+            return ""
+
+        # Ensure data is a list
+        if not isinstance(data, list):
+            data = [data]
+
+        output = io.StringIO()
+        OutputFormatter.write_csv(data, output)
         return output.getvalue()
 
 
@@ -155,3 +161,64 @@ def format_output(data: Any, format_type: str, title: str = None) -> Union[str,
             return formatter.format_table([converted_data], title)
     else:
         return str(converted_data)
+
+
+def print_output(data: Any, format_type: str, title: str = None) -> None:
+    """Print data in the requested format
+
+    CSV is streamed to stdout row by row instead of being built in memory.
+    """
+    if format_type != "csv":
+        console.print(format_output(data, format_type, title))
+        return
+
+    if hasattr(data, "to_dict") or isinstance(data, (str, dict)):
+        data = [data]
+    elif not hasattr(data, "__iter__"):
+        data = [{"value": str(data)}]
+    OutputFormatter.write_csv(data, sys.stdout)
+    sys.stdout.flush()
+
+
+def dataframe_rows(df: Any, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Rows of a DataFrame for print_output, timestamps as ISO strings
+
+    Midnight-only timestamp columns (daily charts) are shown as dates.
+    """
+    if limit:
+        df = df.tail(limit)
+    df = df.copy()
+    for name in df.columns:
+        column = df[name]
+        if hasattr(column, "dt") and str(column.dtype).startswith("datetime"):
+            daily = bool((column.dt.normalize() == column).all())
+            df[name] = column.dt.strftime("%Y-%m-%d" if daily else "%Y-%m-%dT%H:%M:%SZ")
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict("records")
+
+
+def stream_export(
+    pages: Iterable[Dict[str, Any]],
+    output: str,
+    schema: List[Any],
+    export_format: Optional[str] = None,
+    compression: Optional[str] = "zstd",
+    max_rows: Optional[int] = None,
+    item_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+) -> int:
+    """Stream raw API pages to a columnar file, reporting progress as pages arrive"""
+    from ..exporters import export_pages
+
+    with console.status(f"Exporting to {output}...") as status:
+        return export_pages(
+            pages,
+            output,
+            schema,
+            format=export_format,
+            compression=compression,
+            max_rows=max_rows,
+            item_filter=item_filter,
+            progress=lambda rows: status.update(
+                f"Exporting to {output}... {rows:,} rows"
+            ),
+        )
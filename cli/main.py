@@ -3,7 +3,7 @@
 import click
 from rich.console import Console
 from .config import Config
-from .commands import search, address, transaction, block, token
+from .commands import search, address, transaction, block, token, sync, stats, feed
 
 console = Console()
 
@@ -19,8 +19,9 @@ console = Console()
     help="Output format",
 )
 @click.option("--max-items", type=int, help="Maximum number of items to fetch")
+@click.option("--rate-limit", type=float, help="Maximum API requests per second")
 @click.pass_context
-def cli(ctx, config, base_url, timeout, output_format, max_items):
+def cli(ctx, config, base_url, timeout, output_format, max_items, rate_limit):
     """BlockScout API CLI client"""
     # Load configuration
     ctx.ensure_object(dict)
@@ -35,6 +36,8 @@ def cli(ctx, config, base_url, timeout, output_format, max_items):
         config_obj.output_format = output_format
     if max_items:
         config_obj.max_items = max_items
+    if rate_limit:
+        config_obj.rate_limit = rate_limit
 
     ctx.obj["config"] = config_obj
 
@@ -74,6 +77,7 @@ def show_config(ctx):
     console.print(f"Timeout: {config.timeout}s")
     console.print(f"Output Format: {config.output_format}")
     console.print(f"Max Items: {config.max_items}")
+    console.print(f"Rate Limit: {config.rate_limit or 'unlimited'} req/s")
 
 
 # Add command groups
@@ -82,6 +86,9 @@ cli.add_command(address.address_group)
 cli.add_command(transaction.transaction_group)
 cli.add_command(block.block_group)
 cli.add_command(token.token_group)
+cli.add_command(sync.sync_group)
+cli.add_command(stats.stats_group)
+cli.add_command(feed.feed_group)
 
 if __name__ == "__main__":
     cli()
@@ -1,26 +1,43 @@
 """BlockScout API Client"""
 
 import httpx
-from typing import List, Optional, Dict, Any, Union
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Union
 from urllib.parse import urljoin
 
+from pydantic import ValidationError
+
 from .exceptions import BlockScoutAPIError, BlockScoutError
 from .models import *
+from .rate_limit import RateLimiter
+from .registry import RegistryEntry, TokenRegistry, search_entries
 
 
 class BlockScoutClient:
     """BlockScout API Client"""
 
-    def __init__(self, base_url: str, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        rate_limit: Optional[float] = None,
+    ):
         """
         Initialize BlockScout client
 
         Args:
             base_url: Base URL for BlockScout API (e.g., "https://blockscout.com/poa/core/api/v2/")
             timeout: Request timeout in seconds
+            rate_limit: Maximum requests per second, shared by all threads
+                using this client (None for unlimited)
         """
         self.base_url = base_url.rstrip("/") + "/"
         self.client = httpx.Client(timeout=timeout)
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        # Local search registry used by search_local (in-memory until set)
+        self.registry: Optional[TokenRegistry] = None
 
     def __enter__(self):
         return self
@@ -36,13 +53,19 @@ class BlockScoutClient:
         await self.client.aclose()
 
     def _make_request(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        json: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Make HTTP request to API"""
         url = urljoin(self.base_url, endpoint.lstrip("/"))
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
 
         try:
-            response = self.client.get(url, params=params)
+            response = self.client.request(method, url, params=params, json=json)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
@@ -54,6 +77,46 @@ class BlockScoutClient:
         except Exception as e:
             raise BlockScoutError(f"Request failed: {str(e)}")
 
+    def get_raw(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Get the raw JSON response of any endpoint"""
+        return self._make_request(endpoint, params)
+
+    def iter_raw_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        page_params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over raw JSON pages of a paginated endpoint
+
+        Args:
+            endpoint: API endpoint (e.g., "/tokens/{hash}/holders")
+            params: Query parameters sent with every page
+            max_pages: Stop after this many pages (None for all)
+            page_params: next_page_params to resume from (None for the first page)
+        """
+        next_page_params = page_params
+        pages = 0
+
+        while True:
+            page_params = dict(params or {})
+            if next_page_params:
+                page_params.update(next_page_params)
+
+            data = self._make_request(endpoint, page_params)
+            yield data
+            pages += 1
+
+            next_page_params = data.get("next_page_params")
+            if not next_page_params or not data.get("items"):
+                break
+            if max_pages and pages >= max_pages:
+                break
+
     # Search endpoints
     def search(self, query: str) -> PaginatedResponse:
         """Search for addresses, transactions, blocks, tokens"""
@@ -79,6 +142,26 @@ class BlockScoutClient:
         data = self._make_request("/search/check-redirect", {"q": query})
         return SearchResultRedirect(**data)
 
+    def search_local(
+        self, query: str, limit: int = 10, fallback: bool = True
+    ) -> List[RegistryEntry]:
+        """
+        Search tokens and contracts in the local registry
+
+        On a miss the server search is used instead and its token, contract
+        and named address results are added to the registry. Assign a
+        persistent registry to ``client.registry`` to keep them.
+        """
+        if self.registry is None:
+            self.registry = TokenRegistry()
+        results = self.registry.search(query, limit)
+        if results or not fallback:
+            return results
+        data = self._make_request("/search", {"q": query})
+        found = search_entries(data.get("items", []))
+        self.registry.add(found)
+        return found[:limit]
+
     # Transaction endpoints
     def get_transactions(
         self,
@@ -102,11 +185,148 @@ class BlockScoutClient:
             items=transactions, next_page_params=data.get("next_page_params")
         )
 
+    def get_token_transfers(
+        self, page_params: Optional[Dict] = None
+    ) -> PaginatedResponse:
+        """Get token transfers of the whole chain, newest first"""
+        data = self._make_request("/token-transfers", page_params)
+        transfers = [TokenTransfer(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=transfers, next_page_params=data.get("next_page_params")
+        )
+
+    def get_internal_transactions(
+        self, page_params: Optional[Dict] = None
+    ) -> PaginatedResponse:
+        """Get internal transactions of the whole chain, newest first"""
+        data = self._make_request("/internal-transactions", page_params)
+        internal = [InternalTransaction(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=internal, next_page_params=data.get("next_page_params")
+        )
+
     def get_transaction(self, tx_hash: str) -> Transaction:
         """Get transaction by hash"""
         data = self._make_request(f"/transactions/{tx_hash}")
         return Transaction(**data)
 
+    def _collect_items(
+        self, endpoint: str, model: Any, params: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        """Fetch every page of an endpoint and parse the items"""
+        return [
+            model(**item)
+            for page in self.iter_raw_pages(endpoint, params)
+            for item in page.get("items", [])
+        ]
+
+    def get_transaction_logs(
+        self, tx_hash: str, page_params: Optional[Dict] = None
+    ) -> PaginatedResponse:
+        """Get logs emitted by a transaction"""
+        data = self._make_request(f"/transactions/{tx_hash}/logs", page_params)
+        logs = [Log(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=logs, next_page_params=data.get("next_page_params")
+        )
+
+    def get_transaction_internal_transactions(
+        self, tx_hash: str, page_params: Optional[Dict] = None
+    ) -> PaginatedResponse:
+        """Get internal transactions of a transaction"""
+        data = self._make_request(
+            f"/transactions/{tx_hash}/internal-transactions", page_params
+        )
+        internal = [InternalTransaction(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=internal, next_page_params=data.get("next_page_params")
+        )
+
+    def get_transaction_state_changes(
+        self, tx_hash: str, page_params: Optional[Dict] = None
+    ) -> PaginatedResponse:
+        """Get balance state changes caused by a transaction"""
+        data = self._make_request(f"/transactions/{tx_hash}/state-changes", page_params)
+        changes = [StateChange(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=changes, next_page_params=data.get("next_page_params")
+        )
+
+    def get_transaction_summary(self, tx_hash: str) -> TransactionSummary:
+        """Get the human-readable summary of a transaction"""
+        data = self._make_request(f"/transactions/{tx_hash}/summary")
+        return TransactionSummary(**data)
+
+    def get_transaction_raw_trace(self, tx_hash: str) -> List[Dict[str, Any]]:
+        """Get the raw execution trace of a transaction"""
+        return self._make_request(f"/transactions/{tx_hash}/raw-trace")
+
+    def get_transaction_bundle(
+        self, tx_hash: str, raw_trace: bool = True, max_workers: int = 6
+    ) -> TransactionBundle:
+        """
+        Get a transaction with all its sub-resources, fetched concurrently
+
+        Token transfers, logs, internal transactions, state changes, summary
+        and raw trace are requested in parallel, each following its own
+        pagination. Sub-resources the instance does not support are left
+        empty and reported in ``errors``; only the transaction itself must
+        succeed.
+
+        Args:
+            tx_hash: Transaction hash
+            raw_trace: Also fetch the raw trace (can be large)
+            max_workers: Concurrent requests
+        """
+        base = f"/transactions/{tx_hash}"
+        tasks = {
+            "transaction": lambda: self.get_transaction(tx_hash),
+            "token_transfers": lambda: self._collect_items(
+                f"{base}/token-transfers", TokenTransfer
+            ),
+            "logs": lambda: self._collect_items(f"{base}/logs", Log),
+            "internal_transactions": lambda: self._collect_items(
+                f"{base}/internal-transactions", InternalTransaction
+            ),
+            "state_changes": lambda: self._collect_items(
+                f"{base}/state-changes", StateChange
+            ),
+            "summary": lambda: self.get_transaction_summary(tx_hash),
+        }
+        if raw_trace:
+            tasks["raw_trace"] = lambda: self.get_transaction_raw_trace(tx_hash)
+
+        results, errors = self._run_concurrently(tasks, max_workers)
+        if "transaction" in errors:
+            raise BlockScoutError(errors["transaction"])
+        return TransactionBundle(**results, errors=errors)
+
+    @staticmethod
+    def _run_concurrently(
+        tasks: Dict[str, Any], max_workers: int
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Run named callables in a thread pool; returns (results, errors)
+
+        Request failures and responses that do not match their model are
+        recorded in errors by name; anything else propagates.
+        """
+        results: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(task) for name, task in tasks.items()}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except (BlockScoutError, ValidationError) as e:
+                    errors[name] = str(e)
+        return results, errors
+
     def get_transaction_token_transfers(
         self, tx_hash: str, token_type: Optional[str] = None
     ) -> PaginatedResponse:
@@ -137,11 +357,66 @@ class BlockScoutClient:
             items=transactions, next_page_params=data.get("next_page_params")
         )
 
+    def get_address_logs(
+        self, address_hash: str, page_params: Optional[Dict] = None
+    ) -> PaginatedResponse:
+        """Get logs emitted by a contract address, newest first"""
+        data = self._make_request(f"/addresses/{address_hash}/logs", page_params)
+        logs = [Log(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=logs, next_page_params=data.get("next_page_params")
+        )
+
+    def get_address_token_transfers(
+        self,
+        address_hash: str,
+        token_type: Optional[str] = None,
+        filter_type: Optional[str] = None,
+        page_params: Optional[Dict] = None,
+    ) -> PaginatedResponse:
+        """Get token transfers to or from an address, newest first"""
+        params = dict(page_params or {})
+        if token_type:
+            params["type"] = token_type
+        if filter_type:
+            params["filter"] = filter_type
+        data = self._make_request(f"/addresses/{address_hash}/token-transfers", params)
+        transfers = [TokenTransfer(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=transfers, next_page_params=data.get("next_page_params")
+        )
+
     def get_address_token_balances(self, address_hash: str) -> List[TokenBalance]:
         """Get address token balances"""
         data = self._make_request(f"/addresses/{address_hash}/token-balances")
         return [TokenBalance(**item) for item in data]
 
+    def get_address_coin_balance_history(
+        self, address_hash: str, page_params: Optional[Dict] = None
+    ) -> PaginatedResponse:
+        """Get native coin balance changes of an address, newest first"""
+        data = self._make_request(
+            f"/addresses/{address_hash}/coin-balance-history", page_params
+        )
+        entries = [CoinBalanceHistoryEntry(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=entries, next_page_params=data.get("next_page_params")
+        )
+
+    def get_address_coin_balance_history_by_day(
+        self, address_hash: str
+    ) -> List[CoinBalanceHistoryByDaysEntry]:
+        """Get daily native coin balances of an address"""
+        data = self._make_request(
+            f"/addresses/{address_hash}/coin-balance-history-by-day"
+        )
+        # Newer instances wrap the list as {"items": [...], "days": n}
+        items = data.get("items", []) if isinstance(data, dict) else data
+        return [CoinBalanceHistoryByDaysEntry(**item) for item in items]
+
     # Block endpoints
     def get_blocks(self, block_type: Optional[str] = None) -> PaginatedResponse:
         """Get blocks list"""
@@ -158,6 +433,204 @@ class BlockScoutClient:
         data = self._make_request(f"/blocks/{block_number_or_hash}")
         return Block(**data)
 
+    def get_main_page_blocks(self) -> List[Block]:
+        """Get the newest blocks shown on the main page"""
+        data = self._make_request("/main-page/blocks")
+        return [Block(**item) for item in data]
+
+    def get_block_transactions(
+        self,
+        block_number_or_hash: Union[str, int],
+        page_params: Optional[Dict] = None,
+    ) -> PaginatedResponse:
+        """Get transactions of a block"""
+        data = self._make_request(
+            f"/blocks/{block_number_or_hash}/transactions", page_params
+        )
+        transactions = [Transaction(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=transactions, next_page_params=data.get("next_page_params")
+        )
+
+    def get_block_withdrawals(
+        self,
+        block_number_or_hash: Union[str, int],
+        page_params: Optional[Dict] = None,
+    ) -> PaginatedResponse:
+        """Get beacon chain withdrawals of a block"""
+        data = self._make_request(
+            f"/blocks/{block_number_or_hash}/withdrawals", page_params
+        )
+        withdrawals = [Withdrawal(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=withdrawals, next_page_params=data.get("next_page_params")
+        )
+
+    def iter_block_transaction_pages(
+        self, block_number_or_hash: Union[str, int], max_workers: int = 4
+    ) -> Iterator[PaginatedResponse]:
+        """
+        Iterate over the transaction pages of a block, fetching ahead concurrently
+
+        Block transactions are paged by descending position with an ``index``
+        cursor, so once the first page is known the cursors of all remaining
+        pages can be predicted and fetched ``max_workers`` at a time. Every
+        page's actual cursor is checked against the prediction; on a mismatch
+        (or an unfamiliar cursor format) iteration continues from the actual
+        cursor. Pages are yielded in order.
+        """
+        page = self.get_block_transactions(block_number_or_hash)
+        yield page
+        while page.next_page_params and page.items:
+            cursors = self._predict_block_cursors(page)
+            if max_workers < 2 or len(cursors) < 2:
+                page = self.get_block_transactions(
+                    block_number_or_hash, page.next_page_params
+                )
+                yield page
+                continue
+            page = yield from self._fetch_predicted_pages(
+                block_number_or_hash, cursors, max_workers
+            )
+
+    @staticmethod
+    def _predict_block_cursors(page: PaginatedResponse) -> List[Dict[str, Any]]:
+        """Cursors of all pages after ``page`` (empty if they can't be predicted)"""
+        cursor = page.next_page_params or {}
+        index, items_count = cursor.get("index"), cursor.get("items_count")
+        if not isinstance(index, int) or not isinstance(items_count, int):
+            return []
+        positions = [transaction.position for transaction in page.items]
+        if positions != sorted(positions, reverse=True) or positions[-1] != index:
+            return []
+        step = len(positions)
+        return [
+            dict(cursor, index=index - k * step, items_count=items_count + k * step)
+            for k in range((index + step - 1) // step)
+        ]
+
+    def _fetch_predicted_pages(
+        self,
+        block_number_or_hash: Union[str, int],
+        cursors: List[Dict[str, Any]],
+        max_workers: int,
+    ):
+        """Yield pages for predicted cursors in order; returns the last page"""
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = [
+            executor.submit(self.get_block_transactions, block_number_or_hash, cursor)
+            for cursor in cursors[:max_workers]
+        ]
+        try:
+            for position in range(len(cursors)):
+                page = futures[position].result()
+                yield page
+                expected = (
+                    cursors[position + 1] if position + 1 < len(cursors) else None
+                )
+                if (page.next_page_params or None) != expected:
+                    return page
+                if position + max_workers < len(cursors):
+                    futures.append(
+                        executor.submit(
+                            self.get_block_transactions,
+                            block_number_or_hash,
+                            cursors[position + max_workers],
+                        )
+                    )
+            return page
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def get_block_bundle(
+        self,
+        block_number_or_hash: Union[str, int],
+        withdrawals: bool = True,
+        max_workers: int = 4,
+    ) -> BlockBundle:
+        """
+        Get a block with all of its transactions and withdrawals
+
+        The header, the transaction pages and the withdrawal pages are
+        requested concurrently. Withdrawals are left empty and reported in
+        ``errors`` on chains without them; only the block itself must succeed.
+
+        Args:
+            block_number_or_hash: Block number or hash
+            withdrawals: Also fetch withdrawals
+            max_workers: Concurrent transaction page requests
+        """
+        base = f"/blocks/{block_number_or_hash}"
+        tasks = {
+            "block": lambda: self.get_block(block_number_or_hash),
+            "transactions": lambda: [
+                transaction
+                for page in self.iter_block_transaction_pages(
+                    block_number_or_hash, max_workers
+                )
+                for transaction in page.items
+            ],
+        }
+        if withdrawals:
+            tasks["withdrawals"] = lambda: self._collect_items(
+                f"{base}/withdrawals", Withdrawal
+            )
+
+        results, errors = self._run_concurrently(tasks, len(tasks))
+        if "block" in errors:
+            raise BlockScoutError(errors["block"])
+        if "transactions" in errors:
+            raise BlockScoutError(errors["transactions"])
+        return BlockBundle(**results, errors=errors)
+
+    def iter_block_bundles(
+        self,
+        start: int,
+        end: int,
+        workers: int = 4,
+        withdrawals: bool = True,
+        max_workers: int = 2,
+    ) -> Iterator[BlockBundle]:
+        """
+        Yield bundles for blocks start..end (inclusive) in height order
+
+        Up to ``workers`` blocks are fetched at a time, each with up to
+        ``max_workers`` concurrent transaction page requests. Blocks that
+        fail to fetch raise BlockScoutError; use BlockBackfill for
+        resumable bulk downloads that tolerate missing heights.
+        """
+        heights = iter(range(start, end + 1))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        pending = deque(
+            executor.submit(self.get_block_bundle, height, withdrawals, max_workers)
+            for height in itertools.islice(heights, workers)
+        )
+        try:
+            while pending:
+                bundle = pending.popleft().result()
+                height = next(heights, None)
+                if height is not None:
+                    pending.append(
+                        executor.submit(
+                            self.get_block_bundle, height, withdrawals, max_workers
+                        )
+                    )
+                yield bundle
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    # Smart contract endpoints
+    def get_smart_contract(self, address_hash: str) -> SmartContract:
+        """Get verified smart contract details (ABI, sources, compiler settings)"""
+        data = self._make_request(f"/smart-contracts/{address_hash}")
+        return SmartContract(**data)
+
     # Token endpoints
     def get_tokens(
         self, query: Optional[str] = None, token_type: Optional[str] = None
@@ -181,8 +654,81 @@ class BlockScoutClient:
         data = self._make_request(f"/tokens/{address_hash}")
         return TokenInfo(**data)
 
+    def get_token_instances(
+        self, address_hash: str, page_params: Optional[Dict] = None
+    ) -> PaginatedResponse:
+        """Get NFT instances of a token collection"""
+        data = self._make_request(f"/tokens/{address_hash}/instances", page_params)
+        instances = [NFTInstance(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=instances, next_page_params=data.get("next_page_params")
+        )
+
+    def get_token_instance(
+        self, address_hash: str, token_id: Union[str, int]
+    ) -> NFTInstance:
+        """Get an NFT instance by token id"""
+        data = self._make_request(f"/tokens/{address_hash}/instances/{token_id}")
+        return NFTInstance(**data)
+
+    def get_token_instance_transfers(
+        self,
+        address_hash: str,
+        token_id: Union[str, int],
+        page_params: Optional[Dict] = None,
+    ) -> PaginatedResponse:
+        """Get transfers of an NFT instance"""
+        data = self._make_request(
+            f"/tokens/{address_hash}/instances/{token_id}/transfers", page_params
+        )
+        transfers = [TokenTransfer(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=transfers, next_page_params=data.get("next_page_params")
+        )
+
+    def get_token_instance_holders(
+        self,
+        address_hash: str,
+        token_id: Union[str, int],
+        page_params: Optional[Dict] = None,
+    ) -> PaginatedResponse:
+        """Get holders of an NFT instance (ERC-1155 ids can have many)"""
+        data = self._make_request(
+            f"/tokens/{address_hash}/instances/{token_id}/holders", page_params
+        )
+        holders = [Holder(**item) for item in data.get("items", [])]
+
+        return PaginatedResponse(
+            items=holders, next_page_params=data.get("next_page_params")
+        )
+
+    def get_token_instance_transfers_count(
+        self, address_hash: str, token_id: Union[str, int]
+    ) -> int:
+        """Get the number of transfers of an NFT instance"""
+        data = self._make_request(
+            f"/tokens/{address_hash}/instances/{token_id}/transfers-count"
+        )
+        return int(data["transfers_count"])
+
+    def refetch_token_instance_metadata(
+        self, address_hash: str, token_id: Union[str, int], recaptcha_response: str
+    ) -> Dict[str, Any]:
+        """Ask the instance to re-fetch NFT metadata (requires a reCAPTCHA response)"""
+        return self._make_request(
+            f"/tokens/{address_hash}/instances/{token_id}/refetch-metadata",
+            method="PATCH",
+            json={"recaptcha_response": recaptcha_response},
+        )
+
     def get_token_holders(
-        self, address_hash: str, limit: Optional[int] = None, all_pages: bool = False
+        self,
+        address_hash: str,
+        limit: Optional[int] = None,
+        all_pages: bool = False,
+        compact: bool = False,
     ) -> PaginatedResponse:
         """
         Get token holders with pagination support
@@ -191,7 +737,9 @@ class BlockScoutClient:
             address_hash: Token contract address
             limit: Maximum number of holders to return (None for API default)
             all_pages: If True, fetch all pages of results
+            compact: If True, return HolderRecord items instead of Holder models
         """
+        parse = HolderRecord.from_json if compact else (lambda item: Holder(**item))
         all_holders = []
         next_page_params = None
 
@@ -202,7 +750,7 @@ class BlockScoutClient:
                 params.update(next_page_params)
 
             data = self._make_request(f"/tokens/{address_hash}/holders", params)
-            holders = [Holder(**item) for item in data.get("items", [])]
+            holders = [parse(item) for item in data.get("items", [])]
 
             all_holders.extend(holders)
 
@@ -225,6 +773,67 @@ class BlockScoutClient:
             next_page_params=next_page_params if not all_pages else None,
         )
 
+    def iter_token_holder_pages(
+        self,
+        address_hash: str,
+        min_value: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over raw holder pages, stopping as soon as possible
+
+        Holders are returned in descending balance order, so pagination stops
+        at the first holder below min_value or once limit holders were yielded.
+        Pages are truncated to the holders that qualify.
+
+        Args:
+            address_hash: Token contract address
+            min_value: Minimum balance in base units (exact integer)
+            limit: Maximum number of holders (e.g. top N)
+        """
+        count = 0
+        for page in self.iter_raw_pages(f"/tokens/{address_hash}/holders"):
+            items = page.get("items", [])
+            stop = False
+
+            if min_value is not None:
+                for index, item in enumerate(items):
+                    if int(item["value"]) < min_value:
+                        items = items[:index]
+                        stop = True
+                        break
+
+            if limit is not None and count + len(items) >= limit:
+                items = items[: limit - count]
+                stop = True
+
+            count += len(items)
+            if items:
+                yield dict(page, items=items)
+            if stop:
+                break
+
+    def iter_token_holders(
+        self,
+        address_hash: str,
+        min_value: Optional[int] = None,
+        limit: Optional[int] = None,
+        compact: bool = False,
+    ) -> Iterator[Union[Holder, HolderRecord]]:
+        """
+        Iterate over token holders in descending balance order
+
+        Args:
+            address_hash: Token contract address
+            min_value: Stop at the first holder below this base-unit balance
+            limit: Stop after this many holders
+            compact: If True, yield HolderRecord items instead of Holder models
+        """
+        parse = HolderRecord.from_json if compact else (lambda item: Holder(**item))
+        for page in self.iter_token_holder_pages(address_hash, min_value, limit):
+            for item in page["items"]:
+                yield parse(item)
+
     def get_token_holders_paginated(
         self, address_hash: str, page_params: Optional[Dict] = None
     ) -> PaginatedResponse:
@@ -246,11 +855,72 @@ class BlockScoutClient:
             items=transfers, next_page_params=data.get("next_page_params")
         )
 
+    def iter_token_transfer_pages(
+        self,
+        address_hash: str,
+        min_block: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over raw transfer pages of a token, newest first
+
+        Pagination stops at the first transfer below min_block, and pages are
+        truncated to the transfers at or above it.
+
+        Args:
+            address_hash: Token contract address
+            min_block: Oldest block number to include
+            max_pages: Stop after this many pages (None for all)
+
+        Raises:
+            BlockScoutError: min_block is set but the instance does not
+                return ``block_number`` on transfers
+        """
+        for page in self.iter_raw_pages(
+            f"/tokens/{address_hash}/transfers", max_pages=max_pages
+        ):
+            items = page.get("items", [])
+            stop = False
+
+            if min_block is not None:
+                for index, item in enumerate(items):
+                    block_number = item.get("block_number")
+                    if block_number is None:
+                        raise BlockScoutError(
+                            "Token transfers carry no block_number on this "
+                            "instance, so they cannot be limited to min_block"
+                        )
+                    if block_number < min_block:
+                        items = items[:index]
+                        stop = True
+                        break
+
+            if items:
+                yield dict(page, items=items)
+            if stop:
+                break
+
     def get_token_counters(self, address_hash: str) -> TokenCounters:
         """Get token counters"""
         data = self._make_request(f"/tokens/{address_hash}/counters")
         return TokenCounters(**data)
 
+    # Stats endpoints
+    def get_stats(self) -> StatsResponse:
+        """Get chain-wide counters"""
+        data = self._make_request("/stats")
+        return StatsResponse(**data)
+
+    def get_transactions_chart(self) -> List[TransactionChartItem]:
+        """Get daily transaction counts"""
+        data = self._make_request("/stats/charts/transactions")
+        return [TransactionChartItem(**item) for item in data.get("chart_data", [])]
+
+    def get_market_chart(self) -> MarketChart:
+        """Get daily coin price and market cap history"""
+        data = self._make_request("/stats/charts/market")
+        return MarketChart(**data)
+
     def close(self):
         """Close the HTTP client"""
         self.client.close()
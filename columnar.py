@@ -0,0 +1,253 @@
+"""Columnar page batches built directly from raw API items
+
+``utils.to_pandas_dataframe`` goes model -> ``to_dict()`` -> list of dicts ->
+DataFrame. The builders here skip all of that: values are read straight out
+of the decoded JSON pages into typed column buffers, page by page, and the
+buffers are handed to NumPy, Arrow, pandas or polars without any per-row
+dict being created.
+"""
+
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+# Column kinds and the array.array typecode backing them
+_TYPECODES = {"int": "q", "float": "d", "bool": "b"}
+
+# Largest magnitude a Decimal(38, 0) holds
+_DECIMAL128_MAX = 10**38 - 1
+
+
+def _make_getter(path: Sequence[str]) -> Callable[[Dict[str, Any]], Any]:
+    """Build a fast accessor for a dotted path into a raw item"""
+    if len(path) == 1:
+        key = path[0]
+        return lambda item: item.get(key)
+
+    def getter(item: Dict[str, Any]) -> Any:
+        value: Any = item
+        for key in path:
+            if value is None:
+                return None
+            value = value.get(key)
+        return value
+
+    return getter
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for this function. Install with: pip install pyarrow"
+        )
+    return pa
+
+
+class Column:
+    """Column definition: output name, dotted path into the item and kind
+
+    Kinds:
+        "int": int64
+        "float": float64
+        "bool": bool
+        "str": Python / Arrow strings
+        "category": repeated strings, dictionary encoded on export
+        "datetime": ISO-8601 timestamps, parsed to datetime64 (UTC) on export
+        "uint256": exact integers such as wei amounts, kept as Python ints
+            (object dtype) in pandas and as decimal strings in Arrow, since
+            decimal256 stops at 76 digits and 2**256 - 1 has 78
+    """
+
+    __slots__ = ("name", "path", "kind", "getter")
+
+    def __init__(self, name: str, path: Optional[str] = None, kind: str = "str"):
+        self.name = name
+        self.path = tuple((path or name).split("."))
+        self.kind = kind
+        self.getter = _make_getter(self.path)
+
+    def __repr__(self) -> str:
+        return f"Column({self.name!r}, {'.'.join(self.path)!r}, {self.kind!r})"
+
+
+class _ColumnBuffer:
+    """Append-only buffer for one column"""
+
+    __slots__ = ("column", "values", "mask", "has_nulls")
+
+    def __init__(self, column: Column):
+        self.column = column
+        typecode = _TYPECODES.get(column.kind)
+        self.values: Union[array, List[Any]] = array(typecode) if typecode else []
+        self.mask = bytearray()
+        self.has_nulls = False
+
+    def extend(self, items: Sequence[Dict[str, Any]]) -> None:
+        raw = list(map(self.column.getter, items))
+        kind = self.column.kind
+        if kind in ("str", "category", "datetime"):
+            self.values.extend(
+                value if value is None or type(value) is str else str(value)
+                for value in raw
+            )
+            return
+        if kind == "uint256":
+            self.values.extend(None if value is None else int(value) for value in raw)
+            return
+
+        if None in raw:
+            self.has_nulls = True
+            self.mask.extend(value is None for value in raw)
+            raw = [0 if value is None else value for value in raw]
+        else:
+            self.mask.extend(bytes(len(raw)))
+
+        if kind == "int":
+            self.values.extend(map(int, raw))
+        elif kind == "float":
+            self.values.extend(map(float, raw))
+        elif kind == "bool":
+            self.values.extend(map(bool, raw))
+        else:
+            self.values.extend(raw)
+
+    def _data(self) -> np.ndarray:
+        # copy so the array.array is not left exporting its buffer
+        data = np.frombuffer(self.values, dtype=self.values.typecode).copy()
+        return data.astype(bool) if self.column.kind == "bool" else data
+
+    def _null_mask(self) -> np.ndarray:
+        return np.frombuffer(self.mask, dtype=np.uint8).astype(bool)
+
+    def _datetimes(self) -> pd.DatetimeIndex:
+        return pd.to_datetime(pd.Index(self.values, dtype=object), utc=True)
+
+    def to_numpy(self) -> np.ndarray:
+        kind = self.column.kind
+        if kind == "datetime":
+            return self._datetimes().tz_localize(None).to_numpy()
+        if kind not in _TYPECODES:
+            return np.array(self.values, dtype=object)
+        if self.has_nulls:
+            return np.ma.masked_array(self._data(), mask=self._null_mask())
+        return self._data()
+
+    def to_arrow(self):
+        pa = _require_pyarrow()
+        kind = self.column.kind
+        if kind == "str":
+            return pa.array(self.values, type=pa.string())
+        if kind == "category":
+            return pa.array(self.values, type=pa.string()).dictionary_encode()
+        if kind == "datetime":
+            # one unit for every batch, so empty files get the same schema
+            timestamps = pa.array(self._datetimes())
+            return timestamps.cast(pa.timestamp("us", tz="UTC"), safe=False)
+        if kind == "uint256":
+            return pa.array(
+                [None if value is None else str(value) for value in self.values],
+                type=pa.string(),
+            )
+        if self.has_nulls:
+            return pa.array(self._data(), mask=self._null_mask())
+        return pa.array(self._data())
+
+    def to_pandas(self) -> pd.Series:
+        kind = self.column.kind
+        name = self.column.name
+        if kind == "category":
+            return pd.Series(pd.Categorical(self.values), name=name)
+        if kind == "datetime":
+            return pd.Series(self._datetimes(), name=name)
+        if kind in ("str", "uint256") or not self.has_nulls:
+            return pd.Series(self.to_numpy(), name=name)
+        array_type = {
+            "int": pd.arrays.IntegerArray,
+            "float": pd.arrays.FloatingArray,
+            "bool": pd.arrays.BooleanArray,
+        }[kind]
+        return pd.Series(array_type(self._data(), self._null_mask()), name=name)
+
+
+class ColumnarBatch:
+    """Typed column buffers filled from raw API pages
+
+    Example:
+        batch = ColumnarBatch([
+            Column("address", "address.hash"),
+            Column("is_contract", "address.is_contract", "bool"),
+            Column("value"),
+        ])
+        for page in client.iter_raw_pages(f"/tokens/{token}/holders"):
+            batch.append_page(page)
+        table = batch.to_arrow()
+    """
+
+    def __init__(self, columns: Sequence[Column]):
+        self.columns = list(columns)
+        self._buffers = [_ColumnBuffer(column) for column in self.columns]
+        self.num_rows = 0
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def append_items(self, items: Sequence[Dict[str, Any]]) -> None:
+        """Append raw items (decoded JSON dicts)"""
+        if not items:
+            return
+        for buffer in self._buffers:
+            buffer.extend(items)
+        self.num_rows += len(items)
+
+    def append_page(self, page: Dict[str, Any]) -> None:
+        """Append the items of a raw paginated response"""
+        self.append_items(page.get("items", []))
+
+    def extend_pages(self, pages: Iterable[Dict[str, Any]]) -> "ColumnarBatch":
+        """Append every page of an iterator, e.g. client.iter_raw_pages()"""
+        for page in pages:
+            self.append_page(page)
+        return self
+
+    def to_numpy(self) -> Dict[str, np.ndarray]:
+        """Return columns as NumPy arrays (masked arrays where values are null)"""
+        return {b.column.name: b.to_numpy() for b in self._buffers}
+
+    def to_arrow(self) -> "pa.Table":
+        """Return columns as a pyarrow Table"""
+        pa = _require_pyarrow()
+        return pa.table({b.column.name: b.to_arrow() for b in self._buffers})
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Return columns as a pandas DataFrame"""
+        if not self._buffers:
+            return pd.DataFrame()
+        return pd.concat([b.to_pandas() for b in self._buffers], axis=1)
+
+    def to_polars(self) -> "pl.DataFrame":
+        """Return columns as a polars DataFrame
+
+        polars decimals stop at 38 digits, so uint256 columns become
+        Decimal(38, 0) when every value fits and stay strings otherwise.
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError(
+                "polars is required for this function. Install with: pip install polars"
+            )
+        pa = _require_pyarrow()
+        table = self.to_arrow()
+        for index, buffer in enumerate(self._buffers):
+            if buffer.column.kind == "uint256" and all(
+                value is None or -_DECIMAL128_MAX <= value <= _DECIMAL128_MAX
+                for value in buffer.values
+            ):
+                # checked up front: Arrow wraps out-of-range strings silently
+                values = table.column(index).cast(pa.decimal128(38, 0))
+                table = table.set_column(index, buffer.column.name, values)
+        return pl.from_arrow(table)
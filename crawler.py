@@ -0,0 +1,437 @@
+"""Breadth-first counterparty crawler
+
+Expands from one or more root addresses to the addresses they transacted
+with, level by level up to a configurable depth. Each level is fetched by a
+pool of worker threads sharing the client (and its rate limiter); edges are
+filtered, deduplicated and handed to the sink on the calling thread, so
+sinks need not be thread-safe.
+
+Visited addresses and emitted edges are tracked in an exact set, or for
+very large crawls in a fixed-size Bloom filter. The frontier and the
+visited structure are checkpointed to a state file, so an interrupted
+crawl resumes where it stopped. Addresses whose fetch failed are kept in a
+retry list and expanded again before the crawl moves to the next depth.
+"""
+
+import base64
+import hashlib
+import json
+import math
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from .exceptions import BlockScoutError
+
+SOURCES = ("transactions", "token_transfers")
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings
+
+    Never reports a false negative. At capacity about ``error_rate`` of the
+    keys never added are reported as present, i.e. a few counterparties may
+    be skipped as already visited in exchange for bounded memory
+    (~1.8 bytes per key at 0.1%).
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float = 0.001,
+        data: Optional[bytes] = None,
+        count: int = 0,
+    ):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be > 0 and error_rate in (0, 1)")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.size = (bits + 7) // 8 * 8
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = count
+        self._bits = bytearray(data) if data is not None else bytearray(self.size // 8)
+        if len(self._bits) != self.size // 8:
+            raise ValueError("Bloom filter data does not match its capacity")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _positions(self, key: str) -> List[int]:
+        # Double hashing: h1 + i * h2 over one 128-bit digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: str) -> None:
+        bits = self._bits
+        new = False
+        for p in self._positions(key):
+            if not bits[p >> 3] & (1 << (p & 7)):
+                bits[p >> 3] |= 1 << (p & 7)
+                new = True
+        self.count += new
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._bits)
+
+
+Visited = Union[Set[str], BloomFilter]
+
+
+class CrawlState:
+    """Frontier, retry list and visited keys persisted to a JSON state file"""
+
+    def __init__(
+        self,
+        roots: List[str],
+        path: Optional[str] = None,
+        bloom_capacity: Optional[int] = None,
+        error_rate: float = 0.001,
+    ):
+        self.roots = [root.lower() for root in roots]
+        self.path = path
+        self.level = 0
+        self.pending: List[str] = list(roots)
+        self.next: List[str] = []
+        self.retry: List[str] = []  # addresses of this level whose fetch failed
+        self.expanded = 0
+        self.edges = 0
+        self.visited: Visited = (
+            BloomFilter(bloom_capacity, error_rate) if bloom_capacity else set()
+        )
+        for root in self.roots:
+            self.visited.add(f"a:{root}")
+
+    @property
+    def done(self) -> bool:
+        return not self.pending and not self.next and not self.retry
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        roots: List[str],
+        bloom_capacity: Optional[int] = None,
+        error_rate: float = 0.001,
+    ) -> "CrawlState":
+        """Load a state file, or start fresh if it does not exist"""
+        state = cls(roots, path, bloom_capacity, error_rate)
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            if sorted(data["roots"]) != sorted(state.roots):
+                raise ValueError(f"State file {path} belongs to another crawl")
+            state.level = data["level"]
+            state.pending = data["pending"]
+            state.next = data["next"]
+            state.retry = data.get("retry", [])
+            state.expanded = data["expanded"]
+            state.edges = data["edges"]
+            visited = data["visited"]
+            if isinstance(visited, list):
+                state.visited = set(visited)
+            else:
+                state.visited = BloomFilter(
+                    visited["capacity"],
+                    visited["error_rate"],
+                    zlib.decompress(base64.b64decode(visited["bits"])),
+                    visited["count"],
+                )
+        return state
+
+    def save(self) -> None:
+        """Atomically write the state file"""
+        if self.path is None:
+            return
+        if isinstance(self.visited, BloomFilter):
+            visited: Any = {
+                "capacity": self.visited.capacity,
+                "error_rate": self.visited.error_rate,
+                "count": self.visited.count,
+                "bits": base64.b64encode(
+                    zlib.compress(self.visited.to_bytes())
+                ).decode(),
+            }
+        else:
+            visited = sorted(self.visited)
+        data = {
+            "roots": self.roots,
+            "level": self.level,
+            "pending": self.pending,
+            "next": self.next,
+            "retry": self.retry,
+            "expanded": self.expanded,
+            "edges": self.edges,
+            "visited": visited,
+        }
+        partial = f"{self.path}.partial"
+        with open(partial, "w") as f:
+            json.dump(data, f)
+        os.replace(partial, self.path)
+
+
+def _party(party: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return party or {}
+
+
+def _transaction_edge(item: Dict[str, Any]) -> Dict[str, Any]:
+    to = _party(item.get("to") or item.get("created_contract"))
+    return {
+        "from_address": _party(item.get("from")).get("hash"),
+        "to_address": to.get("hash"),
+        "from_is_contract": _party(item.get("from")).get("is_contract"),
+        "to_is_contract": to.get("is_contract"),
+        "kind": "transaction",
+        "transaction_hash": item["hash"],
+        "log_index": None,
+        "block_number": item.get("block_number", item.get("block")),
+        "value": int(item.get("value") or 0),
+        "token_address": None,
+        "token_symbol": None,
+        "token_id": None,
+    }
+
+
+def _token_transfer_edge(item: Dict[str, Any]) -> Dict[str, Any]:
+    total = item.get("total") or {}
+    token = item.get("token") or {}
+    return {
+        "from_address": _party(item.get("from")).get("hash"),
+        "to_address": _party(item.get("to")).get("hash"),
+        "from_is_contract": _party(item.get("from")).get("is_contract"),
+        "to_is_contract": _party(item.get("to")).get("is_contract"),
+        "kind": "token_transfer",
+        "transaction_hash": item["transaction_hash"],
+        "log_index": item.get("log_index"),
+        "block_number": item.get("block_number"),
+        # ERC-721 transfers carry no amount; count them as one unit
+        "value": int(total["value"]) if total.get("value") is not None else 1,
+        "token_address": token.get("address") or token.get("address_hash"),
+        "token_symbol": token.get("symbol"),
+        "token_id": total.get("token_id"),
+    }
+
+
+_ENDPOINTS = {
+    "transactions": ("transactions", _transaction_edge),
+    "token_transfers": ("token-transfers", _token_transfer_edge),
+}
+
+
+class CounterpartyCrawler:
+    """
+    Breadth-first crawl of the counterparties of a set of addresses
+
+    Example:
+        with BlockScoutClient(url, rate_limit=20) as client:
+            crawler = CounterpartyCrawler(client, ["0x..."], depth=3,
+                                          max_fanout=20, state_path="crawl.state")
+            crawler.run(edge_writer.write_items)
+
+    Args:
+        client: BlockScoutClient instance (shared by all workers)
+        roots: Addresses to start from (depth 0)
+        depth: Number of hops to expand; addresses first seen at this depth
+            appear in edges but are not expanded themselves
+        max_fanout: Counterparties followed per address, most frequent first
+        min_value: Ignore transfers below this amount in base units (wei for
+            transactions, the token's smallest unit for token transfers;
+            an ERC-721 transfer counts as 1)
+        sources: "transactions" and/or "token_transfers"
+        max_pages: Pages fetched per address and source (newest first)
+        expand_contracts: Also expand contract counterparties (tokens and
+            routers usually explode the crawl, so they are leaves by default)
+        workers: Concurrent requests
+        bloom_capacity: Track visited keys in a Bloom filter sized for this
+            many addresses plus edges instead of an exact set
+        state_path: Resumable state file (None to keep state in memory only)
+        checkpoint_every: Save the state after this many expanded addresses
+        retries: Rounds of retrying failed addresses per depth and run; if
+            some still fail, ``run`` stops before the next depth and a later
+            run retries them first
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        roots: Iterable[str],
+        depth: int = 2,
+        max_fanout: int = 25,
+        min_value: int = 0,
+        sources: Iterable[str] = SOURCES,
+        max_pages: int = 1,
+        expand_contracts: bool = False,
+        workers: int = 8,
+        bloom_capacity: Optional[int] = None,
+        state_path: Optional[str] = None,
+        checkpoint_every: int = 50,
+        retries: int = 2,
+    ):
+        roots = list(roots)
+        sources = tuple(sources)
+        if not roots:
+            raise ValueError("At least one root address is required")
+        unknown = set(sources) - set(SOURCES)
+        if unknown:
+            raise ValueError(f"Unknown crawl sources: {', '.join(sorted(unknown))}")
+        self.client = client
+        self.depth = depth
+        self.max_fanout = max_fanout
+        self.min_value = min_value
+        self.sources = sources
+        self.max_pages = max_pages
+        self.expand_contracts = expand_contracts
+        self.workers = workers
+        self.checkpoint_every = checkpoint_every
+        self.retries = retries
+        self.state = (
+            CrawlState.load(state_path, roots, bloom_capacity)
+            if state_path
+            else CrawlState(roots, bloom_capacity=bloom_capacity)
+        )
+        self.errors: Dict[str, str] = {}
+
+    def _fetch_edges(self, address: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Edges of one address at or above min_value (runs in a worker)
+
+        Returns None if a request failed; the error is kept in ``errors``.
+        """
+        edges = []
+        for source in self.sources:
+            path, to_edge = _ENDPOINTS[source]
+            try:
+                for page in self.client.iter_raw_pages(
+                    f"/addresses/{address}/{path}", max_pages=self.max_pages
+                ):
+                    for item in page.get("items", []):
+                        edge = to_edge(item)
+                        if edge["value"] >= self.min_value:
+                            edges.append(edge)
+            except BlockScoutError as e:
+                self.errors[address] = str(e)
+                return None
+        self.errors.pop(address, None)
+        return edges
+
+    def _expand(
+        self, address: str, edges: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """New edges of an expanded address; queues its new counterparties"""
+        state = self.state
+        key = address.lower()
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for edge in edges:
+            outgoing = (edge["from_address"] or "").lower() == key
+            other = edge["to_address"] if outgoing else edge["from_address"]
+            if other is None or other.lower() == key:
+                continue
+            groups.setdefault(other.lower(), []).append(edge)
+
+        # Follow the most frequent counterparties, most recent first on ties
+        ranked = sorted(
+            groups.values(),
+            key=lambda group: (
+                -len(group),
+                -max(edge["block_number"] or 0 for edge in group),
+            ),
+        )
+        rows = []
+        for group in ranked[: self.max_fanout]:
+            for edge in group:
+                edge_key = f"e:{edge['transaction_hash']}:{edge['log_index']}"
+                if edge_key not in state.visited:
+                    state.visited.add(edge_key)
+                    rows.append(dict(edge, depth=state.level))
+
+            edge = group[0]
+            outgoing = (edge["from_address"] or "").lower() == key
+            other = edge["to_address"] if outgoing else edge["from_address"]
+            is_contract = (
+                edge["to_is_contract"] if outgoing else edge["from_is_contract"]
+            )
+            if f"a:{other.lower()}" in state.visited:
+                continue
+            state.visited.add(f"a:{other.lower()}")
+            if state.level + 1 < self.depth and (
+                self.expand_contracts or not is_contract
+            ):
+                state.next.append(other)
+        return rows
+
+    def run(
+        self,
+        edge_sink: Callable[[List[Dict[str, Any]]], None],
+        progress: Optional[Callable[[int, int, int], None]] = None,
+        flush: Optional[Callable[[], None]] = None,
+    ) -> int:
+        """
+        Crawl until the frontier is exhausted
+
+        Stops early, with ``state.retry`` non-empty, if some addresses of a
+        depth still fail after ``retries`` rounds.
+
+        Args:
+            edge_sink: Called with the new edge rows of every checkpoint chunk
+            progress: Callback receiving (addresses expanded, edges emitted,
+                current depth)
+            flush: Called before every state checkpoint so buffered sink
+                output is durable before its addresses are marked done
+
+        Returns:
+            Number of edges emitted in this run
+        """
+        state = self.state
+        emitted = 0
+        rounds = 0
+
+        def checkpoint():
+            if flush is not None:
+                flush()
+            state.save()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while not state.done:
+                if not state.pending:
+                    if state.retry:
+                        if rounds >= self.retries:
+                            break
+                        rounds += 1
+                        state.pending, state.retry = state.retry, []
+                        continue
+                    rounds = 0
+                    state.level += 1
+                    state.pending, state.next = state.next, []
+                    continue
+
+                chunk = state.pending[: self.checkpoint_every]
+                rows = []
+                expanded = 0
+                for address, edges in zip(
+                    chunk, executor.map(self._fetch_edges, chunk)
+                ):
+                    if edges is None:
+                        state.retry.append(address)
+                        continue
+                    rows.extend(self._expand(address, edges))
+                    expanded += 1
+                if rows:
+                    edge_sink(rows)
+                emitted += len(rows)
+
+                del state.pending[: len(chunk)]
+                state.expanded += expanded
+                state.edges += len(rows)
+                if progress is not None:
+                    progress(state.expanded, state.edges, state.level)
+                checkpoint()
+
+        checkpoint()
+        return emitted
@@ -0,0 +1,360 @@
+"""Streaming exporters for paginated results
+
+The writers take raw API pages as they arrive and write them out straight
+away (CSV, NDJSON) or in row groups (Parquet, Feather), so memory stays
+bounded no matter how many pages the export covers.
+"""
+
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Union
+
+from .columnar import Column, ColumnarBatch, _require_pyarrow
+
+COLUMNAR_FORMATS = ("parquet", "feather")
+EXPORT_FORMATS = ("csv", "ndjson") + COLUMNAR_FORMATS
+
+_EXTENSIONS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".ipc": "feather",
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+
+def format_from_path(path: str, default: str = "csv") -> str:
+    """Guess the export format from a file extension"""
+    return _EXTENSIONS.get(os.path.splitext(path)[1].lower(), default)
+
+
+def part_path(path: str) -> str:
+    """Return path, or the first free numbered variant if it already exists
+
+    Resumed exports write their new rows to ``name.1.ext``, ``name.2.ext``, ...
+    next to the original file instead of overwriting it.
+    """
+    if not os.path.exists(path):
+        return path
+    stem, ext = os.path.splitext(path)
+    part = 1
+    while os.path.exists(f"{stem}.{part}{ext}"):
+        part += 1
+    return f"{stem}.{part}{ext}"
+
+
+class _TextPageWriter(ABC):
+    """Base class for line-oriented writers that flush periodically"""
+
+    def __init__(self, path: Union[str, IO[str]], flush_every: int):
+        if isinstance(path, str):
+            self._file = open(path, "w", newline="", encoding="utf-8")
+            self._owns_file = True
+        else:
+            self._file = path
+            self._owns_file = False
+        self.path = path
+        self.flush_every = flush_every
+        self.rows_written = 0
+        self._unflushed = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write_items(self, items: List[Dict[str, Any]]) -> None:
+        """Write raw items immediately"""
+        if not items:
+            return
+        self._write(items)
+        self.rows_written += len(items)
+        self._unflushed += len(items)
+        if self._unflushed >= self.flush_every:
+            self.flush()
+
+    def write_page(self, page: Dict[str, Any]) -> None:
+        """Write the items of a raw paginated response"""
+        self.write_items(page.get("items", []))
+
+    def flush(self) -> None:
+        """Flush written rows to disk"""
+        self._file.flush()
+        self._unflushed = 0
+
+    def close(self) -> None:
+        """Flush and close the file"""
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+    @abstractmethod
+    def _write(self, items: List[Dict[str, Any]]) -> None:
+        """Write raw items to the file"""
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
+
+
+class CsvPageWriter(_TextPageWriter):
+    """Write pages to CSV as they arrive, one flat column per schema entry"""
+
+    def __init__(
+        self,
+        path: Union[str, IO[str]],
+        schema: List[Column],
+        flush_every: int = 10_000,
+    ):
+        super().__init__(path, flush_every)
+        self._getters = [column.getter for column in schema]
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([column.name for column in schema])
+
+    def _write(self, items: List[Dict[str, Any]]) -> None:
+        getters = self._getters
+        self._writer.writerows(
+            [_csv_value(getter(item)) for getter in getters] for item in items
+        )
+
+
+class NdjsonPageWriter(_TextPageWriter):
+    """Write raw items as newline-delimited JSON as they arrive"""
+
+    def __init__(
+        self,
+        path: Union[str, IO[str]],
+        schema: Optional[List[Column]] = None,
+        flush_every: int = 10_000,
+    ):
+        super().__init__(path, flush_every)
+
+    def _write(self, items: List[Dict[str, Any]]) -> None:
+        dumps = json.dumps
+        self._file.writelines(dumps(item, default=str) + "\n" for item in items)
+
+
+class _ArrowPageWriter(ABC):
+    """Buffers pages into a ColumnarBatch and flushes full row groups"""
+
+    def __init__(self, path: str, schema: List[Column], row_group_rows: int):
+        self.path = path
+        self.schema = list(schema)
+        self.row_group_rows = row_group_rows
+        self.rows_written = 0
+        self._batch = ColumnarBatch(self.schema)
+        self._arrow_schema = None
+        self._writer = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write_items(self, items: List[Dict[str, Any]]) -> None:
+        """Buffer raw items, flushing a row group once enough rows are pending"""
+        self._batch.append_items(items)
+        if len(self._batch) >= self.row_group_rows:
+            self.flush()
+
+    def write_page(self, page: Dict[str, Any]) -> None:
+        """Buffer the items of a raw paginated response"""
+        self.write_items(page.get("items", []))
+
+    def flush(self) -> None:
+        """Write pending rows as one row group"""
+        if not len(self._batch):
+            return
+        table = self._prepare(self._batch.to_arrow())
+        if self._writer is None:
+            self._arrow_schema = table.schema
+            self._writer = self._open(table.schema)
+        elif table.schema != self._arrow_schema:
+            table = table.cast(self._arrow_schema)
+        self._write(table)
+        self.rows_written += table.num_rows
+        self._batch = ColumnarBatch(self.schema)
+
+    def close(self) -> None:
+        """Flush pending rows and close the file (empty but typed if no rows)"""
+        if self._closed:
+            return
+        self.flush()
+        if self._writer is None:
+            table = self._prepare(ColumnarBatch(self.schema).to_arrow())
+            self._writer = self._open(table.schema)
+        self._writer.close()
+        self._writer = None
+        self._closed = True
+
+    def _prepare(self, table):
+        return table
+
+    @abstractmethod
+    def _open(self, arrow_schema):
+        """Open the underlying Arrow writer"""
+
+    @abstractmethod
+    def _write(self, table) -> None:
+        """Write one flushed table"""
+
+
+class ParquetPageWriter(_ArrowPageWriter):
+    """Write pages to a Parquet file, one row group per flushed batch"""
+
+    def __init__(
+        self,
+        path: str,
+        schema: List[Column],
+        compression: Optional[str] = "zstd",
+        row_group_rows: int = 10_000,
+    ):
+        super().__init__(path, schema, row_group_rows)
+        self.compression = compression
+
+    def _open(self, arrow_schema):
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(
+            self.path, arrow_schema, compression=self.compression or "none"
+        )
+
+    def _write(self, table) -> None:
+        self._writer.write_table(table)
+
+
+class FeatherPageWriter(_ArrowPageWriter):
+    """Write pages to an Arrow IPC (Feather v2) file, one record batch per flush"""
+
+    def __init__(
+        self,
+        path: str,
+        schema: List[Column],
+        compression: Optional[str] = "zstd",
+        row_group_rows: int = 10_000,
+    ):
+        super().__init__(path, schema, row_group_rows)
+        self.compression = compression
+
+    def _prepare(self, table):
+        # The IPC file format cannot change dictionaries between batches
+        pa = _require_pyarrow()
+        for index, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                table = table.set_column(
+                    index, field.name, table.column(index).cast(field.type.value_type)
+                )
+        return table
+
+    def _open(self, arrow_schema):
+        pa = _require_pyarrow()
+        compression = None if self.compression in (None, "none") else self.compression
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        return pa.ipc.new_file(self.path, arrow_schema, options=options)
+
+    def _write(self, table) -> None:
+        for batch in table.to_batches():
+            self._writer.write_batch(batch)
+
+
+def open_page_writer(
+    path: str,
+    schema: List[Column],
+    format: Optional[str] = None,
+    compression: Optional[str] = "zstd",
+    row_group_rows: int = 10_000,
+):
+    """Open a streaming page writer for any export format"""
+    format = format or format_from_path(path, default="parquet")
+    if format == "csv":
+        return CsvPageWriter(path, schema, flush_every=row_group_rows)
+    if format == "ndjson":
+        return NdjsonPageWriter(path, schema, flush_every=row_group_rows)
+    if format == "parquet":
+        return ParquetPageWriter(path, schema, compression, row_group_rows)
+    if format == "feather":
+        return FeatherPageWriter(path, schema, compression, row_group_rows)
+    raise ValueError(f"Unsupported export format: {format}")
+
+
+def export_pages(
+    pages: Iterable[Dict[str, Any]],
+    path: str,
+    schema: List[Column],
+    format: Optional[str] = None,
+    compression: Optional[str] = "zstd",
+    row_group_rows: int = 10_000,
+    item_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    max_rows: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Stream raw API pages into a CSV, NDJSON, Parquet or Feather file
+
+    Args:
+        pages: Raw page iterator, e.g. client.iter_raw_pages(...)
+        path: Output file path
+        schema: Column schema, e.g. schemas.HOLDER_SCHEMA (NDJSON keeps raw items)
+        format: "csv", "ndjson", "parquet" or "feather" (guessed from the
+            extension if omitted)
+        compression: Parquet/Feather codec ("zstd", "snappy", "lz4", ...) or None
+        row_group_rows: Rows per row group (Parquet/Feather) or between
+            flushes (CSV/NDJSON)
+        item_filter: Optional predicate applied to every raw item
+        max_rows: Stop after this many rows (None for all)
+        progress: Optional callback receiving the number of rows seen so far
+
+    Returns:
+        Number of rows written
+    """
+    rows = 0
+    with open_page_writer(path, schema, format, compression, row_group_rows) as writer:
+        for page in pages:
+            items = page.get("items", [])
+            if item_filter is not None:
+                items = [item for item in items if item_filter(item)]
+            if max_rows is not None:
+                items = items[: max_rows - rows]
+            writer.write_items(items)
+            rows += len(items)
+            if progress is not None:
+                progress(rows)
+            if max_rows is not None and rows >= max_rows:
+                break
+    return writer.rows_written
+
+
+def export_dataframe(
+    df: Any,
+    path: str,
+    format: Optional[str] = None,
+    compression: Optional[str] = "zstd",
+) -> int:
+    """Write an in-memory DataFrame in any export format; returns the row count"""
+    format = format or format_from_path(path, default="parquet")
+    if format == "csv":
+        df.to_csv(path, index=False)
+    elif format == "ndjson":
+        df.to_json(path, orient="records", lines=True, date_format="iso")
+    elif format in COLUMNAR_FORMATS:
+        _require_pyarrow()
+        if format == "parquet":
+            df.to_parquet(path, index=False, compression=compression)
+        else:
+            df.reset_index(drop=True).to_feather(path, compression=compression)
+    else:
+        raise ValueError(f"Unsupported export format: {format}")
+    return len(df)
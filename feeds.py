@@ -0,0 +1,352 @@
+"""Chain-wide token transfer and internal transaction feeds
+
+``/token-transfers`` and ``/internal-transactions`` list the activity of the
+whole chain, newest first, 50 items per request - far cheaper than crawling
+address by address. FeedConsumer pages them backward from the head down to
+a target block (``backfill``) or polls the head for new items (``follow``)
+and hands deduplicated batches to a sink: a callback, a page writer
+(``open_page_writer(...).write_items``) or a Warehouse insert method.
+
+Items are deduplicated by ``(transaction_hash, log_index)`` for transfers
+and ``(transaction_hash, index)`` for internal transactions. The backfill
+cursor and the follow head (block number plus the keys already emitted in
+that block) are checkpointed to a state file after every flushed batch, so
+a backfill followed by ``follow`` captures every item exactly once, across
+restarts. Both rely on the items' ``block_number``; a feed whose items do
+not carry one raises ValueError instead of silently never advancing.
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .columnar import Column
+from .exceptions import BlockScoutError
+from .schemas import INTERNAL_TRANSACTION_SCHEMA, TOKEN_TRANSFER_SCHEMA
+
+
+class Feed(NamedTuple):
+    """A chain-wide feed endpoint"""
+
+    name: str
+    endpoint: str
+    index_field: str  # second half of the dedupe key
+    schema: List[Column]
+    insert: str  # Warehouse method storing the items
+
+
+FEEDS: Dict[str, Feed] = {
+    "token-transfers": Feed(
+        "token-transfers",
+        "/token-transfers",
+        "log_index",
+        TOKEN_TRANSFER_SCHEMA,
+        "insert_token_transfers",
+    ),
+    "internal-transactions": Feed(
+        "internal-transactions",
+        "/internal-transactions",
+        "index",
+        INTERNAL_TRANSACTION_SCHEMA,
+        "insert_internal_transactions",
+    ),
+}
+
+Key = Tuple[str, Any]
+
+
+class FeedState:
+    """Backfill cursor and follow head persisted to a JSON state file"""
+
+    def __init__(self, feed: str, path: Optional[str] = None):
+        self.feed = feed
+        self.path = path
+        self.page_params: Optional[Dict[str, Any]] = None
+        self.until_block: Optional[int] = None
+        self.done = False
+        self.head_block: Optional[int] = None
+        self.head_keys: List[Key] = []
+        self.rows = 0
+
+    @classmethod
+    def load(cls, path: str, feed: str) -> "FeedState":
+        """Load a state file, or start fresh if it does not exist"""
+        state = cls(feed, path)
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data["feed"] != feed:
+                raise ValueError(f"State file {path} belongs to feed {data['feed']}")
+            state.page_params = data["page_params"]
+            state.until_block = data["until_block"]
+            state.done = data["done"]
+            state.head_block = data["head_block"]
+            state.head_keys = [tuple(key) for key in data["head_keys"]]
+            state.rows = data["rows"]
+        return state
+
+    def save(self) -> None:
+        """Atomically write the state file"""
+        if self.path is None:
+            return
+        data = {
+            "feed": self.feed,
+            "page_params": self.page_params,
+            "until_block": self.until_block,
+            "done": self.done,
+            "head_block": self.head_block,
+            "head_keys": self.head_keys,
+            "rows": self.rows,
+        }
+        partial = f"{self.path}.partial"
+        with open(partial, "w") as f:
+            json.dump(data, f)
+        os.replace(partial, self.path)
+
+
+class FeedConsumer:
+    """
+    Consume a chain-wide feed in batches
+
+    Example:
+        consumer = FeedConsumer(client, "token-transfers", state_path="tt.state")
+        with open_page_writer("transfers.parquet", TOKEN_TRANSFER_SCHEMA) as out:
+            consumer.backfill(out.write_items, until_block=19_000_000,
+                              flush=out.flush)
+        with Warehouse("chain.db") as wh:
+            consumer.follow(wh.insert_token_transfers, interval=5,
+                            flush=wh.commit)
+
+    Args:
+        client: BlockScoutClient instance
+        feed: "token-transfers" or "internal-transactions"
+        batch_size: Items handed to the sink at once (at page granularity)
+        state_path: JSON file checkpointing the cursor and head
+        dedupe_window: Recent keys remembered beyond the head block
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        feed: str,
+        batch_size: int = 1000,
+        state_path: Optional[str] = None,
+        dedupe_window: int = 100_000,
+    ):
+        if feed not in FEEDS:
+            raise ValueError(f"Unknown feed {feed!r}; expected one of {list(FEEDS)}")
+        self.client = client
+        self.feed = FEEDS[feed]
+        self.batch_size = batch_size
+        self.dedupe_window = dedupe_window
+        self.state = FeedState.load(state_path, feed) if state_path else FeedState(feed)
+        self.duplicates = 0
+        self._seen: "OrderedDict[Key, None]" = OrderedDict(
+            (key, None) for key in self.state.head_keys
+        )
+
+    def key(self, item: Dict[str, Any]) -> Key:
+        return (item.get("transaction_hash"), item.get(self.feed.index_field))
+
+    def _block(self, item: Dict[str, Any]) -> Optional[int]:
+        """Block number of an item (None while it is pending)"""
+        if "block_number" not in item:
+            raise ValueError(
+                f"{self.feed.endpoint} items carry no block_number on this "
+                f"instance; the feed cannot track its head or stop at a block"
+            )
+        return item["block_number"]
+
+    def _fresh(self, items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Items whose key was not seen recently; remembers the new keys"""
+        fresh = []
+        for item in items:
+            key = self.key(item)
+            if key in self._seen:
+                self.duplicates += 1
+                continue
+            self._seen[key] = None
+            fresh.append(item)
+        while len(self._seen) > self.dedupe_window:
+            self._seen.popitem(last=False)
+        return fresh
+
+    def _track_head(self, items: Iterable[Dict[str, Any]]) -> None:
+        """Raise the follow head to the newest block of the items"""
+        state = self.state
+        for item in items:
+            block = self._block(item)
+            if block is None or (
+                state.head_block is not None and block < state.head_block
+            ):
+                continue
+            if state.head_block is None or block > state.head_block:
+                state.head_block = block
+                state.head_keys = []
+            key = self.key(item)
+            if key not in state.head_keys:
+                state.head_keys.append(key)
+
+    def _checkpoint(
+        self,
+        sink: Callable[[List[Dict[str, Any]]], Any],
+        items: List[Dict[str, Any]],
+        flush: Optional[Callable[[], None]],
+    ) -> None:
+        if items:
+            sink(items)
+        if flush is not None:
+            flush()
+        self.state.rows += len(items)
+        self.state.save()
+
+    def backfill(
+        self,
+        sink: Callable[[List[Dict[str, Any]]], Any],
+        until_block: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        progress: Optional[Callable[[int], None]] = None,
+        flush: Optional[Callable[[], None]] = None,
+    ) -> int:
+        """
+        Page backward from the head, or the saved cursor, to until_block
+
+        Items are handed to the sink newest first. A resumed backfill keeps
+        the until_block it was started with.
+
+        Args:
+            sink: Receives lists of raw items
+            until_block: Oldest block to include (None for the whole feed)
+            max_pages: Stop after this many pages (resumable)
+            progress: Callback receiving the rows handed over so far
+            flush: Called after each batch, before the state is saved
+
+        Returns:
+            Number of items handed to the sink
+        """
+        state = self.state
+        if state.done:
+            return 0
+        if state.page_params is None:
+            state.until_block = until_block
+        until_block = state.until_block
+        from_head = state.page_params is None
+
+        rows = 0
+        buffer: List[Dict[str, Any]] = []
+        for page in self.client.iter_raw_pages(
+            self.feed.endpoint, max_pages=max_pages, page_params=state.page_params
+        ):
+            items = page.get("items", [])
+            stop = False
+            if until_block is not None:
+                for index, item in enumerate(items):
+                    block = self._block(item)
+                    if block is not None and block < until_block:
+                        items = items[:index]
+                        stop = True
+                        break
+            if from_head:
+                self._track_head(items)
+            buffer.extend(self._fresh(items))
+
+            state.page_params = page.get("next_page_params")
+            if stop or not state.page_params or not page.get("items"):
+                state.done = True
+            if len(buffer) >= self.batch_size or state.done:
+                self._checkpoint(sink, buffer, flush)
+                rows += len(buffer)
+                buffer = []
+                if progress is not None:
+                    progress(rows)
+            if state.done:
+                break
+
+        if buffer or not state.done:
+            self._checkpoint(sink, buffer, flush)
+            rows += len(buffer)
+            if progress is not None:
+                progress(rows)
+        return rows
+
+    def poll(
+        self,
+        sink: Callable[[List[Dict[str, Any]]], Any],
+        flush: Optional[Callable[[], None]] = None,
+    ) -> int:
+        """
+        Fetch items newer than the head once and hand them over oldest first
+
+        Paging stops at the first item below the head block. Without a head
+        (no state, no backfill) the first poll only records the current head.
+        Pending items without a block are skipped until they are mined.
+        """
+        state = self.state
+        first_poll = state.head_block is None
+        new: List[Dict[str, Any]] = []
+        for page in self.client.iter_raw_pages(self.feed.endpoint):
+            stop = first_poll
+            for item in page.get("items", []):
+                block = self._block(item)
+                if block is None:
+                    continue
+                if not first_poll and block < state.head_block:
+                    stop = True
+                    break
+                new.append(item)
+            if stop:
+                break
+
+        new.reverse()
+        self._track_head(new)
+        if first_poll:
+            self._fresh(new)
+            state.save()
+            return 0
+
+        fresh = self._fresh(new)
+        for start in range(0, len(fresh), self.batch_size):
+            sink(fresh[start : start + self.batch_size])
+        if flush is not None:
+            flush()
+        state.rows += len(fresh)
+        state.save()
+        return len(fresh)
+
+    def follow(
+        self,
+        sink: Callable[[List[Dict[str, Any]]], Any],
+        interval: float = 5.0,
+        max_polls: Optional[int] = None,
+        progress: Optional[Callable[[int], None]] = None,
+        flush: Optional[Callable[[], None]] = None,
+        max_interval: float = 60.0,
+    ) -> int:
+        """
+        Poll the head every interval seconds (forever, or max_polls times)
+
+        Request errors are retried with exponential backoff up to
+        max_interval.
+
+        Returns:
+            Number of items handed to the sink
+        """
+        rows = 0
+        polls = 0
+        delay = interval
+        while max_polls is None or polls < max_polls:
+            try:
+                rows += self.poll(sink, flush)
+            except BlockScoutError:
+                time.sleep(delay)
+                delay = min(max_interval, delay * 2)
+                continue
+            delay = interval
+            polls += 1
+            if progress is not None:
+                progress(rows)
+            if max_polls is None or polls < max_polls:
+                time.sleep(interval)
+        return rows
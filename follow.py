@@ -0,0 +1,308 @@
+"""Chain-follow mode
+
+Tails the chain head through ``/main-page/blocks`` (falling back to
+``/blocks``) and yields every new block exactly once, in height order.
+
+Reorgs are detected by checking each block's ``parent_hash`` against a
+small window of recently emitted blocks; replaced blocks are announced with
+``rollback`` events before the new canonical blocks are emitted.
+
+A block only enters the window, and moves the head, once everything it
+needs (its transactions, the blocks of a reorg) has been fetched, so a
+failed request never skips a block: the next poll resumes right after the
+last emitted one. Blocks missed between polls are fetched and yielded one
+at a time.
+
+The poll interval adapts to the observed block time: after a block arrives
+the follower sleeps until shortly before the next one is due, then polls
+quickly until it shows up, backing off when blocks are late or requests
+fail.
+"""
+
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from .exceptions import BlockScoutAPIError, BlockScoutError
+
+
+class FollowEvent(NamedTuple):
+    """A new canonical block or the rollback of a replaced one"""
+
+    kind: str  # "block" | "rollback"
+    block: Dict[str, Any]
+    transactions: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def height(self) -> int:
+        return self.block["height"]
+
+    @property
+    def hash(self) -> str:
+        return self.block["hash"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"event": self.kind, "height": self.height, "hash": self.hash}
+        if self.kind == "block":
+            data["parent_hash"] = self.block.get("parent_hash")
+            data["timestamp"] = self.block.get("timestamp")
+            data["transaction_count"] = self.block.get("transaction_count")
+            if self.transactions is not None:
+                data["transactions"] = [tx.get("hash") for tx in self.transactions]
+        return data
+
+
+def _timestamp(block: Dict[str, Any]) -> Optional[float]:
+    value = block.get("timestamp")
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class ChainFollower:
+    """
+    Follow the chain head
+
+    Example:
+        follower = ChainFollower(client, transactions=True)
+        for event in follower.events():
+            if event.kind == "rollback":
+                undo(event.block)
+            else:
+                handle(event.block, event.transactions)
+
+    Args:
+        client: BlockScoutClient instance
+        transactions: Also fetch the transactions of every new block
+        start_height: First height to emit (default: the current head)
+        window: Number of recent blocks kept for reorg detection
+        min_interval: Shortest delay between polls in seconds
+        max_interval: Longest delay between polls in seconds
+        block_time: Initial block time estimate in seconds
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        transactions: bool = False,
+        start_height: Optional[int] = None,
+        window: int = 64,
+        min_interval: float = 0.5,
+        max_interval: float = 30.0,
+        block_time: float = 12.0,
+    ):
+        self.client = client
+        self.transactions = transactions
+        self.start_height = start_height
+        self.window = window
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.block_time = block_time
+        self.head: Optional[int] = None
+        self.reorgs = 0
+        self._recent: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._last_arrival: Optional[float] = None
+        self._empty_polls = 0
+        self._use_main_page = True
+
+    # Fetching
+
+    def _latest_blocks(self) -> List[Dict[str, Any]]:
+        """Newest blocks, ascending by height"""
+        if self._use_main_page:
+            try:
+                blocks = self.client.get_raw("/main-page/blocks")
+            except BlockScoutAPIError as e:
+                if e.status_code != 404:
+                    raise
+                self._use_main_page = False
+            else:
+                return sorted(blocks, key=lambda block: block["height"])
+        page = self.client.get_raw("/blocks", {"type": "block"})
+        return sorted(page.get("items", []), key=lambda block: block["height"])
+
+    def _fetch_block(self, height: int) -> Dict[str, Any]:
+        return self.client.get_raw(f"/blocks/{height}")
+
+    def _fetch_transactions(self, block: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if block.get("transaction_count") == 0:
+            return []
+        transactions: List[Dict[str, Any]] = []
+        for page in self.client.iter_raw_pages(
+            f"/blocks/{block['height']}/transactions"
+        ):
+            transactions.extend(page.get("items", []))
+        return transactions
+
+    # Window bookkeeping
+
+    def _prepare(self, block: Dict[str, Any]) -> FollowEvent:
+        """Fetch what the block event carries, without touching the window"""
+        transactions = self._fetch_transactions(block) if self.transactions else None
+        return FollowEvent("block", block, transactions)
+
+    def _commit(self, event: FollowEvent) -> FollowEvent:
+        """Add a prepared block to the window and move the head to it"""
+        block = event.block
+        self._observe_block_time(block)
+        self._recent[block["height"]] = block
+        while len(self._recent) > self.window:
+            self._recent.popitem(last=False)
+        self.head = block["height"]
+        return event
+
+    def _observe_block_time(self, block: Dict[str, Any]) -> None:
+        previous = self._recent.get(block["height"] - 1)
+        if previous is None:
+            return
+        current_ts, previous_ts = _timestamp(block), _timestamp(previous)
+        if current_ts is None or previous_ts is None or current_ts <= previous_ts:
+            return
+        # Exponential moving average of the block interval
+        self.block_time = 0.8 * self.block_time + 0.2 * (current_ts - previous_ts)
+
+    def _rollback(self, canonical: Dict[str, Any]) -> List[FollowEvent]:
+        """
+        Roll back emitted blocks until the canonical chain reconnects
+
+        Returns rollback events (newest first) followed by the canonical
+        replacement blocks (oldest first). The replacements are fetched
+        before the window changes, so a failed request leaves it intact.
+        """
+        height = canonical["height"]
+        # Emitted blocks at or above the canonical block's height
+        rollbacks = [
+            FollowEvent("rollback", self._recent[emitted_height])
+            for emitted_height in sorted(self._recent, reverse=True)
+            if emitted_height >= height
+        ]
+
+        # Walk back while the canonical parent differs from what we emitted
+        replacements = [canonical]
+        parent_height = height - 1
+        while True:
+            emitted = self._recent.get(parent_height)
+            if emitted is None or emitted["hash"] == replacements[-1]["parent_hash"]:
+                break
+            rollbacks.append(FollowEvent("rollback", emitted))
+            replacements.append(self._fetch_block(parent_height))
+            parent_height -= 1
+        blocks = [self._prepare(block) for block in reversed(replacements)]
+
+        self.reorgs += 1
+        for event in rollbacks:
+            del self._recent[event.height]
+        self.head = max(self._recent) if self._recent else None
+        return rollbacks + [self._commit(event) for event in blocks]
+
+    def _advance(self, block: Dict[str, Any]) -> Iterator[FollowEvent]:
+        """Emit block (and any blocks missed before it), handling reorgs"""
+        height = block["height"]
+        emitted = self._recent.get(height)
+        if emitted is not None:
+            if emitted["hash"] != block["hash"]:
+                yield from self._rollback(block)
+            return
+
+        if self.head is not None and height <= self.head:
+            # Older than the window; nothing to compare against
+            return
+
+        if self.head is not None and height > self.head + 1:
+            # Fill the gap oldest first so every height is emitted once
+            for missing in range(self.head + 1, height):
+                yield from self._advance(self._fetch_block(missing))
+
+        parent = self._recent.get(height - 1)
+        if parent is not None and parent["hash"] != block["parent_hash"]:
+            yield from self._rollback(block)
+            return
+        yield self._commit(self._prepare(block))
+
+    # Polling
+
+    def _poll(self) -> Iterator[FollowEvent]:
+        """Poll the head once, yielding each event as soon as it is committed"""
+        latest = self._latest_blocks()
+        if not latest:
+            return
+
+        if self.head is None:
+            start = self.start_height
+            if start is None:
+                start = latest[-1]["height"]
+            self.head = start - 1
+
+        arrived = False
+        try:
+            for block in latest:
+                if (
+                    self.head is None
+                    or block["height"] > self.head
+                    or block["height"] in self._recent
+                ):
+                    for event in self._advance(block):
+                        arrived = arrived or event.kind == "block"
+                        yield event
+        finally:
+            if arrived:
+                self._last_arrival = time.monotonic()
+                self._empty_polls = 0
+            else:
+                self._empty_polls += 1
+
+    def poll(self) -> List[FollowEvent]:
+        """
+        Poll the head once and return the resulting events
+
+        If a request fails after some blocks were emitted, those events are
+        returned and the next poll resumes after them.
+        """
+        events: List[FollowEvent] = []
+        try:
+            for event in self._poll():
+                events.append(event)
+        except BlockScoutError:
+            if not events:
+                raise
+        return events
+
+    def next_delay(self) -> float:
+        """Seconds to wait before the next poll"""
+        fast = max(self.min_interval, self.block_time / 10)
+        if self._last_arrival is not None and self._empty_polls == 0:
+            # Sleep until shortly before the next block is due
+            due = self._last_arrival + 0.8 * self.block_time - time.monotonic()
+            return min(self.max_interval, max(fast, due))
+        # Late block: poll quickly at first, then back off
+        backoff = fast * (1.5 ** max(0, self._empty_polls - 5))
+        return min(self.max_interval, backoff)
+
+    def events(self, max_blocks: Optional[int] = None) -> Iterator[FollowEvent]:
+        """
+        Yield events forever (or until max_blocks new blocks were emitted)
+
+        Events are yielded as soon as they are ready, so catching up on a
+        long gap streams blocks instead of fetching all of them first.
+        Request errors are retried with exponential backoff.
+        """
+        emitted = 0
+        error_delay = self.min_interval
+        while max_blocks is None or emitted < max_blocks:
+            try:
+                for event in self._poll():
+                    yield event
+                    if event.kind == "block":
+                        emitted += 1
+                        if max_blocks is not None and emitted >= max_blocks:
+                            return
+            except BlockScoutError:
+                time.sleep(error_delay)
+                error_delay = min(self.max_interval, error_delay * 2)
+                continue
+            error_delay = self.min_interval
+            time.sleep(self.next_delay())
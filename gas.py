@@ -0,0 +1,331 @@
+"""Vectorized gas and fee analytics over block ranges
+
+Block (and optionally transaction) gas fields arrive as JSON strings. They
+are parsed as they arrive into typed column buffers and the raw items are
+dropped, so a month-long range costs a few numbers per block, and
+percentiles, moving averages and histograms over it are single array
+passes.
+
+Wei amounts are float64 columns (exact to ~15 significant digits), which
+is plenty for statistics; burnt and priority fee totals are additionally
+summed as exact integers while parsing.
+"""
+
+from array import array
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .backfill import BlockBackfill
+from .columnar import Column, ColumnarBatch
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+BLOCK_COLUMNS = (
+    "gas_used",
+    "gas_limit",
+    "base_fee_per_gas",
+    "burnt_fees",
+    "priority_fee",
+    "transaction_count",
+)
+
+_BLOCK_SCHEMA = [Column("height", kind="int"), Column("timestamp", kind="datetime")]
+_BLOCK_SCHEMA += [Column(name, kind="float") for name in BLOCK_COLUMNS]
+
+_TX_SCHEMA = [
+    Column("gas_price", kind="float"),
+    Column("gas_used", kind="float"),
+    Column("fee", "fee.value", "float"),
+]
+
+
+def _raw(item: Any) -> Dict[str, Any]:
+    """Raw API item of a raw item or a model"""
+    return item if isinstance(item, dict) else item.model_dump(by_alias=True)
+
+
+def _floats(values: np.ndarray) -> np.ndarray:
+    """float64 column with missing values as NaN"""
+    return np.ma.filled(values, np.nan)
+
+
+class GasFrameBuilder:
+    """
+    Parse raw blocks (and transactions) into GasFrame columns as they arrive
+
+    Nothing but the typed column buffers is kept, so the builder can be fed
+    straight from a backfill sink.
+
+    Example:
+        builder = GasFrameBuilder(transactions=True)
+        BlockBackfill(client, start, end, transactions=True).run(builder.add)
+        frame = builder.build()
+    """
+
+    def __init__(self, transactions: bool = False):
+        self._blocks = ColumnarBatch(_BLOCK_SCHEMA)
+        self._transactions = ColumnarBatch(_TX_SCHEMA) if transactions else None
+        self._tx_block = array("q")
+        self.burnt_fees_total = 0
+        self.priority_fee_total = 0
+
+    def add_blocks(self, blocks: Sequence[Dict[str, Any]]) -> None:
+        """Append raw block items"""
+        self._blocks.append_items(blocks)
+        for block in blocks:
+            self.burnt_fees_total += int(block.get("burnt_fees") or 0)
+            self.priority_fee_total += int(block.get("priority_fee") or 0)
+
+    def add_transactions(
+        self, transactions: Sequence[Dict[str, Any]], height: Optional[int] = None
+    ) -> None:
+        """Append raw transaction items (of the block at height, if given)"""
+        if self._transactions is None:
+            raise ValueError("Builder was created without transactions")
+        self._transactions.append_items(transactions)
+        if height is not None:
+            self._tx_block.extend([height] * len(transactions))
+        else:
+            self._tx_block.extend(
+                tx.get("block_number") or tx.get("block") or -1 for tx in transactions
+            )
+
+    def add(
+        self, block: Dict[str, Any], transactions: Sequence[Dict[str, Any]] = ()
+    ) -> None:
+        """Append a block and its transactions (a BlockBackfill sink)"""
+        self.add_blocks([block])
+        if self._transactions is not None:
+            self.add_transactions(transactions, block["height"])
+
+    def build(self) -> "GasFrame":
+        """GasFrame of everything added, sorted by height"""
+        data = self._blocks.to_numpy()
+        height = np.asarray(data.pop("height"), dtype=np.int64)
+        order = np.argsort(height, kind="stable")
+        timestamp = data.pop("timestamp")[order]
+        columns = {name: _floats(values)[order] for name, values in data.items()}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            columns["utilization"] = columns["gas_used"] / columns["gas_limit"]
+
+        tx_block = None
+        tx_columns = None
+        if self._transactions is not None:
+            tx_block = np.frombuffer(self._tx_block, dtype=np.int64).copy()
+            tx_columns = {
+                name: _floats(values)
+                for name, values in self._transactions.to_numpy().items()
+            }
+        return GasFrame(
+            height[order],
+            timestamp,
+            columns,
+            tx_block,
+            tx_columns,
+            burnt_fees_total=self.burnt_fees_total,
+            priority_fee_total=self.priority_fee_total,
+        )
+
+
+class GasFrame:
+    """
+    Typed gas columns of a block range, one row per block sorted by height
+
+    Transaction columns (``gas_price``, ``fee`` and the transactions'
+    ``gas_used``) are present when transactions were ingested; ``tx_block``
+    holds the block height of every transaction.
+
+    Example:
+        frame = fetch_gas_frame(client, 19_000_000, 19_007_200, workers=16)
+        frame.percentiles("base_fee_per_gas")
+        frame.moving_average("utilization", 100)
+        frame.histogram("utilization", bins=10)
+    """
+
+    def __init__(
+        self,
+        height: np.ndarray,
+        timestamp: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        tx_block: Optional[np.ndarray] = None,
+        tx_columns: Optional[Dict[str, np.ndarray]] = None,
+        burnt_fees_total: int = 0,
+        priority_fee_total: int = 0,
+    ):
+        self.height = height
+        self.timestamp = timestamp
+        self.columns = columns
+        self.tx_block = tx_block
+        self.tx_columns = tx_columns or {}
+        self.burnt_fees_total = burnt_fees_total
+        self.priority_fee_total = priority_fee_total
+        self.errors: Dict[int, str] = {}
+
+    @classmethod
+    def from_blocks(
+        cls,
+        blocks: Iterable[Any],
+        transactions: Optional[Iterable[Any]] = None,
+    ) -> "GasFrame":
+        """Build from raw block items or Block models (and transactions)"""
+        builder = GasFrameBuilder(transactions=transactions is not None)
+        builder.add_blocks([_raw(block) for block in blocks])
+        if transactions is not None:
+            builder.add_transactions([_raw(tx) for tx in transactions])
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.height)
+
+    @property
+    def transaction_count(self) -> int:
+        return 0 if self.tx_block is None else len(self.tx_block)
+
+    def column(self, name: str) -> np.ndarray:
+        """A block column, or a transaction column prefixed with ``tx_``"""
+        if name.startswith("tx_") and name[3:] in self.tx_columns:
+            return self.tx_columns[name[3:]]
+        if name in self.columns:
+            return self.columns[name]
+        if name in self.tx_columns:
+            return self.tx_columns[name]
+        raise KeyError(f"Unknown gas column: {name}")
+
+    def percentiles(
+        self, name: str, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[float, float]:
+        """Percentiles of a column, ignoring missing values"""
+        values = self.column(name)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return {p: float("nan") for p in percentiles}
+        return dict(zip(percentiles, np.percentile(values, percentiles).tolist()))
+
+    def moving_average(self, name: str, window: int) -> np.ndarray:
+        """Trailing mean over ``window`` blocks (NaN until the window fills)
+
+        Missing values are skipped, so a window averages the blocks that
+        have the field.
+        """
+        values = self.column(name)
+        if window <= 0:
+            raise ValueError("window must be positive")
+        present = ~np.isnan(values)
+        sums = np.concatenate(([0.0], np.cumsum(np.where(present, values, 0.0))))
+        counts = np.concatenate(([0], np.cumsum(present)))
+        result = np.full(len(values), np.nan)
+        if len(values) >= window:
+            window_sums = sums[window:] - sums[:-window]
+            window_counts = counts[window:] - counts[:-window]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result[window - 1 :] = window_sums / window_counts
+        return result
+
+    def histogram(
+        self,
+        name: str = "utilization",
+        bins: int = 10,
+        range: Optional[Tuple[float, float]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(counts, bin edges) of a column; utilization defaults to [0, 1]"""
+        values = self.column(name)
+        values = values[~np.isnan(values)]
+        if range is None and name == "utilization":
+            range = (0.0, 1.0)
+        return np.histogram(np.clip(values, *range) if range else values, bins, range)
+
+    def block_percentiles(
+        self,
+        name: str = "gas_price",
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    ) -> np.ndarray:
+        """
+        Per-block percentiles of a transaction column
+
+        Returns:
+            Array of shape (blocks, percentiles) aligned with ``height``;
+            NaN for blocks without transactions. Uses the nearest-rank
+            method, computed for all blocks at once on one sorted copy.
+        """
+        if self.tx_block is None:
+            raise ValueError("No transactions were ingested")
+        values = self.tx_columns[name]
+        keep = ~np.isnan(values)
+        blocks, values = self.tx_block[keep], values[keep]
+        order = np.lexsort((values, blocks))
+        blocks, values = blocks[order], values[order]
+
+        starts = np.searchsorted(blocks, self.height, side="left")
+        ends = np.searchsorted(blocks, self.height, side="right")
+        counts = ends - starts
+        result = np.full((len(self.height), len(percentiles)), np.nan)
+        has = counts > 0
+        for column, p in enumerate(percentiles):
+            ranks = np.ceil(p / 100 * counts[has]).astype(np.int64) - 1
+            result[has, column] = values[starts[has] + np.maximum(ranks, 0)]
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        """Headline figures of the range"""
+        gas_used = self.columns["gas_used"]
+        utilization = self.columns["utilization"]
+        summary: Dict[str, Any] = {
+            "blocks": len(self),
+            "first_block": int(self.height[0]) if len(self) else None,
+            "last_block": int(self.height[-1]) if len(self) else None,
+            "gas_used": int(np.nansum(gas_used)),
+            "mean_utilization": float(np.nanmean(utilization)) if len(self) else None,
+            "burnt_fees": self.burnt_fees_total,
+            "priority_fees": self.priority_fee_total,
+            "transactions": int(np.nansum(self.columns["transaction_count"])),
+        }
+        if len(self) > 1:
+            seconds = (self.timestamp[-1] - self.timestamp[0]) / np.timedelta64(1, "s")
+            summary["seconds"] = float(seconds)
+        return summary
+
+    def to_pandas(self, moving_average: Optional[int] = None) -> pd.DataFrame:
+        """Per-block DataFrame, optionally with moving-average columns"""
+        df = pd.DataFrame({"height": self.height, "timestamp": self.timestamp})
+        for name, values in self.columns.items():
+            df[name] = values
+        if moving_average:
+            for name in ("base_fee_per_gas", "utilization"):
+                df[f"{name}_ma{moving_average}"] = self.moving_average(
+                    name, moving_average
+                )
+        return df
+
+
+def fetch_gas_frame(
+    client: Any,
+    start: int,
+    end: int,
+    workers: int = 8,
+    transactions: bool = False,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> GasFrame:
+    """
+    Fetch a block range concurrently and parse it into a GasFrame
+
+    Heights that failed or are not indexed are left out and reported in
+    ``GasFrame.errors``.
+
+    Args:
+        client: BlockScoutClient instance (shared by all workers)
+        start: First block height
+        end: Last block height (inclusive)
+        workers: Concurrent requests
+        transactions: Also fetch every block's transactions (gas prices)
+        progress: Callback receiving (blocks done, total blocks)
+    """
+    builder = GasFrameBuilder(transactions=transactions)
+    backfill = BlockBackfill(
+        client, start, end, workers=workers, transactions=transactions
+    )
+    backfill.run(builder.add, progress=progress)
+    frame = builder.build()
+    frame.errors = dict(backfill.errors)
+    return frame
@@ -0,0 +1,550 @@
+"""Compact transfer graphs for flow analytics
+
+Address hashes are mapped to dense integer ids and transfers are stored as
+compressed sparse row (CSR) adjacency arrays: for node ``i`` its outgoing
+edges are ``indptr[i]:indptr[i + 1]`` of the ``indices`` (receiver),
+``amount``, ``block`` and ``token`` columns. A second, permuted index gives
+the incoming edges. A transfer then costs ~32 bytes instead of a networkx
+edge dict, and neighbors, flow sums and k-hop reachability run as NumPy
+array operations. Addresses are kept lower-cased.
+
+Amounts are float64 in token units (base units scaled by the token
+decimals when they are known). They are meant for flow analytics; use the
+exact integer ``value`` of the transfers themselves for accounting. An
+ERC-721 transfer counts as 1.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .columnar import _require_pyarrow
+from .models.records import unpack_hash
+
+# Exported column names accepted by TransferGraph.from_parquet, in order of
+# preference: TOKEN_TRANSFER_SCHEMA, TOKEN_TRANSFER_RECORD_SCHEMA and
+# CRAWL_EDGE_SCHEMA files all work
+_PARQUET_COLUMNS = {
+    "from": ("from_hash", "from", "from_address"),
+    "to": ("to_hash", "to", "to_address"),
+    "value": ("total_value", "value"),
+    "decimals": ("token_decimals",),
+    "token": ("token_address",),
+    "block": ("block_number",),
+}
+
+
+def _transfer_fields(
+    transfer: Any,
+) -> Tuple[Optional[str], Optional[str], Any, Any, Optional[str], Optional[int]]:
+    """(from, to, value, decimals, token, block) of a raw item, model or record"""
+    if isinstance(transfer, dict):
+        total = transfer.get("total") or {}
+        token = transfer.get("token") or {}
+        return (
+            (transfer.get("from") or {}).get("hash"),
+            (transfer.get("to") or {}).get("hash"),
+            total.get("value"),
+            total.get("decimals") or token.get("decimals"),
+            token.get("address"),
+            transfer.get("block_number"),
+        )
+    if hasattr(transfer, "flags"):
+        return (
+            unpack_hash(transfer.from_address),
+            unpack_hash(transfer.to_address),
+            transfer.value,
+            transfer.token.decimals,
+            transfer.token.address,
+            transfer.block_number,
+        )
+    return (
+        transfer.from_.hash,
+        transfer.to.hash,
+        getattr(transfer.total, "value", None),
+        getattr(transfer.total, "decimals", None) or transfer.token.decimals,
+        transfer.token.address,
+        transfer.block_number,
+    )
+
+
+class _IdMap:
+    """Dense ids for lower-cased keys, assigned in first-seen order
+
+    The keys live in a list; a pandas Index (and, for Arrow input, an Arrow
+    array) mirror it for vectorized lookups and are extended lazily.
+    """
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self._index = pd.Index([], dtype=object)
+        self._arrow: Any = None
+
+    def _assign(self, keys: Sequence[str], ids: np.ndarray) -> np.ndarray:
+        """Give the keys not found (id -1) the next free ids; returns the mask"""
+        new = ids < 0
+        if new.any():
+            ids[new] = np.arange(len(self.keys), len(self.keys) + new.sum())
+            self.keys.extend(np.asarray(keys, dtype=object)[new].tolist())
+        return new
+
+    def lookup(self, values: Sequence[Optional[str]]) -> np.ndarray:
+        """Ids of values (-1 for missing ones), assigning ids to new keys"""
+        if type(values).__module__.startswith("pyarrow"):
+            return self._lookup_arrow(values)
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object), sort=False)
+        lowered, keys = pd.factorize(pd.Index(uniques, dtype=object).str.lower())
+        if len(self._index) < len(self.keys):
+            tail = pd.Index(self.keys[len(self._index) :], dtype=object)
+            self._index = self._index.append(tail)
+        ids = self._index.get_indexer(keys)
+        new = self._assign(keys, ids)
+        if new.any():
+            self._index = self._index.append(keys[new])
+        # factorize codes missing values as -1, which picks the trailing -1
+        return np.append(ids[lowered], -1)[codes]
+
+    def _lookup_arrow(self, values: Any) -> np.ndarray:
+        # Hashing in Arrow is ~3x faster than hashing Python strings
+        pa = _require_pyarrow()
+        import pyarrow.compute as pc
+
+        encoded = pc.dictionary_encode(pc.utf8_lower(pc.cast(values, pa.string())))
+        if self._arrow is None:
+            self._arrow = pa.array([], pa.string())
+        if len(self._arrow) < len(self.keys):
+            tail = pa.array(self.keys[len(self._arrow) :], pa.string())
+            self._arrow = pa.concat_arrays([self._arrow, tail])
+        keys = encoded.dictionary
+        ids = (
+            pc.index_in(keys, value_set=self._arrow)
+            .fill_null(-1)
+            .to_numpy()
+            .astype(np.int64)
+        )
+        new = self._assign(keys.to_numpy(zero_copy_only=False), ids)
+        if new.any():
+            self._arrow = pa.concat_arrays([self._arrow, keys.filter(pa.array(new))])
+        indices = encoded.indices.fill_null(len(ids)).to_numpy()
+        return np.append(ids, -1)[indices]
+
+
+class TransferGraphBuilder:
+    """
+    Accumulate transfers into column chunks, then build a TransferGraph
+
+    Example:
+        builder = TransferGraphBuilder()
+        for page in client.iter_token_transfer_pages(token_address):
+            builder.add_transfers(page["items"])
+        graph = builder.build()
+
+    Args:
+        chunk_size: Rows per vectorized id lookup; every chunk rehashes the
+            addresses seen so far, so larger chunks are faster but buffer
+            more rows
+    """
+
+    def __init__(self, chunk_size: int = 1_000_000):
+        self.chunk_size = chunk_size
+        self._addresses = _IdMap()
+        self._tokens = _IdMap()
+        self._chunks: List[Tuple[np.ndarray, ...]] = []
+        self._rows: List[Tuple[Any, ...]] = []
+
+    def add_transfers(self, transfers: Iterable[Any]) -> "TransferGraphBuilder":
+        """Add raw transfer items, TokenTransfer models or TokenTransferRecords"""
+        rows = self._rows
+        for transfer in transfers:
+            rows.append(_transfer_fields(transfer))
+            if len(rows) >= self.chunk_size:
+                self._flush_rows()
+        return self
+
+    def _flush_rows(self) -> None:
+        if not self._rows:
+            return
+        senders, receivers, values, decimals, tokens, blocks = zip(*self._rows)
+        self._rows = []
+        amounts = np.array(
+            [1.0 if value is None else float(value) for value in values]
+        ) / np.power(10.0, [int(d or 0) for d in decimals])
+        self.add_columns(
+            senders,
+            receivers,
+            amounts,
+            tokens,
+            np.array([-1 if b is None else b for b in blocks], dtype=np.int64),
+        )
+
+    def add_columns(
+        self,
+        senders: Sequence[Optional[str]],
+        receivers: Sequence[Optional[str]],
+        amounts: Any,
+        tokens: Optional[Sequence[Optional[str]]] = None,
+        blocks: Any = None,
+    ) -> "TransferGraphBuilder":
+        """
+        Add one chunk of edges given as parallel columns
+
+        Rows with a missing sender or receiver are dropped.
+
+        Args:
+            senders: Sender address hashes (sequence or Arrow string array)
+            receivers: Receiver address hashes (sequence or Arrow string array)
+            amounts: Amounts in token units (array-like of floats)
+            tokens: Token address of every edge (None for native transfers)
+            blocks: Block number of every edge (-1 when unknown)
+        """
+        count = len(senders)
+        # One lookup for both ends hashes the known addresses once per chunk
+        if type(senders).__module__.startswith("pyarrow"):
+            pa = _require_pyarrow()
+            parties = pa.concat_arrays([senders, receivers])
+        else:
+            parties = np.concatenate(
+                [np.asarray(senders, dtype=object), np.asarray(receivers, dtype=object)]
+            )
+        ids = self._addresses.lookup(parties)
+        src, dst = ids[:count], ids[count:]
+        token = (
+            self._tokens.lookup(tokens)
+            if tokens is not None
+            else np.full(count, -1, dtype=np.int64)
+        )
+        block = (
+            np.asarray(blocks, dtype=np.int64)
+            if blocks is not None
+            else np.full(count, -1, dtype=np.int64)
+        )
+        amount = np.asarray(amounts, dtype=np.float64)
+        keep = (src >= 0) & (dst >= 0)
+        if not keep.all():
+            src, dst, amount, token, block = (
+                column[keep] for column in (src, dst, amount, token, block)
+            )
+        self._chunks.append((src, dst, amount, token, block))
+        return self
+
+    def add_parquet(self, *paths: str) -> "TransferGraphBuilder":
+        """Add transfers from exported Parquet files, one row group at a time"""
+        pa = _require_pyarrow()
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        for path in paths:
+            parquet = pq.ParquetFile(path)
+            names = parquet.schema_arrow.names
+            columns = {}
+            for field, candidates in _PARQUET_COLUMNS.items():
+                columns[field] = next((c for c in candidates if c in names), None)
+            missing = [f for f in ("from", "to", "value") if columns[f] is None]
+            if missing:
+                raise ValueError(
+                    f"{path} has no {', '.join(missing)} column for a transfer graph"
+                )
+
+            wanted = [c for c in columns.values() if c is not None]
+            for batch in parquet.iter_batches(
+                batch_size=self.chunk_size, columns=wanted
+            ):
+                data = dict(zip(batch.schema.names, batch.columns))
+                picked = {
+                    field: data[name] if name else None
+                    for field, name in columns.items()
+                }
+
+                value = pc.cast(picked["value"], pa.float64(), safe=False)
+                amount = value.fill_null(1.0).to_numpy(zero_copy_only=False)
+                if picked["decimals"] is not None:
+                    decimals = pc.cast(picked["decimals"], pa.float64()).fill_null(0)
+                    amount = amount / np.power(
+                        10.0, decimals.to_numpy(zero_copy_only=False)
+                    )
+                block = picked["block"]
+                self.add_columns(
+                    picked["from"],
+                    picked["to"],
+                    amount,
+                    picked["token"],
+                    (
+                        pc.cast(block, pa.int64())
+                        .fill_null(-1)
+                        .to_numpy(zero_copy_only=False)
+                        if block is not None
+                        else None
+                    ),
+                )
+        return self
+
+    def build(self) -> "TransferGraph":
+        """Build the CSR graph from everything added so far"""
+        self._flush_rows()
+        if self._chunks:
+            src, dst, amount, token, block = (
+                np.concatenate(parts) for parts in zip(*self._chunks)
+            )
+        else:
+            src = dst = token = block = np.zeros(0, dtype=np.int64)
+            amount = np.zeros(0, dtype=np.float64)
+        return TransferGraph(
+            list(self._addresses.keys),
+            list(self._tokens.keys),
+            src,
+            dst,
+            amount,
+            token,
+            block,
+        )
+
+
+def _csr(keys: np.ndarray, nodes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(indptr, stable order) grouping edge positions by node"""
+    order = np.argsort(keys, kind="stable")
+    indptr = np.zeros(nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=nodes), out=indptr[1:])
+    return indptr, order
+
+
+def _gather(indptr: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """Edge positions of all nodes, concatenated"""
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    total = int(counts.sum())
+    if not total:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return offsets + np.arange(total)
+
+
+class TransferGraph:
+    """
+    Directed multigraph of transfers in CSR form
+
+    Build with ``TransferGraph.from_transfers(...)``,
+    ``TransferGraph.from_parquet(...)`` or a TransferGraphBuilder.
+
+    Example:
+        graph = TransferGraph.from_parquet("transfers.parquet")
+        graph.successors("0x...")
+        graph.flows(token=token_address).nlargest(10, "net")
+        graph.reachable("0x...", hops=3, min_amount=1000)
+    """
+
+    def __init__(
+        self,
+        addresses: List[str],
+        tokens: List[str],
+        src: np.ndarray,
+        dst: np.ndarray,
+        amount: np.ndarray,
+        token: np.ndarray,
+        block: np.ndarray,
+    ):
+        self.addresses = addresses
+        self.tokens = tokens
+        self._ids = {address: i for i, address in enumerate(addresses)}
+        self._token_ids = {t: i for i, t in enumerate(tokens)}
+        nodes = len(addresses)
+        index_type = np.int32 if max(nodes, len(src)) < 2**31 else np.int64
+
+        self.indptr, order = _csr(src, nodes)
+        self.indices = dst[order].astype(index_type)
+        self.amount = amount[order]
+        self.block = block[order]
+        self.token = token[order].astype(np.int32)
+
+        # Incoming edges: positions into the outgoing edge columns
+        self.in_indptr, in_order = _csr(self.indices, nodes)
+        self.in_edges = in_order.astype(index_type)
+        self.in_indices = self._sources()[in_order].astype(index_type)
+
+    @classmethod
+    def from_transfers(cls, transfers: Iterable[Any]) -> "TransferGraph":
+        """Graph of raw transfer items, TokenTransfer models or records"""
+        return TransferGraphBuilder().add_transfers(transfers).build()
+
+    @classmethod
+    def from_parquet(cls, *paths: str) -> "TransferGraph":
+        """Graph of exported transfer (or crawl edge) Parquet files"""
+        return TransferGraphBuilder().add_parquet(*paths).build()
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def __contains__(self, address: str) -> bool:
+        return address.lower() in self._ids
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    def node_id(self, address: str) -> int:
+        """Dense id of an address (KeyError if it is not in the graph)"""
+        return self._ids[address.lower()]
+
+    def _sources(self) -> np.ndarray:
+        """Sender id of every outgoing edge position"""
+        return np.repeat(
+            np.arange(len(self.addresses), dtype=self.indices.dtype),
+            np.diff(self.indptr),
+        )
+
+    def _edge_mask(
+        self,
+        token: Optional[str] = None,
+        min_amount: float = 0.0,
+        from_block: Optional[int] = None,
+        to_block: Optional[int] = None,
+    ) -> Optional[np.ndarray]:
+        """Boolean mask over edge positions, or None when nothing is filtered"""
+        mask = None
+
+        def both(condition):
+            return condition if mask is None else mask & condition
+
+        if token is not None:
+            token_id = self._token_ids.get(token.lower(), -2)
+            mask = both(self.token == token_id)
+        if min_amount:
+            mask = both(self.amount >= min_amount)
+        if from_block is not None:
+            mask = both(self.block >= from_block)
+        if to_block is not None:
+            mask = both(self.block <= to_block)
+        return mask
+
+    # Neighbors
+
+    def successors(self, address: str) -> List[str]:
+        """Distinct receivers of an address's transfers"""
+        node = self.node_id(address)
+        neighbors = np.unique(self.indices[self.indptr[node] : self.indptr[node + 1]])
+        return [self.addresses[i] for i in neighbors]
+
+    def predecessors(self, address: str) -> List[str]:
+        """Distinct senders of transfers to an address"""
+        node = self.node_id(address)
+        neighbors = np.unique(
+            self.in_indices[self.in_indptr[node] : self.in_indptr[node + 1]]
+        )
+        return [self.addresses[i] for i in neighbors]
+
+    def edges(self, address: str, direction: str = "out") -> pd.DataFrame:
+        """Transfers from ("out") or to ("in") an address as a DataFrame"""
+        node = self.node_id(address)
+        if direction == "out":
+            positions = np.arange(self.indptr[node], self.indptr[node + 1])
+            counterparties = self.indices[positions]
+        elif direction == "in":
+            window = slice(self.in_indptr[node], self.in_indptr[node + 1])
+            positions = self.in_edges[window]
+            counterparties = self.in_indices[window]
+        else:
+            raise ValueError("direction must be 'out' or 'in'")
+        tokens = self.token[positions]
+        return pd.DataFrame(
+            {
+                "counterparty": [self.addresses[i] for i in counterparties],
+                "amount": self.amount[positions],
+                "block_number": self.block[positions],
+                "token": [self.tokens[i] if i >= 0 else None for i in tokens],
+            }
+        )
+
+    # Flows
+
+    def flows(
+        self,
+        token: Optional[str] = None,
+        from_block: Optional[int] = None,
+        to_block: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Inflow, outflow and net flow of every address
+
+        Sums mix token units unless ``token`` selects one token.
+
+        Returns:
+            DataFrame indexed by address with "in", "out" and "net" columns
+        """
+        nodes = len(self.addresses)
+        mask = self._edge_mask(token, from_block=from_block, to_block=to_block)
+        weights = self.amount if mask is None else np.where(mask, self.amount, 0.0)
+        outflow = np.bincount(self._sources(), weights=weights, minlength=nodes)
+        inflow = np.bincount(self.indices, weights=weights, minlength=nodes)
+        return pd.DataFrame(
+            {"in": inflow, "out": outflow, "net": inflow - outflow},
+            index=pd.Index(self.addresses, name="address"),
+        )
+
+    def flow(self, address: str, token: Optional[str] = None) -> Tuple[float, float]:
+        """(inflow, outflow) of one address"""
+        node = self.node_id(address)
+        out_positions = slice(self.indptr[node], self.indptr[node + 1])
+        in_positions = self.in_edges[self.in_indptr[node] : self.in_indptr[node + 1]]
+        if token is None:
+            return (
+                float(self.amount[in_positions].sum()),
+                float(self.amount[out_positions].sum()),
+            )
+        token_id = self._token_ids.get(token.lower(), -2)
+        inflow = self.amount[in_positions][self.token[in_positions] == token_id]
+        outflow = self.amount[out_positions][self.token[out_positions] == token_id]
+        return float(inflow.sum()), float(outflow.sum())
+
+    # Reachability
+
+    def reachable(
+        self,
+        address: str,
+        hops: int,
+        direction: str = "out",
+        token: Optional[str] = None,
+        min_amount: float = 0.0,
+        from_block: Optional[int] = None,
+        to_block: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Addresses reachable within ``hops`` transfers, with their distance
+
+        Args:
+            address: Start address
+            hops: Maximum number of transfers to follow
+            direction: "out" follows funds forward, "in" traces them back,
+                "both" ignores direction
+            token: Only follow transfers of this token
+            min_amount: Only follow transfers of at least this amount
+            from_block: Only follow transfers at or after this block
+            to_block: Only follow transfers at or before this block
+        """
+        if direction not in ("out", "in", "both"):
+            raise ValueError("direction must be 'out', 'in' or 'both'")
+        mask = self._edge_mask(token, min_amount, from_block, to_block)
+        start = self.node_id(address)
+        distance = np.full(len(self.addresses), -1, dtype=np.int32)
+        distance[start] = 0
+        frontier = np.array([start], dtype=np.int64)
+
+        for hop in range(1, hops + 1):
+            found = []
+            if direction in ("out", "both"):
+                positions = _gather(self.indptr, frontier)
+                if mask is not None:
+                    positions = positions[mask[positions]]
+                found.append(self.indices[positions])
+            if direction in ("in", "both"):
+                positions = _gather(self.in_indptr, frontier)
+                if mask is not None:
+                    positions = positions[mask[self.in_edges[positions]]]
+                found.append(self.in_indices[positions])
+            neighbors = np.unique(np.concatenate(found))
+            frontier = neighbors[distance[neighbors] < 0].astype(np.int64)
+            if not len(frontier):
+                break
+            distance[frontier] = hop
+
+        reached = np.flatnonzero(distance > 0)
+        return {self.addresses[i]: int(distance[i]) for i in reached}
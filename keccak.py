@@ -0,0 +1,211 @@
+"""Keccak-256 hashing for event topics, function selectors and checksums
+
+Ethereum uses the original Keccak padding, not the NIST SHA3 one, so
+``hashlib.sha3_256`` gives different digests. When pycryptodome is
+installed (``pip install pycryptodome``) its C implementation is used;
+otherwise a pure-Python Keccak-f[1600] permutation is, which is plenty for
+hashing signatures and addresses.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, List
+
+_MASK = (1 << 64) - 1
+_RATE = 136  # bytes absorbed per permutation for a 256-bit digest
+
+_ROUND_CONSTANTS = [
+    0x0000000000000001,
+    0x0000000000008082,
+    0x800000000000808A,
+    0x8000000080008000,
+    0x000000000000808B,
+    0x0000000080000001,
+    0x8000000080008081,
+    0x8000000000008009,
+    0x000000000000008A,
+    0x0000000000000088,
+    0x0000000080008009,
+    0x000000008000000A,
+    0x000000008000808B,
+    0x800000000000008B,
+    0x8000000000008089,
+    0x8000000000008003,
+    0x8000000000008002,
+    0x8000000000000080,
+    0x000000000000800A,
+    0x800000008000000A,
+    0x8000000080008081,
+    0x8000000000008080,
+    0x0000000080000001,
+    0x8000000080008008,
+]
+
+# Rotation offsets indexed by lane x + 5 * y
+_ROTATIONS = [
+    0, 1, 62, 28, 27,
+    36, 44, 6, 55, 20,
+    3, 10, 43, 25, 39,
+    41, 45, 15, 21, 8,
+    18, 2, 61, 56, 14,
+]  # fmt: skip
+
+# Destination lane of the pi step: B[y, 2x + 3y] = A[x, y]
+_PI = [y + 5 * ((2 * x + 3 * y) % 5) for y in range(5) for x in range(5)]
+_PI_SOURCES = [x + 5 * y for y in range(5) for x in range(5)]
+
+
+def _rotl(value: int, shift: int) -> int:
+    return ((value << shift) | (value >> (64 - shift))) & _MASK if shift else value
+
+
+def _keccak_f(lanes: List[int]) -> None:
+    """Keccak-f[1600] permutation over 25 64-bit lanes, in place"""
+    b = [0] * 25
+    for constant in _ROUND_CONSTANTS:
+        # theta
+        c = [
+            lanes[x] ^ lanes[x + 5] ^ lanes[x + 10] ^ lanes[x + 15] ^ lanes[x + 20]
+            for x in range(5)
+        ]
+        for x in range(5):
+            d = c[(x - 1) % 5] ^ _rotl(c[(x + 1) % 5], 1)
+            for y in range(0, 25, 5):
+                lanes[x + y] ^= d
+        # rho and pi
+        for source, destination in zip(_PI_SOURCES, _PI):
+            b[destination] = _rotl(lanes[source], _ROTATIONS[source])
+        # chi
+        for y in range(0, 25, 5):
+            row = b[y : y + 5]
+            for x in range(5):
+                lanes[x + y] = row[x] ^ (~row[(x + 1) % 5] & row[(x + 2) % 5])
+        # iota
+        lanes[0] ^= constant
+
+
+def _keccak256_python(data: bytes) -> bytes:
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(b"\x00" * (-len(padded) % _RATE))
+    padded[-1] |= 0x80
+
+    lanes = [0] * 25
+    for offset in range(0, len(padded), _RATE):
+        block = padded[offset : offset + _RATE]
+        for i in range(_RATE // 8):
+            lanes[i] ^= int.from_bytes(block[i * 8 : i * 8 + 8], "little")
+        _keccak_f(lanes)
+    return b"".join(lane.to_bytes(8, "little") for lane in lanes[:4])
+
+
+def _native_keccak256() -> Callable[[bytes], bytes]:
+    try:
+        from Crypto.Hash import keccak
+    except ImportError:
+        return _keccak256_python
+    return lambda data: keccak.new(digest_bits=256, data=data).digest()
+
+
+keccak256: Callable[[bytes], bytes] = _native_keccak256()
+keccak256.__doc__ = "Keccak-256 digest of data"
+
+
+# Signatures
+
+_ALIASES = {"uint": "uint256", "int": "int256", "byte": "bytes1"}
+
+
+def _split_top_level(params: str) -> List[str]:
+    """Split a parameter list on commas outside parentheses"""
+    parts, depth, current = [], 0, []
+    for char in params:
+        if char == "," and depth == 0:
+            parts.append("".join(current))
+            current = []
+            continue
+        depth += char == "("
+        depth -= char == ")"
+        current.append(char)
+    if current or parts:
+        parts.append("".join(current))
+    return [part.strip() for part in parts]
+
+
+def _canonical_type(param: str) -> str:
+    param = param.strip()
+    if param.startswith("("):
+        # Tuple: canonicalize the components, keep any array suffix
+        depth = 0
+        for position, char in enumerate(param):
+            depth += char == "("
+            depth -= char == ")"
+            if depth == 0:
+                break
+        inner = ",".join(
+            _canonical_type(p) for p in _split_top_level(param[1:position]) if p
+        )
+        suffix = (
+            param[position + 1 :].split()[0] if param[position + 1 :].strip() else ""
+        )
+        return f"({inner}){suffix}"
+    if param.startswith("tuple("):
+        return _canonical_type(param[len("tuple") :])
+    name = param.split()[0]
+    match = re.match(r"([a-z]+)(\d*)((?:\[\d*\])*)$", name)
+    if not match:
+        raise ValueError(f"Invalid ABI type: {param!r}")
+    base, bits, arrays = match.groups()
+    return _ALIASES.get(base + bits, base + bits) + arrays
+
+
+@lru_cache(maxsize=4096)
+def canonical_signature(signature: str) -> str:
+    """
+    Normalize a human-readable signature to its canonical form
+
+    ``"Transfer(address indexed from, address to, uint value)"`` becomes
+    ``"Transfer(address,address,uint256)"``. An optional leading
+    ``event``/``function`` keyword is dropped.
+    """
+    signature = re.sub(r"^\s*(event|function)\s+", "", signature.strip())
+    open_paren = signature.find("(")
+    if open_paren <= 0:
+        raise ValueError(f"Invalid signature: {signature!r}")
+    name = signature[:open_paren].strip()
+    # Match the parameter list's closing paren; anything after it (modifiers,
+    # "returns (...)") is ignored
+    depth = 0
+    for position in range(open_paren, len(signature)):
+        depth += signature[position] == "("
+        depth -= signature[position] == ")"
+        if depth == 0:
+            break
+    else:
+        raise ValueError(f"Invalid signature: {signature!r}")
+    params = _split_top_level(signature[open_paren + 1 : position])
+    return f"{name}({','.join(_canonical_type(p) for p in params if p)})"
+
+
+@lru_cache(maxsize=4096)
+def event_topic(signature: str) -> str:
+    """topics[0] of an event, e.g. event_topic("Transfer(address,address,uint256)")"""
+    return "0x" + keccak256(canonical_signature(signature).encode()).hex()
+
+
+@lru_cache(maxsize=4096)
+def function_selector(signature: str) -> str:
+    """4-byte selector of a function, e.g. function_selector("transfer(address,uint256)")"""
+    return "0x" + keccak256(canonical_signature(signature).encode())[:4].hex()
+
+
+def to_checksum_address(address: str) -> str:
+    """EIP-55 mixed-case checksum form of an address"""
+    hex_address = address.lower().replace("0x", "", 1)
+    if not re.fullmatch(r"[0-9a-f]{40}", hex_address):
+        raise ValueError(f"Invalid address: {address!r}")
+    digest = keccak256(hex_address.encode()).hex()
+    return "0x" + "".join(
+        char.upper() if int(nibble, 16) >= 8 else char
+        for char, nibble in zip(hex_address, digest)
+    )
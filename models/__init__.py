@@ -16,6 +16,10 @@ from .transaction import *
 from .token import *
 from .block import *
 from .search import *
+from .contract import *
+from .records import *
+from .bundle import *
+from .stats import *
 
 
 # Rebuild models to resolve forward references
@@ -0,0 +1,36 @@
+"""Composite models fetched by the client's bundle methods"""
+
+from typing import Any, Dict, List, Optional
+from pydantic import Field
+from .base import BaseBlockScoutModel
+from .block import Block, Withdrawal
+from .transaction import (
+    InternalTransaction,
+    Log,
+    StateChange,
+    Transaction,
+    TransactionSummary,
+)
+from .token import TokenTransfer
+
+
+class TransactionBundle(BaseBlockScoutModel):
+    """Transaction with all of its sub-resources"""
+
+    transaction: Transaction
+    token_transfers: List[TokenTransfer] = Field(default_factory=list)
+    logs: List[Log] = Field(default_factory=list)
+    internal_transactions: List[InternalTransaction] = Field(default_factory=list)
+    state_changes: List[StateChange] = Field(default_factory=list)
+    summary: Optional[TransactionSummary] = None
+    raw_trace: Optional[List[Dict[str, Any]]] = None
+    errors: Dict[str, str] = Field(default_factory=dict)  # sub-resource -> error
+
+
+class BlockBundle(BaseBlockScoutModel):
+    """Block with all of its transactions and withdrawals"""
+
+    block: Block
+    transactions: List[Transaction] = Field(default_factory=list)
+    withdrawals: List[Withdrawal] = Field(default_factory=list)
+    errors: Dict[str, str] = Field(default_factory=dict)  # sub-resource -> error
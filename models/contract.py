@@ -0,0 +1,52 @@
+"""Smart contract models"""
+
+from typing import Any, Dict, List, Optional, Union
+from .base import BaseBlockScoutModel
+
+
+class ExternalLibrary(BaseBlockScoutModel):
+    """Library linked into a verified contract"""
+
+    name: str
+    address_hash: str
+
+
+class ContractSource(BaseBlockScoutModel):
+    """Additional source file of a verified contract"""
+
+    file_path: Optional[str] = None
+    source_code: Optional[str] = None
+
+
+class SmartContract(BaseBlockScoutModel):
+    """Smart contract model"""
+
+    verified_twin_address_hash: Optional[str] = None
+    is_verified: Optional[bool] = None
+    is_changed_bytecode: Optional[bool] = None
+    is_partially_verified: Optional[bool] = None
+    is_fully_verified: Optional[bool] = None
+    is_verified_via_sourcify: Optional[bool] = None
+    is_verified_via_eth_bytecode_db: Optional[bool] = None
+    is_self_destructed: Optional[bool] = None
+    can_be_visualized_via_sol2uml: Optional[bool] = None
+    minimal_proxy_address_hash: Optional[str] = None
+    sourcify_repo_url: Optional[str] = None
+    name: Optional[str] = None
+    optimization_enabled: Optional[bool] = None
+    optimizations_runs: Optional[int] = None
+    compiler_version: Optional[str] = None
+    evm_version: Optional[str] = None
+    verified_at: Optional[str] = None
+    abi: Optional[Union[List[Dict[str, Any]], str]] = None
+    source_code: Optional[str] = None
+    file_path: Optional[str] = None
+    compiler_settings: Optional[Dict[str, Any]] = None
+    constructor_args: Optional[str] = None
+    additional_sources: List[ContractSource] = []
+    decoded_constructor_args: Optional[List[Any]] = None
+    deployed_bytecode: Optional[str] = None
+    creation_bytecode: Optional[str] = None
+    external_libraries: List[ExternalLibrary] = []
+    language: Optional[str] = None
+    status: Optional[str] = None
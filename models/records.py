@@ -0,0 +1,630 @@
+"""Compact record types for high-volume entities
+
+Pydantic models keep a ``__dict__``, a fields-set and nested ``AddressParam``
+objects per item, which adds up to kilobytes per holder or transfer. The
+record classes below use ``__slots__``, store hashes as fixed-width bytes,
+amounts as ``int`` and intern repeated strings, so millions of them fit in a
+fraction of the memory.
+
+Records can be built from the Pydantic models (``from_model``) or straight
+from raw API items (``from_json``) and converted back with ``to_model``.
+Hashes come back lowercase, and fields a record does not keep (tags,
+decoded input, ...) are filled with neutral defaults.
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .base import AddressParam, TokenInfo
+from .block import Block
+from .token import Holder, TokenTransfer, TotalERC20, TotalERC721, TotalERC1155
+from .transaction import Fee, Transaction
+
+
+def pack_hash(value: Optional[str]) -> Optional[bytes]:
+    """Convert a 0x-prefixed hex hash to raw bytes"""
+    if value is None:
+        return None
+    return bytes.fromhex(value[2:] if value[:2] in ("0x", "0X") else value)
+
+
+def unpack_hash(value: Optional[bytes]) -> Optional[str]:
+    """Convert raw hash bytes back to a 0x-prefixed hex string"""
+    if value is None:
+        return None
+    return "0x" + value.hex()
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def _to_str(value: Optional[int]) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
+
+def _address_flags(param: Any) -> int:
+    """Pack is_contract / is_verified of an address param into two bits"""
+    if param is None:
+        return 0
+    if isinstance(param, dict):
+        return int(bool(param.get("is_contract"))) | (
+            int(bool(param.get("is_verified"))) << 1
+        )
+    return int(bool(param.is_contract)) | (int(bool(param.is_verified)) << 1)
+
+
+def _address_param(address: Optional[bytes], flags: int) -> Optional[AddressParam]:
+    if address is None:
+        return None
+    return AddressParam(
+        hash=unpack_hash(address),
+        is_contract=bool(flags & 1),
+        is_verified=bool(flags & 2),
+    )
+
+
+class _Record(ABC):
+    """Base class for slotted records"""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to a flat dictionary"""
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._values()))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items())
+        return f"{type(self).__name__}({fields})"
+
+
+class HolderRecord(_Record):
+    """Compact token holder"""
+
+    __slots__ = ("address", "value", "token_id", "flags")
+
+    def __init__(
+        self,
+        address: bytes,
+        value: int,
+        token_id: Optional[int] = None,
+        flags: int = 0,
+    ):
+        self.address = address
+        self.value = value
+        self.token_id = token_id
+        self.flags = flags
+
+    @property
+    def is_contract(self) -> bool:
+        return bool(self.flags & 1)
+
+    @property
+    def is_verified(self) -> bool:
+        return bool(self.flags & 2)
+
+    @classmethod
+    def from_json(cls, item: Dict[str, Any]) -> "HolderRecord":
+        """Build record from a raw API item"""
+        address = item["address"]
+        return cls(
+            pack_hash(address["hash"]),
+            int(item["value"]),
+            _to_int(item.get("token_id")),
+            _address_flags(address),
+        )
+
+    @classmethod
+    def from_model(cls, holder: Holder) -> "HolderRecord":
+        """Build record from a Holder model"""
+        return cls(
+            pack_hash(holder.address.hash),
+            int(holder.value),
+            _to_int(holder.token_id),
+            _address_flags(holder.address),
+        )
+
+    def to_model(self) -> Holder:
+        """Convert record back to a Holder model"""
+        return Holder(
+            address=_address_param(self.address, self.flags),
+            value=str(self.value),
+            token_id=_to_str(self.token_id),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to a flat dictionary"""
+        data = {
+            "address": unpack_hash(self.address),
+            "value": str(self.value),
+            "is_contract": self.is_contract,
+        }
+        if self.token_id is not None:
+            data["token_id"] = str(self.token_id)
+        return data
+
+
+class TokenTransferRecord(_Record):
+    """Compact token transfer
+
+    The token metadata is shared between records of the same token instead
+    of being copied into every transfer.
+    """
+
+    __slots__ = (
+        "transaction_hash",
+        "log_index",
+        "block_hash",
+        "block_number",
+        "timestamp",
+        "from_address",
+        "to_address",
+        "flags",
+        "token",
+        "value",
+        "token_id",
+        "type",
+        "method",
+    )
+
+    def __init__(
+        self,
+        transaction_hash: bytes,
+        log_index: int,
+        block_hash: bytes,
+        from_address: bytes,
+        to_address: bytes,
+        token: TokenInfo,
+        value: Optional[int] = None,
+        token_id: Optional[int] = None,
+        type: str = "token_transfer",
+        method: Optional[str] = None,
+        timestamp: Optional[str] = None,
+        block_number: Optional[int] = None,
+        flags: int = 0,
+    ):
+        self.transaction_hash = transaction_hash
+        self.log_index = log_index
+        self.block_hash = block_hash
+        self.block_number = block_number
+        self.timestamp = timestamp
+        self.from_address = from_address
+        self.to_address = to_address
+        self.flags = flags
+        self.token = token
+        self.value = value
+        self.token_id = token_id
+        self.type = type
+        self.method = method
+
+    def _values(self) -> tuple:
+        # TokenInfo is an unhashable Pydantic model; the token is identified
+        # by its address
+        return tuple(
+            self.token.address if name == "token" else getattr(self, name)
+            for name in self.__slots__
+        )
+
+    @classmethod
+    def from_json(
+        cls,
+        item: Dict[str, Any],
+        token_cache: Optional[Dict[str, TokenInfo]] = None,
+    ) -> "TokenTransferRecord":
+        """Build record from a raw API item
+
+        Args:
+            item: Raw token transfer item
+            token_cache: Optional dict shared between calls so every transfer
+                of the same token references a single TokenInfo
+        """
+        token_data = item["token"]
+        cache = token_cache if token_cache is not None else {}
+        token = cache.get(token_data["address"])
+        if token is None:
+            token = cache.setdefault(token_data["address"], TokenInfo(**token_data))
+        total = item.get("total") or {}
+        return cls(
+            pack_hash(item["transaction_hash"]),
+            item["log_index"],
+            pack_hash(item["block_hash"]),
+            pack_hash(item["from"]["hash"]),
+            pack_hash(item["to"]["hash"]),
+            token,
+            value=_to_int(total.get("value")),
+            token_id=_to_int(total.get("token_id")),
+            type=_intern(item.get("type", "token_transfer")),
+            method=_intern(item.get("method")),
+            timestamp=item.get("timestamp"),
+            block_number=item.get("block_number"),
+            flags=_address_flags(item["from"]) | (_address_flags(item["to"]) << 2),
+        )
+
+    @classmethod
+    def from_model(
+        cls,
+        transfer: TokenTransfer,
+        token_cache: Optional[Dict[str, TokenInfo]] = None,
+    ) -> "TokenTransferRecord":
+        """Build record from a TokenTransfer model"""
+        cache = token_cache if token_cache is not None else {}
+        token = cache.setdefault(transfer.token.address, transfer.token)
+        return cls(
+            pack_hash(transfer.transaction_hash),
+            transfer.log_index,
+            pack_hash(transfer.block_hash),
+            pack_hash(transfer.from_.hash),
+            pack_hash(transfer.to.hash),
+            token,
+            value=_to_int(getattr(transfer.total, "value", None)),
+            token_id=_to_int(getattr(transfer.total, "token_id", None)),
+            type=_intern(transfer.type),
+            method=_intern(transfer.method),
+            timestamp=transfer.timestamp,
+            block_number=transfer.block_number,
+            flags=_address_flags(transfer.from_) | (_address_flags(transfer.to) << 2),
+        )
+
+    def to_model(self) -> TokenTransfer:
+        """Convert record back to a TokenTransfer model"""
+        total: Union[TotalERC20, TotalERC721, TotalERC1155]
+        if self.token_id is None:
+            total = TotalERC20(
+                decimals=self.token.decimals or "0", value=str(self.value)
+            )
+        elif self.value is None:
+            total = TotalERC721(token_id=str(self.token_id))
+        else:
+            total = TotalERC1155(
+                token_id=str(self.token_id),
+                decimals=self.token.decimals,
+                value=str(self.value),
+            )
+        return TokenTransfer(
+            block_hash=unpack_hash(self.block_hash),
+            block_number=self.block_number,
+            from_=_address_param(self.from_address, self.flags & 3),
+            log_index=self.log_index,
+            method=self.method,
+            timestamp=self.timestamp,
+            to=_address_param(self.to_address, self.flags >> 2),
+            token=self.token,
+            total=total,
+            transaction_hash=unpack_hash(self.transaction_hash),
+            type=self.type,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to a flat dictionary"""
+        data = {
+            "transaction_hash": unpack_hash(self.transaction_hash),
+            "log_index": self.log_index,
+            "block_hash": unpack_hash(self.block_hash),
+            "block_number": self.block_number,
+            "timestamp": self.timestamp,
+            "from": unpack_hash(self.from_address),
+            "to": unpack_hash(self.to_address),
+            "token_address": self.token.address,
+            "token_symbol": self.token.symbol,
+            "value": _to_str(self.value),
+            "token_id": _to_str(self.token_id),
+            "type": self.type,
+            "method": self.method,
+        }
+        return {k: v for k, v in data.items() if v is not None}
+
+
+class TransactionRecord(_Record):
+    """Compact transaction summary"""
+
+    __slots__ = (
+        "hash",
+        "block_number",
+        "position",
+        "timestamp",
+        "from_address",
+        "to_address",
+        "value",
+        "fee",
+        "gas_limit",
+        "gas_used",
+        "gas_price",
+        "nonce",
+        "type",
+        "status",
+        "method",
+    )
+
+    def __init__(
+        self,
+        hash: bytes,
+        block_number: int,
+        position: int,
+        timestamp: str,
+        from_address: bytes,
+        to_address: Optional[bytes],
+        value: int,
+        fee: int,
+        gas_limit: int,
+        gas_used: Optional[int] = None,
+        gas_price: Optional[int] = None,
+        nonce: int = 0,
+        type: int = 0,
+        status: str = "ok",
+        method: Optional[str] = None,
+    ):
+        self.hash = hash
+        self.block_number = block_number
+        self.position = position
+        self.timestamp = timestamp
+        self.from_address = from_address
+        self.to_address = to_address
+        self.value = value
+        self.fee = fee
+        self.gas_limit = gas_limit
+        self.gas_used = gas_used
+        self.gas_price = gas_price
+        self.nonce = nonce
+        self.type = type
+        self.status = status
+        self.method = method
+
+    @classmethod
+    def from_json(cls, item: Dict[str, Any]) -> "TransactionRecord":
+        """Build record from a raw API item"""
+        to = item.get("to")
+        return cls(
+            pack_hash(item["hash"]),
+            item["block_number"],
+            item["position"],
+            item["timestamp"],
+            pack_hash(item["from"]["hash"]),
+            pack_hash(to["hash"]) if to else None,
+            int(item["value"]),
+            int(item["fee"]["value"]),
+            int(item["gas_limit"]),
+            _to_int(item.get("gas_used")),
+            _to_int(item.get("gas_price")),
+            item.get("nonce", 0),
+            item.get("type", 0),
+            _intern(item.get("status", "ok")),
+            _intern(item.get("method")),
+        )
+
+    @classmethod
+    def from_model(cls, tx: Transaction) -> "TransactionRecord":
+        """Build record from a Transaction model"""
+        return cls(
+            pack_hash(tx.hash),
+            tx.block_number,
+            tx.position,
+            tx.timestamp,
+            pack_hash(tx.from_.hash),
+            pack_hash(tx.to.hash) if tx.to else None,
+            int(tx.value),
+            int(tx.fee.value),
+            tx.gas_limit,
+            _to_int(tx.gas_used),
+            _to_int(tx.gas_price),
+            tx.nonce,
+            tx.type,
+            _intern(tx.status),
+            _intern(tx.method),
+        )
+
+    def to_model(self) -> Transaction:
+        """Convert record back to a summary Transaction model"""
+        return Transaction(
+            timestamp=self.timestamp,
+            fee=Fee(type="actual", value=str(self.fee)),
+            gas_limit=self.gas_limit,
+            block_number=self.block_number,
+            status=self.status,
+            method=self.method,
+            confirmations=0,
+            type=self.type,
+            exchange_rate="0",
+            to=_address_param(self.to_address, 0),
+            hash=unpack_hash(self.hash),
+            gas_price=_to_str(self.gas_price),
+            from_=_address_param(self.from_address, 0),
+            gas_used=_to_str(self.gas_used),
+            position=self.position,
+            nonce=self.nonce,
+            raw_input="0x",
+            value=str(self.value),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to a flat dictionary"""
+        data = {
+            "hash": unpack_hash(self.hash),
+            "block_number": self.block_number,
+            "position": self.position,
+            "timestamp": self.timestamp,
+            "from": unpack_hash(self.from_address),
+            "to": unpack_hash(self.to_address),
+            "value": str(self.value),
+            "fee": str(self.fee),
+            "gas_limit": self.gas_limit,
+            "gas_used": _to_str(self.gas_used),
+            "gas_price": _to_str(self.gas_price),
+            "nonce": self.nonce,
+            "type": self.type,
+            "status": self.status,
+            "method": self.method,
+        }
+        return {k: v for k, v in data.items() if v is not None}
+
+
+class BlockRecord(_Record):
+    """Compact block summary"""
+
+    __slots__ = (
+        "height",
+        "hash",
+        "parent_hash",
+        "timestamp",
+        "miner",
+        "gas_used",
+        "gas_limit",
+        "base_fee_per_gas",
+        "burnt_fees",
+        "priority_fee",
+        "transaction_count",
+        "size",
+        "type",
+    )
+
+    def __init__(
+        self,
+        height: int,
+        hash: bytes,
+        parent_hash: bytes,
+        timestamp: str,
+        miner: bytes,
+        gas_used: int,
+        gas_limit: int,
+        base_fee_per_gas: Optional[int] = None,
+        burnt_fees: Optional[int] = None,
+        priority_fee: Optional[int] = None,
+        transaction_count: int = 0,
+        size: int = 0,
+        type: str = "block",
+    ):
+        self.height = height
+        self.hash = hash
+        self.parent_hash = parent_hash
+        self.timestamp = timestamp
+        self.miner = miner
+        self.gas_used = gas_used
+        self.gas_limit = gas_limit
+        self.base_fee_per_gas = base_fee_per_gas
+        self.burnt_fees = burnt_fees
+        self.priority_fee = priority_fee
+        self.transaction_count = transaction_count
+        self.size = size
+        self.type = type
+
+    @classmethod
+    def from_json(cls, item: Dict[str, Any]) -> "BlockRecord":
+        """Build record from a raw API item"""
+        return cls(
+            item["height"],
+            pack_hash(item["hash"]),
+            pack_hash(item["parent_hash"]),
+            item["timestamp"],
+            pack_hash(item["miner"]["hash"]),
+            int(item["gas_used"]),
+            int(item["gas_limit"]),
+            _to_int(item.get("base_fee_per_gas")),
+            _to_int(item.get("burnt_fees")),
+            _to_int(item.get("priority_fee")),
+            item.get("transaction_count", 0),
+            item.get("size", 0),
+            _intern(item.get("type", "block")),
+        )
+
+    @classmethod
+    def from_model(cls, block: Block) -> "BlockRecord":
+        """Build record from a Block model"""
+        return cls(
+            block.height,
+            pack_hash(block.hash),
+            pack_hash(block.parent_hash),
+            block.timestamp,
+            pack_hash(block.miner.hash),
+            int(block.gas_used),
+            int(block.gas_limit),
+            _to_int(block.base_fee_per_gas),
+            _to_int(block.burnt_fees),
+            _to_int(block.priority_fee),
+            block.transaction_count,
+            block.size,
+            _intern(block.type),
+        )
+
+    def to_model(self) -> Block:
+        """Convert record back to a summary Block model"""
+        return Block(
+            base_fee_per_gas=_to_str(self.base_fee_per_gas),
+            burnt_fees=_to_str(self.burnt_fees),
+            difficulty="0",
+            extra_data="0x",
+            gas_limit=str(self.gas_limit),
+            gas_used=str(self.gas_used),
+            hash=unpack_hash(self.hash),
+            height=self.height,
+            miner=_address_param(self.miner, 0),
+            nonce="0x",
+            parent_hash=unpack_hash(self.parent_hash),
+            priority_fee=_to_str(self.priority_fee),
+            size=self.size,
+            state_root="0x",
+            timestamp=self.timestamp,
+            total_difficulty="0",
+            transaction_count=self.transaction_count,
+            type=self.type,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to a flat dictionary"""
+        data = {
+            "height": self.height,
+            "hash": unpack_hash(self.hash),
+            "parent_hash": unpack_hash(self.parent_hash),
+            "timestamp": self.timestamp,
+            "miner": unpack_hash(self.miner),
+            "gas_used": str(self.gas_used),
+            "gas_limit": str(self.gas_limit),
+            "base_fee_per_gas": _to_str(self.base_fee_per_gas),
+            "burnt_fees": _to_str(self.burnt_fees),
+            "priority_fee": _to_str(self.priority_fee),
+            "transaction_count": self.transaction_count,
+            "size": self.size,
+            "type": self.type,
+        }
+        return {k: v for k, v in data.items() if v is not None}
+
+
+_RECORD_TYPES = {
+    Holder: HolderRecord,
+    TokenTransfer: TokenTransferRecord,
+    Transaction: TransactionRecord,
+    Block: BlockRecord,
+}
+
+
+def to_records(items: Iterable[Any]) -> List[_Record]:
+    """Convert Holder/TokenTransfer/Transaction/Block models to compact records"""
+    token_cache: Dict[str, TokenInfo] = {}
+    records = []
+    for item in items:
+        if isinstance(item, _Record):
+            records.append(item)
+        elif isinstance(item, TokenTransfer):
+            records.append(TokenTransferRecord.from_model(item, token_cache))
+        else:
+            record_type = _RECORD_TYPES.get(type(item))
+            if record_type is None:
+                raise TypeError(f"No compact record type for {type(item).__name__}")
+            records.append(record_type.from_model(item))
+    return records
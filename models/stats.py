@@ -0,0 +1,47 @@
+"""Chain statistics models"""
+
+from typing import Any, Dict, List, Optional
+from .base import BaseBlockScoutModel
+
+
+class StatsResponse(BaseBlockScoutModel):
+    """Chain-wide counters"""
+
+    total_blocks: str
+    total_addresses: str
+    total_transactions: str
+    average_block_time: float
+    coin_price: Optional[str] = None
+    coin_price_change_percentage: Optional[float] = None
+    total_gas_used: str
+    transactions_today: Optional[str] = None
+    gas_used_today: str
+    gas_prices: Optional[Dict[str, Any]] = None
+    gas_price_updated_at: Optional[str] = None
+    gas_prices_update_in: Optional[int] = None
+    static_gas_price: Optional[str] = None
+    market_cap: Optional[str] = None
+    network_utilization_percentage: float
+    tvl: Optional[str] = None
+
+
+class TransactionChartItem(BaseBlockScoutModel):
+    """Daily transaction count"""
+
+    date: str
+    transaction_count: int
+
+
+class MarketChartItem(BaseBlockScoutModel):
+    """Daily coin price and market cap"""
+
+    date: str
+    closing_price: Optional[str] = None
+    market_cap: Optional[str] = None
+
+
+class MarketChart(BaseBlockScoutModel):
+    """Market history of the native coin"""
+
+    available_supply: Optional[str] = None
+    chart_data: List[MarketChartItem] = []
@@ -62,6 +62,7 @@ class TokenTransfer(BaseBlockScoutModel):
     """Token transfer"""
 
     block_hash: str
+    block_number: Optional[int] = None
     from_: AddressParam = Field(alias="from")
     log_index: int
     method: Optional[str] = None
@@ -122,7 +122,7 @@ class Log(BaseBlockScoutModel):
     decoded: Optional[dict] = None
     index: int
     smart_contract: Optional[AddressParam] = None
-    topics: List[str] = Field(default_factory=list)
+    topics: List[Optional[str]] = Field(default_factory=list)
     transaction_hash: str
 
 
@@ -0,0 +1,221 @@
+"""Concurrent NFT collection harvester
+
+Pages through ``/tokens/{hash}/instances`` and fetches the detail of every
+instance of a page with a bounded pool of worker threads while the next
+page is already being requested. Metadata blobs are deduplicated by content
+hash (collections often share one metadata document across thousands of
+ids), so instances reference ``metadata_hash`` and every distinct blob is
+emitted once.
+
+Progress (the page cursor and the metadata hashes already emitted) is
+checkpointed to a small state file, so an interrupted harvest resumes where
+it stopped.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .exceptions import BlockScoutError
+
+
+def metadata_hash(metadata: Any) -> Optional[str]:
+    """SHA-256 of the canonical JSON encoding of a metadata document"""
+    if metadata is None:
+        return None
+    blob = json.dumps(metadata, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+class HarvestState:
+    """Page cursor and emitted metadata hashes persisted to a JSON state file"""
+
+    def __init__(self, token_address: str, path: Optional[str] = None):
+        self.token_address = token_address.lower()
+        self.path = path
+        self.page_params: Optional[Dict[str, Any]] = None
+        self.done = False
+        self.instances = 0
+        self.metadata_hashes: Set[str] = set()
+
+    @classmethod
+    def load(cls, path: str, token_address: str) -> "HarvestState":
+        """Load a state file, or start fresh if it does not exist"""
+        state = cls(token_address, path)
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data["token_address"] != state.token_address:
+                raise ValueError(
+                    f"State file {path} belongs to token {data['token_address']}"
+                )
+            state.page_params = data["page_params"]
+            state.done = data["done"]
+            state.instances = data["instances"]
+            state.metadata_hashes = set(data["metadata_hashes"])
+        return state
+
+    def save(self) -> None:
+        """Atomically write the state file"""
+        if self.path is None:
+            return
+        data = {
+            "token_address": self.token_address,
+            "page_params": self.page_params,
+            "done": self.done,
+            "instances": self.instances,
+            "metadata_hashes": sorted(self.metadata_hashes),
+        }
+        partial = f"{self.path}.partial"
+        with open(partial, "w") as f:
+            json.dump(data, f)
+        os.replace(partial, self.path)
+
+
+class NFTHarvester:
+    """
+    Harvest every instance of an NFT collection
+
+    Example:
+        with BlockScoutClient(url, rate_limit=20) as client:
+            harvester = NFTHarvester(client, "0x...", workers=16,
+                                     state_path="collection.state")
+            harvester.run(instance_writer.write_items, metadata_writer.write_items)
+
+    Args:
+        client: BlockScoutClient instance (shared by all workers)
+        token_address: Collection (ERC-721 / ERC-1155 token) address
+        workers: Concurrent requests
+        details: Fetch /instances/{id} for every instance; without it only
+            the list pages are used
+        state_path: Resumable state file (None to keep state in memory only)
+        checkpoint_every: Save the state after this many pages
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        token_address: str,
+        workers: int = 8,
+        details: bool = True,
+        state_path: Optional[str] = None,
+        checkpoint_every: int = 20,
+    ):
+        self.client = client
+        self.token_address = token_address
+        self.workers = workers
+        self.details = details
+        self.checkpoint_every = checkpoint_every
+        self.state = (
+            HarvestState.load(state_path, token_address)
+            if state_path
+            else HarvestState(token_address)
+        )
+        self.errors: Dict[str, str] = {}
+
+    def _fetch_page(self, page_params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return self.client.get_raw(
+            f"/tokens/{self.token_address}/instances", page_params
+        )
+
+    def _fetch_instance(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Instance detail merged over the list item (the item alone on failure)"""
+        try:
+            detail = self.client.get_raw(
+                f"/tokens/{self.token_address}/instances/{item['id']}"
+            )
+        except BlockScoutError as e:
+            self.errors[str(item["id"])] = str(e)
+            return item
+        return dict(item, **detail)
+
+    def _rows(
+        self, items: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Instance rows plus the metadata blobs not emitted before"""
+        rows, blobs = [], []
+        for item in items:
+            metadata = item.get("metadata")
+            digest = metadata_hash(metadata)
+            rows.append(dict(item, metadata_hash=digest))
+            if digest is not None and digest not in self.state.metadata_hashes:
+                self.state.metadata_hashes.add(digest)
+                blobs.append(
+                    {"metadata_hash": digest, "metadata": json.dumps(metadata)}
+                )
+        return rows, blobs
+
+    def run(
+        self,
+        instance_sink: Callable[[List[Dict[str, Any]]], None],
+        metadata_sink: Callable[[List[Dict[str, Any]]], None],
+        max_pages: Optional[int] = None,
+        progress: Optional[Callable[[int], None]] = None,
+        flush: Optional[Callable[[], None]] = None,
+    ) -> int:
+        """
+        Harvest instances until the collection (or max_pages) is exhausted
+
+        Args:
+            instance_sink: Called with the instance rows of every page
+                (raw instance dicts plus ``metadata_hash``)
+            metadata_sink: Called with new ``{"metadata_hash", "metadata"}``
+                rows (metadata as a JSON string)
+            max_pages: Stop after this many pages (resume later)
+            progress: Callback receiving the number of instances harvested
+            flush: Called before every state checkpoint so buffered sink
+                output is durable before its pages are marked done
+
+        Returns:
+            Number of instances harvested in this run
+        """
+        if self.state.done:
+            return 0
+
+        harvested = 0
+        pages = 0
+
+        def checkpoint():
+            if flush is not None:
+                flush()
+            self.state.save()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            next_page: Optional[Future] = executor.submit(
+                self._fetch_page, self.state.page_params
+            )
+            while next_page is not None:
+                page = next_page.result()
+                items = page.get("items", [])
+                cursor = page.get("next_page_params")
+                pages += 1
+
+                # Request the next page before waiting on this page's details
+                more = bool(cursor and items)
+                next_page = (
+                    executor.submit(self._fetch_page, cursor)
+                    if more and (max_pages is None or pages < max_pages)
+                    else None
+                )
+                if self.details:
+                    items = list(executor.map(self._fetch_instance, items))
+
+                rows, blobs = self._rows(items)
+                if rows:
+                    instance_sink(rows)
+                if blobs:
+                    metadata_sink(blobs)
+                harvested += len(rows)
+
+                self.state.page_params = cursor
+                self.state.done = not more
+                self.state.instances += len(rows)
+                if progress is not None:
+                    progress(self.state.instances)
+                if pages % self.checkpoint_every == 0:
+                    checkpoint()
+
+        checkpoint()
+        return harvested
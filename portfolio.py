@@ -0,0 +1,241 @@
+"""Batch token portfolios
+
+Fetches the token balances of many addresses concurrently and aggregates
+them per token and per address. Values stay exact integers in base units;
+token-unit amounts are formatted from them with integer math
+(``utils.format_token_amount``), and only USD estimates are floats.
+
+Token metadata (decimals, symbol, exchange rate) comes embedded in the
+balance items; a shared TokenCache keeps the first copy of each token and
+only requests ``/tokens/{hash}`` once for tokens whose decimals are missing.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .columnar import Column, ColumnarBatch
+from .exceptions import BlockScoutError
+from .schemas import (
+    PORTFOLIO_ADDRESS_SCHEMA,
+    PORTFOLIO_BALANCE_SCHEMA,
+    PORTFOLIO_TOKEN_SCHEMA,
+)
+from .utils import format_token_amount
+
+
+class TokenCache:
+    """Thread-safe token metadata cache shared by portfolio workers"""
+
+    def __init__(self, client: Any):
+        self.client = client
+        self.fetched = 0
+        self._tokens: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._pending: Dict[str, threading.Event] = {}
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def get(self, address: str) -> Optional[Dict[str, Any]]:
+        return self._tokens.get(address.lower())
+
+    def resolve(self, token: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cached metadata for a token embedded in a balance item
+
+        ERC-20 tokens embedded without decimals are fetched once; concurrent
+        callers for the same token wait for that single request.
+        """
+        key = token["address"].lower()
+        with self._lock:
+            cached = self._tokens.get(key)
+            if cached is not None:
+                return cached
+            if token.get("decimals") is not None or token.get("type") != "ERC-20":
+                self._tokens[key] = token
+                return token
+            waiting = self._pending.get(key)
+            if waiting is None:
+                self._pending[key] = threading.Event()
+
+        if waiting is not None:
+            waiting.wait()
+            return self._tokens.get(key, token)
+
+        try:
+            resolved = dict(token, **self.client.get_raw(f"/tokens/{token['address']}"))
+            self.fetched += 1
+        except BlockScoutError:
+            resolved = token
+        with self._lock:
+            self._tokens[key] = resolved
+            self._pending.pop(key).set()
+        return resolved
+
+
+def _usd(value: int, decimals: int, exchange_rate: Any) -> Optional[float]:
+    if exchange_rate in (None, ""):
+        return None
+    try:
+        return float(Decimal(value).scaleb(-decimals) * Decimal(str(exchange_rate)))
+    except InvalidOperation:
+        return None
+
+
+class Portfolio:
+    """Token balances of a set of addresses with per-token/per-address totals"""
+
+    def __init__(self, tokens: TokenCache):
+        self.tokens = tokens
+        self.balances: List[Dict[str, Any]] = []
+        self.errors: Dict[str, str] = {}
+        self.addresses: List[str] = []
+
+    def add(self, address: str, items: List[Dict[str, Any]]) -> None:
+        """Add the raw /token-balances items of one address"""
+        for item in items:
+            token = self.tokens.resolve(item["token"])
+            decimals = int(token.get("decimals") or 0)
+            value = int(item["value"])
+            self.balances.append(
+                {
+                    "address": address,
+                    "token": token,
+                    "token_id": item.get("token_id"),
+                    "value": value,
+                    "amount": format_token_amount(value, decimals),
+                    "value_usd": _usd(value, decimals, token.get("exchange_rate")),
+                }
+            )
+
+    def by_token(self) -> List[Dict[str, Any]]:
+        """Totals per token, largest USD value first"""
+        totals: Dict[str, Dict[str, Any]] = {}
+        for balance in self.balances:
+            token = balance["token"]
+            total = totals.get(token["address"])
+            if total is None:
+                total = totals[token["address"]] = {
+                    "token": token,
+                    "holders": set(),
+                    "value": 0,
+                }
+            total["holders"].add(balance["address"])
+            total["value"] += balance["value"]
+
+        rows = []
+        for total in totals.values():
+            token = total["token"]
+            decimals = int(token.get("decimals") or 0)
+            rows.append(
+                {
+                    "token": token,
+                    "holders": len(total["holders"]),
+                    "value": total["value"],
+                    "amount": format_token_amount(total["value"], decimals),
+                    "value_usd": _usd(
+                        total["value"], decimals, token.get("exchange_rate")
+                    ),
+                }
+            )
+        rows.sort(key=lambda row: (-(row["value_usd"] or 0), row["token"]["address"]))
+        return rows
+
+    def by_address(self) -> List[Dict[str, Any]]:
+        """Token count and USD value per address, largest first"""
+        totals = {
+            address: {"tokens": 0, "value_usd": 0.0} for address in self.addresses
+        }
+        for balance in self.balances:
+            total = totals.setdefault(
+                balance["address"], {"tokens": 0, "value_usd": 0.0}
+            )
+            total["tokens"] += 1
+            total["value_usd"] += balance["value_usd"] or 0.0
+        rows = [{"address": address, **total} for address, total in totals.items()]
+        rows.sort(key=lambda row: (-row["value_usd"], row["address"]))
+        return rows
+
+    def view(self, view: str) -> Tuple[List[Column], List[Dict[str, Any]]]:
+        """Schema and raw rows of the "balances", "tokens" or "addresses" view"""
+        if view == "balances":
+            return PORTFOLIO_BALANCE_SCHEMA, self.balances
+        if view == "tokens":
+            return PORTFOLIO_TOKEN_SCHEMA, self.by_token()
+        if view == "addresses":
+            return PORTFOLIO_ADDRESS_SCHEMA, self.by_address()
+        raise ValueError(f"Unknown portfolio view: {view}")
+
+    def to_batch(self, view: str = "balances") -> ColumnarBatch:
+        """Columnar table of the "balances", "tokens" or "addresses" view"""
+        schema, rows = self.view(view)
+        batch = ColumnarBatch(schema)
+        batch.append_items(rows)
+        return batch
+
+    def flat_rows(self, view: str = "balances") -> List[Dict[str, Any]]:
+        """Rows of a view flattened to its schema columns"""
+        schema, rows = self.view(view)
+        return [{column.name: column.getter(row) for column in schema} for row in rows]
+
+
+def read_addresses(lines: Iterable[str]) -> List[str]:
+    """Addresses from text lines (one per line, # comments, deduplicated)"""
+    seen = set()
+    addresses = []
+    for line in lines:
+        address = line.split("#", 1)[0].strip().split(",")[0].strip()
+        if address and address.lower() not in seen:
+            seen.add(address.lower())
+            addresses.append(address)
+    return addresses
+
+
+def fetch_portfolio(
+    client: Any,
+    addresses: Iterable[str],
+    workers: int = 16,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Portfolio:
+    """
+    Fetch the token balances of many addresses concurrently
+
+    Failed addresses are reported in ``Portfolio.errors`` instead of
+    aborting the batch.
+
+    Args:
+        client: BlockScoutClient instance (shared by all workers)
+        addresses: Address hashes
+        workers: Concurrent requests
+        progress: Callback receiving (addresses done, total addresses)
+    """
+    portfolio = Portfolio(TokenCache(client))
+    portfolio.addresses = list(addresses)
+    total = len(portfolio.addresses)
+
+    def fetch(address: str) -> List[Dict[str, Any]]:
+        items = client.get_raw(f"/addresses/{address}/token-balances")
+        # Resolve in the worker so missing-decimals lookups run concurrently
+        for item in items:
+            portfolio.tokens.resolve(item["token"])
+        return items
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(fetch, address): address for address in portfolio.addresses
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            address = futures[future]
+            try:
+                portfolio.add(address, future.result())
+            except BlockScoutError as e:
+                portfolio.errors[address] = str(e)
+            if progress is not None:
+                progress(done, total)
+
+    # Completion order is arbitrary; keep balances grouped by input order
+    order = {address: i for i, address in enumerate(portfolio.addresses)}
+    portfolio.balances.sort(key=lambda balance: order[balance["address"]])
+    return portfolio
@@ -0,0 +1,454 @@
+"""Local token and contract registry with an offline search index
+
+``search()`` and ``get_tokens(query=...)`` cost a server round-trip per
+lookup. The registry pages ``/tokens`` and ``/smart-contracts`` once into a
+SQLite file and keeps an in-memory index over names, symbols and
+addresses, so autocomplete-style lookups are answered locally in
+microseconds:
+
+- prefix search: every term (symbol, name, each word of the name, address)
+  sits in one sorted list with a parallel array of entry ids, so a prefix is
+  a bisect plus a slice. Entry ids are assigned in rank order (tokens by
+  holders, then contracts), so the best matches of a range are simply its
+  smallest ids; the top ids of every one- and two-character prefix are
+  precomputed since those ranges span most of the registry.
+- fuzzy search: a trigram index over names and symbols, built on first
+  use, fills up the results for misspelled or mid-word queries.
+
+``BlockScoutClient.search_local()`` falls back to the server on a miss and
+adds what it finds to the registry.
+"""
+
+import bisect
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+from .exceptions import BlockScoutError
+from .utils import chain_slug
+
+SOURCES = ("tokens", "smart-contracts")
+
+# Prefixes this short match most of the registry; their top ids are cached
+_SHORT_PREFIX = 2
+_TOP = 100
+# Longer prefixes matching more terms than this have their top ids cached
+_LARGE_RANGE = 1024
+
+_ADDRESS = re.compile(r"^0x[0-9a-f]{40}$")
+_WORD = re.compile(r"[0-9a-z]+")
+
+
+class RegistryEntry(NamedTuple):
+    """A token, verified contract or named address"""
+
+    address: str
+    name: Optional[str]
+    symbol: Optional[str]
+    kind: str  # "token" | "contract" | "address"
+    token_type: Optional[str] = None
+    holders: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+def default_registry_path(base_url: str) -> str:
+    """Registry file of a chain under ~/.blockscout/registry"""
+    return os.path.expanduser(f"~/.blockscout/registry/{chain_slug(base_url)}.db")
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return None if value is None else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def token_entry(item: Dict[str, Any]) -> RegistryEntry:
+    """Entry from a raw /tokens item"""
+    return RegistryEntry(
+        item.get("address") or item.get("address_hash"),
+        item.get("name"),
+        item.get("symbol"),
+        "token",
+        item.get("type"),
+        _int(item.get("holders", item.get("holders_count"))),
+    )
+
+
+def contract_entry(item: Dict[str, Any]) -> RegistryEntry:
+    """Entry from a raw /smart-contracts item"""
+    address = item.get("address") or {}
+    return RegistryEntry(address.get("hash"), address.get("name"), None, "contract")
+
+
+def search_entries(items: Iterable[Dict[str, Any]]) -> List[RegistryEntry]:
+    """Entries from raw /search items (tokens, contracts and named addresses)"""
+    entries = []
+    for item in items:
+        kind = item.get("type")
+        address = item.get("address") or item.get("address_hash")
+        if not address:
+            continue
+        if kind == "token":
+            entries.append(
+                RegistryEntry(
+                    address,
+                    item.get("name"),
+                    item.get("symbol"),
+                    "token",
+                    item.get("token_type"),
+                )
+            )
+        elif kind in ("contract", "address") and item.get("name"):
+            entries.append(RegistryEntry(address, item["name"], None, kind))
+    return entries
+
+
+def _normalize(text: str) -> str:
+    return text.strip().lower()
+
+
+def _terms(entry: RegistryEntry) -> List[str]:
+    """Indexed terms: address, symbol, name and every word of the name"""
+    terms = [entry.address.lower()]
+    for text in (entry.symbol, entry.name):
+        if text:
+            text = _normalize(text)
+            terms.append(text)
+            terms.extend(_WORD.findall(text))
+    return list(dict.fromkeys(terms))
+
+
+def _trigrams(text: str) -> set:
+    text = f" {text} "
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class _Index:
+    """Immutable search index over entries in rank order"""
+
+    def __init__(self, entries: List[RegistryEntry]):
+        self.entries = entries
+        terms: List[str] = []
+        owners: List[int] = []
+        for entry_id, entry in enumerate(entries):
+            entry_terms = _terms(entry)
+            terms.extend(entry_terms)
+            owners.extend([entry_id] * len(entry_terms))
+        # Stable sort by term keeps the ids of equal terms in rank order
+        order = sorted(range(len(terms)), key=terms.__getitem__)
+        self.terms = [terms[i] for i in order]
+        self.ids = np.array(owners, dtype=np.int32)[np.array(order, dtype=np.int64)]
+        self.by_address = {
+            entry.address.lower(): entry_id for entry_id, entry in enumerate(entries)
+        }
+
+        self.top: Dict[str, np.ndarray] = {}
+        prefixes = set()
+        for length in range(1, _SHORT_PREFIX + 1):
+            prefixes.update({term[:length] for term in self.terms})
+        for prefix in prefixes:
+            lo, hi = self.prefix_range(prefix)
+            self.top[prefix] = np.unique(self.ids[lo:hi])[:_TOP]
+        self._grams: Optional[Dict[str, np.ndarray]] = None
+        self._lock = threading.Lock()
+
+    def prefix_range(self, prefix: str):
+        lo = bisect.bisect_left(self.terms, prefix)
+        hi = bisect.bisect_left(self.terms, prefix + "\uffff", lo)
+        return lo, hi
+
+    def prefix(self, query: str, limit: int) -> np.ndarray:
+        """Ids of entries with a term starting with query, best first"""
+        top = self.top.get(query)
+        if top is not None and (limit <= _TOP or len(top) < _TOP):
+            return top
+        lo, hi = self.prefix_range(query)
+        ids = np.unique(self.ids[lo:hi])
+        if hi - lo > _LARGE_RANGE:
+            # Common prefixes are typed again and again; keep their best ids
+            self.top[query] = ids[:_TOP]
+        return ids
+
+    def exact(self, query: str) -> np.ndarray:
+        # Each entry has a term once and pairs are sorted by (term, id), so
+        # the ids of one term are already unique and in rank order
+        lo = bisect.bisect_left(self.terms, query)
+        hi = bisect.bisect_right(self.terms, query, lo)
+        return self.ids[lo:hi]
+
+    def grams(self) -> Dict[str, np.ndarray]:
+        with self._lock:
+            if self._grams is None:
+                postings: Dict[str, List[int]] = {}
+                for entry_id, entry in enumerate(self.entries):
+                    text = " ".join(filter(None, (entry.symbol, entry.name)))
+                    for gram in _trigrams(_normalize(text)):
+                        postings.setdefault(gram, []).append(entry_id)
+                self._grams = {
+                    gram: np.array(ids, dtype=np.int32)
+                    for gram, ids in postings.items()
+                }
+        return self._grams
+
+    def fuzzy(self, query: str, min_score: float) -> np.ndarray:
+        """Ids sharing at least min_score of the query's trigrams, best first"""
+        query_grams = _trigrams(query)
+        grams = self.grams()
+        postings = [grams[gram] for gram in query_grams if gram in grams]
+        if not postings:
+            return self.ids[:0]
+        ids, counts = np.unique(np.concatenate(postings), return_counts=True)
+        keep = counts >= min_score * len(query_grams)
+        ids, counts = ids[keep], counts[keep]
+        return ids[np.lexsort((ids, -counts))]
+
+
+class TokenRegistry:
+    """
+    Persistent token / contract registry with local prefix and fuzzy search
+
+    Example:
+        registry = TokenRegistry(default_registry_path(url))
+        registry.refresh(client, max_age=86400)
+        registry.search("usd")
+
+    Args:
+        path: SQLite file (":memory:" for a throwaway registry)
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self._lock = threading.RLock()
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "address TEXT NOT NULL PRIMARY KEY COLLATE NOCASE, name TEXT, "
+                "symbol TEXT, kind TEXT NOT NULL, token_type TEXT, holders INTEGER)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS refreshes ("
+                "source TEXT NOT NULL PRIMARY KEY, refreshed_at REAL, rows INTEGER)"
+            )
+        # Entries added since the index was built (server fallback hits)
+        self._pending: List[RegistryEntry] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.reload()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index.entries) + len(self._pending)
+
+    def close(self) -> None:
+        self.stop_auto_refresh()
+        self.conn.close()
+
+    # Storage
+
+    def reload(self) -> None:
+        """Rebuild the search index from the database"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT address, name, symbol, kind, token_type, holders "
+                "FROM entries ORDER BY "
+                "CASE kind WHEN 'token' THEN 0 WHEN 'contract' THEN 1 ELSE 2 END, "
+                "COALESCE(holders, -1) DESC, name"
+            ).fetchall()
+            self._index = _Index([RegistryEntry(*row) for row in rows])
+            self._pending = []
+
+    def _upsert(self, entries: Iterable[RegistryEntry]) -> int:
+        # A token keeps its token fields when it also shows up as a contract
+        rows = [tuple(entry) for entry in entries if entry.address]
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO entries "
+                "(address, name, symbol, kind, token_type, holders) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (address) DO UPDATE SET "
+                "name = CASE WHEN kind = 'token' AND excluded.kind != 'token' "
+                "THEN COALESCE(name, excluded.name) "
+                "ELSE COALESCE(excluded.name, name) END, "
+                "symbol = COALESCE(excluded.symbol, symbol), "
+                "kind = CASE WHEN kind = 'token' THEN kind ELSE excluded.kind END, "
+                "token_type = COALESCE(excluded.token_type, token_type), "
+                "holders = COALESCE(excluded.holders, holders)",
+                rows,
+            )
+        return len(rows)
+
+    def add(self, entries: Iterable[RegistryEntry]) -> int:
+        """Store entries and make them searchable without a full rebuild"""
+        entries = [entry for entry in entries if entry.address]
+        self._upsert(entries)
+        with self._lock:
+            known = self._index.by_address
+            self._pending.extend(
+                entry for entry in entries if entry.address.lower() not in known
+            )
+        return len(entries)
+
+    def refreshed_at(self, source: str) -> Optional[float]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT refreshed_at FROM refreshes WHERE source = ?", (source,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def refresh(
+        self,
+        client: Any,
+        sources: Iterable[str] = SOURCES,
+        max_age: Optional[float] = None,
+        max_pages: Optional[int] = None,
+        progress: Optional[Callable[[str, int], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Page /tokens and /smart-contracts into the registry
+
+        Args:
+            client: BlockScoutClient instance
+            sources: "tokens" and/or "smart-contracts"
+            max_age: Skip sources refreshed less than this many seconds ago
+            max_pages: Stop each source after this many pages
+            progress: Callback receiving (source, entries so far)
+
+        Returns:
+            Entries stored per refreshed source
+        """
+        counts = {}
+        for source in sources:
+            if source not in SOURCES:
+                raise ValueError(
+                    f"Unknown source {source!r}; expected one of {SOURCES}"
+                )
+            refreshed_at = self.refreshed_at(source)
+            if max_age is not None and refreshed_at is not None:
+                if time.time() - refreshed_at < max_age:
+                    continue
+            to_entry = token_entry if source == "tokens" else contract_entry
+            rows = 0
+            for page in client.iter_raw_pages(f"/{source}", max_pages=max_pages):
+                rows += self._upsert(to_entry(item) for item in page.get("items", []))
+                if progress is not None:
+                    progress(source, rows)
+            with self._lock, self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO refreshes VALUES (?, ?, ?)",
+                    (source, time.time(), rows),
+                )
+            counts[source] = rows
+        if counts:
+            self.reload()
+        return counts
+
+    def start_auto_refresh(
+        self, client: Any, interval: float = 3600.0, **refresh_options: Any
+    ) -> threading.Thread:
+        """
+        Refresh in a daemon thread every interval seconds
+
+        Searches keep using the previous index until the new one is built.
+        Request errors are ignored until the next round.
+        """
+        self.stop_auto_refresh()
+        self._stop.clear()
+
+        def run():
+            while not self._stop.is_set():
+                try:
+                    self.refresh(client, max_age=interval, **refresh_options)
+                except BlockScoutError:
+                    pass
+                self._stop.wait(interval)
+
+        self._thread = threading.Thread(
+            target=run, name="registry-refresh", daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def stop_auto_refresh(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    # Search
+
+    def get(self, address: str) -> Optional[RegistryEntry]:
+        """Entry of an address"""
+        index = self._index
+        entry_id = index.by_address.get(address.lower())
+        if entry_id is not None:
+            return index.entries[entry_id]
+        for entry in self._pending:
+            if entry.address.lower() == address.lower():
+                return entry
+        return None
+
+    def search(
+        self, query: str, limit: int = 10, fuzzy: bool = True, min_score: float = 0.5
+    ) -> List[RegistryEntry]:
+        """
+        Entries matching a query, best first
+
+        Exact symbol / name / word matches come first, then prefix matches
+        by rank, then (for queries of 3+ characters) fuzzy trigram matches.
+
+        Args:
+            query: Symbol, name, word or address prefix
+            limit: Maximum number of results
+            fuzzy: Fill up with trigram matches
+            min_score: Share of the query's trigrams a fuzzy match must contain
+        """
+        query = _normalize(query)
+        if not query or limit <= 0:
+            return []
+        if _ADDRESS.match(query):
+            entry = self.get(query)
+            return [entry] if entry else []
+
+        index = self._index
+        results: List[RegistryEntry] = []
+        seen = set()
+
+        def take(ids: np.ndarray) -> bool:
+            # ids are in rank order; only the first few can make the cut
+            for entry_id in ids[: limit + len(seen)].tolist():
+                if entry_id not in seen:
+                    seen.add(entry_id)
+                    results.append(index.entries[entry_id])
+                    if len(results) >= limit:
+                        return True
+            return False
+
+        pending = [
+            entry
+            for entry in self._pending
+            if any(term.startswith(query) for term in _terms(entry))
+        ]
+        results.extend(pending[:limit])
+        if len(results) >= limit or take(index.exact(query)):
+            return results
+        if take(index.prefix(query, limit)):
+            return results
+        if fuzzy and len(query) >= 3:
+            take(index.fuzzy(query, min_score))
+        return results
@@ -0,0 +1,343 @@
+"""Typed column schemas for DataFrame conversion
+
+Each schema flattens the nested fields of one model (``from.hash`` becomes
+``from_hash``) and gives every column a kind, so timestamps end up as
+datetime64, counters as int64, wei amounts as exact integers and repeated
+strings such as ``type`` or ``status`` as categoricals.
+"""
+
+from typing import Any, Dict, List
+
+from .columnar import Column
+from .models import (
+    Block,
+    BlockRecord,
+    Holder,
+    HolderRecord,
+    InternalTransaction,
+    NFTInstance,
+    TokenBalance,
+    TokenInfo,
+    TokenTransfer,
+    TokenTransferRecord,
+    Transaction,
+    TransactionRecord,
+)
+
+
+def _flat(path: str, kind: str = "str") -> Column:
+    return Column(path.replace(".", "_"), path, kind)
+
+
+HOLDER_SCHEMA: List[Column] = [
+    _flat("address.hash"),
+    _flat("address.name"),
+    _flat("address.is_contract", "bool"),
+    _flat("address.is_verified", "bool"),
+    _flat("value", "uint256"),
+    _flat("token_id", "uint256"),
+]
+
+TOKEN_TRANSFER_SCHEMA: List[Column] = [
+    _flat("transaction_hash"),
+    _flat("log_index", "int"),
+    _flat("block_hash"),
+    _flat("block_number", "int"),
+    _flat("timestamp", "datetime"),
+    _flat("from.hash"),
+    _flat("from.is_contract", "bool"),
+    _flat("to.hash"),
+    _flat("to.is_contract", "bool"),
+    _flat("token.address"),
+    _flat("token.symbol", "category"),
+    _flat("token.name", "category"),
+    _flat("token.type", "category"),
+    _flat("token.decimals", "int"),
+    _flat("total.value", "uint256"),
+    _flat("total.token_id", "uint256"),
+    _flat("type", "category"),
+    _flat("method", "category"),
+]
+
+INTERNAL_TRANSACTION_SCHEMA: List[Column] = [
+    _flat("transaction_hash"),
+    _flat("index", "int"),
+    _flat("block_number", "int"),
+    _flat("timestamp", "datetime"),
+    _flat("type", "category"),
+    _flat("from.hash"),
+    _flat("from.is_contract", "bool"),
+    _flat("to.hash"),
+    _flat("to.is_contract", "bool"),
+    _flat("created_contract.hash"),
+    _flat("value", "uint256"),
+    _flat("gas_limit", "int"),
+    _flat("success", "bool"),
+    _flat("error", "category"),
+]
+
+TRANSACTION_SCHEMA: List[Column] = [
+    _flat("hash"),
+    _flat("block_number", "int"),
+    _flat("position", "int"),
+    _flat("timestamp", "datetime"),
+    _flat("from.hash"),
+    _flat("to.hash"),
+    _flat("created_contract.hash"),
+    _flat("value", "uint256"),
+    _flat("fee.value", "uint256"),
+    _flat("gas_limit", "int"),
+    _flat("gas_used", "int"),
+    _flat("gas_price", "uint256"),
+    _flat("max_fee_per_gas", "uint256"),
+    _flat("max_priority_fee_per_gas", "uint256"),
+    _flat("base_fee_per_gas", "uint256"),
+    _flat("priority_fee", "uint256"),
+    _flat("transaction_burnt_fee", "uint256"),
+    _flat("nonce", "int"),
+    _flat("type", "int"),
+    _flat("confirmations", "int"),
+    _flat("status", "category"),
+    _flat("result", "category"),
+    _flat("method", "category"),
+]
+
+BLOCK_SCHEMA: List[Column] = [
+    _flat("height", "int"),
+    _flat("hash"),
+    _flat("parent_hash"),
+    _flat("timestamp", "datetime"),
+    _flat("miner.hash"),
+    _flat("gas_used", "int"),
+    _flat("gas_limit", "int"),
+    _flat("gas_used_percentage", "float"),
+    _flat("base_fee_per_gas", "uint256"),
+    _flat("burnt_fees", "uint256"),
+    _flat("priority_fee", "uint256"),
+    _flat("transaction_fees", "uint256"),
+    _flat("transaction_count", "int"),
+    _flat("size", "int"),
+    _flat("difficulty", "uint256"),
+    _flat("total_difficulty", "uint256"),
+    _flat("type", "category"),
+]
+
+TOKEN_SCHEMA: List[Column] = [
+    _flat("address"),
+    _flat("name"),
+    _flat("symbol"),
+    _flat("type", "category"),
+    _flat("decimals", "int"),
+    _flat("holders", "int"),
+    _flat("total_supply", "uint256"),
+    _flat("exchange_rate", "float"),
+    _flat("circulating_market_cap", "float"),
+]
+
+TOKEN_BALANCE_SCHEMA: List[Column] = [
+    _flat("token.address"),
+    _flat("token.symbol", "category"),
+    _flat("token.type", "category"),
+    _flat("token.decimals", "int"),
+    _flat("token_id", "uint256"),
+    _flat("value", "uint256"),
+]
+
+# Compact records flatten themselves in to_dict()
+HOLDER_RECORD_SCHEMA: List[Column] = [
+    Column("address"),
+    Column("is_contract", kind="bool"),
+    Column("value", kind="uint256"),
+    Column("token_id", kind="uint256"),
+]
+
+TOKEN_TRANSFER_RECORD_SCHEMA: List[Column] = [
+    Column("transaction_hash"),
+    Column("log_index", kind="int"),
+    Column("block_hash"),
+    Column("block_number", kind="int"),
+    Column("timestamp", kind="datetime"),
+    Column("from"),
+    Column("to"),
+    Column("token_address"),
+    Column("token_symbol", kind="category"),
+    Column("value", kind="uint256"),
+    Column("token_id", kind="uint256"),
+    Column("type", kind="category"),
+    Column("method", kind="category"),
+]
+
+TRANSACTION_RECORD_SCHEMA: List[Column] = [
+    Column("hash"),
+    Column("block_number", kind="int"),
+    Column("position", kind="int"),
+    Column("timestamp", kind="datetime"),
+    Column("from"),
+    Column("to"),
+    Column("value", kind="uint256"),
+    Column("fee", kind="uint256"),
+    Column("gas_limit", kind="int"),
+    Column("gas_used", kind="int"),
+    Column("gas_price", kind="uint256"),
+    Column("nonce", kind="int"),
+    Column("type", kind="int"),
+    Column("status", kind="category"),
+    Column("method", kind="category"),
+]
+
+BLOCK_RECORD_SCHEMA: List[Column] = [
+    Column("height", kind="int"),
+    Column("hash"),
+    Column("parent_hash"),
+    Column("timestamp", kind="datetime"),
+    Column("miner"),
+    Column("gas_used", kind="int"),
+    Column("gas_limit", kind="int"),
+    Column("base_fee_per_gas", kind="uint256"),
+    Column("burnt_fees", kind="uint256"),
+    Column("priority_fee", kind="uint256"),
+    Column("transaction_count", kind="int"),
+    Column("size", kind="int"),
+    Column("type", kind="category"),
+]
+
+# Rows emitted by snapshots.diff_snapshots (HolderChange.to_dict)
+HOLDER_CHANGE_SCHEMA: List[Column] = [
+    Column("kind", kind="category"),
+    Column("address"),
+    Column("token_id", kind="uint256"),
+    Column("old_value", kind="uint256"),
+    Column("new_value", kind="uint256"),
+    Column("delta"),
+]
+
+NFT_INSTANCE_SCHEMA: List[Column] = [
+    _flat("id", "uint256"),
+    _flat("is_unique", "bool"),
+    _flat("owner.hash"),
+    _flat("holder_address_hash"),
+    Column("name", "metadata.name"),
+    _flat("image_url"),
+    _flat("animation_url"),
+    _flat("external_app_url"),
+    Column("metadata_hash"),
+]
+
+# Distinct metadata blobs written by nft.NFTHarvester, keyed by content hash
+NFT_METADATA_SCHEMA: List[Column] = [
+    Column("metadata_hash"),
+    Column("metadata"),
+]
+
+# Rows of portfolio.Portfolio views
+PORTFOLIO_BALANCE_SCHEMA: List[Column] = [
+    Column("address"),
+    _flat("token.address"),
+    _flat("token.symbol", "category"),
+    _flat("token.type", "category"),
+    _flat("token.decimals", "int"),
+    Column("token_id", kind="uint256"),
+    Column("value", kind="uint256"),
+    Column("amount"),
+    Column("value_usd", kind="float"),
+]
+
+PORTFOLIO_TOKEN_SCHEMA: List[Column] = [
+    _flat("token.address"),
+    _flat("token.symbol", "category"),
+    _flat("token.type", "category"),
+    _flat("token.decimals", "int"),
+    Column("holders", kind="int"),
+    Column("value", kind="uint256"),
+    Column("amount"),
+    Column("value_usd", kind="float"),
+]
+
+PORTFOLIO_ADDRESS_SCHEMA: List[Column] = [
+    Column("address"),
+    Column("tokens", kind="int"),
+    Column("value_usd", kind="float"),
+]
+
+# Edge list written by crawler.CounterpartyCrawler
+CRAWL_EDGE_SCHEMA: List[Column] = [
+    Column("from_address"),
+    Column("to_address"),
+    Column("from_is_contract", kind="bool"),
+    Column("to_is_contract", kind="bool"),
+    Column("kind", kind="category"),
+    Column("transaction_hash"),
+    Column("log_index", kind="int"),
+    Column("block_number", kind="int"),
+    Column("value", kind="uint256"),
+    Column("token_address"),
+    Column("token_symbol", kind="category"),
+    Column("token_id", kind="uint256"),
+    Column("depth", kind="int"),
+]
+
+# Time series kept by timeseries.TimeSeriesCache
+COIN_BALANCE_HISTORY_SCHEMA: List[Column] = [
+    _flat("block_number", "int"),
+    _flat("block_timestamp", "datetime"),
+    _flat("transaction_hash"),
+    _flat("delta", "uint256"),
+    _flat("value", "uint256"),
+]
+
+COIN_BALANCE_BY_DAY_SCHEMA: List[Column] = [
+    _flat("date", "datetime"),
+    _flat("value", "float"),
+]
+
+TRANSACTION_CHART_SCHEMA: List[Column] = [
+    _flat("date", "datetime"),
+    _flat("transaction_count", "int"),
+]
+
+MARKET_CHART_SCHEMA: List[Column] = [
+    _flat("date", "datetime"),
+    _flat("closing_price", "float"),
+    _flat("market_cap", "float"),
+]
+
+# One row per /stats snapshot; gas prices are flattened to gwei by the cache
+STATS_SCHEMA: List[Column] = [
+    _flat("fetched_at", "datetime"),
+    _flat("total_blocks", "int"),
+    _flat("total_addresses", "int"),
+    _flat("total_transactions", "int"),
+    _flat("transactions_today", "int"),
+    _flat("average_block_time", "float"),
+    _flat("total_gas_used", "uint256"),
+    _flat("gas_used_today", "uint256"),
+    _flat("gas_price_slow", "float"),
+    _flat("gas_price_average", "float"),
+    _flat("gas_price_fast", "float"),
+    _flat("coin_price", "float"),
+    _flat("market_cap", "float"),
+    _flat("network_utilization_percentage", "float"),
+]
+
+SCHEMAS: Dict[type, List[Column]] = {
+    Holder: HOLDER_SCHEMA,
+    TokenTransfer: TOKEN_TRANSFER_SCHEMA,
+    Transaction: TRANSACTION_SCHEMA,
+    Block: BLOCK_SCHEMA,
+    TokenInfo: TOKEN_SCHEMA,
+    TokenBalance: TOKEN_BALANCE_SCHEMA,
+    HolderRecord: HOLDER_RECORD_SCHEMA,
+    TokenTransferRecord: TOKEN_TRANSFER_RECORD_SCHEMA,
+    TransactionRecord: TRANSACTION_RECORD_SCHEMA,
+    BlockRecord: BLOCK_RECORD_SCHEMA,
+    NFTInstance: NFT_INSTANCE_SCHEMA,
+    InternalTransaction: INTERNAL_TRANSACTION_SCHEMA,
+}
+
+
+def schema_for(item: Any) -> List[Column]:
+    """Look up the column schema for a model or record instance"""
+    for cls in type(item).__mro__:
+        if cls in SCHEMAS:
+            return SCHEMAS[cls]
+    raise ValueError(f"No column schema for {type(item).__name__}")
@@ -0,0 +1,364 @@
+"""Holder snapshot store
+
+A snapshot is a compact binary file with every holder of a token sorted by
+address hash (then token id). Sorting by address lets two snapshots be
+diffed with a single streaming merge in linear time and constant memory.
+
+File layout::
+
+    b"BSHS" | version (1 byte) | header length (4 bytes, big-endian) | JSON header
+    records: address (20) | flags (1) | value length (1) | value (big-endian)
+             | token id length (1) | token id (big-endian)
+
+A token id length of 255 marks a holder without token id (ERC-20).
+
+Holders arrive from the API in balance order, so writing a snapshot runs an
+external merge sort: sorted runs of ``chunk_size`` holders are spilled to
+temporary files and merged into the final file.
+"""
+
+import heapq
+import json
+import os
+import struct
+import tempfile
+import time
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from .models import HolderRecord
+from .models.records import pack_hash, unpack_hash
+
+MAGIC = b"BSHS"
+VERSION = 1
+_NO_TOKEN_ID = 255
+_READ_SIZE = 1 << 20
+
+
+def _int_bytes(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+
+def _encode(record: HolderRecord) -> bytes:
+    value = _int_bytes(record.value)
+    if record.token_id is None:
+        token_id = b""
+        token_id_len = _NO_TOKEN_ID
+    else:
+        token_id = _int_bytes(record.token_id)
+        token_id_len = len(token_id)
+    return b"".join(
+        (
+            record.address,
+            bytes((record.flags, len(value))),
+            value,
+            bytes((token_id_len,)),
+            token_id,
+        )
+    )
+
+
+def _decode_stream(stream: IO[bytes]) -> Iterator[HolderRecord]:
+    """Decode records from a binary stream positioned after the header"""
+    buffer = b""
+    offset = 0
+    from_bytes = int.from_bytes
+    while True:
+        chunk = stream.read(_READ_SIZE)
+        if not chunk:
+            break
+        buffer = buffer[offset:] + chunk
+        view = memoryview(buffer)
+        offset = 0
+        end = len(buffer)
+        while offset + 22 <= end:
+            value_end = offset + 22 + view[offset + 21]
+            if value_end + 1 > end:
+                break
+            token_id_len = view[value_end]
+            token_id_end = value_end + 1
+            if token_id_len != _NO_TOKEN_ID:
+                token_id_end += token_id_len
+            if token_id_end > end:
+                break
+            yield HolderRecord(
+                bytes(view[offset : offset + 20]),
+                from_bytes(view[offset + 22 : value_end], "big"),
+                None
+                if token_id_len == _NO_TOKEN_ID
+                else from_bytes(view[value_end + 1 : token_id_end], "big"),
+                view[offset + 20],
+            )
+            offset = token_id_end
+        view.release()
+    if offset != len(buffer):
+        raise ValueError("Truncated holder snapshot")
+
+
+def _sort_key(record: HolderRecord):
+    return (record.address, -1 if record.token_id is None else record.token_id)
+
+
+def _write_run(records: List[HolderRecord], directory: str) -> str:
+    records.sort(key=_sort_key)
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "wb", buffering=_READ_SIZE) as f:
+        f.writelines(_encode(record) for record in records)
+    return path
+
+
+def write_snapshot(
+    path: str,
+    holders: Iterable[Any],
+    token_address: Optional[str] = None,
+    block_number: Union[int, Callable[[], Optional[int]], None] = None,
+    decimals: Any = None,
+    chunk_size: int = 1_000_000,
+    meta: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    Write holders to a snapshot file sorted by address
+
+    Args:
+        path: Output file path
+        holders: Holder models, HolderRecords or raw API items, in any order
+        token_address: Token contract address stored in the header
+        block_number: Block height the snapshot corresponds to, or a
+            callable returning it once every holder has been read
+        decimals: Token decimals stored in the header
+        chunk_size: Holders sorted in memory per run
+        meta: Extra JSON-serializable fields stored in the header
+
+    Returns:
+        Number of holders written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    runs: List[str] = []
+    chunk: List[HolderRecord] = []
+    count = 0
+
+    try:
+        for holder in holders:
+            if isinstance(holder, dict):
+                holder = HolderRecord.from_json(holder)
+            elif not isinstance(holder, HolderRecord):
+                holder = HolderRecord.from_model(holder)
+            chunk.append(holder)
+            count += 1
+            if len(chunk) >= chunk_size:
+                runs.append(_write_run(chunk, directory))
+                chunk = []
+
+        chunk.sort(key=_sort_key)
+        if callable(block_number):
+            block_number = block_number()
+        streams = [open(run, "rb") for run in runs]
+        try:
+            merged = heapq.merge(
+                *[_decode_stream(stream) for stream in streams], chunk, key=_sort_key
+            )
+            header = json.dumps(
+                {
+                    **(meta or {}),
+                    "token_address": token_address,
+                    "block_number": block_number,
+                    "decimals": decimals,
+                    "count": count,
+                    "created_at": int(time.time()),
+                }
+            ).encode()
+            with open(path, "wb", buffering=_READ_SIZE) as f:
+                f.write(MAGIC + bytes((VERSION,)) + struct.pack(">I", len(header)))
+                f.write(header)
+                f.writelines(_encode(record) for record in merged)
+        finally:
+            for stream in streams:
+                stream.close()
+    finally:
+        for run in runs:
+            os.remove(run)
+
+    return count
+
+
+class HolderSnapshot:
+    """Read-only view of a snapshot file, iterated in address order"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self.meta, self._data_offset = self._read_header(f)
+
+    @staticmethod
+    def _read_header(f: IO[bytes]):
+        prefix = f.read(9)
+        if len(prefix) != 9 or prefix[:4] != MAGIC:
+            raise ValueError(f"{f.name} is not a holder snapshot")
+        if prefix[4] != VERSION:
+            raise ValueError(f"Unsupported holder snapshot version {prefix[4]}")
+        (header_len,) = struct.unpack(">I", prefix[5:])
+        return json.loads(f.read(header_len)), 9 + header_len
+
+    @property
+    def token_address(self) -> Optional[str]:
+        return self.meta.get("token_address")
+
+    @property
+    def block_number(self) -> Optional[int]:
+        return self.meta.get("block_number")
+
+    @property
+    def decimals(self) -> Optional[str]:
+        return self.meta.get("decimals")
+
+    def __len__(self) -> int:
+        return self.meta.get("count", 0)
+
+    def __iter__(self) -> Iterator[HolderRecord]:
+        with open(self.path, "rb") as f:
+            f.seek(self._data_offset)
+            yield from _decode_stream(f)
+
+
+class HolderChange(NamedTuple):
+    """Difference for one holder between two snapshots"""
+
+    kind: str  # "new" | "exited" | "changed"
+    address: str
+    token_id: Optional[int]
+    old_value: int
+    new_value: int
+
+    @property
+    def delta(self) -> int:
+        return self.new_value - self.old_value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "address": self.address,
+            "token_id": None if self.token_id is None else str(self.token_id),
+            "old_value": str(self.old_value),
+            "new_value": str(self.new_value),
+            "delta": str(self.delta),
+        }
+
+
+def diff_snapshots(
+    old: Iterable[HolderRecord],
+    new: Iterable[HolderRecord],
+    include_unchanged: bool = False,
+) -> Iterator[HolderChange]:
+    """
+    Stream-merge two snapshots and yield new, exited and changed holders
+
+    Both snapshots are read sequentially in address order, so memory use is
+    constant and time is linear in the number of holders. Any iterable of
+    HolderRecords sorted by (address, token_id) works, e.g. a BalanceIndex.
+    """
+    old_iter = iter(old)
+    new_iter = iter(new)
+    old_rec = next(old_iter, None)
+    new_rec = next(new_iter, None)
+
+    while old_rec is not None or new_rec is not None:
+        if new_rec is None or (
+            old_rec is not None and _sort_key(old_rec) < _sort_key(new_rec)
+        ):
+            yield HolderChange(
+                "exited",
+                unpack_hash(old_rec.address),
+                old_rec.token_id,
+                old_rec.value,
+                0,
+            )
+            old_rec = next(old_iter, None)
+        elif old_rec is None or _sort_key(new_rec) < _sort_key(old_rec):
+            yield HolderChange(
+                "new", unpack_hash(new_rec.address), new_rec.token_id, 0, new_rec.value
+            )
+            new_rec = next(new_iter, None)
+        else:
+            if include_unchanged or old_rec.value != new_rec.value:
+                yield HolderChange(
+                    "changed",
+                    unpack_hash(new_rec.address),
+                    new_rec.token_id,
+                    old_rec.value,
+                    new_rec.value,
+                )
+            old_rec = next(old_iter, None)
+            new_rec = next(new_iter, None)
+
+
+def lookup_address(snapshot: HolderSnapshot, address: str) -> List[HolderRecord]:
+    """Return the snapshot records of one address (linear scan)"""
+    key = pack_hash(address.lower())
+    records = []
+    for record in snapshot:
+        if record.address == key:
+            records.append(record)
+        elif record.address > key:
+            break
+    return records
+
+
+def snapshot_token_holders(
+    client: Any,
+    address_hash: str,
+    path: str,
+    chunk_size: int = 1_000_000,
+    on_page: Optional[Callable[[int], None]] = None,
+) -> HolderSnapshot:
+    """
+    Stream every holder of a token into a snapshot file
+
+    The latest block height is read once every holder page has been fetched
+    and stored in the header, so BalanceIndex.sync never replays a transfer
+    the snapshot already reflects. The height when the crawl started is kept
+    as ``started_block``: holders fetched early in a long crawl may miss
+    transfers made between the two, which a later diff reveals.
+
+    Args:
+        client: BlockScoutClient instance
+        address_hash: Token contract address
+        path: Output file path
+        chunk_size: Holders sorted in memory per run
+        on_page: Callback receiving the number of holders fetched so far
+    """
+
+    def head() -> Optional[int]:
+        blocks = client.get_blocks()
+        return blocks.items[0].height if blocks.items else None
+
+    token = client.get_token(address_hash)
+    started_block = head()
+
+    def holders() -> Iterator[Dict[str, Any]]:
+        fetched = 0
+        for page in client.iter_token_holder_pages(address_hash):
+            yield from page["items"]
+            fetched += len(page["items"])
+            if on_page is not None:
+                on_page(fetched)
+
+    write_snapshot(
+        path,
+        holders(),
+        token_address=token.address,
+        block_number=head,
+        decimals=token.decimals,
+        chunk_size=chunk_size,
+        meta={"started_block": started_block},
+    )
+    return HolderSnapshot(path)
@@ -0,0 +1,415 @@
+"""Push-based subscriptions over the Blockscout websocket
+
+Blockscout publishes new blocks and address activity on Phoenix channels
+(``blocks:new_block``, ``addresses:{hash}``). BlockScoutSubscriber joins
+those channels, keeps the connection alive with Phoenix heartbeats,
+reconnects with exponential backoff and, while the socket is down, falls
+back to polling the REST API so no events are missed. What already exists
+(the latest block, each address's latest transactions) is recorded over REST
+as soon as the socket is healthy, so the first fallback poll after an outage
+delivers everything newer than that baseline. Events are delivered
+as parsed ``Block`` / ``Transaction`` models through callbacks or an async
+iterator, deduplicated across socket and polling.
+
+Requires the optional ``websockets`` package (``pip install websockets``).
+"""
+
+import asyncio
+import itertools
+import json
+import random
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from pydantic import ValidationError
+
+from .exceptions import BlockScoutError
+from .models import Block, Transaction
+
+BLOCKS_TOPIC = "blocks:new_block"
+
+
+def _require_websockets():
+    try:
+        import websockets
+    except ImportError:
+        raise ImportError(
+            "websockets is required for this function. Install with: pip install websockets"
+        )
+    return websockets
+
+
+def socket_url_from_base(base_url: str) -> str:
+    """Derive the Phoenix socket URL from an API base URL
+
+    ``https://host/api/v2/`` becomes ``wss://host/socket/v2/websocket?vsn=2.0.0``
+    (instances under a path prefix keep it).
+    """
+    parts = urlsplit(base_url)
+    scheme = "wss" if parts.scheme == "https" else "ws"
+    path = parts.path.rstrip("/")
+    if path.endswith("/api/v2"):
+        path = path[: -len("/api/v2")]
+    return urlunsplit(
+        (scheme, parts.netloc, f"{path}/socket/v2/websocket", "vsn=2.0.0", "")
+    )
+
+
+class SubscriptionEvent(NamedTuple):
+    """One block or transaction delivered by a subscription"""
+
+    kind: str  # "block" | "transaction"
+    data: Any  # Block / Transaction model, or the raw dict if it fails to parse
+    topic: str
+    source: str  # "socket" | "poll"
+
+    @property
+    def hash(self) -> Optional[str]:
+        if isinstance(self.data, dict):
+            return self.data.get("hash")
+        return getattr(self.data, "hash", None)
+
+
+def _parse(model: Any, raw: Dict[str, Any]) -> Any:
+    try:
+        return model(**raw)
+    except ValidationError:
+        return raw
+
+
+class BlockScoutSubscriber:
+    """
+    Websocket subscription client with polling fallback
+
+    Example:
+        subscriber = BlockScoutSubscriber("https://eth.blockscout.com/api/v2/")
+        subscriber.subscribe_blocks(lambda event: print(event.data.height))
+        await subscriber.run()
+
+        # or
+        subscriber.subscribe_address("0x...")
+        async for event in subscriber:
+            print(event.kind, event.hash)
+
+    Args:
+        base_url: API base URL, used to derive the socket URL and for polling
+        socket_url: Explicit websocket URL (e.g. a local test server)
+        poll_client: BlockScoutClient used while the socket is down
+            (created from base_url if omitted)
+        fallback_polling: Poll the REST API while disconnected
+        heartbeat_interval: Seconds between Phoenix heartbeats
+        reconnect_min: First reconnect delay in seconds
+        reconnect_max: Longest reconnect delay in seconds
+        poll_interval: Seconds between polls while disconnected
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        socket_url: Optional[str] = None,
+        poll_client: Any = None,
+        fallback_polling: bool = True,
+        heartbeat_interval: float = 30.0,
+        reconnect_min: float = 1.0,
+        reconnect_max: float = 60.0,
+        poll_interval: float = 5.0,
+    ):
+        if socket_url is None:
+            if base_url is None:
+                raise ValueError("base_url or socket_url is required")
+            socket_url = socket_url_from_base(base_url)
+        self.base_url = base_url
+        self.socket_url = socket_url
+        self.poll_client = poll_client
+        self.fallback_polling = fallback_polling
+        self.heartbeat_interval = heartbeat_interval
+        self.reconnect_min = reconnect_min
+        self.reconnect_max = reconnect_max
+        self.poll_interval = poll_interval
+        self.connected = False
+        self.reconnects = 0
+        self._callbacks: Dict[str, List[Callable[[SubscriptionEvent], Any]]] = {}
+        self._refs = itertools.count(1)
+        self._seen: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._last_height: Optional[int] = None
+        self._address_baseline: Dict[str, bool] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._closed = False
+        self._ws: Any = None
+
+    # Subscriptions
+
+    def subscribe_blocks(
+        self, callback: Optional[Callable[[SubscriptionEvent], Any]] = None
+    ) -> "BlockScoutSubscriber":
+        """Subscribe to new blocks"""
+        return self._subscribe(BLOCKS_TOPIC, callback)
+
+    def subscribe_address(
+        self,
+        address_hash: str,
+        callback: Optional[Callable[[SubscriptionEvent], Any]] = None,
+    ) -> "BlockScoutSubscriber":
+        """Subscribe to new transactions of an address"""
+        return self._subscribe(f"addresses:{address_hash.lower()}", callback)
+
+    def _subscribe(self, topic, callback) -> "BlockScoutSubscriber":
+        callbacks = self._callbacks.setdefault(topic, [])
+        if callback is not None:
+            callbacks.append(callback)
+        return self
+
+    # Delivery
+
+    async def _deliver(self, event: SubscriptionEvent) -> None:
+        key = (event.kind, event.hash or "")
+        if event.hash is not None:
+            if key in self._seen:
+                return
+            self._seen[key] = None
+            if len(self._seen) > 10_000:
+                self._seen.popitem(last=False)
+        if event.kind == "block":
+            height = (
+                event.data.get("height")
+                if isinstance(event.data, dict)
+                else event.data.height
+            )
+            if height is not None:
+                self._last_height = max(self._last_height or 0, height)
+
+        for callback in self._callbacks.get(event.topic, []):
+            result = callback(event)
+            if asyncio.iscoroutine(result):
+                await result
+        if self._queue is not None:
+            await self._queue.put(event)
+
+    async def _handle_message(self, message: Any) -> None:
+        if isinstance(message, list):
+            _, _, topic, event, payload = message
+        else:
+            topic, event, payload = (
+                message.get("topic"),
+                message.get("event"),
+                message.get("payload"),
+            )
+        payload = payload or {}
+
+        if event == "phx_reply":
+            if payload.get("status") == "error":
+                raise BlockScoutError(f"Failed to join {topic}: {payload}")
+            return
+        if event in ("phx_error", "phx_close"):
+            raise ConnectionError(f"Channel {topic} closed by server")
+
+        if topic == BLOCKS_TOPIC and event == "new_block":
+            block = payload.get("block")
+            if block:
+                await self._deliver(
+                    SubscriptionEvent("block", _parse(Block, block), topic, "socket")
+                )
+        elif (
+            topic
+            and topic.startswith("addresses:")
+            and event
+            in (
+                "transaction",
+                "pending_transaction",
+            )
+        ):
+            transactions = payload.get("transactions") or [payload.get("transaction")]
+            for transaction in transactions:
+                if isinstance(transaction, dict):
+                    await self._deliver(
+                        SubscriptionEvent(
+                            "transaction",
+                            _parse(Transaction, transaction),
+                            topic,
+                            "socket",
+                        )
+                    )
+
+    # Socket
+
+    async def _send(self, ws, join_ref, topic, event, payload=None) -> None:
+        ref = str(next(self._refs))
+        await ws.send(json.dumps([join_ref, ref, topic, event, payload or {}]))
+
+    async def _heartbeat(self, ws) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await self._send(ws, None, "phoenix", "heartbeat")
+
+    async def _connect_once(self) -> None:
+        websockets = _require_websockets()
+        async with websockets.connect(self.socket_url, ping_interval=None) as ws:
+            self._ws = ws
+            for topic in self._callbacks:
+                await self._send(ws, str(next(self._refs)), topic, "phx_join")
+            self.connected = True
+            if self.fallback_polling:
+                try:
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, self._take_baseline
+                    )
+                except BlockScoutError:
+                    pass
+            heartbeat = asyncio.ensure_future(self._heartbeat(ws))
+            try:
+                async for raw in ws:
+                    await self._handle_message(json.loads(raw))
+            finally:
+                heartbeat.cancel()
+                self.connected = False
+                self._ws = None
+
+    # Polling fallback
+
+    def _get_poll_client(self):
+        if self.poll_client is None:
+            if self.base_url is None:
+                return None
+            from .client import BlockScoutClient
+
+            self.poll_client = BlockScoutClient(self.base_url)
+        return self.poll_client
+
+    def _take_baseline(self) -> None:
+        """Record the current head and address transactions (runs in a thread)
+
+        Topics that already have a baseline are skipped, so only the first
+        healthy connection after subscribing fetches anything.
+        """
+        client = self._get_poll_client()
+        if client is None:
+            return
+        for topic in list(self._callbacks):
+            if topic == BLOCKS_TOPIC:
+                if self._last_height is None:
+                    heights = [b["height"] for b in client.get_raw("/main-page/blocks")]
+                    if heights:
+                        self._last_height = max(heights)
+            elif topic.startswith("addresses:") and not self._address_baseline.get(
+                topic
+            ):
+                address_hash = topic.split(":", 1)[1]
+                page = client.get_raw(f"/addresses/{address_hash}/transactions")
+                for item in page.get("items", []):
+                    self._seen[("transaction", item["hash"])] = None
+                self._address_baseline[topic] = True
+
+    def _poll_once(self) -> List[SubscriptionEvent]:
+        """Fetch new blocks / address transactions over REST (runs in a thread)"""
+        client = self._get_poll_client()
+        if client is None:
+            return []
+        events = []
+        for topic in self._callbacks:
+            if topic == BLOCKS_TOPIC:
+                blocks = sorted(
+                    client.get_raw("/main-page/blocks"), key=lambda b: b["height"]
+                )
+                if self._last_height is None:
+                    blocks = blocks[-1:]
+                for block in blocks:
+                    if self._last_height is None or block["height"] > self._last_height:
+                        events.append(
+                            SubscriptionEvent(
+                                "block", _parse(Block, block), topic, "poll"
+                            )
+                        )
+            elif topic.startswith("addresses:"):
+                address_hash = topic.split(":", 1)[1]
+                page = client.get_raw(f"/addresses/{address_hash}/transactions")
+                items = page.get("items", [])
+                if not self._address_baseline.get(topic):
+                    # Never connected, so there is no baseline yet: the
+                    # first poll only records what already exists
+                    self._address_baseline[topic] = True
+                    for item in items:
+                        self._seen[("transaction", item["hash"])] = None
+                    continue
+                for item in reversed(items):
+                    events.append(
+                        SubscriptionEvent(
+                            "transaction", _parse(Transaction, item), topic, "poll"
+                        )
+                    )
+        return events
+
+    async def _poll_for(self, seconds: float) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + seconds
+        while not self._closed:
+            try:
+                events = await loop.run_in_executor(None, self._poll_once)
+            except BlockScoutError:
+                events = []
+            for event in events:
+                await self._deliver(event)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(self.poll_interval, remaining))
+
+    # Lifecycle
+
+    async def run(self) -> None:
+        """Stay subscribed until close() is called"""
+        if not self._callbacks:
+            raise ValueError("Nothing to subscribe to")
+        websockets = _require_websockets()
+        disconnected = (
+            OSError,
+            ConnectionError,
+            asyncio.TimeoutError,
+            BlockScoutError,
+            websockets.exceptions.WebSocketException,
+        )
+        delay = self.reconnect_min
+        while not self._closed:
+            try:
+                await self._connect_once()
+                delay = self.reconnect_min
+            except disconnected:
+                pass
+            if self._closed:
+                break
+
+            self.reconnects += 1
+            wait = delay * random.uniform(0.8, 1.2)
+            if self.fallback_polling:
+                await self._poll_for(wait)
+            else:
+                await asyncio.sleep(wait)
+            delay = min(self.reconnect_max, delay * 2)
+
+    async def close(self) -> None:
+        """Stop run() and close the socket"""
+        self._closed = True
+        if self._ws is not None:
+            await self._ws.close()
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        self._queue = asyncio.Queue()
+        task = asyncio.ensure_future(self.run())
+        try:
+            while True:
+                getter = asyncio.ensure_future(self._queue.get())
+                done, _ = await asyncio.wait(
+                    {getter, task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if getter in done:
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                task.result()
+                return
+        finally:
+            await self.close()
+            task.cancel()
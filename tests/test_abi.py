@@ -0,0 +1,319 @@
+"""Known-answer tests for local ABI decoding"""
+
+import pytest
+
+from blockscout_client.abi import AbiDecoder, AbiRegistry, _Event
+from blockscout_client.keccak import keccak256
+
+TOKEN = "0x" + "70" * 20
+CONTRACT = "0x" + "c0" * 20
+ALICE = "0x" + "a1" * 20
+BOB = "0x" + "b2" * 20
+
+
+def _param(type, name="", **extra):
+    return {"type": type, "name": name, **extra}
+
+
+def _function(name, *inputs):
+    return {"type": "function", "name": name, "inputs": list(inputs), "outputs": []}
+
+
+def _event(name, *inputs, anonymous=False):
+    return {
+        "type": "event",
+        "name": name,
+        "inputs": list(inputs),
+        "anonymous": anonymous,
+    }
+
+
+ERC20 = [
+    _function("transfer", _param("address", "to"), _param("uint256", "value")),
+    _event(
+        "Transfer",
+        _param("address", "from", indexed=True),
+        _param("address", "to", indexed=True),
+        _param("uint256", "value", indexed=False),
+    ),
+]
+
+# Examples from the Solidity ABI specification
+SPEC = [
+    _function("baz", _param("uint32", "x"), _param("bool", "y")),
+    _function(
+        "sam", _param("bytes", "a"), _param("bool", "b"), _param("uint256[]", "c")
+    ),
+    _function(
+        "f",
+        _param("uint256", "a"),
+        _param("uint32[]", "b"),
+        _param("bytes10", "c"),
+        _param("bytes", "d"),
+    ),
+    _function("g", _param("uint256[][]", "a"), _param("string[]", "b")),
+    _function(
+        "nested",
+        _param("uint256[]", "a"),
+        _param("string", "s"),
+        _param(
+            "tuple",
+            "t",
+            components=[_param("uint8", "k"), _param("bytes", "b")],
+        ),
+    ),
+    _function("signed", _param("int8", "a"), _param("int256", "b")),
+]
+
+
+def _hex(*words):
+    """Concatenate 32-byte words given as 64 hex digits"""
+    assert all(len(word) == 64 for word in words)
+    return "".join(words)
+
+
+def _word(value):
+    return "%064x" % value
+
+
+def _text(value):
+    return value.encode().hex().ljust(64, "0")
+
+
+def _topic_address(address):
+    return "0x" + address[2:].rjust(64, "0")
+
+
+TRANSFER_INPUT = "0xa9059cbb" + _hex(ALICE[2:].rjust(64, "0"), _word(10**24 + 1))
+
+CALLS = [
+    (
+        "0xcdcd77c0" + _hex(_word(69), _word(1)),
+        "baz(uint32,bool)",
+        {"x": 69, "y": True},
+    ),
+    (
+        "0xa5643bf2"
+        + _hex(
+            _word(0x60),
+            _word(1),
+            _word(0xA0),
+            _word(4),
+            _text("dave"),
+            _word(3),
+            _word(1),
+            _word(2),
+            _word(3),
+        ),
+        "sam(bytes,bool,uint256[])",
+        {"a": "0x" + b"dave".hex(), "b": True, "c": [1, 2, 3]},
+    ),
+    (
+        "0x8be65246"
+        + _hex(
+            _word(0x123),
+            _word(0x80),
+            _text("1234567890"),
+            _word(0xE0),
+            _word(2),
+            _word(0x456),
+            _word(0x789),
+            _word(13),
+            _text("Hello, world!"),
+        ),
+        "f(uint256,uint32[],bytes10,bytes)",
+        {
+            "a": 0x123,
+            "b": [0x456, 0x789],
+            "c": "0x" + b"1234567890".hex(),
+            "d": "0x" + b"Hello, world!".hex(),
+        },
+    ),
+    (
+        "0x2289b18c"
+        + _hex(
+            _word(0x40),
+            _word(0x140),
+            _word(2),
+            _word(0x40),
+            _word(0xA0),
+            _word(2),
+            _word(1),
+            _word(2),
+            _word(1),
+            _word(3),
+            _word(3),
+            _word(0x60),
+            _word(0xA0),
+            _word(0xE0),
+            _word(3),
+            _text("one"),
+            _word(3),
+            _text("two"),
+            _word(5),
+            _text("three"),
+        ),
+        "g(uint256[][],string[])",
+        {"a": [[1, 2], [3]], "b": ["one", "two", "three"]},
+    ),
+    (
+        "0x"
+        + keccak256(b"nested(uint256[],string,(uint8,bytes))")[:4].hex()
+        + _hex(
+            _word(0x60),
+            _word(0xC0),
+            _word(0x100),
+            _word(2),
+            _word(1),
+            _word(2),
+            _word(2),
+            _text("hi"),
+            _word(7),
+            _word(0x40),
+            _word(2),
+            "beef".ljust(64, "0"),
+        ),
+        "nested(uint256[],string,(uint8,bytes))",
+        {"a": [1, 2], "s": "hi", "t": {"k": 7, "b": "0xbeef"}},
+    ),
+    (
+        "0x"
+        + keccak256(b"signed(int8,int256)")[:4].hex()
+        + _hex("f" * 64, "f" * 63 + "e"),
+        "signed(int8,int256)",
+        {"a": -1, "b": -2},
+    ),
+]
+
+
+@pytest.fixture
+def decoder():
+    registry = AbiRegistry()
+    registry.add_abi(TOKEN, ERC20)
+    registry.add_abi(CONTRACT, SPEC)
+    yield AbiDecoder(registry)
+    registry.close()
+
+
+def test_erc20_transfer_call(decoder):
+    (decoded,) = decoder.decode_inputs(
+        [{"to": {"hash": TOKEN}, "raw_input": TRANSFER_INPUT}]
+    )
+    assert decoded.name == "transfer"
+    assert decoded.signature == "transfer(address,uint256)"
+    assert decoded.args == {"to": ALICE, "value": 10**24 + 1}
+
+
+def test_selector_shared_with_another_contract_decodes(decoder):
+    (decoded,) = decoder.decode_inputs([{"to": BOB, "raw_input": TRANSFER_INPUT}])
+    assert decoded.args == {"to": ALICE, "value": 10**24 + 1}
+
+
+@pytest.mark.parametrize("raw_input,signature,args", CALLS)
+def test_spec_vectors(decoder, raw_input, signature, args):
+    (decoded,) = decoder.decode_inputs([{"to": CONTRACT, "raw_input": raw_input}])
+    assert decoded.signature == signature
+    assert decoded.args == args
+
+
+def test_transfer_event(decoder):
+    log = {
+        "address": {"hash": TOKEN},
+        "topics": [
+            "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",
+            _topic_address(ALICE),
+            _topic_address(BOB),
+            None,
+        ],
+        "data": "0x" + _word(2**256 - 1),
+    }
+    (decoded,) = decoder.decode_logs([log])
+    assert decoded.signature == "Transfer(address,address,uint256)"
+    assert decoded.args == {"from": ALICE, "to": BOB, "value": 2**256 - 1}
+
+
+def test_indexed_reference_types_stay_hashes(decoder):
+    entry = _event(
+        "Labeled",
+        _param("string", "label", indexed=True),
+        _param("address", "who", indexed=True),
+        _param("uint256", "amount"),
+        _param("string", "note"),
+    )
+    decoder.registry.add_abi(CONTRACT, SPEC + [entry])
+    label_hash = "0x" + keccak256(b"gm").hex()
+    log = {
+        "address": CONTRACT,
+        "topics": [
+            "0x" + keccak256(b"Labeled(string,address,uint256,string)").hex(),
+            label_hash,
+            _topic_address(BOB),
+        ],
+        "data": "0x" + _hex(_word(5), _word(0x40), _word(3), _text("hey")),
+    }
+    (decoded,) = decoder.decode_logs([log])
+    assert decoded.args == {"label": label_hash, "who": BOB, "amount": 5, "note": "hey"}
+
+
+def test_anonymous_event_has_no_signature_topic():
+    event = _Event(
+        _event(
+            "Anon",
+            _param("uint256", "id", indexed=True),
+            _param("bool", "flag"),
+            anonymous=True,
+        )
+    )
+    assert event.decode(["0x" + _word(9)], bytes.fromhex(_word(1))) == {
+        "id": 9,
+        "flag": True,
+    }
+
+
+@pytest.mark.parametrize(
+    "raw_input",
+    [
+        # too short for a selector
+        "0xa905",
+        # static arguments cut short
+        TRANSFER_INPUT[:-2],
+        # dynamic offset pointing past the data
+        "0xa5643bf2" + _hex(_word(0x1000), _word(1), _word(0xA0)),
+        # array length larger than the data
+        "0xa5643bf2" + _hex(_word(0x60), _word(1), _word(0x60), _word(2**200)),
+        # bytes length running past the data
+        "0xa5643bf2" + _hex(_word(0x60), _word(1), _word(0xA0), _word(64), _text("x")),
+        # selector nobody knows
+        "0xdeadbeef" + _word(1),
+    ],
+)
+def test_malformed_input_returns_none(decoder, raw_input):
+    contract = TOKEN if raw_input.startswith("0xa9") else CONTRACT
+    assert decoder.decode_inputs([{"to": contract, "raw_input": raw_input}]) == [None]
+
+
+def test_malformed_logs_return_none(decoder):
+    topic0 = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+    logs = [
+        # value word missing
+        {
+            "address": TOKEN,
+            "topics": [topic0, _topic_address(ALICE), _topic_address(BOB)],
+            "data": "0x",
+        },
+        # no topics at all
+        {"address": TOKEN, "topics": [], "data": "0x" + _word(1)},
+    ]
+    assert decoder.decode_logs(logs) == [None, None]
+
+
+def test_columnar_keeps_large_integers_exact(decoder):
+    transactions = [
+        {"hash": "0x01", "to": TOKEN, "raw_input": TRANSFER_INPUT},
+        {"hash": "0x02", "to": CONTRACT, "raw_input": CALLS[0][0]},
+    ]
+    batches = decoder.decode_inputs_columnar(transactions)
+    assert set(batches) == {"transfer(address,uint256)", "baz(uint32,bool)"}
+    transfer = batches["transfer(address,uint256)"].to_pandas()
+    assert transfer["value"].tolist() == [10**24 + 1]
+    assert batches["baz(uint32,bool)"].to_pandas()["y"].tolist() == [True]
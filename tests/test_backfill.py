@@ -0,0 +1,74 @@
+"""Tests for BlockBackfill resume with a stub client"""
+
+import pytest
+
+from blockscout_client.backfill import BackfillState, BlockBackfill, HeightBitmap
+from blockscout_client.exceptions import BlockScoutAPIError, BlockScoutError
+
+
+class StubBlocks:
+    """Serves /blocks/{n}; heights in ``failing`` error, ``unindexed`` 404"""
+
+    def __init__(self, failing=(), unindexed=()):
+        self.failing = set(failing)
+        self.unindexed = set(unindexed)
+        self.fetched = []
+
+    def get_raw(self, endpoint, params=None):
+        height = int(endpoint.rsplit("/", 1)[1])
+        self.fetched.append(height)
+        if height in self.failing:
+            raise BlockScoutError(f"block {height} failed")
+        if height in self.unindexed:
+            raise BlockScoutAPIError(404, "Not found")
+        return {"height": height, "transaction_count": 0}
+
+    def iter_raw_pages(self, endpoint, params=None, max_pages=None):
+        raise AssertionError("empty blocks need no transaction request")
+
+
+def test_bitmap_tracks_gaps_and_round_trips():
+    bitmap = HeightBitmap(10, 40)
+    for height in list(range(10, 20)) + [25] + list(range(30, 41)):
+        bitmap.add(height)
+
+    assert len(bitmap) == 31
+    assert bitmap.count() == 22
+    assert 25 in bitmap and 24 not in bitmap
+    assert list(bitmap.gaps()) == [(20, 24), (26, 29)]
+
+    restored = HeightBitmap(10, 40, bitmap.to_bytes())
+    assert list(restored.gaps()) == [(20, 24), (26, 29)]
+    with pytest.raises(ValueError):
+        HeightBitmap(10, 100, bitmap.to_bytes())
+
+
+def test_resume_fetches_only_the_missing_heights(tmp_path):
+    path = str(tmp_path / "range.state")
+    client = StubBlocks(failing={105, 106}, unindexed={150})
+    sunk = []
+
+    backfill = BlockBackfill(
+        client, 100, 150, workers=4, shard_size=8, transactions=True, state_path=path
+    )
+    assert backfill.run(lambda block, txs: sunk.append(block["height"])) == 48
+    assert set(backfill.errors) == {105, 106}
+    assert backfill.missing == {150}
+    assert list(backfill.bitmap.gaps()) == [(105, 106), (150, 150)]
+
+    # a new process picks up the state file and only asks for the gaps
+    client = StubBlocks()
+    resumed = BlockBackfill(client, 100, 150, workers=2, state_path=path)
+    assert resumed.bitmap.count() == 48
+    assert resumed.run(lambda block, txs: sunk.append(block["height"])) == 3
+    assert sorted(client.fetched) == [105, 106, 150]
+    assert sorted(sunk) == list(range(100, 151))
+    assert list(BackfillState.load(path, 100, 150).bitmap.gaps()) == []
+
+
+def test_state_file_for_another_range_is_rejected(tmp_path):
+    path = str(tmp_path / "range.state")
+    BlockBackfill(StubBlocks(), 1, 20, state_path=path).run(lambda block, txs: None)
+
+    with pytest.raises(ValueError):
+        BackfillState.load(path, 1, 30)
@@ -0,0 +1,109 @@
+"""Tests for FeedConsumer backfill and follow with a stub client"""
+
+import pytest
+
+from blockscout_client.feeds import FeedConsumer
+
+
+def _transfer(block, log_index):
+    return {
+        "transaction_hash": "0x%064x" % block,
+        "log_index": log_index,
+        "block_number": block,
+    }
+
+
+class StubFeed:
+    """Pages /token-transfers newest first, three items per page"""
+
+    def __init__(self):
+        self.items = []
+
+    def add_block(self, block, count=2):
+        self.items[:0] = [_transfer(block, i) for i in reversed(range(count))]
+
+    def iter_raw_pages(self, endpoint, params=None, max_pages=None, page_params=None):
+        # keyset paging like the API: a cursor is the last (block, log index)
+        # seen, so items added at the head never shift older pages
+        assert endpoint == "/token-transfers"
+        cursor = page_params and (page_params["block_number"], page_params["index"])
+        pages = 0
+        while True:
+            pages += 1
+            older = [
+                item
+                for item in self.items
+                if cursor is None or (item["block_number"], item["log_index"]) < cursor
+            ]
+            items = older[:3]
+            next_page_params = None
+            if len(older) > 3:
+                last = items[-1]
+                cursor = (last["block_number"], last["log_index"])
+                next_page_params = {"block_number": cursor[0], "index": cursor[1]}
+            yield {"items": items, "next_page_params": next_page_params}
+            if not next_page_params or (max_pages is not None and pages >= max_pages):
+                return
+
+
+def _keys(items):
+    return [(item["block_number"], item["log_index"]) for item in items]
+
+
+def test_backfill_then_follow_emits_every_item_once(tmp_path):
+    path = str(tmp_path / "tt.state")
+    client = StubFeed()
+    for block in range(1, 11):
+        client.add_block(block)
+    out = []
+
+    consumer = FeedConsumer(client, "token-transfers", batch_size=4, state_path=path)
+    assert consumer.backfill(out.extend, until_block=3, max_pages=2) == 6
+    # new blocks land at the head while the backfill is interrupted
+    client.add_block(11)
+    client.add_block(12, count=1)
+
+    consumer = FeedConsumer(client, "token-transfers", batch_size=4, state_path=path)
+    consumer.backfill(out.extend, max_pages=10)
+    assert consumer.state.done
+    assert consumer.state.head_block == 10
+    assert sorted(_keys(out)) == [(b, i) for b in range(3, 11) for i in (0, 1)]
+
+    followed = []
+    client.add_block(13)
+    consumer = FeedConsumer(client, "token-transfers", state_path=path)
+    assert consumer.follow(followed.extend, interval=0, max_polls=1) == 5
+    assert _keys(followed) == [(11, 0), (11, 1), (12, 0), (13, 0), (13, 1)]
+    assert consumer.state.head_block == 13
+
+    # another poll without new blocks hands nothing over again
+    assert consumer.poll(followed.extend) == 0
+    assert len(followed) == 5
+
+
+def test_first_poll_without_state_only_records_the_head():
+    client = StubFeed()
+    for block in range(1, 4):
+        client.add_block(block)
+    out = []
+
+    consumer = FeedConsumer(client, "token-transfers")
+    assert consumer.poll(out.extend) == 0
+    assert consumer.state.head_block == 3
+
+    client.add_block(4, count=1)
+    assert consumer.poll(out.extend) == 1
+    assert _keys(out) == [(4, 0)]
+
+
+def test_items_without_block_number_fail_loudly(tmp_path):
+    client = StubFeed()
+    client.add_block(1)
+    for item in client.items:
+        del item["block_number"]
+
+    consumer = FeedConsumer(client, "token-transfers")
+    with pytest.raises(ValueError):
+        consumer.backfill(lambda items: None, until_block=1)
+    with pytest.raises(ValueError):
+        consumer.follow(lambda items: None, interval=0, max_polls=1)
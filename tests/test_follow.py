@@ -0,0 +1,146 @@
+"""Tests for ChainFollower with a stub client"""
+
+import pytest
+
+from blockscout_client.exceptions import BlockScoutError
+from blockscout_client.follow import ChainFollower
+
+
+def _hash(height, fork=0):
+    return "0x%062x%02x" % (height, fork)
+
+
+class StubChain:
+    """Serves blocks and transactions of an in-memory chain"""
+
+    def __init__(self, head):
+        self.blocks = {}
+        self.failures = {}  # endpoint -> number of times it still fails
+        self.calls = []
+        self.extend(1, head)
+
+    def extend(self, start, end, fork=0):
+        for height in range(start, end + 1):
+            parent = self.blocks.get(height - 1)
+            self.blocks[height] = {
+                "height": height,
+                "hash": _hash(height, fork),
+                "parent_hash": parent["hash"] if parent else _hash(0),
+                "timestamp": None,
+                "transaction_count": 1,
+            }
+
+    def _check(self, endpoint):
+        self.calls.append(endpoint)
+        if self.failures.get(endpoint):
+            self.failures[endpoint] -= 1
+            raise BlockScoutError(f"{endpoint} failed")
+
+    def get_raw(self, endpoint, params=None):
+        self._check(endpoint)
+        if endpoint == "/main-page/blocks":
+            top = max(self.blocks)
+            return [self.blocks[h] for h in range(top, max(0, top - 4), -1)]
+        return self.blocks[int(endpoint.rsplit("/", 1)[1])]
+
+    def iter_raw_pages(self, endpoint, params=None, max_pages=None):
+        self._check(endpoint)
+        height = int(endpoint.split("/")[2])
+        yield {"items": [{"hash": "tx-" + self.blocks[height]["hash"]}]}
+
+
+def _summary(events):
+    return [(event.kind, event.height, event.hash[-2:]) for event in events]
+
+
+def test_first_poll_starts_at_the_head():
+    chain = StubChain(head=10)
+    follower = ChainFollower(chain)
+
+    assert _summary(follower.poll()) == [("block", 10, "00")]
+    chain.extend(11, 12)
+    assert [event.height for event in follower.poll()] == [11, 12]
+    assert follower.poll() == []
+    assert follower.head == 12
+
+
+def test_gap_is_filled_in_order_and_streamed():
+    chain = StubChain(head=20)
+    follower = ChainFollower(chain, start_height=5, min_interval=0)
+
+    events = follower.events(max_blocks=16)
+    first = next(events)
+    assert first.height == 5
+    # only the first missing block was fetched before it was yielded
+    assert [call for call in chain.calls if call.startswith("/blocks/")] == [
+        "/blocks/5"
+    ]
+    assert [event.height for event in events] == list(range(6, 21))
+
+
+def test_reorg_rolls_back_and_emits_the_canonical_chain():
+    chain = StubChain(head=10)
+    follower = ChainFollower(chain, start_height=7, transactions=True)
+    assert [event.height for event in follower.poll()] == [7, 8, 9, 10]
+
+    chain.extend(9, 11, fork=1)
+    events = follower.poll()
+
+    assert _summary(events) == [
+        ("rollback", 10, "00"),
+        ("rollback", 9, "00"),
+        ("block", 9, "01"),
+        ("block", 10, "01"),
+        ("block", 11, "01"),
+    ]
+    assert events[2].transactions == [{"hash": "tx-" + _hash(9, 1)}]
+    assert follower.reorgs == 1
+    assert follower.head == 11
+
+
+def test_failed_transaction_fetch_does_not_skip_the_block():
+    chain = StubChain(head=10)
+    follower = ChainFollower(chain, start_height=6, transactions=True)
+    chain.failures["/blocks/8/transactions"] = 1
+
+    assert [event.height for event in follower.poll()] == [6, 7]
+    assert follower.head == 7
+
+    events = follower.poll()
+    assert [event.height for event in events] == [8, 9, 10]
+    assert events[0].transactions == [{"hash": "tx-" + _hash(8)}]
+
+
+def test_failed_gap_fetch_raises_without_moving_the_head():
+    chain = StubChain(head=10)
+    follower = ChainFollower(chain)
+    follower.poll()
+    chain.extend(11, 20)
+    chain.failures["/blocks/11"] = 1
+
+    with pytest.raises(BlockScoutError):
+        follower.poll()
+    assert follower.head == 10
+    assert [event.height for event in follower.poll()] == list(range(11, 21))
+
+
+def test_failed_reorg_fetch_leaves_the_window_intact():
+    chain = StubChain(head=10)
+    follower = ChainFollower(chain, start_height=7)
+    follower.poll()
+    # the fork point is below the blocks on the main page: walking back to
+    # it needs /blocks/10 and /blocks/9
+    chain.extend(9, 14, fork=1)
+    chain.failures["/blocks/9"] = 1
+
+    with pytest.raises(BlockScoutError):
+        follower.poll()
+    assert follower.head == 10
+    assert follower.reorgs == 0
+
+    events = follower.poll()
+    assert _summary(events)[:2] == [("rollback", 10, "00"), ("rollback", 9, "00")]
+    assert [event.height for event in events if event.kind == "block"] == list(
+        range(9, 15)
+    )
+    assert follower.reorgs == 1
@@ -0,0 +1,68 @@
+"""Tests for gas frames built from a stub client"""
+
+import numpy as np
+
+from blockscout_client.gas import GasFrame, fetch_gas_frame
+
+
+def _block(height):
+    return {
+        "height": height,
+        "timestamp": "2024-01-01T00:00:%02dZ" % height,
+        "gas_used": str(height * 1_000_000),
+        "gas_limit": "30000000",
+        # pre-London blocks carry no base fee
+        "base_fee_per_gas": None if height < 3 else str(height * 10**9),
+        "burnt_fees": str(10**20 + height),
+        "priority_fee": "7",
+        "transaction_count": 2,
+    }
+
+
+def _transactions(height):
+    return [
+        {
+            "block_number": height,
+            "gas_price": str(price * 10**9),
+            "gas_used": "21000",
+            "fee": {"type": "actual", "value": str(21000 * price * 10**9)},
+        }
+        for price in (height, height * 2)
+    ]
+
+
+class StubBlocks:
+    def get_raw(self, endpoint, params=None):
+        return _block(int(endpoint.rsplit("/", 1)[1]))
+
+    def iter_raw_pages(self, endpoint, params=None, max_pages=None):
+        yield {"items": _transactions(int(endpoint.split("/")[2]))}
+
+
+def test_fetched_frame_is_sorted_and_typed():
+    frame = fetch_gas_frame(StubBlocks(), 1, 10, workers=4, transactions=True)
+
+    assert frame.height.tolist() == list(range(1, 11))
+    assert np.isnan(frame.columns["base_fee_per_gas"][:2]).all()
+    assert frame.columns["utilization"][2] == 0.1
+    # fee totals are exact integers, beyond float64 precision
+    assert frame.burnt_fees_total == 10 * 10**20 + 55
+    assert frame.summary()["seconds"] == 9.0
+    assert frame.transaction_count == 20
+    assert frame.block_percentiles("gas_price", (50, 100))[4].tolist() == [5e9, 10e9]
+
+
+def test_frame_from_blocks_matches_the_fetched_frame():
+    heights = [4, 2, 3, 1]
+    frame = GasFrame.from_blocks(
+        [_block(h) for h in heights],
+        [tx for h in heights for tx in _transactions(h)],
+    )
+    fetched = fetch_gas_frame(StubBlocks(), 1, 4, transactions=True)
+
+    for name in frame.columns:
+        np.testing.assert_array_equal(frame.columns[name], fetched.columns[name])
+    np.testing.assert_array_equal(
+        frame.block_percentiles(), fetched.block_percentiles()
+    )
+    assert (frame.timestamp == fetched.timestamp).all()
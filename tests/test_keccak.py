@@ -0,0 +1,74 @@
+"""Tests for Keccak-256 digests, topics, selectors and EIP-55 checksums"""
+
+import pytest
+
+from blockscout_client.keccak import (
+    _keccak256_python,
+    canonical_signature,
+    event_topic,
+    function_selector,
+    keccak256,
+    to_checksum_address,
+)
+
+DIGESTS = [
+    (b"", "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"),
+    (b"abc", "4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45"),
+]
+
+# Test vectors from EIP-55
+CHECKSUMS = [
+    "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+    "0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359",
+    "0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB",
+    "0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb",
+]
+
+
+@pytest.mark.parametrize("hash_function", [keccak256, _keccak256_python])
+@pytest.mark.parametrize("data,digest", DIGESTS)
+def test_known_digests(hash_function, data, digest):
+    assert hash_function(data).hex() == digest
+
+
+@pytest.mark.parametrize("length", [135, 136, 137, 272, 1000])
+def test_python_fallback_matches_pycryptodome_across_block_boundaries(length):
+    keccak = pytest.importorskip("Crypto.Hash.keccak")
+    data = bytes(range(256)) * 4
+    expected = keccak.new(digest_bits=256, data=data[:length]).digest()
+    assert _keccak256_python(data[:length]) == expected
+
+
+def test_event_topics_and_selectors():
+    assert (
+        event_topic(
+            "event Transfer(address indexed from, address indexed to, uint value)"
+        )
+        == "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+    )
+    assert (
+        event_topic("Approval(address,address,uint256)")
+        == "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925"
+    )
+    assert function_selector("transfer(address,uint256)") == "0xa9059cbb"
+    assert function_selector("balanceOf(address owner) returns (uint)") == "0x70a08231"
+
+
+def test_canonical_signature_expands_tuples_and_aliases():
+    assert (
+        canonical_signature("f((uint a, bytes[] b)[2] pairs, int c, byte d)")
+        == "f((uint256,bytes[])[2],int256,bytes1)"
+    )
+    with pytest.raises(ValueError):
+        canonical_signature("no parentheses")
+
+
+@pytest.mark.parametrize("address", CHECKSUMS)
+def test_eip55_checksums(address):
+    assert to_checksum_address(address.lower()) == address
+    assert to_checksum_address(address.upper().replace("0X", "0x")) == address
+
+
+def test_checksum_rejects_invalid_addresses():
+    with pytest.raises(ValueError):
+        to_checksum_address("0x1234")
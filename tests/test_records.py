@@ -0,0 +1,154 @@
+"""Tests for the compact record types"""
+
+import pytest
+
+from blockscout_client.models.records import (
+    BlockRecord,
+    HolderRecord,
+    TokenTransferRecord,
+    TransactionRecord,
+)
+
+ALICE = "0x" + "a1" * 20
+BOB = "0x" + "b2" * 20
+TOKEN = {
+    "address": "0x" + "c3" * 20,
+    "symbol": "TKN",
+    "name": "Token",
+    "decimals": "18",
+    "type": "ERC-20",
+}
+
+HOLDER = {
+    "address": {"hash": ALICE, "is_contract": True, "is_verified": False},
+    "value": str(2**256 - 1),
+}
+TRANSFER = {
+    "transaction_hash": "0x" + "11" * 32,
+    "log_index": 3,
+    "block_hash": "0x" + "22" * 32,
+    "block_number": 19_000_000,
+    "timestamp": "2024-01-01T00:00:00.000000Z",
+    "from": {"hash": ALICE, "is_contract": False},
+    "to": {"hash": BOB, "is_contract": True},
+    "token": TOKEN,
+    "total": {"decimals": "18", "value": "1000500000000000000000"},
+    "type": "token_transfer",
+    "method": "transfer",
+}
+TRANSACTION = {
+    "hash": "0x" + "33" * 32,
+    "block_number": 19_000_000,
+    "position": 7,
+    "timestamp": "2024-01-01T00:00:00.000000Z",
+    "from": {"hash": ALICE},
+    "to": None,
+    "value": "0",
+    "fee": {"type": "actual", "value": "21000000000000"},
+    "gas_limit": "53000",
+    "gas_used": "21000",
+    "gas_price": "1000000000",
+    "nonce": 4,
+    "type": 2,
+    "status": "error",
+}
+BLOCK = {
+    "height": 19_000_000,
+    "hash": "0x" + "44" * 32,
+    "parent_hash": "0x" + "55" * 32,
+    "timestamp": "2024-01-01T00:00:00.000000Z",
+    "miner": {"hash": BOB},
+    "gas_used": "12000000",
+    "gas_limit": "30000000",
+    "base_fee_per_gas": "9000000000",
+    "transaction_count": 150,
+    "size": 60000,
+}
+
+CASES = [
+    (
+        HolderRecord,
+        HOLDER,
+        {"address": ALICE, "value": str(2**256 - 1), "is_contract": True},
+    ),
+    (
+        TokenTransferRecord,
+        TRANSFER,
+        {
+            "transaction_hash": TRANSFER["transaction_hash"],
+            "log_index": 3,
+            "block_hash": TRANSFER["block_hash"],
+            "block_number": 19_000_000,
+            "timestamp": TRANSFER["timestamp"],
+            "from": ALICE,
+            "to": BOB,
+            "token_address": TOKEN["address"],
+            "token_symbol": "TKN",
+            "value": "1000500000000000000000",
+            "type": "token_transfer",
+            "method": "transfer",
+        },
+    ),
+    (
+        TransactionRecord,
+        TRANSACTION,
+        {
+            "hash": TRANSACTION["hash"],
+            "block_number": 19_000_000,
+            "position": 7,
+            "timestamp": TRANSACTION["timestamp"],
+            "from": ALICE,
+            "value": "0",
+            "fee": "21000000000000",
+            "gas_limit": 53000,
+            "gas_used": "21000",
+            "gas_price": "1000000000",
+            "nonce": 4,
+            "type": 2,
+            "status": "error",
+        },
+    ),
+    (
+        BlockRecord,
+        BLOCK,
+        {
+            "height": 19_000_000,
+            "hash": BLOCK["hash"],
+            "parent_hash": BLOCK["parent_hash"],
+            "timestamp": BLOCK["timestamp"],
+            "miner": BOB,
+            "gas_used": "12000000",
+            "gas_limit": "30000000",
+            "base_fee_per_gas": "9000000000",
+            "transaction_count": 150,
+            "size": 60000,
+            "type": "block",
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize("record_type,item,expected", CASES)
+def test_from_json_to_dict(record_type, item, expected):
+    assert record_type.from_json(item).to_dict() == expected
+
+
+@pytest.mark.parametrize("record_type,item,expected", CASES)
+def test_model_round_trip(record_type, item, expected):
+    record = record_type.from_json(item)
+    assert record_type.from_model(record.to_model()) == record
+
+
+@pytest.mark.parametrize("record_type,item,expected", CASES)
+def test_records_are_hashable(record_type, item, expected):
+    first = record_type.from_json(item)
+    # a separate parse builds equal but distinct objects (TokenInfo included)
+    second = record_type.from_json(item)
+    other = record_type.from_json({**item, "timestamp": "2025-01-01T00:00:00Z"})
+    if record_type is HolderRecord:
+        other = record_type.from_json({**item, "value": "1"})
+
+    assert first == second and first is not second
+    assert first != other
+    assert {first, second, other} == {first, other}
+    assert {first: "x"}[second] == "x"
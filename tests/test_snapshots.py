@@ -0,0 +1,130 @@
+"""Tests for holder snapshot files with a stub client"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from blockscout_client.models import HolderRecord
+from blockscout_client.models.records import pack_hash
+from blockscout_client.snapshots import (
+    HolderSnapshot,
+    diff_snapshots,
+    lookup_address,
+    snapshot_token_holders,
+    write_snapshot,
+)
+
+TOKEN = "0x" + "ee" * 20
+
+
+def _address(n):
+    return "0x%040x" % n
+
+
+def _item(n, value, token_id=None):
+    item = {"address": {"hash": _address(n)}, "value": str(value)}
+    if token_id is not None:
+        item["token_id"] = str(token_id)
+    return item
+
+
+def _changes(old, new):
+    return [
+        (change.kind, change.address, change.token_id, change.delta)
+        for change in diff_snapshots(old, new)
+    ]
+
+
+def test_round_trip_sorts_holders_across_spilled_runs(tmp_path):
+    path = str(tmp_path / "holders.bshs")
+    # balance order, as the API returns them; 2**256 - 1 needs all 32 bytes
+    holders = [
+        _item(7, 2**256 - 1),
+        _item(3, 500, token_id=2**70),
+        _item(3, 400, token_id=1),
+        _item(9, 0),
+        HolderRecord(pack_hash(_address(1)), 1),
+    ]
+
+    count = write_snapshot(
+        path, holders, token_address=TOKEN, block_number=123, chunk_size=2
+    )
+
+    snapshot = HolderSnapshot(path)
+    assert count == len(snapshot) == 5
+    assert (snapshot.token_address, snapshot.block_number) == (TOKEN, 123)
+    assert [(r.address, r.token_id, r.value) for r in snapshot] == [
+        (pack_hash(_address(1)), None, 1),
+        (pack_hash(_address(3)), 1, 400),
+        (pack_hash(_address(3)), 2**70, 500),
+        (pack_hash(_address(7)), None, 2**256 - 1),
+        (pack_hash(_address(9)), None, 0),
+    ]
+    assert [r.value for r in lookup_address(snapshot, _address(3))] == [400, 500]
+    # spilled runs are cleaned up
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["holders.bshs"]
+
+
+def test_diff_reports_new_exited_and_changed_holders(tmp_path):
+    old_path = str(tmp_path / "old.bshs")
+    new_path = str(tmp_path / "new.bshs")
+    write_snapshot(old_path, [_item(1, 10), _item(2, 20), _item(4, 40)])
+    write_snapshot(new_path, [_item(4, 40), _item(3, 30), _item(2, 25)], chunk_size=1)
+
+    assert _changes(HolderSnapshot(old_path), HolderSnapshot(new_path)) == [
+        ("exited", _address(1), None, -10),
+        ("changed", _address(2), None, 5),
+        ("new", _address(3), None, 30),
+    ]
+    assert _changes(HolderSnapshot(new_path), HolderSnapshot(new_path)) == []
+
+
+def test_rejects_files_that_are_not_snapshots(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"PK\x03\x04 not a snapshot")
+
+    with pytest.raises(ValueError):
+        HolderSnapshot(str(path))
+
+
+def test_truncated_snapshot_is_detected(tmp_path):
+    path = tmp_path / "holders.bshs"
+    write_snapshot(str(path), [_item(1, 10), _item(2, 20)])
+    path.write_bytes(path.read_bytes()[:-3])
+
+    with pytest.raises(ValueError):
+        list(HolderSnapshot(str(path)))
+
+
+class StubClient:
+    """Serves holder pages while the chain head moves on"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.height = 100
+
+    def get_token(self, address_hash):
+        return SimpleNamespace(address=address_hash, decimals="18")
+
+    def get_blocks(self):
+        return SimpleNamespace(items=[SimpleNamespace(height=self.height)])
+
+    def iter_token_holder_pages(self, address_hash):
+        for items in self.pages:
+            self.height += 5
+            yield {"items": items}
+
+
+def test_snapshot_records_the_head_after_the_crawl(tmp_path):
+    client = StubClient([[_item(5, 50), _item(2, 20)], [_item(8, 1)]])
+    fetched = []
+
+    snapshot = snapshot_token_holders(
+        client, TOKEN, str(tmp_path / "holders.bshs"), on_page=fetched.append
+    )
+
+    assert fetched == [2, 3]
+    assert snapshot.block_number == 110
+    assert snapshot.meta["started_block"] == 100
+    assert snapshot.decimals == "18"
+    assert [r.value for r in snapshot] == [20, 50, 1]
@@ -0,0 +1,195 @@
+"""Tests for the websocket subscriber against a local Phoenix-style server"""
+
+import asyncio
+import json
+
+import pytest
+
+websockets = pytest.importorskip("websockets")
+
+from blockscout_client.subscriptions import (  # noqa: E402
+    BLOCKS_TOPIC,
+    BlockScoutSubscriber,
+    socket_url_from_base,
+)
+
+ADDRESS = "0x" + "ab" * 20
+
+
+def _tx(n):
+    return {"hash": "0x%064x" % n}
+
+
+def _block(height):
+    return {"height": height, "hash": "0x%064x" % (10**6 + height)}
+
+
+class StubClient:
+    """REST client used by the polling fallback"""
+
+    def __init__(self):
+        self.blocks = []
+        self.transactions = []
+        self.calls = []
+
+    def get_raw(self, endpoint, params=None):
+        self.calls.append(endpoint)
+        if endpoint == "/main-page/blocks":
+            return list(self.blocks)
+        return {"items": list(self.transactions), "next_page_params": None}
+
+
+class PhoenixServer:
+    """Accepts joins; the first connection runs ``script`` and then drops"""
+
+    def __init__(self, script):
+        self.script = script
+        self.connections = 0
+
+    async def handler(self, ws):
+        self.connections += 1
+        first = self.connections == 1
+        joined = asyncio.Event()
+
+        async def reader():
+            async for raw in ws:
+                join_ref, ref, topic, event, _ = json.loads(raw)
+                if event == "phx_join":
+                    reply = {"status": "ok", "response": {}}
+                    await ws.send(
+                        json.dumps([join_ref, ref, topic, "phx_reply", reply])
+                    )
+                    joined.set()
+
+        task = asyncio.ensure_future(reader())
+        try:
+            await joined.wait()
+            if first:
+                await self.script(ws)
+                return
+            await task
+        finally:
+            task.cancel()
+
+
+async def _run_until(subscriber, predicate, timeout=5.0):
+    task = asyncio.ensure_future(subscriber.run())
+    try:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not predicate():
+            assert asyncio.get_running_loop().time() < deadline, "timed out"
+            assert not task.done(), task.exception()
+            await asyncio.sleep(0.02)
+    finally:
+        await subscriber.close()
+        await asyncio.wait_for(task, timeout)
+
+
+async def _wait_for(predicate, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.02)
+
+
+def _subscriber(port, client):
+    return BlockScoutSubscriber(
+        socket_url=f"ws://127.0.0.1:{port}/socket/v2/websocket?vsn=2.0.0",
+        poll_client=client,
+        reconnect_min=0.3,
+        poll_interval=0.05,
+    )
+
+
+def _serve(server):
+    return websockets.serve(server.handler, "127.0.0.1", 0)
+
+
+def test_socket_url_from_base():
+    assert (
+        socket_url_from_base("https://eth.blockscout.com/api/v2/")
+        == "wss://eth.blockscout.com/socket/v2/websocket?vsn=2.0.0"
+    )
+    assert (
+        socket_url_from_base("http://host/poa/core/api/v2")
+        == "ws://host/poa/core/socket/v2/websocket?vsn=2.0.0"
+    )
+
+
+def test_fallback_poll_delivers_transactions_from_the_outage():
+    client = StubClient()
+    client.transactions = [_tx(1)]
+    events = []
+
+    async def script(ws):
+        topic = f"addresses:{ADDRESS}"
+        await ws.send(
+            json.dumps([None, None, topic, "transaction", {"transaction": _tx(2)}])
+        )
+        # baseline is taken over REST once the socket is up
+        await _wait_for(lambda: any("/addresses/" in call for call in client.calls))
+        # activity while the socket is down
+        client.transactions = [_tx(3), _tx(2), _tx(1)]
+
+    async def main():
+        server = PhoenixServer(script)
+        async with _serve(server) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            subscriber = _subscriber(port, client)
+            subscriber.subscribe_address(ADDRESS, events.append)
+            await _run_until(subscriber, lambda: len(events) >= 2)
+
+    asyncio.run(main())
+    assert [(event.hash, event.source) for event in events] == [
+        (_tx(2)["hash"], "socket"),
+        (_tx(3)["hash"], "poll"),
+    ]
+
+
+def test_fallback_poll_delivers_blocks_after_the_baseline():
+    client = StubClient()
+    client.blocks = [_block(100), _block(99)]
+    events = []
+
+    async def script(ws):
+        await _wait_for(lambda: "/main-page/blocks" in client.calls)
+        payload = {"block": _block(101)}
+        await ws.send(json.dumps([None, None, BLOCKS_TOPIC, "new_block", payload]))
+        await _wait_for(lambda: events)
+        client.blocks = [_block(h) for h in (103, 102, 101, 100)]
+
+    async def main():
+        server = PhoenixServer(script)
+        async with _serve(server) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            subscriber = _subscriber(port, client)
+            subscriber.subscribe_blocks(events.append)
+            await _run_until(subscriber, lambda: len(events) >= 3)
+            assert subscriber.reconnects >= 1
+
+    asyncio.run(main())
+    assert [(event.data["height"], event.source) for event in events] == [
+        (101, "socket"),
+        (102, "poll"),
+        (103, "poll"),
+    ]
+
+
+def test_first_poll_records_baseline_without_socket():
+    client = StubClient()
+    client.transactions = [_tx(1)]
+    events = []
+
+    async def main():
+        # nothing listens on this port: the subscriber only ever polls
+        subscriber = _subscriber(1, client)
+        subscriber.subscribe_address(ADDRESS, events.append)
+
+        def later():
+            client.transactions = [_tx(2), _tx(1)]
+
+        asyncio.get_running_loop().call_later(0.2, later)
+        await _run_until(subscriber, lambda: events)
+
+    asyncio.run(main())
+    assert [event.hash for event in events] == [_tx(2)["hash"]]
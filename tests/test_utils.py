@@ -0,0 +1,78 @@
+"""Tests for exact token amount conversions"""
+
+from decimal import Decimal
+
+import pytest
+
+from blockscout_client.utils import format_token_amount, parse_token_amount
+
+
+@pytest.mark.parametrize(
+    "amount,decimals,expected",
+    [
+        ("1000.5", 18, 1000500000000000000000),
+        ("1000.5", "18", 1000500000000000000000),
+        ("1e18", 0, 10**18),
+        ("1.5e3", 6, 1_500_000_000),
+        ("0.000000000000000001", 18, 1),
+        (Decimal("2.50"), 2, 250),
+        (7, None, 7),
+        ("7", "0", 7),
+        ("-1.5", 18, -1500000000000000000),
+        # beyond float64 precision
+        (str(2**256 - 1), 0, 2**256 - 1),
+        (
+            "115792089237316195423570985008687907853269984665640564039457.584007913129639935",
+            18,
+            2**256 - 1,
+        ),
+    ],
+)
+def test_parse_token_amount(amount, decimals, expected):
+    assert parse_token_amount(amount, decimals) == expected
+
+
+@pytest.mark.parametrize(
+    "amount,decimals",
+    [
+        ("0.0000000000000000001", 18),
+        ("1.5", 0),
+        ("1.5", None),
+        ("1e-7", 6),
+    ],
+)
+def test_parse_rejects_too_many_decimal_places(amount, decimals):
+    with pytest.raises(ValueError, match="decimal places"):
+        parse_token_amount(amount, decimals)
+
+
+@pytest.mark.parametrize(
+    "amount", ["inf", "-Infinity", "nan", "sNaN", "", "1,5", "abc"]
+)
+def test_parse_rejects_non_numbers(amount):
+    with pytest.raises(ValueError, match="Invalid token amount"):
+        parse_token_amount(amount, 18)
+
+
+@pytest.mark.parametrize(
+    "value,decimals,expected",
+    [
+        (1000500000000000000000, 18, "1000.5"),
+        ("1000000000000000000", "18", "1"),
+        (1, 18, "0.000000000000000001"),
+        (0, 18, "0"),
+        (-1500000000000000000, 18, "-1.5"),
+        (-1, 6, "-0.000001"),
+        (2**256 - 1, None, str(2**256 - 1)),
+        (12345, "0", "12345"),
+    ],
+)
+def test_format_token_amount(value, decimals, expected):
+    assert format_token_amount(value, decimals) == expected
+
+
+@pytest.mark.parametrize(
+    "value", [0, 1, -1, 10**18, 123456789012345678901234567890, -(2**255)]
+)
+def test_format_and_parse_round_trip(value):
+    assert parse_token_amount(format_token_amount(value, 18), 18) == value
@@ -0,0 +1,134 @@
+"""Tests for incremental warehouse syncs with a stub client"""
+
+import json
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from blockscout_client.exceptions import BlockScoutError
+from blockscout_client.warehouse import Warehouse, sync_blocks, sync_token
+
+TOKEN = "0x" + "ee" * 20
+
+
+class StubBlocks:
+    """Pages /blocks newest first, ten blocks per page"""
+
+    def __init__(self, head):
+        self.head = head
+        self.pages = 0
+
+    def iter_raw_pages(self, endpoint, params=None, max_pages=None, page_params=None):
+        start = page_params["height"] if page_params else self.head
+        pages = 0
+        while True:
+            self.pages += 1
+            pages += 1
+            items = [
+                {"height": height, "hash": "0x%064x" % height}
+                for height in range(start, max(0, start - 10), -1)
+            ]
+            next_page_params = {"height": start - 10} if start > 10 else None
+            yield {"items": items, "next_page_params": next_page_params}
+            start -= 10
+            if not next_page_params or (max_pages is not None and pages >= max_pages):
+                return
+
+
+def _heights(wh):
+    return [row["height"] for row in wh.query("SELECT height FROM blocks")]
+
+
+def test_max_pages_runs_add_up_to_the_full_history(tmp_path):
+    client = StubBlocks(head=100)
+    with Warehouse(str(tmp_path / "chain.db")) as wh:
+        assert sync_blocks(client, wh, max_pages=3) == 30
+        client.head = 125
+        for _ in range(5):
+            sync_blocks(client, wh, max_pages=3)
+        assert sorted(_heights(wh)) == list(range(1, 126))
+
+        # complete: a top-up only reads the head page
+        client.head = 130
+        client.pages = 0
+        assert sync_blocks(client, wh, max_pages=3) == 6
+        assert client.pages == 1
+        assert len(_heights(wh)) == 130
+
+
+def test_busy_head_does_not_starve_the_older_range(tmp_path):
+    client = StubBlocks(head=100)
+    with Warehouse(str(tmp_path / "chain.db")) as wh:
+        sync_blocks(client, wh, max_pages=2)
+        # the head moves further than one run's budget can page down
+        client.head = 200
+        sync_blocks(client, wh, max_pages=2)
+        marks = json.loads(wh.get_cursor("blocks"))
+        assert marks["high"] == 200
+        assert marks["gaps"] == [{"low": {"height": 180}, "until": 100}]
+        assert marks["low"] == {"height": 60}
+        assert sorted(_heights(wh)) == list(range(61, 101)) + list(range(181, 201))
+
+        # one gap page per run next to the top-up page
+        for _ in range(9):
+            sync_blocks(client, wh, max_pages=2)
+        marks = json.loads(wh.get_cursor("blocks"))
+        assert marks["gaps"] == [] and marks["done"]
+        assert sorted(_heights(wh)) == list(range(1, 201))
+
+
+def test_rows_are_committed_in_batches(tmp_path):
+    path = str(tmp_path / "chain.db")
+    client = StubBlocks(head=100)
+    with Warehouse(path, commit_every=50) as wh:
+        sync_blocks(client, wh, max_pages=4)
+        reader = sqlite3.connect(path)
+        # 40 rows are pending: neither they nor their cursor are visible yet
+        assert reader.execute("SELECT COUNT(*) FROM blocks").fetchone()[0] == 0
+        assert reader.execute("SELECT COUNT(*) FROM sync_state").fetchone()[0] == 0
+        sync_blocks(client, wh, max_pages=2)
+        assert reader.execute("SELECT COUNT(*) FROM blocks").fetchone()[0] == 50
+    assert reader.execute("SELECT COUNT(*) FROM sync_state").fetchone()[0] == 1
+    reader.close()
+
+
+class StubToken:
+    """Serves a token and its holders, ten per page"""
+
+    def __init__(self, holders, fail_at_page=None):
+        self.holders = holders
+        self.fail_at_page = fail_at_page
+
+    def get_token(self, address_hash):
+        token = {"address": TOKEN, "name": "Token", "symbol": "TKN", "type": "ERC-20"}
+        return SimpleNamespace(address=TOKEN, model_dump=lambda by_alias: token)
+
+    def iter_raw_pages(self, endpoint, params=None, max_pages=None, page_params=None):
+        assert endpoint == f"/tokens/{TOKEN}/holders"
+        for page, start in enumerate(range(0, self.holders, 10)):
+            if page == self.fail_at_page:
+                raise BlockScoutError("holders page failed")
+            items = [
+                {"address": {"hash": "0x%040x" % n}, "value": str(n)}
+                for n in range(start, min(start + 10, self.holders))
+            ]
+            yield {"items": items}
+
+
+def _holders(wh):
+    return wh.query("SELECT COUNT(*) AS n FROM token_holders")[0]["n"]
+
+
+def test_holder_refresh_is_atomic_and_never_truncated(tmp_path):
+    with Warehouse(str(tmp_path / "chain.db"), commit_every=5) as wh:
+        counts = sync_token(StubToken(35), wh, TOKEN, transfers=False, max_pages=1)
+        # max_pages bounds incremental streams, not the full holder refresh
+        assert counts["holders"] == _holders(wh) == 35
+
+        with pytest.raises(BlockScoutError):
+            sync_token(StubToken(50, fail_at_page=3), wh, TOKEN, transfers=False)
+        assert _holders(wh) == 35
+
+        sync_token(StubToken(12), wh, TOKEN, transfers=False)
+        assert _holders(wh) == 12
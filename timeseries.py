@@ -0,0 +1,382 @@
+"""Incremental time-series cache for balance histories and stats charts
+
+Coin balance histories, daily charts and ``/stats`` counters are kept in a
+local append-only store: one directory per chain and series, holding Arrow
+IPC chunks and a ``meta.json`` with the cached tail. A refresh only appends
+what is newer than the tail, and reads return typed Arrow tables or pandas
+DataFrames, so a dashboard re-rendering every minute costs one request (or
+none within ``max_age``) instead of a full history download.
+
+Layout::
+
+    <root>/<chain>/address/<hash>/coin-balance-history/
+        meta.json                 {"chunks": [...], "tail": ..., "fetched_at": ...}
+        chunk-000001.arrow
+        chunk-000002.arrow
+
+Chunks are listed in ``meta.json``, which is replaced atomically after a
+chunk is written, so an interrupted refresh or compaction leaves at most an
+orphaned file behind and never a half-read series.
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .columnar import Column, ColumnarBatch, _require_pyarrow
+from .schemas import (
+    COIN_BALANCE_BY_DAY_SCHEMA,
+    COIN_BALANCE_HISTORY_SCHEMA,
+    MARKET_CHART_SCHEMA,
+    STATS_SCHEMA,
+    TRANSACTION_CHART_SCHEMA,
+)
+from .utils import chain_slug
+
+DEFAULT_ROOT = "~/.blockscout/series"
+
+# Daily charts are recomputed by the indexer a few times an hour at most
+CHART_MAX_AGE = 600
+
+
+def _gas_price(value: Any) -> Any:
+    # Newer instances return {"price": ..., "time": ...} per speed
+    if isinstance(value, dict):
+        return value.get("price")
+    return value
+
+
+def _stats_row(stats: Dict[str, Any], fetched_at: str) -> Dict[str, Any]:
+    row = dict(stats, fetched_at=fetched_at)
+    gas_prices = stats.get("gas_prices") or {}
+    for speed in ("slow", "average", "fast"):
+        row[f"gas_price_{speed}"] = _gas_price(gas_prices.get(speed))
+    return row
+
+
+def _to_pandas(table, schema: Sequence[Column]) -> pd.DataFrame:
+    """Arrow table to pandas with uint256 columns as Python ints"""
+    df = table.to_pandas()
+    for column in schema:
+        if column.kind == "uint256" and column.name in df:
+            df[column.name] = pd.Series(
+                [None if v is None else int(v) for v in df[column.name]],
+                dtype=object,
+                index=df.index,
+            )
+    return df
+
+
+class SeriesStore:
+    """
+    Append-only columnar store of named series
+
+    Args:
+        root: Directory of one chain's series
+        compact_every: Merge a series into one chunk once it has this many
+    """
+
+    def __init__(self, root: str, compact_every: int = 32):
+        self.root = os.path.expanduser(root)
+        self.compact_every = compact_every
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, *key.split("/"))
+
+    def meta(self, key: str) -> Dict[str, Any]:
+        """Metadata of a series (empty for an unknown series)"""
+        path = os.path.join(self.path(key), "meta.json")
+        if not os.path.exists(path):
+            return {"chunks": [], "tail": None, "fetched_at": None}
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _save_meta(self, key: str, meta: Dict[str, Any]) -> None:
+        path = os.path.join(self.path(key), "meta.json")
+        partial = f"{path}.partial"
+        with open(partial, "w") as f:
+            json.dump(meta, f)
+        os.replace(partial, path)
+
+    def _write_chunk(self, key: str, meta: Dict[str, Any], table) -> str:
+        pa = _require_pyarrow()
+        directory = self.path(key)
+        os.makedirs(directory, exist_ok=True)
+        meta["sequence"] = meta.get("sequence", 0) + 1
+        name = f"chunk-{meta['sequence']:06d}.arrow"
+        partial = os.path.join(directory, f"{name}.partial")
+        with pa.OSFile(partial, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(partial, os.path.join(directory, name))
+        return name
+
+    def append(
+        self,
+        key: str,
+        schema: Sequence[Column],
+        items: List[Dict[str, Any]],
+        unique: Optional[str] = None,
+        **meta_updates: Any,
+    ) -> None:
+        """
+        Append raw items as a new chunk and update the series metadata
+
+        Args:
+            key: Series key, e.g. "chart/transactions"
+            schema: Columns of the series
+            items: Raw items, oldest first (may be empty to only touch meta)
+            unique: Key column; later rows replace earlier ones on read
+            meta_updates: Extra metadata such as ``tail`` and ``fetched_at``
+        """
+        meta = self.meta(key)
+        os.makedirs(self.path(key), exist_ok=True)
+        if items:
+            batch = ColumnarBatch(schema)
+            batch.append_items(items)
+            meta["chunks"].append(self._write_chunk(key, meta, batch.to_arrow()))
+        meta["unique"] = unique
+        meta.update(meta_updates)
+        self._save_meta(key, meta)
+        if len(meta["chunks"]) >= self.compact_every:
+            self.compact(key)
+
+    def read(self, key: str):
+        """
+        Whole series as a pyarrow Table, deduplicated on its key column
+
+        Returns None for a series that was never fetched.
+        """
+        pa = _require_pyarrow()
+        meta = self.meta(key)
+        if not meta["chunks"]:
+            return None
+        directory = self.path(key)
+        tables = []
+        for name in meta["chunks"]:
+            with pa.OSFile(os.path.join(directory, name), "rb") as source:
+                tables.append(pa.ipc.open_file(source).read_all())
+        table = pa.concat_tables(tables) if len(tables) > 1 else tables[0]
+
+        unique = meta.get("unique")
+        if unique and table.num_rows:
+            keys = table.column(unique).to_numpy()
+            # np.unique of the reversed keys finds each key's last row and
+            # returns them sorted by key
+            _, first = np.unique(keys[::-1], return_index=True)
+            table = table.take(pa.array(len(keys) - 1 - first))
+        return table
+
+    def compact(self, key: str) -> None:
+        """Rewrite a series as a single deduplicated chunk"""
+        table = self.read(key)
+        if table is None:
+            return
+        meta = self.meta(key)
+        stale = meta["chunks"]
+        meta["chunks"] = [self._write_chunk(key, meta, table)]
+        self._save_meta(key, meta)
+        for name in stale:
+            try:
+                os.remove(os.path.join(self.path(key), name))
+            except FileNotFoundError:
+                pass
+
+    def clear(self, key: str) -> None:
+        """Forget a series"""
+        meta = self.meta(key)
+        meta.update(chunks=[], tail=None, fetched_at=None)
+        if os.path.isdir(self.path(key)):
+            self._save_meta(key, meta)
+            for name in os.listdir(self.path(key)):
+                if name.startswith("chunk-"):
+                    os.remove(os.path.join(self.path(key), name))
+
+
+class TimeSeriesCache:
+    """
+    Cached, incrementally refreshed time series of one chain
+
+    Every accessor refreshes its series first unless it was fetched less
+    than ``max_age`` seconds ago (``max_age=None`` reads the cache without
+    touching the network) and returns a DataFrame sorted by time.
+
+    Example:
+        with BlockScoutClient(url) as client:
+            series = TimeSeriesCache(client)
+            balances = series.coin_balance_history("0x...")
+            txs = series.transactions_chart()
+
+    Args:
+        client: BlockScoutClient instance
+        root: Cache directory shared by all chains
+        compact_every: Chunks per series before they are merged
+    """
+
+    def __init__(self, client: Any, root: str = DEFAULT_ROOT, compact_every: int = 32):
+        self.client = client
+        self.store = SeriesStore(
+            os.path.join(os.path.expanduser(root), chain_slug(client.base_url)),
+            compact_every,
+        )
+
+    def _stale(self, key: str, max_age: Optional[float]) -> bool:
+        if max_age is None:
+            return False
+        fetched_at = self.store.meta(key).get("fetched_at")
+        return fetched_at is None or time.time() - fetched_at >= max_age
+
+    def _frame(self, key: str, schema: Sequence[Column]) -> pd.DataFrame:
+        table = self.store.read(key)
+        if table is None:
+            return ColumnarBatch(schema).to_pandas()
+        return _to_pandas(table, schema)
+
+    def _refresh_list(
+        self,
+        key: str,
+        schema: Sequence[Column],
+        unique: str,
+        fetch: Callable[[], List[Dict[str, Any]]],
+    ) -> int:
+        """
+        Refresh a series served as one unpaginated list
+
+        The endpoint always returns the full history, so only rows at or
+        after the cached tail are stored; the tail row is kept because the
+        current day's figure is provisional until the day closes.
+        """
+        meta = self.store.meta(key)
+        tail = meta.get("tail")
+        items = sorted(
+            (item for item in fetch() if item.get(unique) is not None),
+            key=lambda item: item[unique],
+        )
+        if tail is not None:
+            items = [item for item in items if item[unique] >= tail]
+            if items == [meta.get("tail_item")]:
+                items = []
+        last = items[-1] if items else meta.get("tail_item")
+        self.store.append(
+            key,
+            schema,
+            items,
+            unique=unique,
+            tail=last[unique] if last else tail,
+            tail_item=last,
+            fetched_at=time.time(),
+        )
+        return len(items)
+
+    # Address series
+
+    def refresh_coin_balance_history(self, address: str) -> int:
+        """
+        Fetch balance changes newer than the cached tail
+
+        Pages arrive newest first, so paging stops at the first entry that
+        is already cached. Returns the number of new entries.
+        """
+        address = address.lower()
+        key = f"address/{address}/coin-balance-history"
+        tail = self.store.meta(key).get("tail")
+        items: List[Dict[str, Any]] = []
+        for page in self.client.iter_raw_pages(
+            f"/addresses/{address}/coin-balance-history"
+        ):
+            page_items = page.get("items", [])
+            fresh = [
+                item
+                for item in page_items
+                if tail is None or item["block_number"] > tail
+            ]
+            items.extend(fresh)
+            if len(fresh) < len(page_items):
+                break
+        items.reverse()
+        self.store.append(
+            key,
+            COIN_BALANCE_HISTORY_SCHEMA,
+            items,
+            unique="block_number",
+            tail=items[-1]["block_number"] if items else tail,
+            fetched_at=time.time(),
+        )
+        return len(items)
+
+    def coin_balance_history(
+        self, address: str, max_age: Optional[float] = 0
+    ) -> pd.DataFrame:
+        """Native coin balance changes of an address, one row per block"""
+        key = f"address/{address.lower()}/coin-balance-history"
+        if self._stale(key, max_age):
+            self.refresh_coin_balance_history(address)
+        return self._frame(key, COIN_BALANCE_HISTORY_SCHEMA)
+
+    def coin_balance_history_by_day(
+        self, address: str, max_age: Optional[float] = CHART_MAX_AGE
+    ) -> pd.DataFrame:
+        """Daily native coin balances of an address"""
+        address = address.lower()
+        key = f"address/{address}/coin-balance-history-by-day"
+
+        def fetch():
+            data = self.client.get_raw(
+                f"/addresses/{address}/coin-balance-history-by-day"
+            )
+            return data.get("items", []) if isinstance(data, dict) else data
+
+        if self._stale(key, max_age):
+            self._refresh_list(key, COIN_BALANCE_BY_DAY_SCHEMA, "date", fetch)
+        return self._frame(key, COIN_BALANCE_BY_DAY_SCHEMA)
+
+    # Chain series
+
+    def transactions_chart(
+        self, max_age: Optional[float] = CHART_MAX_AGE
+    ) -> pd.DataFrame:
+        """Daily transaction counts"""
+        key = "chart/transactions"
+
+        def fetch():
+            return self.client.get_raw("/stats/charts/transactions")["chart_data"]
+
+        if self._stale(key, max_age):
+            self._refresh_list(key, TRANSACTION_CHART_SCHEMA, "date", fetch)
+        return self._frame(key, TRANSACTION_CHART_SCHEMA)
+
+    def market_chart(self, max_age: Optional[float] = CHART_MAX_AGE) -> pd.DataFrame:
+        """Daily closing price and market cap of the native coin"""
+        key = "chart/market"
+
+        def fetch():
+            return self.client.get_raw("/stats/charts/market")["chart_data"]
+
+        if self._stale(key, max_age):
+            self._refresh_list(key, MARKET_CHART_SCHEMA, "date", fetch)
+        return self._frame(key, MARKET_CHART_SCHEMA)
+
+    def stats(self, max_age: Optional[float] = 0) -> pd.DataFrame:
+        """
+        Local history of ``/stats`` counters, one row per snapshot
+
+        The API only serves the current counters, so every refresh appends
+        a snapshot; the latest one is the last row.
+        """
+        key = "stats"
+        if self._stale(key, max_age):
+            fetched_at = datetime.now(timezone.utc).isoformat()
+            row = _stats_row(self.client.get_raw("/stats"), fetched_at)
+            self.store.append(
+                key, STATS_SCHEMA, [row], tail=fetched_at, fetched_at=time.time()
+            )
+        return self._frame(key, STATS_SCHEMA)
+
+    def table(self, key: str):
+        """Cached series as a pyarrow Table, e.g. table("chart/market")"""
+        return self.store.read(key)
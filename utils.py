@@ -1,7 +1,13 @@
 """Utility functions"""
 
 import pandas as pd
-from typing import List, Any, Optional
+from decimal import Decimal, InvalidOperation, localcontext
+from pydantic import BaseModel
+from typing import Dict, List, Any, Optional, Union
+import re
+from urllib.parse import urlparse
+
+from .columnar import Column, ColumnarBatch
 
 
 def to_pandas_dataframe(items: List[Any]) -> pd.DataFrame:
@@ -31,6 +37,65 @@ def to_polars_dataframe(items: List[Any]) -> "pl.DataFrame":
     return pl.DataFrame(data)
 
 
+def _typed_batch(
+    items: List[Any], schema: Optional[List[Column]] = None
+) -> ColumnarBatch:
+    if schema is None:
+        from .schemas import schema_for
+
+        schema = schema_for(items[0])
+
+    rows: List[Dict[str, Any]] = []
+    for item in items:
+        if isinstance(item, BaseModel):
+            rows.append(item.model_dump(by_alias=True))
+        elif hasattr(item, "to_dict"):
+            rows.append(item.to_dict())
+        else:
+            rows.append(item)
+
+    batch = ColumnarBatch(schema)
+    batch.append_items(rows)
+    return batch
+
+
+def to_typed_dataframe(
+    items: List[Any], schema: Optional[List[Column]] = None
+) -> pd.DataFrame:
+    """
+    Convert models, compact records or raw API dicts to a typed pandas DataFrame
+
+    Args:
+        items: Items of a single type
+        schema: Column schema (looked up from the item type if not given;
+            required for raw dicts, e.g. schemas.HOLDER_SCHEMA)
+    """
+    if not items:
+        return pd.DataFrame()
+    return _typed_batch(items, schema).to_pandas()
+
+
+def to_typed_polars_dataframe(
+    items: List[Any], schema: Optional[List[Column]] = None
+) -> "pl.DataFrame":
+    """Convert models, compact records or raw API dicts to a typed polars DataFrame"""
+    if not items:
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError(
+                "polars is required for this function. Install with: pip install polars"
+            )
+        return pl.DataFrame()
+    return _typed_batch(items, schema).to_polars()
+
+
+def chain_slug(base_url: str) -> str:
+    """File-name-safe name of a chain, e.g. eth.blockscout.com_api_v2"""
+    parsed = urlparse(base_url)
+    return re.sub(r"[^A-Za-z0-9.-]+", "_", parsed.netloc + parsed.path).strip("_")
+
+
 def flatten_nested_dict(data: dict, parent_key: str = "", sep: str = "_") -> dict:
     """Flatten nested dictionary for DataFrame compatibility"""
     items = []
@@ -44,3 +109,40 @@ def flatten_nested_dict(data: dict, parent_key: str = "", sep: str = "_") -> dic
         else:
             items.append((new_key, v))
     return dict(items)
+
+
+def parse_token_amount(amount: Union[str, int, Decimal], decimals: Any = 0) -> int:
+    """
+    Convert a human-readable token amount to an exact integer base-unit value
+
+    Args:
+        amount: Amount in token units, e.g. "1000.5"
+        decimals: Token decimals (int or the string returned by the API)
+
+    Example:
+        parse_token_amount("1000.5", "18") == 1000500000000000000000
+    """
+    decimals = int(decimals or 0)
+    try:
+        with localcontext() as ctx:
+            ctx.prec = 100
+            value = Decimal(str(amount)).scaleb(decimals)
+    except InvalidOperation:
+        raise ValueError(f"Invalid token amount: {amount!r}")
+    if not value.is_finite():
+        raise ValueError(f"Invalid token amount: {amount!r}")
+    if value != value.to_integral_value():
+        raise ValueError(f"{amount} has more than {decimals} decimal places")
+    return int(value)
+
+
+def format_token_amount(value: Union[str, int], decimals: Any = 0) -> str:
+    """Format an integer base-unit value as an exact decimal string in token units"""
+    value = int(value)
+    decimals = int(decimals or 0)
+    if not decimals:
+        return str(value)
+    sign = "-" if value < 0 else ""
+    whole, fraction = divmod(abs(value), 10**decimals)
+    fraction_str = str(fraction).rjust(decimals, "0").rstrip("0")
+    return f"{sign}{whole}.{fraction_str}" if fraction_str else f"{sign}{whole}"
@@ -0,0 +1,828 @@
+"""Local chain warehouse
+
+Ingests blocks, transactions, token transfers, internal transactions,
+tokens, holders and contract event logs into a normalized SQLite database
+so analytical questions run as local indexed queries instead of thousands
+of API calls.
+
+Column names follow the flat export schemas (``from.hash`` -> ``from_hash``).
+Integers that can exceed 64 bits (wei amounts, token values) are stored as
+decimal TEXT; cast in SQL or convert in Python when aggregating.
+
+Writes are idempotent upserts (``INSERT ... ON CONFLICT DO UPDATE``)
+committed every ``commit_every`` rows, so a sync can be repeated or resumed
+safely. Each synced stream keeps a high-water mark (the newest position
+stored) and a low-water mark (where its older history continues) in the
+same transactions as its rows: a run tops up from the head down to the
+high-water mark (remembering where a top-up cut short by ``--max-pages``
+stopped, to fill that gap later), then resumes the older range with a page
+budget of its own, so ``--max-pages`` runs add up to the full history.
+"""
+
+import json
+import sqlite3
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .columnar import Column
+from .keccak import event_topic, to_checksum_address
+from .schemas import _flat
+
+_SQL_TYPES = {"int": "INTEGER", "bool": "INTEGER", "float": "REAL"}
+
+
+class Table:
+    """Table definition: columns, primary key and secondary indexes"""
+
+    def __init__(
+        self,
+        name: str,
+        columns: List[Column],
+        primary_key: Sequence[str],
+        indexes: Sequence[Sequence[str]] = (),
+    ):
+        self.name = name
+        self.columns = columns
+        self.primary_key = tuple(primary_key)
+        self.indexes = [tuple(index) for index in indexes]
+        self._getters = [column.getter for column in columns]
+        self._converters = [self._converter(column) for column in columns]
+        self._key_positions = [
+            i for i, column in enumerate(columns) if column.name in self.primary_key
+        ]
+
+    @staticmethod
+    def _converter(column: Column) -> Callable[[Any], Any]:
+        if column.kind in ("int", "bool"):
+            return int
+        if column.kind == "float":
+            return float
+        return str
+
+    def ddl(self) -> List[str]:
+        """CREATE TABLE / CREATE INDEX statements"""
+        columns = ",\n    ".join(
+            f"{column.name} {_SQL_TYPES.get(column.kind, 'TEXT')}"
+            + (" NOT NULL" if column.name in self.primary_key else "")
+            for column in self.columns
+        )
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {self.name} (\n    {columns},\n"
+            f"    PRIMARY KEY ({', '.join(self.primary_key)})\n)"
+        ]
+        for index in self.indexes:
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.name}_{'_'.join(index)} "
+                f"ON {self.name} ({', '.join(index)})"
+            )
+        return statements
+
+    def upsert_sql(self) -> str:
+        names = [column.name for column in self.columns]
+        updates = [name for name in names if name not in self.primary_key]
+        sql = (
+            f"INSERT INTO {self.name} ({', '.join(names)}) "
+            f"VALUES ({', '.join('?' * len(names))}) "
+            f"ON CONFLICT ({', '.join(self.primary_key)}) DO "
+        )
+        if not updates:
+            return sql + "NOTHING"
+        return (
+            sql
+            + "UPDATE SET "
+            + ", ".join(f"{name} = excluded.{name}" for name in updates)
+        )
+
+    def row(self, item: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Flatten a raw API item into a row tuple"""
+        row = [
+            None if value is None else convert(value)
+            for value, convert in zip(
+                (getter(item) for getter in self._getters), self._converters
+            )
+        ]
+        # Primary key columns are NOT NULL so upserts can match them;
+        # a missing token id is stored as ''
+        for position in self._key_positions:
+            if row[position] is None:
+                row[position] = ""
+        return tuple(row)
+
+
+ADDRESSES = Table(
+    "addresses",
+    [
+        _flat("hash"),
+        _flat("name"),
+        _flat("is_contract", "bool"),
+        _flat("is_verified", "bool"),
+    ],
+    primary_key=["hash"],
+)
+
+TOKENS = Table(
+    "tokens",
+    [
+        _flat("address"),
+        _flat("name"),
+        _flat("symbol"),
+        _flat("type"),
+        _flat("decimals", "int"),
+        _flat("holders", "int"),
+        _flat("total_supply", "uint256"),
+        _flat("exchange_rate", "float"),
+    ],
+    primary_key=["address"],
+    indexes=[["symbol"]],
+)
+
+BLOCKS = Table(
+    "blocks",
+    [
+        _flat("height", "int"),
+        _flat("hash"),
+        _flat("parent_hash"),
+        _flat("timestamp", "datetime"),
+        _flat("miner.hash"),
+        _flat("gas_used", "int"),
+        _flat("gas_limit", "int"),
+        _flat("base_fee_per_gas", "uint256"),
+        _flat("burnt_fees", "uint256"),
+        _flat("priority_fee", "uint256"),
+        _flat("transaction_count", "int"),
+        _flat("size", "int"),
+        _flat("type"),
+    ],
+    primary_key=["height"],
+    indexes=[["hash"], ["miner_hash"], ["timestamp"]],
+)
+
+TRANSACTIONS = Table(
+    "transactions",
+    [
+        _flat("hash"),
+        _flat("block_number", "int"),
+        _flat("position", "int"),
+        _flat("timestamp", "datetime"),
+        _flat("from.hash"),
+        _flat("to.hash"),
+        _flat("created_contract.hash"),
+        _flat("value", "uint256"),
+        _flat("fee.value", "uint256"),
+        _flat("gas_limit", "int"),
+        _flat("gas_used", "int"),
+        _flat("gas_price", "uint256"),
+        _flat("nonce", "int"),
+        _flat("type", "int"),
+        _flat("status"),
+        _flat("method"),
+    ],
+    primary_key=["hash"],
+    indexes=[
+        ["block_number"],
+        ["from_hash", "block_number"],
+        ["to_hash", "block_number"],
+    ],
+)
+
+TOKEN_TRANSFERS = Table(
+    "token_transfers",
+    [
+        _flat("transaction_hash"),
+        _flat("log_index", "int"),
+        _flat("block_number", "int"),
+        _flat("block_hash"),
+        _flat("timestamp", "datetime"),
+        _flat("token.address"),
+        _flat("from.hash"),
+        _flat("to.hash"),
+        _flat("total.value", "uint256"),
+        _flat("total.token_id", "uint256"),
+        _flat("type"),
+        _flat("method"),
+    ],
+    primary_key=["transaction_hash", "log_index"],
+    indexes=[
+        ["token_address", "block_number"],
+        ["from_hash", "block_number"],
+        ["to_hash", "block_number"],
+        ["block_number"],
+    ],
+)
+
+INTERNAL_TRANSACTIONS = Table(
+    "internal_transactions",
+    [
+        _flat("transaction_hash"),
+        Column("trace_index", "index", "int"),
+        _flat("block_number", "int"),
+        _flat("timestamp", "datetime"),
+        _flat("type"),
+        _flat("from.hash"),
+        _flat("to.hash"),
+        _flat("created_contract.hash"),
+        _flat("value", "uint256"),
+        _flat("gas_limit", "int"),
+        _flat("success", "bool"),
+        _flat("error"),
+    ],
+    primary_key=["transaction_hash", "trace_index"],
+    indexes=[
+        ["from_hash", "block_number"],
+        ["to_hash", "block_number"],
+        ["block_number"],
+    ],
+)
+
+TOKEN_HOLDERS = Table(
+    "token_holders",
+    [
+        Column("token_address"),
+        _flat("address.hash"),
+        _flat("token_id", "uint256"),
+        _flat("value", "uint256"),
+    ],
+    primary_key=["token_address", "address_hash", "token_id"],
+    indexes=[["address_hash"]],
+)
+
+LOGS = Table(
+    "logs",
+    [
+        _flat("address.hash"),
+        _flat("topic0"),
+        _flat("block_number", "int"),
+        Column("log_index", "index", "int"),
+        _flat("transaction_hash"),
+        _flat("block_hash"),
+        _flat("topic1"),
+        _flat("topic2"),
+        _flat("topic3"),
+        _flat("data"),
+    ],
+    primary_key=["transaction_hash", "log_index"],
+    indexes=[["address_hash", "topic0", "block_number"], ["block_number"]],
+)
+
+SYNC_STATE = Table(
+    "sync_state",
+    [Column("stream"), Column("cursor")],
+    primary_key=["stream"],
+)
+
+TABLES = [
+    ADDRESSES,
+    TOKENS,
+    BLOCKS,
+    TRANSACTIONS,
+    TOKEN_TRANSFERS,
+    INTERNAL_TRANSACTIONS,
+    TOKEN_HOLDERS,
+    LOGS,
+]
+
+# Address params embedded in each kind of item, upserted into `addresses`
+_ADDRESS_FIELDS = {
+    "blocks": ("miner",),
+    "transactions": ("from", "to", "created_contract"),
+    "token_transfers": ("from", "to"),
+    "internal_transactions": ("from", "to", "created_contract"),
+    "token_holders": ("address",),
+    "logs": ("address",),
+}
+
+
+class Warehouse:
+    """SQLite chain warehouse
+
+    Example:
+        with Warehouse("chain.db") as wh, BlockScoutClient(url) as client:
+            sync_token(client, wh, "0x...")
+            wh.query("SELECT COUNT(*) AS n FROM token_transfers")
+    """
+
+    def __init__(self, path: str, commit_every: int = 5000):
+        self.path = path
+        self.commit_every = commit_every
+        self._uncommitted = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        with self.conn:
+            for table in TABLES + [SYNC_STATE]:
+                for statement in table.ddl():
+                    self.conn.execute(statement)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None and issubclass(exc_type, sqlite3.Error):
+            self.conn.rollback()
+        self.close()
+
+    def close(self) -> None:
+        """Commit pending writes and close the database connection"""
+        self.commit()
+        self.conn.close()
+
+    def commit(self) -> None:
+        """Commit the rows (and sync cursors) written since the last commit"""
+        self.conn.commit()
+        self._uncommitted = 0
+
+    def upsert(self, table: Table, items: Iterable[Dict[str, Any]]) -> int:
+        """Upsert raw items into a table in one transaction; returns row count"""
+        rows = [table.row(item) for item in items]
+        if rows:
+            with self.conn:
+                self.conn.executemany(table.upsert_sql(), rows)
+        return len(rows)
+
+    def _upsert_page(
+        self, table: Table, items: List[Dict[str, Any]], batched: bool = True
+    ) -> int:
+        """
+        Upsert a page together with the addresses and tokens it references
+
+        With batched set, pending rows are committed every commit_every rows;
+        otherwise the caller commits.
+        """
+        addresses = {}
+        for item in items:
+            for field in _ADDRESS_FIELDS.get(table.name, ()):
+                param = item.get(field)
+                if param and param.get("hash"):
+                    addresses[param["hash"]] = param
+        tokens = {
+            item["token"]["address"]: item["token"]
+            for item in items
+            if item.get("token")
+        }
+
+        if addresses:
+            self.conn.executemany(
+                ADDRESSES.upsert_sql(),
+                [ADDRESSES.row(param) for param in addresses.values()],
+            )
+        if tokens:
+            self.conn.executemany(
+                TOKENS.upsert_sql(),
+                [TOKENS.row(token) for token in tokens.values()],
+            )
+        self.conn.executemany(table.upsert_sql(), [table.row(i) for i in items])
+        self._uncommitted += len(items)
+        if batched and self._uncommitted >= self.commit_every:
+            self.commit()
+        return len(items)
+
+    def insert_blocks(self, items: List[Dict[str, Any]]) -> int:
+        return self._upsert_page(BLOCKS, items)
+
+    def insert_transactions(self, items: List[Dict[str, Any]]) -> int:
+        return self._upsert_page(TRANSACTIONS, items)
+
+    def insert_token_transfers(self, items: List[Dict[str, Any]]) -> int:
+        return self._upsert_page(TOKEN_TRANSFERS, items)
+
+    def insert_internal_transactions(self, items: List[Dict[str, Any]]) -> int:
+        return self._upsert_page(INTERNAL_TRANSACTIONS, items)
+
+    def insert_tokens(self, items: List[Dict[str, Any]]) -> int:
+        return self.upsert(TOKENS, items)
+
+    def insert_holders(self, token_address: str, items: List[Dict[str, Any]]) -> int:
+        return self._upsert_page(
+            TOKEN_HOLDERS, [dict(item, token_address=token_address) for item in items]
+        )
+
+    def insert_logs(self, items: List[Dict[str, Any]]) -> int:
+        return self._upsert_page(LOGS, [_with_topics(item) for item in items])
+
+    def query_logs(
+        self,
+        address_hash: Optional[str] = None,
+        event: Optional[str] = None,
+        from_block: Optional[int] = None,
+        to_block: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Stored logs, oldest first, filtered by contract, event and block range
+
+        Args:
+            address_hash: Emitting contract
+            event: Event signature (``"Transfer(address,address,uint256)"``,
+                parameter names and ``indexed`` allowed) or a topic0 hash
+            from_block: First block (inclusive)
+            to_block: Last block (inclusive)
+            limit: Maximum number of rows
+        """
+        where, params = [], []
+        if address_hash is not None:
+            where.append("address_hash = ?")
+            params.append(to_checksum_address(address_hash))
+        if event is not None:
+            where.append("topic0 = ?")
+            params.append(event.lower() if _is_topic(event) else event_topic(event))
+        if from_block is not None:
+            where.append("block_number >= ?")
+            params.append(from_block)
+        if to_block is not None:
+            where.append("block_number <= ?")
+            params.append(to_block)
+
+        sql = "SELECT * FROM logs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY block_number, log_index"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self.query(sql, params)
+
+    def replace_holders(
+        self,
+        token_address: str,
+        pages: Iterable[Dict[str, Any]],
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Replace the stored holders of a token with every page, atomically
+
+        The old holders are deleted and the new ones inserted in a single
+        transaction, so a request failing halfway keeps the previous holders.
+        """
+        self.commit()
+        rows = 0
+        try:
+            self.conn.execute(
+                "DELETE FROM token_holders WHERE token_address = ?", (token_address,)
+            )
+            for page in pages:
+                items = [
+                    dict(item, token_address=token_address)
+                    for item in page.get("items", [])
+                ]
+                if items:
+                    rows += self._upsert_page(TOKEN_HOLDERS, items, batched=False)
+                if progress is not None:
+                    progress(rows)
+        except BaseException:
+            self.conn.rollback()
+            self._uncommitted = 0
+            raise
+        self.commit()
+        return rows
+
+    def get_cursor(self, stream: str) -> Optional[str]:
+        """Stored sync cursor of a stream"""
+        row = self.conn.execute(
+            "SELECT cursor FROM sync_state WHERE stream = ?", (stream,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_cursor(self, stream: str, cursor: Any) -> None:
+        """Store a sync cursor, committed together with the pending rows"""
+        self.conn.execute(SYNC_STATE.upsert_sql(), (stream, str(cursor)))
+
+    def max_value(self, table: Table, column: str, where: str = "", params=()) -> Any:
+        """MAX(column) of a table, optionally filtered"""
+        sql = f"SELECT MAX({column}) FROM {table.name}"
+        if where:
+            sql += f" WHERE {where}"
+        return self.conn.execute(sql, params).fetchone()[0]
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """Run a SQL query and return rows as dicts"""
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def counts(self) -> Dict[str, int]:
+        """Row count of every table"""
+        return {
+            table.name: self.conn.execute(
+                f"SELECT COUNT(*) FROM {table.name}"
+            ).fetchone()[0]
+            for table in TABLES
+        }
+
+
+def _is_topic(value: str) -> bool:
+    return len(value) == 66 and value.startswith("0x")
+
+
+def _with_topics(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Spread a log's topics list into topic0..topic3 keys"""
+    topics = list(item.get("topics") or [])[:4]
+    topics += [None] * (4 - len(topics))
+    return dict(
+        item, topic0=topics[0], topic1=topics[1], topic2=topics[2], topic3=topics[3]
+    )
+
+
+def _position(value: Any) -> Any:
+    """Stream position from JSON: (block number, index) pairs come back as lists"""
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _load_marks(warehouse: Warehouse, stream: str) -> Optional[Dict[str, Any]]:
+    """Water marks of a stream (None if it was never synced)"""
+    cursor = warehouse.get_cursor(stream)
+    try:
+        marks = json.loads(cursor) if cursor is not None else None
+    except ValueError:
+        marks = None
+    if not isinstance(marks, dict):
+        # Never synced, or a cursor from an older version: start from the head
+        return None
+    marks["high"] = _position(marks["high"])
+    marks["gaps"] = [
+        dict(gap, until=_position(gap["until"])) for gap in marks.get("gaps", [])
+    ]
+    return marks
+
+
+def _sync_stream(
+    warehouse: Warehouse,
+    stream: str,
+    pages: Callable[
+        [Optional[Dict[str, Any]], Optional[int]], Iterable[Dict[str, Any]]
+    ],
+    insert: Callable[[List[Dict[str, Any]]], int],
+    position: Callable[[Dict[str, Any]], Any],
+    max_pages: Optional[int] = None,
+    full: bool = False,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Incrementally ingest a paginated stream that lists newest items first
+
+    The stream's marks hold ``high`` (newest position stored), ``low``
+    (next_page_params where the older range continues), ``done`` (older
+    range complete) and ``gaps``: top-ups cut short by max_pages before
+    reaching ``high``, each with the page_params where it stopped and the
+    ``until`` position it still has to page down to.
+
+    A run pages from the head down to ``high``, then fills the gaps, newest
+    first, within the same max_pages budget. The older range then resumes
+    at ``low`` with a max_pages budget of its own, so a busy head never
+    starves it. The marks are written after every page, in the same
+    transaction as its rows.
+
+    Args:
+        pages: Called with (page_params, max_pages), returns raw pages
+        insert: Stores a list of raw items
+        position: Block number, or (block number, index), of an item; None
+            for pending items, which are always stored
+        full: Ignore the marks and start over from the head
+    """
+    marks = None if full else _load_marks(warehouse, stream)
+    first_sync = marks is None
+    if first_sync:
+        marks = {"high": None, "low": None, "done": False, "gaps": []}
+    rows = 0
+
+    def save() -> None:
+        warehouse.set_cursor(stream, json.dumps(marks))
+
+    def page_down(
+        page_params: Optional[Dict[str, Any]],
+        until: Any,
+        budget: Optional[int],
+        moved: Callable[[Optional[Dict[str, Any]], Any], None],
+    ) -> int:
+        """
+        Insert pages down to the until position (None for the whole stream)
+
+        moved is called after every page with the next page_params (None
+        once the range is complete) and the newest position of the page.
+        Returns the number of pages read.
+        """
+        nonlocal rows
+        fetched = 0
+        for page in pages(page_params, budget):
+            fetched += 1
+            items = page.get("items", [])
+            reached = False
+            top = None
+            for index, item in enumerate(items):
+                item_position = position(item)
+                if item_position is None:
+                    continue
+                if until is not None and item_position < until:
+                    items = items[:index]
+                    reached = True
+                    break
+                if top is None or item_position > top:
+                    top = item_position
+            rows += insert(items) if items else 0
+            ended = reached or not page.get("next_page_params") or not items
+            moved(None if ended else page.get("next_page_params"), top)
+            if progress is not None:
+                progress(rows)
+            if ended:
+                break
+        return fetched
+
+    # Newest first, down to the high-water mark
+    high = marks["high"]
+    state = {"top": None, "next": None}
+
+    def topped_up(next_page_params, top) -> None:
+        if top is not None and (state["top"] is None or top > state["top"]):
+            state["top"] = top
+        state["next"] = next_page_params
+        if first_sync:
+            # Everything from the head down is contiguous on a first sync
+            marks.update(
+                high=state["top"], low=next_page_params, done=not next_page_params
+            )
+            save()
+
+    fetched = page_down(None, high, max_pages, topped_up)
+    if not first_sync and state["top"] is not None:
+        if state["next"] is not None:
+            # Cut short by max_pages: remember what is left above high
+            marks["gaps"].append({"low": state["next"], "until": high})
+        marks["high"] = state["top"] if high is None else max(high, state["top"])
+        save()
+
+    # Gaps left by earlier top-ups, within the rest of the budget
+    budget = None if max_pages is None else max_pages - fetched
+    for gap in reversed(list(marks["gaps"])):
+        if budget == 0:
+            break
+
+        def filled(next_page_params, top, gap=gap) -> None:
+            if next_page_params is None:
+                marks["gaps"].remove(gap)
+            else:
+                gap["low"] = next_page_params
+            save()
+
+        used = page_down(gap["low"], gap["until"], budget, filled)
+        budget = None if budget is None else budget - used
+
+    # The older range left by earlier runs, with its own budget
+    if not first_sync and not marks["done"] and marks["low"]:
+
+        def resumed(next_page_params, top) -> None:
+            marks["low"] = next_page_params
+            marks["done"] = next_page_params is None
+            save()
+
+        page_down(marks["low"], None, max_pages, resumed)
+    return rows
+
+
+def sync_blocks(
+    client: Any,
+    warehouse: Warehouse,
+    max_pages: Optional[int] = None,
+    full: bool = False,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Ingest blocks, newest first
+
+    Unless full is set, paging stops at the highest block already synced and
+    then continues the older range where the last run left it.
+    """
+    return _sync_stream(
+        warehouse,
+        "blocks",
+        lambda page_params, pages: client.iter_raw_pages(
+            "/blocks", max_pages=pages, page_params=page_params
+        ),
+        warehouse.insert_blocks,
+        lambda item: item.get("height"),
+        max_pages=max_pages,
+        full=full,
+        progress=progress,
+    )
+
+
+def sync_address(
+    client: Any,
+    warehouse: Warehouse,
+    address_hash: str,
+    max_pages: Optional[int] = None,
+    full: bool = False,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, int]:
+    """
+    Ingest the transactions and token transfers of an address, newest first
+
+    Unless full is set, paging stops at the last block synced for the
+    address and then continues its older history where the last run left it.
+    """
+    address_hash = address_hash.lower()
+    counts = {}
+    for key, endpoint, insert in (
+        ("transactions", "transactions", warehouse.insert_transactions),
+        ("token_transfers", "token-transfers", warehouse.insert_token_transfers),
+    ):
+        counts[key] = _sync_stream(
+            warehouse,
+            f"address:{address_hash}:{key}",
+            lambda page_params, pages, endpoint=endpoint: client.iter_raw_pages(
+                f"/addresses/{address_hash}/{endpoint}",
+                max_pages=pages,
+                page_params=page_params,
+            ),
+            insert,
+            lambda item: item.get("block_number"),
+            max_pages=max_pages,
+            full=full,
+            progress=progress,
+        )
+    return counts
+
+
+def sync_token(
+    client: Any,
+    warehouse: Warehouse,
+    address_hash: str,
+    holders: bool = True,
+    transfers: bool = True,
+    max_pages: Optional[int] = None,
+    full: bool = False,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, int]:
+    """
+    Ingest a token, its holders (full refresh) and its transfers (incremental)
+
+    Unless full is set, transfer paging stops at the highest transfer block
+    already synced for the token and then continues the older range.
+    max_pages only bounds the transfers: a holder refresh always reads every
+    page, since a partial one would drop the remaining holders.
+    """
+    token = client.get_token(address_hash)
+    warehouse.insert_tokens([token.model_dump(by_alias=True)])
+    token_address = token.address
+    counts = {"tokens": 1}
+
+    if holders:
+        counts["holders"] = warehouse.replace_holders(
+            token_address,
+            client.iter_raw_pages(f"/tokens/{address_hash}/holders"),
+            progress=progress,
+        )
+
+    if transfers:
+        counts["token_transfers"] = _sync_stream(
+            warehouse,
+            f"token:{token_address.lower()}:transfers",
+            lambda page_params, pages: client.iter_raw_pages(
+                f"/tokens/{address_hash}/transfers",
+                max_pages=pages,
+                page_params=page_params,
+            ),
+            warehouse.insert_token_transfers,
+            lambda item: item.get("block_number"),
+            max_pages=max_pages,
+            full=full,
+            progress=progress,
+        )
+    return counts
+
+
+def sync_logs(
+    client: Any,
+    warehouse: Warehouse,
+    addresses: Iterable[str],
+    max_pages: Optional[int] = None,
+    full: bool = False,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, int]:
+    """
+    Ingest the event logs of contract addresses, newest first
+
+    Each address keeps the (block_number, index) of its newest stored log;
+    unless full is set, paging stops as soon as it is reached, so a top-up
+    costs one page for a quiet contract, and then continues the older logs
+    where the last run left them.
+    """
+    counts = {}
+    for address_hash in addresses:
+        address_hash = address_hash.lower()
+        counts[address_hash] = _sync_stream(
+            warehouse,
+            f"address:{address_hash}:logs",
+            lambda page_params, pages, address_hash=address_hash: (
+                client.iter_raw_pages(
+                    f"/addresses/{address_hash}/logs",
+                    max_pages=pages,
+                    page_params=page_params,
+                )
+            ),
+            warehouse.insert_logs,
+            lambda item: (
+                None
+                if item.get("block_number") is None
+                else (item["block_number"], item["index"])
+            ),
+            max_pages=max_pages,
+            full=full,
+            progress=progress,
+        )
+    return counts